@@ -93,3 +93,57 @@ require_view_access(lakekeeper_id, warehouse_name, namespace_name, view_name, us
     value.allowed == true
 }
 
+
+# Check multiple operations for the same user with as few requests as possible.
+# Returns an array of booleans in the order of the operations.
+# Undefined if any of the requests fails.
+batch_check(lakekeeper_id, user, operations) := results if {
+    count(operations) > 0
+    batch_size := 1000
+    batches := [array.slice(operations, start, start + batch_size) |
+        some start in numbers.range_step(0, count(operations) - 1, batch_size)
+    ]
+    responses := [response |
+        some batch in batches
+        response := authenticated_http_send(
+            lakekeeper_id,
+            "POST", "/management/v1/permissions/check/batch",
+            {
+                "operations": batch,
+                "identity": {
+                    "user": user
+                }
+            }
+        ).body
+    ]
+    count(responses) == count(batches)
+    results := [result.allowed | some response in responses; some result in response.results]
+    count(results) == count(operations)
+}
+
+# Operations for batch_check
+namespace_operation(lakekeeper_id, warehouse_name, namespace_name, action) := {
+    "namespace" : {
+        "action": action,
+        "warehouse-id": warehouse_id_for_name(lakekeeper_id, warehouse_name),
+        "namespace": namespace_name
+    }
+}
+
+table_operation(lakekeeper_id, warehouse_name, namespace_name, table_name, action) := {
+    "table": {
+        "action": action,
+        "warehouse-id": warehouse_id_for_name(lakekeeper_id, warehouse_name),
+        "namespace": namespace_name,
+        "table": table_name
+    }
+}
+
+view_operation(lakekeeper_id, warehouse_name, namespace_name, view_name, action) := {
+    "view": {
+        "action": action,
+        "warehouse-id": warehouse_id_for_name(lakekeeper_id, warehouse_name),
+        "namespace": namespace_name,
+        "table": view_name
+    }
+}
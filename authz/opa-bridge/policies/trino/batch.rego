@@ -0,0 +1,96 @@
+# Filter operations send one batch request per catalog to Lakekeeper
+# instead of one request per schema, table or column.
+package trino
+
+import future.keywords.contains
+import future.keywords.if
+import future.keywords.in
+
+import data.lakekeeper
+import data.trino
+
+batched_operations := {"FilterSchemas", "FilterTables", "FilterColumns"}
+
+# ------------- FilterSchemas -------------
+# always allow "information_schema" schema
+batch contains i if {
+    input.action.operation == "FilterSchemas"
+    some i
+    input.action.filterResources[i].schema.schemaName == "information_schema"
+}
+
+batch contains i if {
+    input.action.operation == "FilterSchemas"
+    some i
+    schema := input.action.filterResources[i].schema
+    schema.schemaName in visible_schemas[schema.catalogName]
+}
+
+# Schemas per catalog for which the user has "get_metadata"
+visible_schemas[catalog_name] := visible if {
+    input.action.operation == "FilterSchemas"
+    some catalog_name in {r.schema.catalogName | some r in input.action.filterResources}
+    trino_catalog := trino.trino_catalog_by_name[catalog_name]
+    schemas := [schema_name | some schema_name in {r.schema.schemaName |
+        some r in input.action.filterResources
+        r.schema.catalogName == catalog_name
+        r.schema.schemaName != "information_schema"
+    }]
+    operations := [lakekeeper.namespace_operation(
+        trino_catalog.lakekeeper_id,
+        trino_catalog.lakekeeper_warehouse,
+        trino.namespace_for_schema(schema_name),
+        "get_metadata"
+    ) | some schema_name in schemas]
+    results := lakekeeper.batch_check(trino_catalog.lakekeeper_id, trino.lakekeeper_user_id, operations)
+    visible := {schema_name | some j, schema_name in schemas; results[j]}
+}
+
+# ------------- FilterTables & FilterColumns -------------
+batch contains i if {
+    input.action.operation in ["FilterTables", "FilterColumns"]
+    some i
+    table := input.action.filterResources[i].table
+    [table.schemaName, table.tableName] in visible_tables[table.catalogName]
+}
+
+# Filtering columns is done with a single table item, and many columns inside.
+# Columns are visible if their table is visible.
+batch contains i if {
+    input.action.operation == "FilterColumns"
+    count(input.action.filterResources) == 1
+    table := input.action.filterResources[0].table
+    [table.schemaName, table.tableName] in visible_tables[table.catalogName]
+    some i, _ in table.columns
+}
+
+# Tables and views per catalog for which the user has "get_metadata",
+# as [schema name, table name] pairs.
+visible_tables[catalog_name] := visible if {
+    input.action.operation in ["FilterTables", "FilterColumns"]
+    some catalog_name in {r.table.catalogName | some r in input.action.filterResources}
+    trino_catalog := trino.trino_catalog_by_name[catalog_name]
+    tables := [table | some table in {[r.table.schemaName, r.table.tableName] |
+        some r in input.action.filterResources
+        r.table.catalogName == catalog_name
+    }]
+    # Trino does not distinguish tables and views here. Check both.
+    operations := array.concat(
+        [lakekeeper.table_operation(
+            trino_catalog.lakekeeper_id,
+            trino_catalog.lakekeeper_warehouse,
+            trino.namespace_for_schema(table[0]),
+            table[1],
+            "get_metadata"
+        ) | some table in tables],
+        [lakekeeper.view_operation(
+            trino_catalog.lakekeeper_id,
+            trino_catalog.lakekeeper_warehouse,
+            trino.namespace_for_schema(table[0]),
+            table[1],
+            "get_metadata"
+        ) | some table in tables]
+    )
+    results := lakekeeper.batch_check(trino_catalog.lakekeeper_id, trino.lakekeeper_user_id, operations)
+    visible := {table | some j, table in tables; results[j]} | {table | some j, table in tables; results[count(tables) + j]}
+}
@@ -28,24 +28,10 @@ allow if {
 	trino.allow_view
 }
 
+# Filter operations in batched_operations are handled in batch.rego
 batch contains i if {
+    not input.action.operation in batched_operations
     some i
     raw_resource := input.action.filterResources[i]
     allow with input.action.resource as raw_resource
 }
-
-# Corner case: filtering columns is done with a single table item, and many columns inside
-# We cannot use our normal logic in other parts of the policy as they are based on sets
-# and we need to retain order
-batch contains i if {
-    some i
-    input.action.operation == "FilterColumns"
-    count(input.action.filterResources) == 1
-    raw_resource := input.action.filterResources[0]
-    count(raw_resource["table"]["columns"]) > 0
-    new_resources := [
-        object.union(raw_resource, {"table": {"column": column_name}})
-        | column_name := raw_resource["table"]["columns"][_]
-    ]
-    allow with input.action.resource as new_resources[i]
-}
\ No newline at end of file
@@ -21,8 +21,22 @@ pub struct S3SignResponse {
     pub headers: HashMap<String, Vec<String>>,
 }
 
+/// Multiple sign requests for objects of the same table.
+#[derive(Clone, Debug, PartialEq, Serialize, Deserialize, TypedBuilder)]
+pub struct S3SignBatchRequest {
+    pub requests: Vec<S3SignRequest>,
+}
+
+/// Signed requests in the order of the corresponding [`S3SignBatchRequest`].
+#[derive(Clone, Debug, PartialEq, Serialize, Deserialize, TypedBuilder)]
+pub struct S3SignBatchResponse {
+    pub responses: Vec<S3SignResponse>,
+}
+
 #[cfg(feature = "axum")]
 impl_into_response!(S3SignResponse);
+#[cfg(feature = "axum")]
+impl_into_response!(S3SignBatchResponse);
 
 mod http_method_serde {
     use std::str::FromStr;
@@ -74,6 +88,31 @@ mod tests {
         assert_eq!(sign_request, deserialized);
     }
 
+    #[test]
+    fn test_batch_request_de() {
+        let value = serde_json::json!({
+            "requests": [
+                {
+                    "region": "eu-central-1",
+                    "uri": "https://bucket.s3.eu-central-1.amazonaws.com/table/metadata/a.avro",
+                    "method": "GET",
+                    "headers": {},
+                },
+                {
+                    "region": "eu-central-1",
+                    "uri": "https://bucket.s3.eu-central-1.amazonaws.com/table/metadata/b.avro",
+                    "method": "HEAD",
+                    "headers": {},
+                    "body": null
+                }
+            ]
+        });
+        let batch: S3SignBatchRequest = serde_json::from_value(value).unwrap();
+        assert_eq!(batch.requests.len(), 2);
+        assert_eq!(batch.requests[1].method, http::Method::HEAD);
+        assert_eq!(batch.requests[0].body, None);
+    }
+
     #[test]
     fn test_http_method_de() {
         let method = "POST";
@@ -66,6 +66,7 @@ pub mod s3 {
             Signer, String, "s3.signer", "s3_signer";
             SignerUri, String, "s3.signer.uri", "s3_signer_uri";
             SignerEndpoint, String, "s3.signer.endpoint", "s3_signer_endpoint";
+            SignerBatchEndpoint, String, "s3.signer.batch-endpoint", "s3_signer_batch_endpoint";
          }
     );
 }
@@ -19,8 +19,8 @@ use lakekeeper::{
         endpoint_statistics::{EndpointStatisticsMessage, EndpointStatisticsTracker, FlushMode},
         event_publisher::{
             kafka::build_kafka_publisher_from_config, nats::build_nats_publisher_from_config,
-            CloudEventBackend, CloudEventsMessage, CloudEventsPublisher,
-            CloudEventsPublisherBackgroundTask, TracingPublisher,
+            outbox::CloudEventsOutboxRelay, CloudEventBackend, CloudEventsMessage,
+            CloudEventsPublisher, CloudEventsPublisherBackgroundTask, TracingPublisher,
         },
         health::ServiceHealthProvider,
         task_queue::TaskQueueRegistry,
@@ -303,6 +303,14 @@ async fn serve_inner<A: Authorizer, N: Authenticator + 'static>(
         tracing::info!("Running without publisher.");
     }
 
+    let outbox_relay = CONFIG.cloudevents_outbox.enabled.then(|| {
+        tracing::info!("Publishing change events through the outbox.");
+        CloudEventsOutboxRelay::<PostgresCatalog> {
+            catalog_state: catalog_state.clone(),
+            sinks: cloud_event_sinks.clone(),
+        }
+    });
+
     let x: CloudEventsPublisherBackgroundTask = CloudEventsPublisherBackgroundTask {
         source: cloud_events_rx,
         sinks: cloud_event_sinks,
@@ -381,6 +389,7 @@ async fn serve_inner<A: Authorizer, N: Authenticator + 'static>(
         };
     });
     let stats_handle = tokio::task::spawn(tracker.run());
+    let outbox_relay_handle = outbox_relay.map(|relay| tokio::task::spawn(relay.run()));
 
     let task_runner = task_queue_registry.task_queues_runner();
     tokio::select!(
@@ -395,6 +404,10 @@ async fn serve_inner<A: Authorizer, N: Authenticator + 'static>(
         .await?;
     cloud_events_tx.send(CloudEventsMessage::Shutdown).await?;
     publisher_handle.await?;
+    // Events of an interrupted batch stay in the outbox and are published after a restart.
+    if let Some(outbox_relay_handle) = outbox_relay_handle {
+        outbox_relay_handle.abort();
+    }
     stats_handle.await?;
     Ok(())
 }
@@ -0,0 +1,3 @@
+ALTER TYPE api_endpoints ADD VALUE 'sign-s3-batch-request-global';
+ALTER TYPE api_endpoints ADD VALUE 'sign-s3-batch-request-prefix';
+ALTER TYPE api_endpoints ADD VALUE 'sign-s3-batch-request-tabular';
@@ -0,0 +1,3 @@
+-- Tasks are claimed per warehouse in scheduling order, see `pick_tasks`.
+drop index if exists task_warehouse_queue_name_idx;
+create index task_warehouse_queue_name_idx on task (warehouse_id, queue_name, scheduled_for);
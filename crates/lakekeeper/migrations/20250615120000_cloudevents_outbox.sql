@@ -0,0 +1,19 @@
+-- Change events written in the transaction of the change, published by the outbox relay.
+create table cloudevents_outbox
+(
+    sequence_number  bigserial primary key,
+    event_id         text        not null,
+    event            jsonb       not null,
+    created_at       timestamptz not null default now(),
+    -- Number of times a relay claimed the event.
+    attempts         integer     not null default 0,
+    -- The event is claimed by a relay or waits for its next attempt until then.
+    leased_until     timestamptz,
+    -- Names of the sinks that already published the event.
+    published_to     text[]      not null default '{}',
+    -- Set once the event is given up on. Such events are kept for inspection.
+    dead_lettered_at timestamptz
+);
+
+create index cloudevents_outbox_pending_idx on cloudevents_outbox (sequence_number)
+    where dead_lettered_at is null;
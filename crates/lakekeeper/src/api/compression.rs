@@ -0,0 +1,170 @@
+use axum::{
+    body::HttpBody,
+    extract::{MatchedPath, Request},
+    middleware::Next,
+    response::Response,
+};
+use tower_http::compression::{
+    predicate::{NotForContentType, Predicate, SizeAbove},
+    CompressionLayer,
+};
+
+use crate::{
+    api::endpoints::{CatalogV1Endpoint, Endpoint},
+    config::{CompressionLevel, CompressionProfile},
+    CONFIG,
+};
+
+/// Compression class of a route. Each class has its own compression layer.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) enum RouteCompression {
+    Default,
+    /// Responses containing table or view metadata.
+    Metadata,
+    Disabled,
+}
+
+impl RouteCompression {
+    fn from_endpoint(endpoint: Option<Endpoint>) -> Self {
+        match endpoint {
+            Some(Endpoint::Sign(_)) if !CONFIG.response_compression.compress_sign_responses => {
+                Self::Disabled
+            }
+            Some(Endpoint::CatalogV1(
+                CatalogV1Endpoint::LoadTable
+                | CatalogV1Endpoint::UpdateTable
+                | CatalogV1Endpoint::CreateTable
+                | CatalogV1Endpoint::RegisterTable
+                | CatalogV1Endpoint::LoadView
+                | CatalogV1Endpoint::CreateView
+                | CatalogV1Endpoint::ReplaceView,
+            )) => Self::Metadata,
+            _ => Self::Default,
+        }
+    }
+}
+
+/// Marks responses with the [`RouteCompression`] of the matched route.
+/// Must be applied inside the compression layers.
+pub(crate) async fn route_compression_middleware_fn(request: Request, next: Next) -> Response {
+    let endpoint = request
+        .extensions()
+        .get::<MatchedPath>()
+        .and_then(|path| Endpoint::from_method_and_matched_path(request.method(), path.as_str()));
+    let mut response = next.run(request).await;
+    response
+        .extensions_mut()
+        .insert(RouteCompression::from_endpoint(endpoint));
+    response
+}
+
+/// Compresses responses of one [`RouteCompression`] class that are large enough.
+#[derive(Debug, Clone, Copy)]
+pub(crate) struct RoutePredicate {
+    route: RouteCompression,
+    size_above: SizeAbove,
+}
+
+impl Predicate for RoutePredicate {
+    fn should_compress<B>(&self, response: &http::Response<B>) -> bool
+    where
+        B: HttpBody,
+    {
+        let route = response
+            .extensions()
+            .get::<RouteCompression>()
+            .copied()
+            .unwrap_or(RouteCompression::Default);
+
+        CONFIG.response_compression.enabled
+            && route == self.route
+            && self.size_above.should_compress(response)
+            && NotForContentType::GRPC.should_compress(response)
+            && NotForContentType::IMAGES.should_compress(response)
+            && NotForContentType::SSE.should_compress(response)
+    }
+}
+
+impl From<CompressionLevel> for tower_http::CompressionLevel {
+    fn from(level: CompressionLevel) -> Self {
+        match level {
+            CompressionLevel::Fastest => Self::Fastest,
+            CompressionLevel::Default => Self::Default,
+            CompressionLevel::Best => Self::Best,
+        }
+    }
+}
+
+/// Compression layer for responses of the `route` class.
+pub(crate) fn compression_layer(route: RouteCompression) -> CompressionLayer<RoutePredicate> {
+    let config = &CONFIG.response_compression;
+    let CompressionProfile {
+        gzip,
+        deflate,
+        br,
+        zstd,
+        level,
+    } = if route == RouteCompression::Metadata {
+        &config.metadata
+    } else {
+        &config.default
+    };
+
+    CompressionLayer::new()
+        .gzip(*gzip)
+        .deflate(*deflate)
+        .br(*br)
+        .zstd(*zstd)
+        .quality((*level).into())
+        .compress_when(RoutePredicate {
+            route,
+            size_above: SizeAbove::new(config.min_size_bytes),
+        })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::api::endpoints::SignEndpoint;
+
+    #[test]
+    fn test_route_compression_from_endpoint() {
+        assert_eq!(
+            RouteCompression::from_endpoint(Some(CatalogV1Endpoint::LoadTable.into())),
+            RouteCompression::Metadata
+        );
+        assert_eq!(
+            RouteCompression::from_endpoint(Some(CatalogV1Endpoint::ListTables.into())),
+            RouteCompression::Default
+        );
+        assert_eq!(
+            RouteCompression::from_endpoint(Some(SignEndpoint::S3RequestPrefix.into())),
+            RouteCompression::Disabled
+        );
+        assert_eq!(
+            RouteCompression::from_endpoint(None),
+            RouteCompression::Default
+        );
+    }
+
+    #[test]
+    fn test_predicate_respects_route_and_size() {
+        let predicate = RoutePredicate {
+            route: RouteCompression::Default,
+            size_above: SizeAbove::new(1024),
+        };
+        let response = |size: usize, route: Option<RouteCompression>| {
+            let mut response = http::Response::new(axum::body::Body::from(vec![b'a'; size]));
+            if let Some(route) = route {
+                response.extensions_mut().insert(route);
+            }
+            response
+        };
+
+        assert!(predicate.should_compress(&response(2048, None)));
+        assert!(predicate.should_compress(&response(2048, Some(RouteCompression::Default))));
+        assert!(!predicate.should_compress(&response(100, Some(RouteCompression::Default))));
+        assert!(!predicate.should_compress(&response(2048, Some(RouteCompression::Metadata))));
+        assert!(!predicate.should_compress(&response(2048, Some(RouteCompression::Disabled))));
+    }
+}
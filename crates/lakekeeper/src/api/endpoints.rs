@@ -169,6 +169,9 @@ generate_endpoints! {
         S3RequestGlobal(POST, "/catalog/v1/aws/s3/sign"),
         S3RequestPrefix(POST, "/catalog/v1/{prefix}/v1/aws/s3/sign"),
         S3RequestTabular(POST, "/catalog/v1/signer/{prefix}/tabular-id/{tabular_id}/v1/aws/s3/sign"),
+        S3BatchRequestGlobal(POST, "/catalog/v1/aws/s3/sign/batch"),
+        S3BatchRequestPrefix(POST, "/catalog/v1/{prefix}/v1/aws/s3/sign/batch"),
+        S3BatchRequestTabular(POST, "/catalog/v1/signer/{prefix}/tabular-id/{tabular_id}/v1/aws/s3/sign/batch"),
     }
 
     enum ManagementV1 {
@@ -17,6 +17,7 @@ pub mod v1 {
     pub mod namespace;
     pub mod oauth;
     pub mod s3_signer;
+    pub(crate) mod table_response;
     pub mod tables;
     pub mod views;
 
@@ -24,7 +25,10 @@ pub mod v1 {
 
     pub use self::{
         namespace::{ListNamespacesQuery, NamespaceParameters, PaginationQuery},
-        tables::{DataAccess, ListTablesQuery, TableParameters},
+        tables::{
+            DataAccess, ListTablesQuery, LoadTableRequest, LoadTableResultOrNotModified,
+            LoadTableSnapshots, TableParameters,
+        },
         views::ViewParameters,
     };
     pub use crate::{
@@ -4,7 +4,9 @@ use axum::{
     routing::post,
     Extension, Json, Router,
 };
-use iceberg_ext::catalog::rest::{S3SignRequest, S3SignResponse};
+use iceberg_ext::catalog::rest::{
+    S3SignBatchRequest, S3SignBatchResponse, S3SignRequest, S3SignResponse,
+};
 
 use super::{ApiContext, Prefix, Result};
 use crate::request_metadata::RequestMetadata;
@@ -29,6 +31,18 @@ where
         state: ApiContext<S>,
         request_metadata: RequestMetadata,
     ) -> Result<S3SignResponse>;
+
+    /// Sign multiple S3 requests for objects of the same table.
+    /// Requests are sent to the `sign` routes above with a `/batch` suffix.
+    /// The table is resolved and authorized once for all requests.
+    /// Responses are returned in the order of the requests.
+    async fn sign_batch(
+        prefix: Option<Prefix>,
+        tabular_id: Option<uuid::Uuid>,
+        request: S3SignBatchRequest,
+        state: ApiContext<S>,
+        request_metadata: RequestMetadata,
+    ) -> Result<S3SignBatchResponse>;
 }
 
 pub fn router<I: Service<S>, S: crate::api::ThreadSafe>() -> Router<ApiContext<S>> {
@@ -77,4 +91,48 @@ pub fn router<I: Service<S>, S: crate::api::ThreadSafe>() -> Router<ApiContext<S
                 },
             ),
         )
+        .route(
+            "/aws/s3/sign/batch",
+            post(
+                |State(api_context): State<ApiContext<S>>,
+                 Extension(metadata): Extension<RequestMetadata>,
+                 Json(request): Json<S3SignBatchRequest>| {
+                    {
+                        I::sign_batch(None, None, request, api_context, metadata)
+                    }
+                },
+            ),
+        )
+        .route(
+            "/{prefix}/v1/aws/s3/sign/batch",
+            post(
+                |Path(prefix): Path<Prefix>,
+                 State(api_context): State<ApiContext<S>>,
+                 Extension(metadata): Extension<RequestMetadata>,
+                 Json(request): Json<S3SignBatchRequest>| {
+                    {
+                        I::sign_batch(Some(prefix), None, request, api_context, metadata)
+                    }
+                },
+            ),
+        )
+        .route(
+            "/signer/{prefix}/tabular-id/{tabular_id}/v1/aws/s3/sign/batch",
+            post(
+                |Path((prefix, tabular_id)): Path<(Prefix, uuid::Uuid)>,
+                 State(api_context): State<ApiContext<S>>,
+                 Extension(metadata): Extension<RequestMetadata>,
+                 Json(request): Json<S3SignBatchRequest>| {
+                    {
+                        I::sign_batch(
+                            Some(prefix),
+                            Some(tabular_id),
+                            request,
+                            api_context,
+                            metadata,
+                        )
+                    }
+                },
+            ),
+        )
 }
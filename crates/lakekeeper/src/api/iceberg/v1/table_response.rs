@@ -0,0 +1,485 @@
+use std::{
+    collections::HashMap,
+    io::Write as _,
+    sync::{Arc, LazyLock},
+};
+
+use axum::{
+    body::{Body, Bytes},
+    response::{IntoResponse, Response},
+};
+use axum_prometheus::metrics;
+use http::{header, HeaderMap, HeaderValue};
+use iceberg::spec::TableMetadata;
+use iceberg_ext::catalog::rest::StorageCredential;
+use serde::Serialize;
+
+use super::tables::LoadTableSnapshots;
+use crate::{api::LoadTableResult, config::CompressionLevel, CONFIG};
+
+const METRIC_CACHE_HITS: &str = "lakekeeper_load_table_response_cache_hits_total";
+const METRIC_CACHE_MISSES: &str = "lakekeeper_load_table_response_cache_misses_total";
+
+/// Content encodings for `loadTable` responses that are assembled from separately
+/// compressed parts. A gzip stream may consist of several members and a zstd stream
+/// of several frames, so the cached, compressed table metadata can be followed by the
+/// per-request fields, compressed on their own.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
+pub(crate) enum SplicedEncoding {
+    Gzip,
+    Zstd,
+}
+
+impl SplicedEncoding {
+    /// Encoding to use for a client sending `headers`. zstd is preferred over gzip
+    /// if the client accepts both with the same quality.
+    pub(crate) fn negotiate(headers: &HeaderMap) -> Option<Self> {
+        let config = &CONFIG.response_compression;
+        if !config.enabled {
+            return None;
+        }
+
+        let mut best: Option<(Self, u16)> = None;
+        for value in headers.get_all(header::ACCEPT_ENCODING) {
+            let Ok(value) = value.to_str() else {
+                continue;
+            };
+            for item in value.split(',') {
+                let mut parts = item.split(';');
+                let encoding = match parts.next().map(str::trim) {
+                    Some(e) if e.eq_ignore_ascii_case("zstd") && config.metadata.zstd => Self::Zstd,
+                    Some(e) if e.eq_ignore_ascii_case("gzip") && config.metadata.gzip => Self::Gzip,
+                    _ => continue,
+                };
+                let quality = parts
+                    .find_map(|p| p.trim().strip_prefix("q="))
+                    .map_or(Some(1000), parse_quality)
+                    .unwrap_or(0);
+                if quality == 0 {
+                    continue;
+                }
+                if best.map_or(true, |(best_encoding, best_quality)| {
+                    quality > best_quality
+                        || (quality == best_quality && best_encoding == Self::Gzip)
+                }) {
+                    best = Some((encoding, quality));
+                }
+            }
+        }
+        best.map(|(encoding, _)| encoding)
+    }
+
+    fn header_value(self) -> HeaderValue {
+        match self {
+            Self::Gzip => HeaderValue::from_static("gzip"),
+            Self::Zstd => HeaderValue::from_static("zstd"),
+        }
+    }
+
+    fn compress(self, payload: &[u8], level: CompressionLevel) -> std::io::Result<Vec<u8>> {
+        match self {
+            Self::Gzip => {
+                let level = match level {
+                    CompressionLevel::Fastest => 1,
+                    CompressionLevel::Default => 6,
+                    CompressionLevel::Best => 9,
+                };
+                let mut encoder =
+                    flate2::write::GzEncoder::new(Vec::new(), flate2::Compression::new(level));
+                encoder.write_all(payload)?;
+                encoder.finish()
+            }
+            Self::Zstd => {
+                let level = match level {
+                    CompressionLevel::Fastest => 1,
+                    CompressionLevel::Default => 3,
+                    CompressionLevel::Best => 19,
+                };
+                zstd::bulk::compress(payload, level)
+            }
+        }
+    }
+}
+
+/// Compress `payload` with `encoding`, or pass it through if `encoding` is `None`.
+fn encode(
+    encoding: Option<SplicedEncoding>,
+    payload: Vec<u8>,
+    level: CompressionLevel,
+) -> std::io::Result<Vec<u8>> {
+    match encoding {
+        Some(encoding) => encoding.compress(&payload, level),
+        None => Ok(payload),
+    }
+}
+
+/// Parse a quality value (`0` to `1` with up to three decimals) into thousandths.
+fn parse_quality(q: &str) -> Option<u16> {
+    let (integer, fraction) = q.trim().split_once('.').unwrap_or((q.trim(), ""));
+    if fraction.len() > 3 || !fraction.bytes().all(|b| b.is_ascii_digit()) {
+        return None;
+    }
+    let fraction = format!("{fraction:0<3}").parse::<u16>().ok()?;
+    match integer {
+        "0" => Some(fraction),
+        "1" if fraction == 0 => Some(1000),
+        _ => None,
+    }
+}
+
+/// The serialized table metadata only depends on the metadata file and on which
+/// snapshots are included, so entries never become stale.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+struct CacheKey {
+    table_uuid: uuid::Uuid,
+    metadata_location: String,
+    snapshots: LoadTableSnapshots,
+    /// `None` for the uncompressed JSON.
+    encoding: Option<SplicedEncoding>,
+}
+
+/// The serialized and possibly compressed head of a `loadTable` response.
+#[derive(Debug, Clone)]
+struct CachedHead {
+    body: Bytes,
+    /// Length of the uncompressed JSON.
+    json_len: usize,
+}
+
+static LOAD_TABLE_RESPONSE_CACHE: LazyLock<moka::future::Cache<CacheKey, CachedHead>> =
+    LazyLock::new(|| {
+        moka::future::Cache::builder()
+            .max_capacity(
+                CONFIG
+                    .cache
+                    .load_table_responses
+                    .max_size_mb
+                    .saturating_mul(1024 * 1024),
+            )
+            .weigher(|_key, value: &CachedHead| u32::try_from(value.body.len()).unwrap_or(u32::MAX))
+            .build()
+    });
+
+#[derive(Serialize)]
+#[serde(rename_all = "kebab-case")]
+struct LoadTableResultHead<'a> {
+    metadata_location: &'a str,
+    metadata: &'a TableMetadata,
+}
+
+#[derive(Serialize)]
+#[serde(rename_all = "kebab-case")]
+struct LoadTableResultTail<'a> {
+    #[serde(skip_serializing_if = "Option::is_none")]
+    config: Option<&'a HashMap<String, String>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    storage_credentials: Option<&'a Vec<StorageCredential>>,
+}
+
+/// `{"metadata-location":...,"metadata":{...}` - the object is left open.
+fn serialize_head(
+    metadata_location: &str,
+    metadata: &TableMetadata,
+) -> serde_json::Result<Vec<u8>> {
+    let mut head = serde_json::to_vec(&LoadTableResultHead {
+        metadata_location,
+        metadata,
+    })?;
+    head.pop();
+    Ok(head)
+}
+
+/// `,"config":{...},"storage-credentials":[...]}` - the rest of the object opened by the head.
+fn serialize_tail(
+    config: Option<&HashMap<String, String>>,
+    storage_credentials: Option<&Vec<StorageCredential>>,
+) -> serde_json::Result<Vec<u8>> {
+    let tail = serde_json::to_vec(&LoadTableResultTail {
+        config,
+        storage_credentials,
+    })?;
+    if tail.len() <= 2 {
+        return Ok(b"}".to_vec());
+    }
+    let mut spliced = Vec::with_capacity(tail.len());
+    spliced.push(b',');
+    spliced.extend_from_slice(&tail[1..]);
+    Ok(spliced)
+}
+
+/// Build a `loadTable` response, compressed with `encoding` if it is set and the
+/// response is at least `min_size_bytes` large.
+///
+/// The table metadata is serialized (and compressed) once per metadata location and
+/// cached. Only `config` and `storage-credentials`, which differ between requests,
+/// are serialized for every response and appended to the cached bytes.
+pub(crate) async fn cached_load_table_response(
+    result: LoadTableResult,
+    snapshots: LoadTableSnapshots,
+    encoding: Option<SplicedEncoding>,
+) -> Response {
+    let (metadata_location, metadata, config, storage_credentials) = match result {
+        LoadTableResult {
+            metadata_location: Some(metadata_location),
+            metadata,
+            config,
+            storage_credentials,
+        } => (metadata_location, metadata, config, storage_credentials),
+        staged @ LoadTableResult {
+            metadata_location: None,
+            ..
+        } => return staged.into_response(),
+    };
+
+    let key = CacheKey {
+        table_uuid: metadata.uuid(),
+        metadata_location,
+        snapshots,
+        encoding,
+    };
+    let metadata = Arc::new(metadata);
+    let head = if let Some(head) = LOAD_TABLE_RESPONSE_CACHE.get(&key).await {
+        metrics::counter!(METRIC_CACHE_HITS).increment(1);
+        Ok(head)
+    } else {
+        metrics::counter!(METRIC_CACHE_MISSES).increment(1);
+        let metadata = metadata.clone();
+        let metadata_location = key.metadata_location.clone();
+        LOAD_TABLE_RESPONSE_CACHE
+            .try_get_with(key.clone(), async move {
+                tokio::task::spawn_blocking(move || {
+                    let head = serialize_head(&metadata_location, &metadata)?;
+                    let json_len = head.len();
+                    let level = CONFIG.response_compression.metadata.level;
+                    encode(encoding, head, level).map(|body| CachedHead {
+                        body: body.into(),
+                        json_len,
+                    })
+                })
+                .await
+                .map_err(std::io::Error::other)?
+            })
+            .await
+    };
+    let tail = serialize_tail(config.as_ref(), storage_credentials.as_ref());
+    // Small responses are not compressed, like responses of other endpoints.
+    if let (Ok(head), Ok(tail), Some(_)) = (&head, &tail, encoding) {
+        if head.json_len + tail.len() < usize::from(CONFIG.response_compression.min_size_bytes) {
+            return LoadTableResult {
+                metadata_location: Some(key.metadata_location),
+                metadata: Arc::unwrap_or_clone(metadata),
+                config,
+                storage_credentials,
+            }
+            .into_response();
+        }
+    }
+    // The tail is small, compressing it inline is cheaper than moving it to another thread.
+    let tail = tail
+        .map_err(std::io::Error::from)
+        .and_then(|tail| encode(encoding, tail, CompressionLevel::Fastest));
+
+    match (head, tail) {
+        (Ok(head), Ok(tail)) => {
+            let mut body = Vec::with_capacity(head.body.len() + tail.len());
+            body.extend_from_slice(&head.body);
+            body.extend_from_slice(&tail);
+            let mut response = (
+                [(
+                    header::CONTENT_TYPE,
+                    HeaderValue::from_static("application/json"),
+                )],
+                Body::from(body),
+            )
+                .into_response();
+            if let Some(encoding) = encoding {
+                let headers = response.headers_mut();
+                headers.insert(header::CONTENT_ENCODING, encoding.header_value());
+                headers.insert(header::VARY, HeaderValue::from_static("accept-encoding"));
+            }
+            response
+        }
+        (head, tail) => {
+            tracing::warn!(
+                "Failed to build loadTable response from cache, serializing it directly. Head: {:?}, Tail: {:?}",
+                head.err(),
+                tail.err()
+            );
+            LoadTableResult {
+                metadata_location: Some(key.metadata_location),
+                metadata: Arc::unwrap_or_clone(metadata),
+                config,
+                storage_credentials,
+            }
+            .into_response()
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::io::Read as _;
+
+    use http_body_util::BodyExt as _;
+    use iceberg::spec::{
+        FormatVersion, Schema, SortOrder, TableMetadataBuilder, UnboundPartitionSpec,
+    };
+
+    use super::*;
+
+    fn table_metadata() -> TableMetadata {
+        TableMetadataBuilder::new(
+            Schema::builder().build().unwrap(),
+            UnboundPartitionSpec::builder().build(),
+            SortOrder::unsorted_order(),
+            "s3://bucket/table".to_string(),
+            FormatVersion::V2,
+            HashMap::new(),
+        )
+        .unwrap()
+        .build()
+        .unwrap()
+        .metadata
+    }
+
+    fn decode(encoding: Option<SplicedEncoding>, body: &[u8]) -> Vec<u8> {
+        let mut decoded = Vec::new();
+        match encoding {
+            None => decoded = body.to_vec(),
+            Some(SplicedEncoding::Gzip) => {
+                flate2::read::MultiGzDecoder::new(body)
+                    .read_to_end(&mut decoded)
+                    .unwrap();
+            }
+            Some(SplicedEncoding::Zstd) => decoded = zstd::stream::decode_all(body).unwrap(),
+        }
+        decoded
+    }
+
+    #[test]
+    fn test_spliced_body_equals_serialized_result() {
+        let metadata = table_metadata();
+        for (config, storage_credentials) in [
+            (None, None),
+            (
+                Some(HashMap::from([("k".to_string(), "v".to_string())])),
+                None,
+            ),
+            (
+                Some(HashMap::new()),
+                Some(vec![StorageCredential {
+                    prefix: "s3://bucket/table".to_string(),
+                    config: HashMap::from([("token".to_string(), "t".to_string())]),
+                }]),
+            ),
+        ] {
+            let mut spliced =
+                serialize_head("s3://bucket/table/metadata/1.json", &metadata).unwrap();
+            spliced.extend(serialize_tail(config.as_ref(), storage_credentials.as_ref()).unwrap());
+            let expected = serde_json::to_vec(&LoadTableResult {
+                metadata_location: Some("s3://bucket/table/metadata/1.json".to_string()),
+                metadata: metadata.clone(),
+                config,
+                storage_credentials,
+            })
+            .unwrap();
+            assert_eq!(
+                String::from_utf8(spliced).unwrap(),
+                String::from_utf8(expected).unwrap()
+            );
+        }
+    }
+
+    #[tokio::test]
+    async fn test_cached_response_decodes_to_result() {
+        let result = LoadTableResult {
+            metadata_location: Some(format!(
+                "s3://bucket/table/metadata/{}.json",
+                uuid::Uuid::now_v7()
+            )),
+            metadata: table_metadata(),
+            // Large enough to be compressed
+            config: Some(HashMap::from([(
+                "k".to_string(),
+                "v".repeat(usize::from(CONFIG.response_compression.min_size_bytes)),
+            )])),
+            storage_credentials: None,
+        };
+        for encoding in [
+            None,
+            Some(SplicedEncoding::Gzip),
+            Some(SplicedEncoding::Zstd),
+        ] {
+            // The second response is assembled from the cache
+            for _ in 0..2 {
+                let response =
+                    cached_load_table_response(result.clone(), LoadTableSnapshots::All, encoding)
+                        .await;
+                assert_eq!(
+                    response.headers().get(header::CONTENT_ENCODING),
+                    encoding.map(SplicedEncoding::header_value).as_ref()
+                );
+                let body = response.into_body().collect().await.unwrap().to_bytes();
+                let decoded: LoadTableResult =
+                    serde_json::from_slice(&decode(encoding, &body)).unwrap();
+                assert_eq!(decoded, result);
+            }
+        }
+    }
+
+    #[tokio::test]
+    async fn test_small_cached_response_is_not_compressed() {
+        let result = LoadTableResult {
+            metadata_location: Some(format!(
+                "s3://bucket/table/metadata/{}.json",
+                uuid::Uuid::now_v7()
+            )),
+            metadata: table_metadata(),
+            config: None,
+            storage_credentials: None,
+        };
+        assert!(
+            serde_json::to_vec(&result).unwrap().len()
+                < usize::from(CONFIG.response_compression.min_size_bytes)
+        );
+        for _ in 0..2 {
+            let response = cached_load_table_response(
+                result.clone(),
+                LoadTableSnapshots::All,
+                Some(SplicedEncoding::Gzip),
+            )
+            .await;
+            assert!(response.headers().get(header::CONTENT_ENCODING).is_none());
+            let body = response.into_body().collect().await.unwrap().to_bytes();
+            let decoded: LoadTableResult = serde_json::from_slice(&body).unwrap();
+            assert_eq!(decoded, result);
+        }
+    }
+
+    #[test]
+    fn test_parse_quality() {
+        assert_eq!(parse_quality("1"), Some(1000));
+        assert_eq!(parse_quality("1.000"), Some(1000));
+        assert_eq!(parse_quality("0.5"), Some(500));
+        assert_eq!(parse_quality("0.05"), Some(50));
+        assert_eq!(parse_quality("0"), Some(0));
+        assert_eq!(parse_quality("1.5"), None);
+        assert_eq!(parse_quality("0.1234"), None);
+        assert_eq!(parse_quality("x"), None);
+    }
+
+    #[test]
+    fn test_negotiate() {
+        let negotiate = |value: &'static str| {
+            let mut headers = HeaderMap::new();
+            headers.insert(header::ACCEPT_ENCODING, HeaderValue::from_static(value));
+            SplicedEncoding::negotiate(&headers)
+        };
+        assert_eq!(negotiate("gzip, deflate"), Some(SplicedEncoding::Gzip));
+        assert_eq!(negotiate("gzip, zstd"), Some(SplicedEncoding::Zstd));
+        assert_eq!(negotiate("zstd;q=0.5, gzip"), Some(SplicedEncoding::Gzip));
+        assert_eq!(negotiate("zstd;q=0, gzip;q=0"), None);
+        assert_eq!(negotiate("br, identity"), None);
+        assert_eq!(SplicedEncoding::negotiate(&HeaderMap::new()), None);
+    }
+}
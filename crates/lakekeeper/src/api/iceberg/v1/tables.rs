@@ -1,15 +1,19 @@
 use async_trait::async_trait;
 use axum::{
     extract::{Path, Query, State},
-    response::IntoResponse,
+    response::{IntoResponse, Response},
     routing::{get, post},
     Extension, Json, Router,
 };
-use http::{HeaderMap, StatusCode};
+use http::{header, HeaderMap, HeaderValue, StatusCode};
 use iceberg::TableIdent;
 use iceberg_ext::catalog::rest::LoadCredentialsResponse;
+use sha2::{Digest, Sha256};
 
-use super::{PageToken, PaginationQuery};
+use super::{
+    table_response::{cached_load_table_response, SplicedEncoding},
+    PageToken, PaginationQuery,
+};
 use crate::{
     api::{
         iceberg::{
@@ -21,6 +25,7 @@ use crate::{
         RenameTableRequest, Result,
     },
     request_metadata::RequestMetadata,
+    CONFIG,
 };
 
 #[derive(Debug, Clone, PartialEq, serde::Serialize, serde::Deserialize)]
@@ -82,10 +87,10 @@ where
     /// Load a table from the catalog
     async fn load_table(
         parameters: TableParameters,
-        data_access: DataAccess,
+        request: LoadTableRequest,
         state: ApiContext<S>,
         request_metadata: RequestMetadata,
-    ) -> Result<LoadTableResult>;
+    ) -> Result<LoadTableResultOrNotModified>;
 
     /// Load a table from the catalog
     async fn load_table_credentials(
@@ -205,10 +210,11 @@ pub fn router<I: TablesService<S>, S: crate::api::ThreadSafe>() -> Router<ApiCon
             // Load a table from the catalog
             get(
                 |Path((prefix, namespace, table)): Path<(Prefix, NamespaceIdentUrl, String)>,
+                 Query(query): Query<LoadTableQuery>,
                  State(api_context): State<ApiContext<S>>,
                  headers: HeaderMap,
-                 Extension(metadata): Extension<RequestMetadata>| {
-                    I::load_table(
+                 Extension(metadata): Extension<RequestMetadata>| async move {
+                    let result = I::load_table(
                         TableParameters {
                             prefix: Some(prefix),
                             table: TableIdent {
@@ -216,10 +222,26 @@ pub fn router<I: TablesService<S>, S: crate::api::ThreadSafe>() -> Router<ApiCon
                                 name: table,
                             },
                         },
-                        parse_data_access(&headers),
+                        LoadTableRequest {
+                            data_access: parse_data_access(&headers),
+                            etags: parse_if_none_match(&headers),
+                            snapshots: query.snapshots,
+                        },
                         api_context,
                         metadata,
                     )
+                    .await;
+                    match result {
+                        Ok(result) => {
+                            result
+                                .into_cached_response(
+                                    query.snapshots,
+                                    SplicedEncoding::negotiate(&headers),
+                                )
+                                .await
+                        }
+                        Err(e) => e.into_response(),
+                    }
                 },
             )
             // Commit updates to a table
@@ -388,6 +410,150 @@ pub(crate) fn parse_data_access(headers: &HeaderMap) -> DataAccess {
     }
 }
 
+#[derive(
+    Debug, Clone, Copy, PartialEq, Eq, Hash, Default, serde::Serialize, serde::Deserialize,
+)]
+#[serde(rename_all = "kebab-case")]
+pub enum LoadTableSnapshots {
+    /// Return all snapshots of the table.
+    #[default]
+    All,
+    /// Return only snapshots referenced by branches or tags.
+    Refs,
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Default, serde::Serialize, serde::Deserialize)]
+#[serde(rename_all = "camelCase")]
+pub struct LoadTableQuery {
+    /// The snapshots to return in the body of the metadata.
+    #[serde(default)]
+    pub snapshots: LoadTableSnapshots,
+}
+
+#[derive(Debug, Clone)]
+pub struct LoadTableRequest {
+    pub data_access: DataAccess,
+    /// Entity tags the client already holds (`If-None-Match`).
+    /// If the current table matches any of them, no metadata is returned.
+    pub etags: Vec<String>,
+    pub snapshots: LoadTableSnapshots,
+}
+
+impl Default for LoadTableRequest {
+    fn default() -> Self {
+        Self {
+            data_access: DataAccess::not_specified(),
+            etags: Vec::new(),
+            snapshots: LoadTableSnapshots::All,
+        }
+    }
+}
+
+#[derive(Debug)]
+#[allow(clippy::large_enum_variant)]
+pub enum LoadTableResultOrNotModified {
+    LoadTableResult(LoadTableResult),
+    /// The table has not changed since the client last loaded it.
+    /// Contains the etag of the current version.
+    NotModifiedResponse(String),
+}
+
+impl LoadTableResultOrNotModified {
+    /// Like `into_response`, but re-uses cached serialized table metadata and
+    /// compresses a loaded table with `encoding` if it is set.
+    async fn into_cached_response(
+        self,
+        snapshots: LoadTableSnapshots,
+        encoding: Option<SplicedEncoding>,
+    ) -> Response {
+        match self {
+            LoadTableResultOrNotModified::LoadTableResult(result) => {
+                let etag = result
+                    .metadata_location
+                    .as_deref()
+                    .map(|location| create_etag(location, snapshots));
+                let response = if CONFIG.cache.load_table_responses.enabled {
+                    cached_load_table_response(result, snapshots, encoding).await
+                } else {
+                    result.into_response()
+                };
+                with_etag(response, etag)
+            }
+            not_modified => not_modified.into_response(),
+        }
+    }
+}
+
+fn with_etag(mut response: Response, etag: Option<String>) -> Response {
+    if let Some(etag) = etag.and_then(|e| HeaderValue::from_str(&e).ok()) {
+        response.headers_mut().insert(header::ETAG, etag);
+    }
+    response
+}
+
+/// A loaded table is returned without an `ETag`, as the entity tag depends on the
+/// snapshots mode of the request. Use `into_cached_response` to include it.
+impl IntoResponse for LoadTableResultOrNotModified {
+    fn into_response(self) -> Response {
+        match self {
+            LoadTableResultOrNotModified::LoadTableResult(result) => result.into_response(),
+            LoadTableResultOrNotModified::NotModifiedResponse(etag) => {
+                let mut response = StatusCode::NOT_MODIFIED.into_response();
+                if let Ok(etag) = HeaderValue::from_str(&etag) {
+                    response.headers_mut().insert(header::ETAG, etag);
+                }
+                response
+            }
+        }
+    }
+}
+
+/// Create a weak entity tag for a table.
+/// Every commit writes a new metadata file, so the metadata location
+/// uniquely identifies the version of a table. The body of the response also
+/// depends on the requested `snapshots`, so they are part of the tag.
+/// The tag is weak, as the same table is returned in different content encodings
+/// and with per-request credentials.
+#[must_use]
+pub fn create_etag(metadata_location: &str, snapshots: LoadTableSnapshots) -> String {
+    let snapshots = match snapshots {
+        LoadTableSnapshots::All => "all",
+        LoadTableSnapshots::Refs => "refs",
+    };
+    let digest = Sha256::new()
+        .chain_update(metadata_location.as_bytes())
+        .chain_update([0])
+        .chain_update(snapshots.as_bytes())
+        .finalize();
+    format!("W/\"{digest:x}\"")
+}
+
+/// Parse all entity tags from `If-None-Match` headers.
+/// Weak validators are reduced to their opaque tag, as `If-None-Match`
+/// uses weak comparison.
+pub(crate) fn parse_if_none_match(headers: &HeaderMap) -> Vec<String> {
+    headers
+        .get_all(header::IF_NONE_MATCH)
+        .iter()
+        .filter_map(|v| v.to_str().ok())
+        .flat_map(|v| v.split(','))
+        .map(str::trim)
+        .filter(|v| !v.is_empty())
+        .map(|v| v.strip_prefix("W/").unwrap_or(v).to_string())
+        .collect()
+}
+
+/// Check if any of the client's entity tags matches the current `etag`,
+/// using weak comparison.
+#[must_use]
+pub(crate) fn etag_matches(etags: &[String], etag: &str) -> bool {
+    fn opaque_tag(etag: &str) -> &str {
+        etag.strip_prefix("W/").unwrap_or(etag)
+    }
+    let etag = opaque_tag(etag);
+    etags.iter().any(|e| e == "*" || opaque_tag(e) == etag)
+}
+
 #[cfg(test)]
 mod test {
     use std::str::FromStr;
@@ -420,4 +586,80 @@ mod test {
         assert!(data_access.vended_credentials);
         assert!(!data_access.remote_signing);
     }
+
+    #[test]
+    fn test_create_etag_is_weak_and_stable() {
+        use super::LoadTableSnapshots::All;
+
+        let etag = super::create_etag("s3://bucket/table/metadata/00000-a.metadata.json", All);
+        assert!(etag.starts_with("W/\"") && etag.ends_with('"'));
+        assert_eq!(etag.len(), 68);
+        assert_eq!(
+            etag,
+            super::create_etag("s3://bucket/table/metadata/00000-a.metadata.json", All)
+        );
+        assert_ne!(
+            etag,
+            super::create_etag("s3://bucket/table/metadata/00001-b.metadata.json", All)
+        );
+    }
+
+    #[test]
+    fn test_create_etag_depends_on_snapshots() {
+        let location = "s3://bucket/table/metadata/00000-a.metadata.json";
+        assert_ne!(
+            super::create_etag(location, super::LoadTableSnapshots::All),
+            super::create_etag(location, super::LoadTableSnapshots::Refs)
+        );
+    }
+
+    #[test]
+    fn test_parse_if_none_match() {
+        let headers = http::header::HeaderMap::new();
+        assert!(super::parse_if_none_match(&headers).is_empty());
+
+        let mut headers = http::header::HeaderMap::new();
+        headers.append(
+            http::header::IF_NONE_MATCH,
+            http::header::HeaderValue::from_static("\"abc\", W/\"def\""),
+        );
+        headers.append(
+            http::header::IF_NONE_MATCH,
+            http::header::HeaderValue::from_static("\"ghi\""),
+        );
+        let etags = super::parse_if_none_match(&headers);
+        assert_eq!(etags, vec!["\"abc\"", "\"def\"", "\"ghi\""]);
+        assert!(super::etag_matches(&etags, "\"def\""));
+        assert!(!super::etag_matches(&etags, "\"xyz\""));
+        assert!(super::etag_matches(&["*".to_string()], "\"xyz\""));
+        // Weak comparison
+        assert!(super::etag_matches(&etags, "W/\"abc\""));
+        assert!(super::etag_matches(&["W/\"abc\"".to_string()], "W/\"abc\""));
+    }
+
+    #[test]
+    fn test_not_modified_response_has_no_body() {
+        use axum::response::IntoResponse;
+
+        let response =
+            super::LoadTableResultOrNotModified::NotModifiedResponse("\"abc\"".to_string())
+                .into_response();
+        assert_eq!(response.status(), http::StatusCode::NOT_MODIFIED);
+        assert_eq!(
+            response.headers().get(http::header::ETAG).unwrap(),
+            "\"abc\""
+        );
+    }
+
+    #[test]
+    fn test_load_table_query_snapshots() {
+        let query: super::LoadTableQuery = serde_json::from_str("{}").unwrap();
+        assert_eq!(query.snapshots, super::LoadTableSnapshots::All);
+        let query: super::LoadTableQuery =
+            serde_json::from_value(serde_json::json!({"snapshots": "refs"})).unwrap();
+        assert_eq!(query.snapshots, super::LoadTableSnapshots::Refs);
+        let query: super::LoadTableQuery =
+            serde_json::from_value(serde_json::json!({"snapshots": "all"})).unwrap();
+        assert_eq!(query.snapshots, super::LoadTableSnapshots::All);
+    }
 }
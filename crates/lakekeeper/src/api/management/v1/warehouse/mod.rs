@@ -30,6 +30,7 @@ use crate::{
     request_metadata::RequestMetadata,
     service::{
         authz::{Authorizer, CatalogProjectAction, CatalogWarehouseAction},
+        event_publisher::{change_events, outbox::write_change_events},
         secrets::SecretStore,
         task_queue::TaskFilter,
         Catalog, ListFlags, NamespaceId, State, TableId, TabularId, Transaction,
@@ -815,6 +816,17 @@ pub trait Service<C: Catalog, A: Authorizer, S: SecretStore> {
             transaction.transaction(),
         )
         .await?;
+        write_change_events::<C, _>(
+            || {
+                change_events::undrop_tabulars(
+                    warehouse_id,
+                    &undrop_tabular_responses,
+                    &request_metadata,
+                )
+            },
+            transaction.transaction(),
+        )
+        .await?;
         transaction.commit().await?;
 
         context
@@ -1,6 +1,8 @@
 pub mod iceberg;
 pub mod management;
 
+#[cfg(feature = "router")]
+pub(crate) mod compression;
 pub(crate) mod endpoints;
 #[cfg(feature = "router")]
 pub mod router;
@@ -7,13 +7,13 @@ use http::{header, HeaderValue, Method};
 use limes::Authenticator;
 use tower::ServiceBuilder;
 use tower_http::{
-    catch_panic::CatchPanicLayer, compression::CompressionLayer, cors::AllowOrigin,
-    sensitive_headers::SetSensitiveHeadersLayer, timeout::TimeoutLayer, trace, trace::TraceLayer,
-    ServiceBuilderExt,
+    catch_panic::CatchPanicLayer, cors::AllowOrigin, sensitive_headers::SetSensitiveHeadersLayer,
+    timeout::TimeoutLayer, trace, trace::TraceLayer, ServiceBuilderExt,
 };
 
 use crate::{
     api::{
+        compression::{compression_layer, route_compression_middleware_fn, RouteCompression},
         iceberg::v1::new_v1_full_router,
         management::v1::{api_doc as v1_api_doc, ApiServer},
         shutdown_signal, ApiContext,
@@ -164,13 +164,15 @@ pub fn new_full_router<
         .layer(axum::middleware::from_fn(
             create_request_metadata_with_trace_and_project_fn,
         ))
+        .layer(axum::middleware::from_fn(route_compression_middleware_fn))
         .layer(
             ServiceBuilder::new()
                 .set_x_request_id(MakeRequestUuid7)
                 .layer(SetSensitiveHeadersLayer::new([
                     axum::http::header::AUTHORIZATION,
                 ]))
-                .layer(CompressionLayer::new())
+                .layer(compression_layer(RouteCompression::Metadata))
+                .layer(compression_layer(RouteCompression::Default))
                 .layer(
                     TraceLayer::new_for_http()
                         .on_failure(())
@@ -0,0 +1,122 @@
+use std::{
+    collections::HashMap,
+    sync::{Arc, LazyLock, Mutex, Weak},
+};
+
+use axum_prometheus::metrics;
+use tokio::sync::OwnedMutexGuard;
+
+use crate::{service::TableId, CONFIG};
+
+const METRIC_COMMIT_QUEUE_WAITS: &str = "lakekeeper_table_commit_queue_waits_total";
+
+type TableLock = tokio::sync::Mutex<()>;
+
+/// One lock per table that currently has commits in flight on this instance.
+/// Entries are removed once the last commit holding or waiting for them finishes.
+static TABLE_COMMIT_LOCKS: LazyLock<Mutex<HashMap<TableId, Weak<TableLock>>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
+pub(super) fn is_enabled() -> bool {
+    CONFIG.commit_queue.enabled
+}
+
+/// Position in the commit queue of a set of tables. Commits to these tables
+/// from other requests on this instance wait until the guard is dropped.
+#[derive(Debug)]
+pub(super) struct TableCommitGuard {
+    table_ids: Vec<TableId>,
+    guards: Vec<OwnedMutexGuard<()>>,
+}
+
+/// Wait until all previously queued commits to any of `table_ids` finished.
+///
+/// Waiters are served in FIFO order. Locks are acquired in table id order,
+/// so multi-table transactions can't deadlock each other.
+pub(super) async fn enqueue(table_ids: impl IntoIterator<Item = TableId>) -> TableCommitGuard {
+    let mut table_ids = table_ids.into_iter().collect::<Vec<_>>();
+    table_ids.sort_unstable();
+    table_ids.dedup();
+
+    let locks = {
+        let mut all_locks = TABLE_COMMIT_LOCKS.lock().expect("Mutex poisoned");
+        table_ids
+            .iter()
+            .map(|table_id| {
+                if let Some(lock) = all_locks.get(table_id).and_then(Weak::upgrade) {
+                    lock
+                } else {
+                    let lock = Arc::new(TableLock::new(()));
+                    all_locks.insert(*table_id, Arc::downgrade(&lock));
+                    lock
+                }
+            })
+            .collect::<Vec<_>>()
+    };
+
+    let mut guards = Vec::with_capacity(locks.len());
+    for lock in locks {
+        let guard = match lock.clone().try_lock_owned() {
+            Ok(guard) => guard,
+            Err(_) => {
+                metrics::counter!(METRIC_COMMIT_QUEUE_WAITS).increment(1);
+                lock.lock_owned().await
+            }
+        };
+        guards.push(guard);
+    }
+
+    TableCommitGuard { table_ids, guards }
+}
+
+impl Drop for TableCommitGuard {
+    fn drop(&mut self) {
+        // Release the locks first, so that unused entries can be detected.
+        self.guards.clear();
+        if let Ok(mut all_locks) = TABLE_COMMIT_LOCKS.lock() {
+            for table_id in &self.table_ids {
+                if all_locks
+                    .get(table_id)
+                    .is_some_and(|lock| lock.strong_count() == 0)
+                {
+                    all_locks.remove(table_id);
+                }
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::time::Duration;
+
+    use super::*;
+
+    #[tokio::test]
+    async fn test_commits_to_same_table_are_serialized() {
+        let table_id = TableId::new_random();
+        let other_table_id = TableId::new_random();
+        let guard = enqueue([table_id]).await;
+
+        // Other tables are not blocked
+        let other = tokio::time::timeout(Duration::from_millis(100), enqueue([other_table_id]))
+            .await
+            .expect("Commit to another table must not wait");
+        drop(other);
+
+        let waiting = tokio::spawn(enqueue([other_table_id, table_id]));
+        tokio::time::sleep(Duration::from_millis(50)).await;
+        assert!(!waiting.is_finished());
+
+        drop(guard);
+        let guard = tokio::time::timeout(Duration::from_secs(1), waiting)
+            .await
+            .expect("Commit must proceed once the table is released")
+            .unwrap();
+        drop(guard);
+
+        let all_locks = TABLE_COMMIT_LOCKS.lock().unwrap();
+        assert!(!all_locks.contains_key(&table_id));
+        assert!(!all_locks.contains_key(&other_table_id));
+    }
+}
@@ -9,6 +9,7 @@ use iceberg_ext::catalog::rest::{ErrorModel, IcebergErrorResponse};
 use super::{io::IoError, CommonMetadata};
 
 const METADATA_COMPRESSION: &str = "write.metadata.compression-codec";
+const ZSTD_LEVEL: i32 = 3;
 
 #[derive(thiserror::Error, Debug)]
 #[error("Unsupported compression codec: {0}")]
@@ -24,46 +25,69 @@ impl From<UnsupportedCompressionCodec> for IcebergErrorResponse {
     }
 }
 
-#[derive(Debug, Clone, Copy, Default)]
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
 pub enum CompressionCodec {
     None,
     #[default]
     Gzip,
+    Zstd,
 }
 
 impl CompressionCodec {
-    pub async fn compress(self, payload: Vec<u8>) -> Result<Vec<u8>, IoError> {
-        match self {
-            CompressionCodec::None => Ok(payload),
-            CompressionCodec::Gzip => tokio::task::spawn_blocking(move || {
-                let mut compressed_metadata = GzEncoder::new(Vec::new(), Compression::default());
-                compressed_metadata
-                    .write_all(&payload)
-                    .map_err(|e| IoError::FileCompression(Box::new(e)))?;
-
-                compressed_metadata
-                    .finish()
-                    .map_err(|e| IoError::FileCompression(Box::new(e)))
-            })
-            .await
-            .unwrap_or_else(|e| Err(IoError::FileCompression(Box::new(e)))),
+    /// Decompress `payload` on the blocking thread pool.
+    pub async fn decompress(self, payload: Vec<u8>) -> Result<Vec<u8>, IoError> {
+        if self == CompressionCodec::None {
+            return Ok(payload);
         }
+        tokio::task::spawn_blocking(move || self.decompress_blocking(&payload))
+            .await
+            .unwrap_or_else(|e| Err(IoError::FileDecompression(Box::new(e))))
     }
 
-    pub async fn decompress(self, payload: Vec<u8>) -> Result<Vec<u8>, IoError> {
+    fn decompress_blocking(self, payload: &[u8]) -> Result<Vec<u8>, IoError> {
         match self {
-            CompressionCodec::None => Ok(payload),
-            CompressionCodec::Gzip => tokio::task::spawn_blocking(move || {
+            CompressionCodec::None => Ok(payload.to_vec()),
+            CompressionCodec::Gzip => {
                 let mut decompressed_metadata = Vec::new();
-                let mut decoder = flate2::read::GzDecoder::new(payload.as_slice());
+                let mut decoder = flate2::read::GzDecoder::new(payload);
                 decoder
                     .read_to_end(&mut decompressed_metadata)
-                    .map_err(|e| IoError::FileCompression(Box::new(e)))?;
+                    .map_err(|e| IoError::FileDecompression(Box::new(e)))?;
 
                 Ok(decompressed_metadata)
-            })
-            .await
-            .unwrap_or_else(|e| Err(IoError::FileDecompression(Box::new(e)))),
+            }
+            CompressionCodec::Zstd => zstd::stream::decode_all(payload)
+                .map_err(|e| IoError::FileDecompression(Box::new(e))),
+        }
+    }
+
+    /// Compress everything `write` writes into `sink`. Blocks the current thread.
+    pub(crate) fn encode_into<W: Write>(
+        self,
+        sink: W,
+        write: impl FnOnce(&mut dyn Write) -> Result<(), IoError>,
+    ) -> Result<W, IoError> {
+        match self {
+            CompressionCodec::None => {
+                let mut sink = sink;
+                write(&mut sink)?;
+                Ok(sink)
+            }
+            CompressionCodec::Gzip => {
+                let mut encoder = GzEncoder::new(sink, Compression::default());
+                write(&mut encoder)?;
+                encoder
+                    .finish()
+                    .map_err(|e| IoError::FileCompression(Box::new(e)))
+            }
+            CompressionCodec::Zstd => {
+                let mut encoder = zstd::stream::Encoder::new(sink, ZSTD_LEVEL)
+                    .map_err(|e| IoError::FileCompression(Box::new(e)))?;
+                write(&mut encoder)?;
+                encoder
+                    .finish()
+                    .map_err(|e| IoError::FileCompression(Box::new(e)))
+            }
         }
     }
 
@@ -71,9 +95,22 @@ impl CompressionCodec {
         match self {
             CompressionCodec::None => "",
             CompressionCodec::Gzip => ".gz",
+            CompressionCodec::Zstd => ".zstd",
         }
     }
 
+    /// Codec of a metadata file, derived from the extension of its `location`.
+    pub fn from_metadata_location(location: &str) -> Self {
+        [CompressionCodec::Gzip, CompressionCodec::Zstd]
+            .into_iter()
+            .find(|codec| {
+                location
+                    .strip_suffix(".metadata.json")
+                    .is_some_and(|l| l.ends_with(codec.as_file_extension()))
+            })
+            .unwrap_or(CompressionCodec::None)
+    }
+
     pub fn try_from_properties(
         properties: &HashMap<String, String>,
     ) -> Result<Self, UnsupportedCompressionCodec> {
@@ -82,6 +119,7 @@ impl CompressionCodec {
             .map(String::as_str)
             .map_or(Ok(Self::default()), |value| match value {
                 "gzip" => Ok(Self::Gzip),
+                "zstd" => Ok(Self::Zstd),
                 "none" => Ok(Self::None),
                 unknown => Err(UnsupportedCompressionCodec(unknown.into())),
             })
@@ -102,3 +140,53 @@ impl CompressionCodec {
         Self::try_from_properties(metadata.properties())
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[tokio::test]
+    async fn test_roundtrip() {
+        let payload = br#"{"format-version":2,"location":"s3://bucket/table"}"#.repeat(100);
+        for codec in [
+            CompressionCodec::None,
+            CompressionCodec::Gzip,
+            CompressionCodec::Zstd,
+        ] {
+            let encoded = codec
+                .encode_into(Vec::new(), |w| {
+                    w.write_all(&payload)
+                        .map_err(|e| IoError::FileCompression(Box::new(e)))
+                })
+                .unwrap();
+            if codec != CompressionCodec::None {
+                assert!(encoded.len() < payload.len());
+            }
+            assert_eq!(codec.decompress(encoded).await.unwrap(), payload);
+        }
+    }
+
+    #[test]
+    fn test_from_metadata_location() {
+        for codec in [
+            CompressionCodec::None,
+            CompressionCodec::Gzip,
+            CompressionCodec::Zstd,
+        ] {
+            let location = format!(
+                "s3://bucket/table/metadata/00001-0195cf7a-5b5e-7b22-9d59-a0a1a7f1e5e4{}.metadata.json",
+                codec.as_file_extension()
+            );
+            assert_eq!(CompressionCodec::from_metadata_location(&location), codec);
+        }
+    }
+
+    #[test]
+    fn test_zstd_from_properties() {
+        let properties = HashMap::from([(METADATA_COMPRESSION.to_string(), "zstd".to_string())]);
+        assert_eq!(
+            CompressionCodec::try_from_properties(&properties).unwrap(),
+            CompressionCodec::Zstd
+        );
+    }
+}
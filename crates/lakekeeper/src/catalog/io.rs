@@ -1,7 +1,16 @@
-use futures::{stream::BoxStream, StreamExt};
-use iceberg::{io::FileIO, spec::TableMetadata};
+use std::{
+    io::{BufWriter, Write},
+    sync::Arc,
+};
+
+use futures::{stream::BoxStream, StreamExt, TryStreamExt};
+use iceberg::{
+    io::{FileIO, FileWrite as _, OutputFile},
+    spec::TableMetadata,
+};
 use iceberg_ext::{catalog::rest::IcebergErrorResponse, configs::Location};
 use serde::Serialize;
+use tokio::sync::mpsc;
 
 use super::compression_codec::CompressionCodec;
 use crate::{
@@ -11,6 +20,7 @@ use crate::{
         reduce_scheme_string as reduce_azure_scheme,
         ALTERNATIVE_PROTOCOLS as AZURE_ALTERNATIVE_PROTOCOLS,
     },
+    utils::rate_limit::RateLimiter,
 };
 
 fn normalize_location(location: &Location) -> String {
@@ -33,32 +43,147 @@ fn normalize_location(location: &Location) -> String {
     }
 }
 
+/// Size of the chunks uploaded to object storage. Each chunk is a part of a
+/// multipart upload, so it must not be smaller than 5 MiB (the S3 minimum).
+const METADATA_WRITE_CHUNK_SIZE: usize = 8 * 1024 * 1024;
+/// Number of chunks buffered between serialization and upload.
+const METADATA_WRITE_BUFFERED_CHUNKS: usize = 2;
+
+/// Serialize, compress and upload `metadata` as a stream of chunks.
+///
+/// The serialized file is never held in memory as a whole. Retries restart
+/// serialization from the beginning instead of holding a copy of the file.
+/// Files that fit into a single chunk are uploaded with a single request, so that
+/// only larger files start a multipart upload.
 pub(crate) async fn write_metadata_file(
     metadata_location: &Location,
-    metadata: impl Serialize,
+    metadata: impl Serialize + Send + Sync + 'static,
     compression_codec: CompressionCodec,
     file_io: &FileIO,
 ) -> Result<(), IoError> {
     let metadata_location = normalize_location(metadata_location);
     tracing::debug!("Writing metadata file to {}", metadata_location);
-
-    let metadata_file = file_io
-        .new_output(metadata_location)
-        .map_err(IoError::FileCreation)?;
-
-    let buf = serde_json::to_vec(&metadata).map_err(IoError::Serialization)?;
-
-    let metadata_bytes = compression_codec.compress(buf).await?;
+    let metadata = Arc::new(metadata);
 
     retry_fn(|| async {
-        metadata_file
-            .write(metadata_bytes.clone().into())
+        let output = file_io
+            .new_output(&metadata_location)
+            .map_err(IoError::FileCreation)?;
+
+        let (chunk_tx, mut chunk_rx) = mpsc::channel(METADATA_WRITE_BUFFERED_CHUNKS);
+        let metadata = metadata.clone();
+        let serialization = tokio::task::spawn_blocking(move || {
+            compression_codec
+                .encode_into(ChunkWriter::new(chunk_tx), |w| {
+                    let mut w = BufWriter::new(w);
+                    serde_json::to_writer(&mut w, &*metadata).map_err(IoError::Serialization)?;
+                    w.flush().map_err(|e| IoError::FileCompression(Box::new(e)))
+                })?
+                .finish()
+        });
+
+        let first_chunk = chunk_rx.recv().await.unwrap_or_default();
+        let Some(second_chunk) = chunk_rx.recv().await else {
+            // The channel is closed, so serialization is done.
+            serialization
+                .await
+                .unwrap_or_else(|e| Err(IoError::FileCompression(Box::new(e))))?;
+            return output
+                .write(first_chunk.into())
+                .await
+                .map_err(|e| IoError::FileWrite(Box::new(e)));
+        };
+
+        let upload_result =
+            upload_chunks(&output, [first_chunk, second_chunk], &mut chunk_rx).await;
+        // Stops serialization early if the upload failed
+        drop(chunk_rx);
+        let serialization_result = serialization
             .await
-            .map_err(IoError::FileWriterCreation)
+            .unwrap_or_else(|e| Err(IoError::FileCompression(Box::new(e))));
+        upload_result?;
+        serialization_result
     })
     .await
 }
 
+/// Upload `first_chunks` followed by the chunks received from `chunk_rx` as a multipart
+/// upload.
+///
+/// `FileIO` can't abort a multipart upload. The parts of a failed upload remain in the
+/// bucket until they are removed by the lifecycle rule of the bucket for incomplete
+/// multipart uploads.
+async fn upload_chunks(
+    output: &OutputFile,
+    first_chunks: [Vec<u8>; 2],
+    chunk_rx: &mut mpsc::Receiver<Vec<u8>>,
+) -> Result<(), IoError> {
+    let mut writer = output.writer().await.map_err(IoError::FileWriterCreation)?;
+    for chunk in first_chunks {
+        writer
+            .write(chunk.into())
+            .await
+            .map_err(|e| IoError::FileWrite(Box::new(e)))?;
+    }
+    while let Some(chunk) = chunk_rx.recv().await {
+        writer
+            .write(chunk.into())
+            .await
+            .map_err(|e| IoError::FileWrite(Box::new(e)))?;
+    }
+    writer.close().await.map_err(IoError::FileClose)
+}
+
+/// Collects written bytes into chunks of [`METADATA_WRITE_CHUNK_SIZE`] and sends
+/// them to the upload. Must be used from a blocking thread.
+struct ChunkWriter {
+    buf: Vec<u8>,
+    chunk_tx: mpsc::Sender<Vec<u8>>,
+}
+
+impl ChunkWriter {
+    fn new(chunk_tx: mpsc::Sender<Vec<u8>>) -> Self {
+        Self {
+            // Allocated as data is written, so that small files don't take a whole chunk.
+            buf: Vec::new(),
+            chunk_tx,
+        }
+    }
+
+    fn send_chunk(&mut self) -> std::io::Result<()> {
+        let chunk = std::mem::take(&mut self.buf);
+        self.chunk_tx
+            .blocking_send(chunk)
+            .map_err(|_| std::io::Error::new(std::io::ErrorKind::BrokenPipe, "Upload aborted"))
+    }
+
+    /// Send the last, possibly smaller, chunk.
+    fn finish(mut self) -> Result<(), IoError> {
+        if self.buf.is_empty() {
+            return Ok(());
+        }
+        self.send_chunk()
+            .map_err(|e| IoError::FileWrite(Box::new(e)))
+    }
+}
+
+impl Write for ChunkWriter {
+    fn write(&mut self, data: &[u8]) -> std::io::Result<usize> {
+        let n = data.len().min(METADATA_WRITE_CHUNK_SIZE - self.buf.len());
+        self.buf.extend_from_slice(&data[..n]);
+        if self.buf.len() == METADATA_WRITE_CHUNK_SIZE {
+            self.send_chunk()?;
+        }
+        Ok(n)
+    }
+
+    fn flush(&mut self) -> std::io::Result<()> {
+        // Chunks are only sent once they are full, so that all but the last part
+        // of the upload have the same size.
+        Ok(())
+    }
+}
+
 pub(crate) async fn delete_file(file_io: &FileIO, location: &Location) -> Result<(), IoError> {
     let location = normalize_location(location);
 
@@ -88,13 +213,9 @@ pub(crate) async fn read_file(file_io: &FileIO, file: &Location) -> Result<Vec<u
     })
     .await?;
 
-    if file.as_str().ends_with(".gz.metadata.json") {
-        let codec = CompressionCodec::Gzip;
-        let content = codec.decompress(content).await?;
-        Ok(content)
-    } else {
-        Ok(content)
-    }
+    CompressionCodec::from_metadata_location(file.as_str())
+        .decompress(content)
+        .await
 }
 
 pub(crate) async fn read_metadata_file(
@@ -125,8 +246,52 @@ pub(crate) async fn remove_all(file_io: &FileIO, location: &Location) -> Result<
     .await
 }
 
+/// Delete `paths` one by one with at most `concurrency` deletions in flight.
+/// Each deletion first waits for a slot of `rate_limit`.
+///
+/// Prefer [`remove_all`] where deletes need not be limited, as it lets the storage
+/// backend batch deletions.
+pub(crate) async fn delete_files(
+    file_io: &FileIO,
+    paths: &[String],
+    concurrency: usize,
+    rate_limit: &RateLimiter,
+) -> Result<(), IoError> {
+    futures::stream::iter(paths)
+        .map(|path| async move {
+            rate_limit.acquire().await;
+            retry_fn(move || async move {
+                file_io
+                    .clone()
+                    .delete(path)
+                    .await
+                    .map_err(IoError::FileDelete)
+            })
+            .await
+        })
+        .buffer_unordered(concurrency.max(1))
+        .try_collect()
+        .await
+}
+
 pub(crate) const DEFAULT_LIST_LOCATION_PAGE_SIZE: usize = 1000;
 
+/// Listed paths may be relative to the root of the bucket or container of `location`.
+fn absolute_path(location: &str, path: &str) -> String {
+    if path.contains("://") {
+        return path.to_string();
+    }
+    let root_end = location
+        .find("://")
+        .and_then(|scheme_end| {
+            location[scheme_end + 3..]
+                .find('/')
+                .map(|i| scheme_end + 3 + i)
+        })
+        .unwrap_or(location.len());
+    format!("{}/{}", &location[..root_end], path.trim_start_matches('/'))
+}
+
 pub(crate) async fn list_location<'a>(
     file_io: &'a FileIO,
     location: &'a Location,
@@ -147,10 +312,10 @@ pub(crate) async fn list_location<'a>(
             })
     })
     .await?
-    .map(|res| match res {
+    .map(move |res| match res {
         Ok(entries) => Ok(entries
             .into_iter()
-            .map(|it| it.path().to_string())
+            .map(|it| absolute_path(&location, it.path()))
             .collect()),
         Err(e) => Err(IoError::List(e)),
     });
@@ -226,11 +391,78 @@ impl From<IoError> for IcebergErrorResponse {
 
 #[cfg(test)]
 mod tests {
+    use std::str::FromStr;
+
     use needs_env_var::needs_env_var;
 
     use super::*;
     use crate::service::storage::{StorageCredential, StorageProfile};
 
+    #[test]
+    fn test_chunk_writer_sends_full_chunks() {
+        let (chunk_tx, mut chunk_rx) = mpsc::channel(3);
+        let mut writer = ChunkWriter::new(chunk_tx);
+        writer
+            .write_all(&vec![1; METADATA_WRITE_CHUNK_SIZE * 2 + 10])
+            .unwrap();
+        writer.flush().unwrap();
+        writer.finish().unwrap();
+
+        let mut chunk_sizes = vec![];
+        while let Ok(chunk) = chunk_rx.try_recv() {
+            chunk_sizes.push(chunk.len());
+        }
+        assert_eq!(
+            chunk_sizes,
+            vec![METADATA_WRITE_CHUNK_SIZE, METADATA_WRITE_CHUNK_SIZE, 10]
+        );
+    }
+
+    #[tokio::test]
+    async fn test_write_metadata_file_single_and_multiple_chunks() {
+        let file_io = iceberg::io::FileIOBuilder::new("memory").build().unwrap();
+        for (name, size) in [("small", 10), ("large", METADATA_WRITE_CHUNK_SIZE * 2)] {
+            let location =
+                Location::from_str(&format!("memory:///metadata/{name}.metadata.json")).unwrap();
+            let metadata = serde_json::json!({"data": "a".repeat(size)});
+            write_metadata_file(
+                &location,
+                metadata.clone(),
+                CompressionCodec::None,
+                &file_io,
+            )
+            .await
+            .unwrap();
+            let content = read_file(&file_io, &location).await.unwrap();
+            assert_eq!(
+                serde_json::from_slice::<serde_json::Value>(&content).unwrap(),
+                metadata
+            );
+        }
+    }
+
+    #[test]
+    fn test_absolute_path() {
+        assert_eq!(
+            absolute_path(
+                "s3://bucket/warehouse/table/",
+                "warehouse/table/data/1.parquet"
+            ),
+            "s3://bucket/warehouse/table/data/1.parquet"
+        );
+        assert_eq!(
+            absolute_path(
+                "s3://bucket/warehouse/table/",
+                "s3://bucket/warehouse/table/data/1.parquet"
+            ),
+            "s3://bucket/warehouse/table/data/1.parquet"
+        );
+        assert_eq!(
+            absolute_path("gs://bucket/", "/table/metadata.json"),
+            "gs://bucket/table/metadata.json"
+        );
+    }
+
     #[allow(dead_code)]
     async fn test_remove_all(cred: StorageCredential, profile: StorageProfile) {
         async fn list_simple(file_io: &FileIO, location: &Location) -> Option<Vec<String>> {
@@ -1,3 +1,4 @@
+mod commit_queue;
 pub(crate) mod commit_tables;
 pub(crate) mod compression_codec;
 mod config;
@@ -6,6 +7,7 @@ mod metrics;
 pub(crate) mod namespace;
 #[cfg(feature = "s3-signer")]
 mod s3_signer;
+mod single_flight;
 pub(crate) mod tables;
 pub(crate) mod tabular;
 pub(crate) mod views;
@@ -70,7 +72,9 @@ pub(crate) async fn maybe_get_secret<S: SecretStore>(
     state: &S,
 ) -> Result<Option<StorageCredential>, IcebergErrorResponse> {
     if let Some(secret_id) = secret {
-        Ok(Some(state.get_secret_by_id(secret_id).await?.secret))
+        Ok(Some(
+            crate::service::secrets::get_storage_credential(state, secret_id).await?,
+        ))
     } else {
         Ok(None)
     }
@@ -0,0 +1,248 @@
+use std::{
+    collections::HashMap,
+    future::Future,
+    hash::Hash,
+    sync::{Arc, Mutex, PoisonError},
+};
+
+use futures::{
+    future::{BoxFuture, Shared},
+    FutureExt,
+};
+use iceberg_ext::catalog::rest::{ErrorModel, IcebergErrorResponse};
+
+use crate::service::Result;
+
+type SharedResult<V> =
+    Shared<BoxFuture<'static, std::result::Result<V, Arc<IcebergErrorResponse>>>>;
+
+/// Coalesces concurrent executions of the same operation.
+///
+/// While an operation for a key is in flight, further callers with the same key
+/// wait for its result instead of starting their own. Results are not retained
+/// once the operation finished - the next caller starts a new operation.
+///
+/// Operations run on their own task, so they complete and release what they hold
+/// even if all callers are cancelled.
+#[derive(Debug)]
+pub(crate) struct SingleFlight<K, V> {
+    in_flight: Arc<Mutex<HashMap<K, SharedResult<V>>>>,
+}
+
+impl<K, V> Default for SingleFlight<K, V> {
+    fn default() -> Self {
+        Self {
+            in_flight: Arc::new(Mutex::new(HashMap::new())),
+        }
+    }
+}
+
+impl<K, V> SingleFlight<K, V>
+where
+    K: Hash + Eq + Clone + Send + Sync + 'static,
+    V: Clone + Send + Sync + 'static,
+{
+    /// Run `operation`, or wait for the operation already in flight for `key`.
+    /// Returns the result and whether an operation of another caller was joined.
+    ///
+    /// `operation` must not depend on the caller, as its result is shared with all callers.
+    /// If another operation is joined, `operation` is dropped before waiting for its result,
+    /// releasing anything it captured.
+    pub(crate) async fn run<F, Fut>(&self, key: K, operation: F) -> (Result<V>, bool)
+    where
+        F: FnOnce() -> Fut,
+        Fut: Future<Output = Result<V>> + Send + 'static,
+    {
+        let mut operation = Some(operation);
+        let (shared, joined) = {
+            let mut in_flight = self.in_flight.lock().expect("Mutex poisoned");
+            if let Some(shared) = in_flight.get(&key) {
+                (shared.clone(), true)
+            } else {
+                let operation = operation.take().expect("operation is only taken once");
+                let fut = operation();
+                let guard = RemoveOnDrop {
+                    in_flight: self.in_flight.clone(),
+                    key: key.clone(),
+                };
+                // The entry is inserted below before the lock is released, so the
+                // task can't remove it before it exists.
+                let task = tokio::spawn(async move {
+                    let _guard = guard;
+                    fut.await.map_err(Arc::new)
+                });
+                let shared = async move {
+                    task.await.unwrap_or_else(|e| {
+                        Err(Arc::new(
+                            ErrorModel::internal(
+                                "Coalesced operation failed",
+                                "SingleFlightTaskFailed",
+                                Some(Box::new(e)),
+                            )
+                            .into(),
+                        ))
+                    })
+                }
+                .boxed()
+                .shared();
+                in_flight.insert(key, shared.clone());
+                (shared, false)
+            }
+        };
+        drop(operation);
+
+        (shared.await.map_err(|e| clone_error(&e)), joined)
+    }
+}
+
+/// Removes the entry of an operation once it finished, panicked or was aborted.
+struct RemoveOnDrop<K: Hash + Eq, V> {
+    in_flight: Arc<Mutex<HashMap<K, SharedResult<V>>>>,
+    key: K,
+}
+
+impl<K: Hash + Eq, V> Drop for RemoveOnDrop<K, V> {
+    fn drop(&mut self) {
+        // Entries are only inserted if the key is absent, so this removes the
+        // entry of this operation.
+        self.in_flight
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .remove(&self.key);
+    }
+}
+
+/// Error sources can't be cloned. They are dropped from the copies handed to each caller.
+fn clone_error(error: &IcebergErrorResponse) -> IcebergErrorResponse {
+    let ErrorModel {
+        message,
+        r#type,
+        code,
+        source: _,
+        stack,
+    } = &error.error;
+    IcebergErrorResponse {
+        error: ErrorModel {
+            message: message.clone(),
+            r#type: r#type.clone(),
+            code: *code,
+            source: None,
+            stack: stack.clone(),
+        },
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    use super::*;
+
+    #[tokio::test]
+    async fn test_concurrent_calls_are_coalesced() {
+        let single_flight = SingleFlight::<&str, usize>::default();
+        let calls = Arc::new(AtomicUsize::new(0));
+        let (tx, rx) = tokio::sync::oneshot::channel::<()>();
+
+        let leader = single_flight.run("key", || {
+            let calls = calls.clone();
+            async move {
+                rx.await.ok();
+                Ok(calls.fetch_add(1, Ordering::SeqCst) + 1)
+            }
+        });
+        let follower = single_flight.run("key", || async { Ok(100) });
+        let release = async {
+            tokio::task::yield_now().await;
+            tx.send(()).ok();
+        };
+        let ((leader, leader_joined), (follower, follower_joined), ()) =
+            tokio::join!(leader, follower, release);
+
+        assert_eq!(leader.unwrap(), 1);
+        assert_eq!(follower.unwrap(), 1);
+        assert!(!leader_joined);
+        assert!(follower_joined);
+
+        // Finished operations are not retained
+        let (result, joined) = single_flight.run("key", || async { Ok(2) }).await;
+        assert_eq!(result.unwrap(), 2);
+        assert!(!joined);
+    }
+
+    #[tokio::test]
+    async fn test_joined_operation_is_dropped_before_waiting() {
+        let single_flight = SingleFlight::<&str, usize>::default();
+        let (tx, rx) = tokio::sync::oneshot::channel::<()>();
+        let (follower_tx, follower_rx) = tokio::sync::oneshot::channel::<()>();
+
+        let leader = single_flight.run("key", || async move {
+            // Only completes once the follower released its operation
+            follower_rx.await.ok();
+            rx.await.ok();
+            Ok(1)
+        });
+        let follower = single_flight.run("key", move || async move {
+            follower_tx.send(()).ok();
+            Ok(100)
+        });
+        let release = async {
+            tokio::task::yield_now().await;
+            tx.send(()).ok();
+        };
+        let ((leader, _), (follower, follower_joined), ()) =
+            tokio::join!(leader, follower, release);
+
+        assert_eq!(leader.unwrap(), 1);
+        assert_eq!(follower.unwrap(), 1);
+        assert!(follower_joined);
+    }
+
+    #[tokio::test]
+    async fn test_cancelled_leader_does_not_leak_its_entry() {
+        let single_flight = SingleFlight::<&str, usize>::default();
+        let (tx, rx) = tokio::sync::oneshot::channel::<()>();
+        let (done_tx, done_rx) = tokio::sync::oneshot::channel::<()>();
+
+        let leader = single_flight.run("key", || async move {
+            rx.await.ok();
+            done_tx.send(()).ok();
+            Ok(1)
+        });
+        // The leader is cancelled before anyone joins
+        assert!(
+            tokio::time::timeout(std::time::Duration::from_millis(10), leader)
+                .await
+                .is_err()
+        );
+        assert!(single_flight.in_flight.lock().unwrap().contains_key("key"));
+
+        // The operation still runs to completion and removes its entry
+        tx.send(()).unwrap();
+        done_rx.await.unwrap();
+        tokio::time::timeout(std::time::Duration::from_secs(5), async {
+            while single_flight.in_flight.lock().unwrap().contains_key("key") {
+                tokio::task::yield_now().await;
+            }
+        })
+        .await
+        .expect("Entry of the cancelled leader was not removed");
+
+        let (result, joined) = single_flight.run("key", || async { Ok(2) }).await;
+        assert_eq!(result.unwrap(), 2);
+        assert!(!joined);
+    }
+
+    #[tokio::test]
+    async fn test_errors_are_shared() {
+        let single_flight = SingleFlight::<&str, usize>::default();
+        let (result, _) = single_flight
+            .run("key", || async {
+                Err(ErrorModel::not_found("Table not found", "NoSuchTableException", None).into())
+            })
+            .await;
+        let error = result.unwrap_err();
+        assert_eq!(error.error.code, 404);
+        assert_eq!(error.error.r#type, "NoSuchTableException");
+    }
+}
@@ -1,13 +1,15 @@
 use std::{
     collections::{HashMap, HashSet},
     str::FromStr as _,
-    sync::Arc,
+    sync::{Arc, LazyLock},
 };
 
+use axum_prometheus::metrics;
 use futures::FutureExt;
 use fxhash::FxHashSet;
 use http::StatusCode;
 use iceberg::{
+    io::FileIO,
     spec::{
         FormatVersion, MetadataLog, SchemaId, SortOrder, TableMetadata, TableMetadataBuildResult,
         TableMetadataBuilder, UnboundPartitionSpec, PROPERTY_FORMAT_VERSION,
@@ -24,20 +26,25 @@ use serde::Serialize;
 use uuid::Uuid;
 
 use super::{
+    commit_queue,
     commit_tables::apply_commit,
     io::{delete_file, read_metadata_file, write_metadata_file},
     maybe_get_secret,
     namespace::{authorized_namespace_ident_to_id, validate_namespace_ident},
-    require_warehouse_id, CatalogServer,
+    require_warehouse_id,
+    single_flight::SingleFlight,
+    CatalogServer,
 };
 use crate::{
     api::{
         iceberg::{
             types::DropParams,
             v1::{
+                tables::{create_etag, etag_matches},
                 ApiContext, CommitTableRequest, CommitTableResponse, CommitTransactionRequest,
                 CreateTableRequest, DataAccess, ErrorModel, ListTablesQuery, ListTablesResponse,
-                LoadTableResult, NamespaceParameters, PaginationQuery, Prefix,
+                LoadTableRequest, LoadTableResult, LoadTableResultOrNotModified,
+                LoadTableSnapshots, NamespaceParameters, PaginationQuery, Prefix,
                 RegisterTableRequest, RenameTableRequest, Result, TableIdent, TableParameters,
             },
         },
@@ -53,6 +60,7 @@ use crate::{
             TableUuid,
         },
         contract_verification::{ContractVerification, ContractVerificationOutcome},
+        event_publisher::{change_events, outbox::write_change_events},
         secrets::SecretStore,
         storage::{StorageLocations as _, StoragePermissions, StorageProfile, ValidationError},
         task_queue::{
@@ -71,6 +79,24 @@ const PROPERTY_METADATA_DELETE_AFTER_COMMIT_ENABLED: &str =
 const PROPERTY_METADATA_DELETE_AFTER_COMMIT_ENABLED_DEFAULT: bool = false;
 
 pub(crate) const CONCURRENT_UPDATE_ERROR_TYPE: &str = "ConcurrentUpdateError";
+
+const METRIC_LOAD_TABLE_COALESCED: &str = "lakekeeper_load_table_coalesced_total";
+
+/// Identifies a version of a table as returned by `load_table`.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+struct LoadTableKey {
+    warehouse_id: WarehouseId,
+    table_id: TableId,
+    metadata_location: String,
+    include_deleted: bool,
+    snapshots: LoadTableSnapshots,
+}
+
+/// Loads from the catalog that are currently in flight, shared by concurrent
+/// `load_table` requests for the same table version.
+static LOAD_TABLE_FLIGHTS: LazyLock<
+    SingleFlight<LoadTableKey, Arc<HashMap<TableId, CatalogLoadTableResult>>>,
+> = LazyLock::new(SingleFlight::default);
 pub(crate) const MAX_RETRIES_ON_CONCURRENT_UPDATE: usize = 2;
 
 #[async_trait::async_trait]
@@ -221,12 +247,8 @@ impl<C: Catalog, A: Authorizer + Clone, S: SecretStore>
         .await?;
 
         // We don't commit the transaction yet, first we need to write the metadata file.
-        let storage_secret = if let Some(secret_id) = warehouse.storage_secret_id {
-            let secret_state = state.v1_state.secrets;
-            Some(secret_state.get_secret_by_id(secret_id).await?.secret)
-        } else {
-            None
-        };
+        let storage_secret =
+            maybe_get_secret(warehouse.storage_secret_id, &state.v1_state.secrets).await?;
 
         let file_io = storage_profile.file_io(storage_secret.as_ref()).await?;
         retry_fn(|| async {
@@ -262,11 +284,12 @@ impl<C: Catalog, A: Authorizer + Clone, S: SecretStore>
         })
         .await??;
 
+        let table_metadata = Arc::new(table_metadata);
         if let Some(metadata_location) = &metadata_location {
-            let compression_codec = CompressionCodec::try_from_metadata(&table_metadata)?;
+            let compression_codec = CompressionCodec::try_from_metadata(table_metadata.as_ref())?;
             write_metadata_file(
                 metadata_location,
-                &table_metadata,
+                table_metadata.clone(),
                 compression_codec,
                 &file_io,
             )
@@ -297,7 +320,7 @@ impl<C: Catalog, A: Authorizer + Clone, S: SecretStore>
 
         let load_table_result = LoadTableResult {
             metadata_location: metadata_location.as_ref().map(ToString::to_string),
-            metadata: table_metadata.clone(),
+            metadata: table_metadata.as_ref().clone(),
             config: Some(config.config.into()),
             storage_credentials,
         };
@@ -306,6 +329,20 @@ impl<C: Catalog, A: Authorizer + Clone, S: SecretStore>
             .create_table(&request_metadata, TableId::from(*tabular_id), namespace_id)
             .await?;
 
+        write_change_events::<C, _>(
+            || {
+                [change_events::create_table(
+                    warehouse_id,
+                    &parameters,
+                    &request,
+                    &table_metadata,
+                    &request_metadata,
+                )]
+            },
+            t.transaction(),
+        )
+        .await?;
+
         // Metadata file written, now we can commit the transaction
         t.commit().await?;
 
@@ -321,7 +358,7 @@ impl<C: Catalog, A: Authorizer + Clone, S: SecretStore>
                 warehouse_id,
                 parameters,
                 Arc::new(request),
-                Arc::new(table_metadata),
+                table_metadata,
                 metadata_location.map(Arc::new),
                 data_access,
                 Arc::new(request_metadata),
@@ -461,6 +498,20 @@ impl<C: Catalog, A: Authorizer + Clone, S: SecretStore>
                 .await?;
         }
 
+        write_change_events::<C, _>(
+            || {
+                [change_events::register_table(
+                    warehouse_id,
+                    &parameters,
+                    &request,
+                    &table_metadata,
+                    &request_metadata,
+                )]
+            },
+            t_write.transaction(),
+        )
+        .await?;
+
         // Commit the transaction
         t_write.commit().await?;
 
@@ -509,10 +560,10 @@ impl<C: Catalog, A: Authorizer + Clone, S: SecretStore>
     #[allow(clippy::too_many_lines)]
     async fn load_table(
         parameters: TableParameters,
-        data_access: DataAccess,
+        request: LoadTableRequest,
         state: ApiContext<State<A, C, S>>,
         request_metadata: RequestMetadata,
-    ) -> Result<LoadTableResult> {
+    ) -> Result<LoadTableResultOrNotModified> {
         // ------------------- VALIDATIONS -------------------
         let TableParameters { prefix, table } = parameters;
         let warehouse_id = require_warehouse_id(prefix)?;
@@ -548,14 +599,48 @@ impl<C: Catalog, A: Authorizer + Clone, S: SecretStore>
         .await?;
 
         // ------------------- BUSINESS LOGIC -------------------
-        let mut metadatas = C::load_tables(
-            warehouse_id,
-            vec![tabular_details.ident],
-            list_flags.include_deleted,
-            t.transaction(),
-        )
-        .await?;
-        t.commit().await?;
+        let LoadTableRequest {
+            data_access,
+            etags,
+            snapshots,
+        } = request;
+
+        // The metadata location changes with every commit. If the client
+        // already holds the current version, skip loading the metadata.
+        if let Some(metadata_location) = tabular_details.metadata_location.as_deref() {
+            let etag = create_etag(metadata_location, snapshots);
+            if etag_matches(&etags, &etag) {
+                t.commit().await?;
+                return Ok(LoadTableResultOrNotModified::NotModifiedResponse(etag));
+            }
+        }
+
+        // Concurrent requests for the same table version share a single load.
+        // Authorization above and credential vending below remain per request.
+        let mut metadatas = if let Some(metadata_location) = tabular_details.metadata_location {
+            load_table_coalesced::<C>(
+                LoadTableKey {
+                    warehouse_id,
+                    table_id: tabular_details.ident,
+                    metadata_location,
+                    include_deleted: list_flags.include_deleted,
+                    snapshots,
+                },
+                t,
+            )
+            .await?
+        } else {
+            let metadatas = C::load_tables(
+                warehouse_id,
+                vec![tabular_details.ident],
+                list_flags.include_deleted,
+                snapshots,
+                t.transaction(),
+            )
+            .await?;
+            t.commit().await?;
+            metadatas
+        };
         let CatalogLoadTableResult {
             table_id,
             namespace_id: _,
@@ -607,7 +692,9 @@ impl<C: Catalog, A: Authorizer + Clone, S: SecretStore>
             storage_credentials,
         };
 
-        Ok(load_table_result)
+        Ok(LoadTableResultOrNotModified::LoadTableResult(
+            load_table_result,
+        ))
     }
 
     async fn load_table_credentials(
@@ -705,7 +792,7 @@ impl<C: Catalog, A: Authorizer + Clone, S: SecretStore>
 
         Ok(CommitTableResponse {
             metadata_location: item.new_metadata_location.to_string(),
-            metadata: item.new_metadata,
+            metadata: Arc::unwrap_or_clone(item.new_metadata),
             config: None,
         })
     }
@@ -768,6 +855,19 @@ impl<C: Catalog, A: Authorizer + Clone, S: SecretStore>
             .await?
             .into_result()?;
 
+        write_change_events::<C, _>(
+            || {
+                [change_events::drop_table(
+                    warehouse_id,
+                    &parameters,
+                    TableId::from(*table_id),
+                    &request_metadata,
+                )]
+            },
+            t.transaction(),
+        )
+        .await?;
+
         match warehouse.tabular_delete_profile {
             TabularDeleteProfile::Hard {} => {
                 let location = C::drop_table(table_id, force, t.transaction()).await?;
@@ -948,6 +1048,19 @@ impl<C: Catalog, A: Authorizer + Clone, S: SecretStore>
             .await?
             .into_result()?;
 
+        write_change_events::<C, _>(
+            || {
+                [change_events::rename_table(
+                    warehouse_id,
+                    source_table_id,
+                    &request,
+                    &request_metadata,
+                )]
+            },
+            t.transaction(),
+        )
+        .await?;
+
         t.commit().await?;
 
         state
@@ -1138,6 +1251,14 @@ async fn commit_tables_internal<C: Catalog, A: Authorizer + Clone, S: SecretStor
         }
     }
 
+    // Commits to the same table on this instance are queued instead of racing each other.
+    // Retries are then only needed for conflicts with other instances.
+    let mut queue_guard = if commit_queue::is_enabled() {
+        Some(commit_queue::enqueue(table_ids.values().copied()).await)
+    } else {
+        None
+    };
+
     // Start the retry loop
     let mut attempt = 0;
     loop {
@@ -1147,11 +1268,14 @@ async fn commit_tables_internal<C: Catalog, A: Authorizer + Clone, S: SecretStor
             table_ids.clone(),
             &state,
             include_deleted,
+            &request_metadata,
         )
         .await;
 
         match result {
             Ok(commits) => {
+                // Let the next queued commit proceed
+                queue_guard.take();
                 // Fire hooks
                 state
                     .v1_state
@@ -1192,18 +1316,21 @@ async fn try_commit_tables<C: Catalog, A: Authorizer + Clone, S: SecretStore>(
     table_ids: Arc<HashMap<TableIdent, TableId>>,
     state: &ApiContext<State<A, C, S>>,
     include_deleted: bool,
+    request_metadata: &RequestMetadata,
 ) -> Result<Vec<CommitContext>> {
-    let mut transaction = C::Transaction::begin_write(state.v1_state.catalog.clone()).await?;
-    let warehouse = C::require_warehouse(warehouse_id, transaction.transaction()).await?;
-
-    // Load old metadata
+    // Load old metadata. No locks are held while the new metadata files are written;
+    // the metadata locations read here are swapped atomically when committing.
+    let mut t_read = C::Transaction::begin_read(state.v1_state.catalog.clone()).await?;
+    let warehouse = C::require_warehouse(warehouse_id, t_read.transaction()).await?;
     let mut previous_metadatas = C::load_tables(
         warehouse_id,
         table_ids.values().copied(),
         include_deleted,
-        transaction.transaction(),
+        LoadTableSnapshots::All,
+        t_read.transaction(),
     )
     .await?;
+    t_read.commit().await?;
 
     let mut expired_metadata_logs: Vec<MetadataLog> = vec![];
 
@@ -1264,7 +1391,7 @@ async fn try_commit_tables<C: Catalog, A: Authorizer + Clone, S: SecretStore>(
                 .saturating_sub(previous_table_metadata.table_metadata.metadata_log().len());
 
             Ok(CommitContext {
-                new_metadata,
+                new_metadata: Arc::new(new_metadata),
                 new_metadata_location,
                 new_compression_codec,
                 previous_metadata_location: previous_table_metadata.metadata_location,
@@ -1276,14 +1403,6 @@ async fn try_commit_tables<C: Catalog, A: Authorizer + Clone, S: SecretStore>(
         })
         .collect::<Result<Vec<_>>>()?;
 
-    // Commit changes in DB
-    C::commit_table_transaction(
-        warehouse_id,
-        commits.iter().map(CommitContext::commit),
-        transaction.transaction(),
-    )
-    .await?;
-
     // Check contract verification
     let futures = commits.iter().map(|c| {
         state
@@ -1298,32 +1417,63 @@ async fn try_commit_tables<C: Catalog, A: Authorizer + Clone, S: SecretStore>(
         .map(ContractVerificationOutcome::into_result)
         .collect::<Result<Vec<()>, ErrorModel>>()?;
 
-    // We don't commit the transaction yet, first we need to write the metadata file.
     let storage_secret =
         maybe_get_secret(warehouse.storage_secret_id, &state.v1_state.secrets).await?;
-
-    // Write metadata files
     let file_io = warehouse
         .storage_profile
         .file_io(storage_secret.as_ref())
         .await?;
 
-    let write_futures: Vec<_> = commits
-        .iter()
-        .map(|commit| {
-            write_metadata_file(
-                &commit.new_metadata_location,
-                &commit.new_metadata,
-                commit.new_compression_codec,
-                &file_io,
-            )
-        })
-        .collect();
-    futures::future::try_join_all(write_futures).await?;
+    // Write metadata files before the write transaction is opened
+    let write_results = futures::future::join_all(commits.iter().map(|commit| {
+        write_metadata_file(
+            &commit.new_metadata_location,
+            commit.new_metadata.clone(),
+            commit.new_compression_codec,
+            &file_io,
+        )
+    }))
+    .await;
+    if write_results.iter().any(Result::is_err) {
+        let written = commits
+            .iter()
+            .zip(&write_results)
+            .filter(|(_, r)| r.is_ok())
+            .map(|(commit, _)| commit.new_metadata_location.clone())
+            .collect::<Vec<_>>();
+        delete_metadata_files(&file_io, &written, "orphaned").await;
+        write_results.into_iter().collect::<Result<Vec<()>, _>>()?;
+    }
 
+    // Swap metadata locations in DB
+    let mut transaction = C::Transaction::begin_write(state.v1_state.catalog.clone()).await?;
+    let mut swap_result = C::commit_table_transaction(
+        warehouse_id,
+        commits.iter().map(CommitContext::commit),
+        transaction.transaction(),
+    )
+    .await;
+    if swap_result.is_ok() {
+        swap_result = write_change_events::<C, _>(
+            || change_events::update_tables(warehouse_id, request, &table_ids, request_metadata),
+            transaction.transaction(),
+        )
+        .await;
+    }
+    if let Err(e) = swap_result {
+        // Dropping the transaction rolls it back, so nothing references the new files.
+        // Files are not deleted if committing the transaction itself fails, because
+        // the commit might have succeeded nevertheless.
+        drop(transaction);
+        let new_locations = commits
+            .iter()
+            .map(|c| c.new_metadata_location.clone())
+            .collect::<Vec<_>>();
+        delete_metadata_files(&file_io, &new_locations, "orphaned").await;
+        return Err(e);
+    }
     transaction.commit().await?;
 
-    // Delete files in parallel - if one delete fails, we still want to delete the rest
     let expired_locations = expired_metadata_logs
         .into_iter()
         .filter_map(|expired_metadata_log| {
@@ -1338,20 +1488,24 @@ async fn try_commit_tables<C: Catalog, A: Authorizer + Clone, S: SecretStore>(
                 .ok()
         })
         .collect::<Vec<_>>();
-    let _ = futures::future::join_all(
-        expired_locations
+    delete_metadata_files(&file_io, &expired_locations, "expired").await;
+
+    Ok(commits)
+}
+
+/// Delete files in parallel - if one delete fails, we still want to delete the rest
+async fn delete_metadata_files(file_io: &FileIO, locations: &[Location], kind: &str) {
+    for result in futures::future::join_all(
+        locations
             .iter()
-            .map(|location| delete_file(&file_io, location))
-            .collect::<Vec<_>>(),
+            .map(|location| delete_file(file_io, location)),
     )
     .await
-    .into_iter()
-    .map(|r| {
-        r.map_err(|e| tracing::warn!("Failed to delete expired metadata file: {:?}", e))
-            .ok()
-    });
-
-    Ok(commits)
+    {
+        if let Err(e) = result {
+            tracing::warn!("Failed to delete {kind} metadata file: {:?}", e);
+        }
+    }
 }
 
 pub(crate) async fn authorized_table_ident_to_id<C: Catalog, A: Authorizer>(
@@ -1393,7 +1547,7 @@ pub(crate) fn extract_count_from_metadata_location(location: &Location) -> Optio
 
 #[derive(Clone, Debug)]
 pub struct CommitContext {
-    pub new_metadata: iceberg::spec::TableMetadata,
+    pub new_metadata: Arc<iceberg::spec::TableMetadata>,
     pub new_metadata_location: Location,
     pub previous_metadata: iceberg::spec::TableMetadata,
     pub previous_metadata_location: Option<Location>,
@@ -1414,7 +1568,7 @@ impl CommitContext {
 
         TableCommit {
             diffs,
-            new_metadata: self.new_metadata.clone(),
+            new_metadata: self.new_metadata.as_ref().clone(),
             new_metadata_location: self.new_metadata_location.clone(),
             previous_metadata_location: self.previous_metadata_location.clone(),
             updates: self.updates.clone(),
@@ -1573,7 +1727,7 @@ fn calculate_diffs(
     }
 }
 
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, Default)]
 pub(crate) struct TableMetadataDiffs {
     pub(crate) removed_snapshots: Vec<i64>,
     pub(crate) added_snapshots: Vec<i64>,
@@ -1711,6 +1865,34 @@ fn require_not_staged<T>(metadata_location: Option<&T>) -> Result<()> {
     Ok(())
 }
 
+/// Load a single table, joining a load of the same table version that is already in flight.
+///
+/// The load uses the read transaction `t` of the request. If a load in flight is joined,
+/// `t` is rolled back right away instead.
+async fn load_table_coalesced<C: Catalog>(
+    key: LoadTableKey,
+    mut t: C::Transaction,
+) -> Result<HashMap<TableId, CatalogLoadTableResult>> {
+    let (result, joined) = LOAD_TABLE_FLIGHTS
+        .run(key.clone(), move || async move {
+            let metadatas = C::load_tables(
+                key.warehouse_id,
+                vec![key.table_id],
+                key.include_deleted,
+                key.snapshots,
+                t.transaction(),
+            )
+            .await?;
+            t.commit().await?;
+            Ok(Arc::new(metadatas))
+        })
+        .await;
+    if joined {
+        metrics::counter!(METRIC_LOAD_TABLE_COALESCED).increment(1);
+    }
+    result.map(Arc::unwrap_or_clone)
+}
+
 fn take_table_metadata<T>(
     table_id: &TableId,
     table_ident: &TableIdent,
@@ -1918,8 +2100,10 @@ pub(crate) mod test {
             iceberg::{
                 types::{PageToken, Prefix},
                 v1::{
-                    tables::TablesService as _, DataAccess, DropParams, ListTablesQuery,
-                    NamespaceParameters, TableParameters,
+                    tables::{create_etag, TablesService as _},
+                    DataAccess, DropParams, ListTablesQuery, LoadTableRequest,
+                    LoadTableResultOrNotModified, LoadTableSnapshots, NamespaceParameters,
+                    TableParameters,
                 },
             },
             management::v1::{
@@ -2060,21 +2244,97 @@ pub(crate) mod test {
         .unwrap()
         .new_metadata;
 
-        let tab = CatalogServer::load_table(
-            TableParameters {
-                prefix: ns_params.prefix,
-                table: TableIdent {
-                    namespace: ns.namespace.clone(),
-                    name: "tab-1".to_string(),
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                TableParameters {
+                    prefix: ns_params.prefix,
+                    table: TableIdent {
+                        namespace: ns.namespace.clone(),
+                        name: "tab-1".to_string(),
+                    },
                 },
+                LoadTableRequest::default(),
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
+        assert_table_metadata_are_equal(&table_metadata.metadata, &tab.metadata);
+    }
+
+    fn expect_loaded(result: LoadTableResultOrNotModified) -> LoadTableResult {
+        match result {
+            LoadTableResultOrNotModified::LoadTableResult(result) => result,
+            LoadTableResultOrNotModified::NotModifiedResponse(etag) => {
+                panic!("Expected table metadata, got not modified response with etag {etag}")
+            }
+        }
+    }
+
+    #[sqlx::test]
+    async fn test_load_table_not_modified(pool: sqlx::PgPool) {
+        let (ctx, ns, ns_params, table) = commit_test_setup(pool).await;
+        let parameters = TableParameters {
+            prefix: ns_params.prefix.clone(),
+            table: TableIdent {
+                namespace: ns.namespace.clone(),
+                name: "tab-1".to_string(),
+            },
+        };
+        let etag = create_etag(
+            table.metadata_location.as_deref().unwrap(),
+            LoadTableSnapshots::All,
+        );
+
+        let result = CatalogServer::load_table(
+            parameters.clone(),
+            LoadTableRequest {
+                etags: vec!["\"some-other-etag\"".to_string(), etag.clone()],
+                ..Default::default()
             },
-            DataAccess::not_specified(),
             ctx.clone(),
             RequestMetadata::new_unauthenticated(),
         )
         .await
         .unwrap();
-        assert_table_metadata_are_equal(&table_metadata.metadata, &tab.metadata);
+        assert!(
+            matches!(result, LoadTableResultOrNotModified::NotModifiedResponse(ref e) if *e == etag)
+        );
+
+        // The etag of all snapshots does not match a load of referenced snapshots only
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                parameters.clone(),
+                LoadTableRequest {
+                    etags: vec![etag.clone()],
+                    snapshots: LoadTableSnapshots::Refs,
+                    ..Default::default()
+                },
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
+        assert_eq!(tab.metadata_location, table.metadata_location);
+
+        // Stale etag - full metadata is returned
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                parameters,
+                LoadTableRequest {
+                    etags: vec!["\"some-other-etag\"".to_string()],
+                    ..Default::default()
+                },
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
+        assert_eq!(tab.metadata_location, table.metadata_location);
+        assert_table_metadata_are_equal(&table.metadata, &tab.metadata);
     }
 
     fn schema() -> Schema {
@@ -2215,20 +2475,22 @@ pub(crate) mod test {
         .await
         .unwrap();
 
-        let tab = CatalogServer::load_table(
-            TableParameters {
-                prefix: ns_params.prefix,
-                table: TableIdent {
-                    namespace: ns.namespace.clone(),
-                    name: "tab-1".to_string(),
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                TableParameters {
+                    prefix: ns_params.prefix,
+                    table: TableIdent {
+                        namespace: ns.namespace.clone(),
+                        name: "tab-1".to_string(),
+                    },
                 },
-            },
-            DataAccess::not_specified(),
-            ctx.clone(),
-            RequestMetadata::new_unauthenticated(),
-        )
-        .await
-        .unwrap();
+                LoadTableRequest::default(),
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
 
         assert_table_metadata_are_equal(&table_metadata.metadata, &tab.metadata);
     }
@@ -2276,20 +2538,22 @@ pub(crate) mod test {
         .unwrap()
         .new_metadata;
 
-        let tab = CatalogServer::load_table(
-            TableParameters {
-                prefix: ns_params.prefix,
-                table: TableIdent {
-                    namespace: ns.namespace.clone(),
-                    name: "tab-1".to_string(),
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                TableParameters {
+                    prefix: ns_params.prefix,
+                    table: TableIdent {
+                        namespace: ns.namespace.clone(),
+                        name: "tab-1".to_string(),
+                    },
                 },
-            },
-            DataAccess::not_specified(),
-            ctx.clone(),
-            RequestMetadata::new_unauthenticated(),
-        )
-        .await
-        .unwrap();
+                LoadTableRequest::default(),
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
         assert_table_metadata_are_equal(&table_metadata.metadata, &tab.metadata);
     }
 
@@ -2356,20 +2620,22 @@ pub(crate) mod test {
         .await
         .unwrap();
 
-        let tab = CatalogServer::load_table(
-            TableParameters {
-                prefix: ns_params.prefix.clone(),
-                table: TableIdent {
-                    namespace: ns.namespace.clone(),
-                    name: "tab-1".to_string(),
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                TableParameters {
+                    prefix: ns_params.prefix.clone(),
+                    table: TableIdent {
+                        namespace: ns.namespace.clone(),
+                        name: "tab-1".to_string(),
+                    },
                 },
-            },
-            DataAccess::not_specified(),
-            ctx.clone(),
-            RequestMetadata::new_unauthenticated(),
-        )
-        .await
-        .unwrap();
+                LoadTableRequest::default(),
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
         assert_eq!(tab.metadata, builder.metadata);
     }
 
@@ -2405,17 +2671,19 @@ pub(crate) mod test {
         .await
         .unwrap();
 
-        let tab = CatalogServer::load_table(
-            TableParameters {
-                prefix: ns_params.prefix.clone(),
-                table: table_ident.clone(),
-            },
-            DataAccess::not_specified(),
-            ctx.clone(),
-            RequestMetadata::new_unauthenticated(),
-        )
-        .await
-        .unwrap();
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                TableParameters {
+                    prefix: ns_params.prefix.clone(),
+                    table: table_ident.clone(),
+                },
+                LoadTableRequest::default(),
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
         assert_table_metadata_are_equal(&builder.metadata, &tab.metadata);
 
         let builder = builder
@@ -2447,22 +2715,23 @@ pub(crate) mod test {
         .next()
         .unwrap();
 
-        let tab = CatalogServer::load_table(
-            TableParameters {
-                prefix: ns_params.prefix.clone(),
-                table: table_ident.clone(),
-            },
-            DataAccess::not_specified(),
-            ctx.clone(),
-            RequestMetadata::new_unauthenticated(),
-        )
-        .await
-        .unwrap();
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                TableParameters {
+                    prefix: ns_params.prefix.clone(),
+                    table: table_ident.clone(),
+                },
+                LoadTableRequest::default(),
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
 
         assert_table_metadata_are_equal(&builder.metadata, &tab.metadata);
 
-        let builder = committed
-            .new_metadata
+        let builder = Arc::unwrap_or_clone(committed.new_metadata)
             .into_builder(tab.metadata_location)
             .set_properties(HashMap::from_iter(vec![(
                 "change_nr".to_string(),
@@ -2490,21 +2759,129 @@ pub(crate) mod test {
         .next()
         .unwrap();
 
-        let tab = CatalogServer::load_table(
-            TableParameters {
-                prefix: ns_params.prefix,
-                table: table_ident.clone(),
-            },
-            DataAccess::not_specified(),
-            ctx.clone(),
-            RequestMetadata::new_unauthenticated(),
-        )
-        .await
-        .unwrap();
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                TableParameters {
+                    prefix: ns_params.prefix,
+                    table: table_ident.clone(),
+                },
+                LoadTableRequest::default(),
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
 
         assert_table_metadata_are_equal(&builder.metadata, &tab.metadata);
     }
 
+    #[sqlx::test]
+    async fn test_load_table_refs_only(pg_pool: PgPool) {
+        let (ctx, ns, ns_params, table) = commit_test_setup(pg_pool).await;
+        let table_ident = TableIdent {
+            namespace: ns.namespace.clone(),
+            name: "tab-1".to_string(),
+        };
+        let parameters = TableParameters {
+            prefix: ns_params.prefix.clone(),
+            table: table_ident.clone(),
+        };
+
+        let mut metadata = table.metadata;
+        let mut metadata_location = table.metadata_location;
+        for snapshot_id in 1..=2 {
+            let snap = Snapshot::builder()
+                .with_snapshot_id(snapshot_id)
+                .with_parent_snapshot_id((snapshot_id > 1).then_some(snapshot_id - 1))
+                .with_timestamp_ms(metadata.last_updated_ms() + 1)
+                .with_sequence_number(snapshot_id - 1)
+                .with_schema_id(0)
+                .with_manifest_list(format!("/snap-{snapshot_id}.avro"))
+                .with_summary(Summary {
+                    operation: Operation::Append,
+                    additional_properties: HashMap::new(),
+                })
+                .build();
+            let builder = metadata
+                .into_builder(metadata_location)
+                .add_snapshot(snap)
+                .unwrap()
+                .set_ref(
+                    MAIN_BRANCH,
+                    SnapshotReference {
+                        snapshot_id,
+                        retention: SnapshotRetention::Branch {
+                            min_snapshots_to_keep: None,
+                            max_snapshot_age_ms: None,
+                            max_ref_age_ms: None,
+                        },
+                    },
+                )
+                .unwrap()
+                .build()
+                .unwrap();
+
+            let _ = super::commit_tables_internal(
+                ns_params.prefix.clone(),
+                super::CommitTransactionRequest {
+                    table_changes: vec![CommitTableRequest {
+                        identifier: Some(table_ident.clone()),
+                        requirements: vec![],
+                        updates: builder.changes,
+                    }],
+                },
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap();
+
+            let tab = expect_loaded(
+                CatalogServer::load_table(
+                    parameters.clone(),
+                    LoadTableRequest::default(),
+                    ctx.clone(),
+                    RequestMetadata::new_unauthenticated(),
+                )
+                .await
+                .unwrap(),
+            );
+            metadata = tab.metadata;
+            metadata_location = tab.metadata_location;
+        }
+        assert_eq!(metadata.snapshots().count(), 2);
+        assert_eq!(metadata.history().len(), 2);
+
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                parameters,
+                LoadTableRequest {
+                    snapshots: LoadTableSnapshots::Refs,
+                    ..Default::default()
+                },
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
+        assert_eq!(
+            tab.metadata
+                .snapshots()
+                .map(|s| s.snapshot_id())
+                .collect_vec(),
+            vec![2]
+        );
+        assert_eq!(tab.metadata.current_snapshot_id(), Some(2));
+        assert_eq!(tab.metadata.history().len(), 1);
+        assert_eq!(
+            tab.metadata.schemas_iter().count(),
+            metadata.schemas_iter().count()
+        );
+        assert_eq!(tab.metadata_location, metadata_location);
+    }
+
     #[sqlx::test]
     async fn test_remove_snapshot_commit(pg_pool: PgPool) {
         let (ctx, ns, ns_params, table) = commit_test_setup(pg_pool).await;
@@ -2568,17 +2945,19 @@ pub(crate) mod test {
         .await
         .unwrap();
 
-        let tab = CatalogServer::load_table(
-            TableParameters {
-                prefix: ns_params.prefix.clone(),
-                table: table_ident.clone(),
-            },
-            DataAccess::not_specified(),
-            ctx.clone(),
-            RequestMetadata::new_unauthenticated(),
-        )
-        .await
-        .unwrap();
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                TableParameters {
+                    prefix: ns_params.prefix.clone(),
+                    table: table_ident.clone(),
+                },
+                LoadTableRequest::default(),
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
         assert_eq!(tab.metadata.history(), builder.metadata.history());
         assert_eq!(tab.metadata, builder.metadata);
 
@@ -2630,17 +3009,19 @@ pub(crate) mod test {
         .await
         .unwrap();
 
-        let tab = CatalogServer::load_table(
-            TableParameters {
-                prefix: ns_params.prefix.clone(),
-                table: table_ident.clone(),
-            },
-            DataAccess::not_specified(),
-            ctx.clone(),
-            RequestMetadata::new_unauthenticated(),
-        )
-        .await
-        .unwrap();
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                TableParameters {
+                    prefix: ns_params.prefix.clone(),
+                    table: table_ident.clone(),
+                },
+                LoadTableRequest::default(),
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
 
         assert_eq!(tab.metadata, builder.metadata);
 
@@ -2687,17 +3068,19 @@ pub(crate) mod test {
         .await
         .unwrap();
 
-        let tab = CatalogServer::load_table(
-            TableParameters {
-                prefix: ns_params.prefix.clone(),
-                table: table_ident.clone(),
-            },
-            DataAccess::not_specified(),
-            ctx.clone(),
-            RequestMetadata::new_unauthenticated(),
-        )
-        .await
-        .unwrap();
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                TableParameters {
+                    prefix: ns_params.prefix.clone(),
+                    table: table_ident.clone(),
+                },
+                LoadTableRequest::default(),
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
 
         assert_eq!(tab.metadata, builder.metadata);
 
@@ -2725,17 +3108,19 @@ pub(crate) mod test {
         .await
         .unwrap();
 
-        let tab = CatalogServer::load_table(
-            TableParameters {
-                prefix: ns_params.prefix.clone(),
-                table: table_ident.clone(),
-            },
-            DataAccess::not_specified(),
-            ctx.clone(),
-            RequestMetadata::new_unauthenticated(),
-        )
-        .await
-        .unwrap();
+        let tab = expect_loaded(
+            CatalogServer::load_table(
+                TableParameters {
+                    prefix: ns_params.prefix.clone(),
+                    table: table_ident.clone(),
+                },
+                LoadTableRequest::default(),
+                ctx.clone(),
+                RequestMetadata::new_unauthenticated(),
+            )
+            .await
+            .unwrap(),
+        );
         assert_eq!(tab.metadata.history(), builder.metadata.history());
         assert_eq!(
             tab.metadata
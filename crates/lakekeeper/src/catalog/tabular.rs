@@ -44,15 +44,13 @@ macro_rules! list_entities {
                     Vec<_>,
                     Vec<_>,
                     Vec<bool>,
-                ) = futures::future::try_join_all(ids.iter().map(|n| {
-                    paste! {
-                        authorizer.[<is_allowed_ $action>](
-                            &request_metadata,
-                            *n,
-                            paste! { [<Catalog $entity Action>]::CanIncludeInList },
-                        )
-                    }
-                }))
+                ) = paste! {
+                    authorizer.[<are_allowed_ $action s>](
+                        &request_metadata,
+                        &ids,
+                        [<Catalog $entity Action>]::CanIncludeInList,
+                    )
+                }
                 .await?
                 .into_iter()
                 .zip(idents.into_iter().zip(ids.into_iter()))
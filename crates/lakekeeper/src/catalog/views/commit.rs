@@ -18,7 +18,7 @@ use crate::{
     catalog::{
         compression_codec::CompressionCodec,
         io::{remove_all, write_metadata_file},
-        require_warehouse_id,
+        maybe_get_secret, require_warehouse_id,
         tables::{
             determine_table_ident, extract_count_from_metadata_location, require_active_warehouse,
             validate_table_or_view_ident, CONCURRENT_UPDATE_ERROR_TYPE,
@@ -30,6 +30,7 @@ use crate::{
     service::{
         authz::{Authorizer, CatalogViewAction, CatalogWarehouseAction},
         contract_verification::ContractVerification,
+        event_publisher::{change_events, outbox::write_change_events},
         secrets::SecretStore,
         storage::{StorageLocations as _, StoragePermissions, StorageProfile},
         Catalog, NamespaceId, State, Transaction, ViewCommit, ViewId, ViewMetadataWithLocation,
@@ -101,6 +102,7 @@ pub(crate) async fn commit_view<C: Catalog, A: Authorizer + Clone, S: SecretStor
     loop {
         let result = try_commit_view::<C, A, S>(
             CommitViewContext {
+                parameters: &parameters,
                 namespace_id,
                 view_id,
                 identifier: &identifier,
@@ -150,6 +152,7 @@ pub(crate) async fn commit_view<C: Catalog, A: Authorizer + Clone, S: SecretStor
 
 // Context structure to hold static parameters for retry function
 struct CommitViewContext<'a> {
+    parameters: &'a ViewParameters,
     namespace_id: NamespaceId,
     view_id: ViewId,
     identifier: &'a TableIdent,
@@ -217,24 +220,13 @@ async fn try_commit_view<C: Catalog, A: Authorizer + Clone, S: SecretStore>(
     .await?;
 
     // Get storage secret
-    let storage_secret = if let Some(secret_id) = ctx.storage_secret_id {
-        Some(
-            state
-                .v1_state
-                .secrets
-                .get_secret_by_id(secret_id)
-                .await?
-                .secret,
-        )
-    } else {
-        None
-    };
+    let storage_secret = maybe_get_secret(ctx.storage_secret_id, &state.v1_state.secrets).await?;
 
     // Write metadata file
     let file_io = ctx.storage_profile.file_io(storage_secret.as_ref()).await?;
     write_metadata_file(
         &metadata_location,
-        &requested_update_metadata,
+        requested_update_metadata.clone(),
         CompressionCodec::try_from_metadata(&requested_update_metadata)?,
         &file_io,
     )
@@ -256,6 +248,20 @@ async fn try_commit_view<C: Catalog, A: Authorizer + Clone, S: SecretStore>(
         )
         .await?;
 
+    write_change_events::<C, _>(
+        || {
+            [change_events::update_view(
+                warehouse_id,
+                ctx.parameters,
+                ctx.request,
+                &requested_update_metadata,
+                request_metadata,
+            )]
+        },
+        t.transaction(),
+    )
+    .await?;
+
     // Commit transaction
     t.commit().await?;
 
@@ -20,6 +20,7 @@ use crate::{
     request_metadata::RequestMetadata,
     service::{
         authz::{Authorizer, CatalogNamespaceAction, CatalogWarehouseAction},
+        event_publisher::{change_events, outbox::write_change_events},
         storage::{StorageLocations as _, StoragePermissions},
         Catalog, Result, SecretStore, State, TabularId, Transaction, ViewId,
     },
@@ -137,7 +138,7 @@ pub(crate) async fn create_view<C: Catalog, A: Authorizer + Clone, S: SecretStor
     let compression_codec = CompressionCodec::try_from_metadata(&metadata.metadata)?;
     write_metadata_file(
         &metadata_location,
-        &metadata.metadata,
+        metadata.metadata.clone(),
         compression_codec,
         &file_io,
     )
@@ -170,6 +171,20 @@ pub(crate) async fn create_view<C: Catalog, A: Authorizer + Clone, S: SecretStor
         )
         .await?;
 
+    write_change_events::<C, _>(
+        || {
+            [change_events::create_view(
+                warehouse_id,
+                &parameters,
+                &request,
+                &metadata.metadata,
+                &request_metadata,
+            )]
+        },
+        t.transaction(),
+    )
+    .await?;
+
     t.commit().await?;
 
     state
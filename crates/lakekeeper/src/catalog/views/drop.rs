@@ -11,6 +11,7 @@ use crate::{
     service::{
         authz::{Authorizer, CatalogViewAction, CatalogWarehouseAction},
         contract_verification::ContractVerification,
+        event_publisher::{change_events, outbox::write_change_events},
         task_queue::{
             tabular_expiration_queue::TabularExpirationPayload,
             tabular_purge_queue::TabularPurgePayload, EntityId, TaskMetadata,
@@ -63,6 +64,19 @@ pub(crate) async fn drop_view<C: Catalog, A: Authorizer + Clone, S: SecretStore>
 
     tracing::debug!("Proceeding to delete view");
 
+    write_change_events::<C, _>(
+        || {
+            [change_events::drop_view(
+                warehouse_id,
+                &parameters,
+                view_id,
+                &request_metadata,
+            )]
+        },
+        t.transaction(),
+    )
+    .await?;
+
     match warehouse.tabular_delete_profile {
         TabularDeleteProfile::Hard {} => {
             let location = C::drop_view(view_id, force, t.transaction()).await?;
@@ -6,14 +6,14 @@ use crate::{
         set_not_found_status_code, ApiContext,
     },
     catalog::{
-        require_warehouse_id,
+        maybe_get_secret, require_warehouse_id,
         tables::{require_active_warehouse, validate_table_or_view_ident},
         views::parse_view_location,
     },
     request_metadata::RequestMetadata,
     service::{
         authz::{Authorizer, CatalogViewAction, CatalogWarehouseAction},
-        storage::{StorageCredential, StoragePermissions},
+        storage::StoragePermissions,
         Catalog, GetWarehouseResponse, Result, SecretStore, State, Transaction,
         ViewMetadataWithLocation,
     },
@@ -85,18 +85,7 @@ pub(crate) async fn load_view<C: Catalog, A: Authorizer + Clone, S: SecretStore>
 
     t.commit().await?;
 
-    let storage_secret: Option<StorageCredential> = if let Some(secret_id) = storage_secret_id {
-        Some(
-            state
-                .v1_state
-                .secrets
-                .get_secret_by_id(secret_id)
-                .await?
-                .secret,
-        )
-    } else {
-        None
-    };
+    let storage_secret = maybe_get_secret(storage_secret_id, &state.v1_state.secrets).await?;
 
     let access = storage_profile
         .generate_table_config(
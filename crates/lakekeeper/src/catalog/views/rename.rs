@@ -10,6 +10,7 @@ use crate::{
     service::{
         authz::{Authorizer, CatalogNamespaceAction, CatalogViewAction, CatalogWarehouseAction},
         contract_verification::ContractVerification,
+        event_publisher::{change_events, outbox::write_change_events},
         Catalog, Result, SecretStore, State, TabularId, Transaction,
     },
 };
@@ -80,6 +81,19 @@ pub(crate) async fn rename_view<C: Catalog, A: Authorizer + Clone, S: SecretStor
         .await?
         .into_result()?;
 
+    write_change_events::<C, _>(
+        || {
+            [change_events::rename_view(
+                warehouse_id,
+                source_id,
+                &request,
+                &request_metadata,
+            )]
+        },
+        t.transaction(),
+    )
+    .await?;
+
     t.commit().await?;
 
     state
@@ -178,6 +178,12 @@ pub struct DynAppConfig {
 
     // ------------- TRACING CLOUDEVENTS ----------
     pub log_cloudevents: Option<bool>,
+    /// Batching and queueing of published `CloudEvents`.
+    #[serde(default)]
+    pub cloudevents_publisher: CloudEventsPublisherConfig,
+    /// Write change events to an outbox table in the transaction of the change.
+    #[serde(default)]
+    pub cloudevents_outbox: CloudEventsOutbox,
 
     // ------------- AUTHENTICATION -------------
     pub openid_provider_uri: Option<Url>,
@@ -231,6 +237,16 @@ pub struct DynAppConfig {
         serialize_with = "crate::config::serialize_std_duration_as_ms"
     )]
     pub task_poll_interval: std::time::Duration,
+    /// Wake task queue workers via Postgres `LISTEN/NOTIFY` instead of polling.
+    #[serde(default)]
+    pub task_notifications: TaskNotifications,
+    /// Maximum number of tasks a worker claims at once, and number of task outcomes it
+    /// records at once. Claimed tasks wait for a free slot of `task_concurrency`.
+    pub task_batch_size: usize,
+    /// Number of tasks a worker runs concurrently.
+    pub task_concurrency: usize,
+    /// Number of concurrent file deletions of a single purge task.
+    pub purge_delete_concurrency: usize,
     // ------------- Tabular -------------
     /// Delay in seconds after which a tabular will be deleted
     #[serde(
@@ -238,6 +254,9 @@ pub struct DynAppConfig {
         serialize_with = "duration_to_seconds"
     )]
     pub default_tabular_expiration_delay_seconds: chrono::Duration,
+    /// Queue concurrent commits to the same table within this instance.
+    #[serde(default)]
+    pub commit_queue: CommitQueue,
 
     // ------------- Stats -------------
     /// Interval to wait before writing the latest accumulated endpoint statistics into the database.
@@ -250,6 +269,13 @@ pub struct DynAppConfig {
     )]
     pub endpoint_stat_flush_interval: Duration,
 
+    // ------------- Caching -------------
+    pub cache: Cache,
+
+    // ------------- Response Compression -------------
+    #[serde(default)]
+    pub response_compression: ResponseCompression,
+
     // ------------- Internal -------------
     /// Optional server id. We recommend to not change this unless multiple catalogs
     /// are sharing the same Authorization system.
@@ -432,6 +458,300 @@ pub enum SecretBackend {
     Postgres,
 }
 
+#[derive(Debug, Clone, Default, Serialize, Deserialize, PartialEq)]
+pub struct Cache {
+    /// In-memory cache of table metadata, keyed by table id and metadata location.
+    #[serde(default)]
+    pub table_metadata: TableMetadataCache,
+    /// In-memory index from table locations to table ids, used to resolve S3 sign requests.
+    #[serde(default)]
+    pub table_locations: TableLocationIndex,
+    /// In-process cache of decrypted storage secrets, keyed by secret id.
+    #[serde(default)]
+    pub storage_secrets: SecretCache,
+    /// Cache of vended STS credentials, keyed by role, table location and permissions.
+    #[serde(default)]
+    pub sts_credentials: CredentialCache,
+    /// Cache of Azure user delegation keys and the SAS tokens signed with them.
+    #[serde(default)]
+    pub adls_credentials: CredentialCache,
+    /// Cache of downscoped GCS tokens, keyed by service account, bucket, prefix and permissions.
+    #[serde(default)]
+    pub gcs_credentials: CredentialCache,
+    /// Cache of `OpenFGA` check results, keyed by user, relation and object.
+    #[serde(default)]
+    pub authz_decisions: AuthzDecisionCache,
+    /// Cache of the table metadata part of `loadTable` responses, keyed by metadata location
+    /// and content encoding.
+    #[serde(default)]
+    pub load_table_responses: LoadTableResponseCache,
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[serde(default)]
+pub struct LoadTableResponseCache {
+    /// If false, table metadata is serialized and compressed for every `loadTable` response.
+    pub enabled: bool,
+    /// Upper bound for the memory used by cached response bodies.
+    pub max_size_mb: u64,
+}
+
+impl Default for LoadTableResponseCache {
+    fn default() -> Self {
+        Self {
+            enabled: true,
+            max_size_mb: 256,
+        }
+    }
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[serde(default)]
+pub struct ResponseCompression {
+    /// If false, responses are never compressed.
+    pub enabled: bool,
+    /// Responses with fewer bytes are sent uncompressed.
+    pub min_size_bytes: u16,
+    /// Settings for all responses except those containing table or view metadata.
+    pub default: CompressionProfile,
+    /// Settings for responses containing table or view metadata.
+    pub metadata: CompressionProfile,
+    /// If true, responses of the S3 signer are compressed as well. They are small and on
+    /// the critical path of every data file access.
+    pub compress_sign_responses: bool,
+}
+
+impl Default for ResponseCompression {
+    fn default() -> Self {
+        Self {
+            enabled: true,
+            min_size_bytes: 1024,
+            default: CompressionProfile::default(),
+            metadata: CompressionProfile::default(),
+            compress_sign_responses: false,
+        }
+    }
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[serde(default)]
+pub struct CompressionProfile {
+    pub gzip: bool,
+    pub deflate: bool,
+    pub br: bool,
+    pub zstd: bool,
+    pub level: CompressionLevel,
+}
+
+impl Default for CompressionProfile {
+    fn default() -> Self {
+        Self {
+            gzip: true,
+            deflate: true,
+            br: true,
+            zstd: true,
+            level: CompressionLevel::Default,
+        }
+    }
+}
+
+#[derive(Debug, Clone, Copy, Default, Serialize, Deserialize, PartialEq, Eq)]
+#[serde(rename_all = "lowercase")]
+pub enum CompressionLevel {
+    Fastest,
+    #[default]
+    Default,
+    Best,
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[serde(default)]
+pub struct CloudEventsPublisherConfig {
+    /// Maximum number of events a sink publishes at once.
+    pub batch_size: usize,
+    /// Number of events queued per sink. Events for a sink with a full queue are dropped.
+    pub sink_queue_size: usize,
+}
+
+impl Default for CloudEventsPublisherConfig {
+    fn default() -> Self {
+        Self {
+            batch_size: 100,
+            sink_queue_size: 10_000,
+        }
+    }
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[serde(default)]
+pub struct CloudEventsOutbox {
+    /// If true, change events are written to the outbox in the transaction of the change
+    /// and published by the outbox relay instead of the in-memory publisher.
+    pub enabled: bool,
+    /// Interval at which the relay checks the outbox once it is drained, if task
+    /// notifications are disabled. Also the delay before the first retry of an event.
+    #[serde(
+        deserialize_with = "crate::config::seconds_to_std_duration",
+        serialize_with = "crate::config::serialize_std_duration_as_ms"
+    )]
+    pub poll_interval: std::time::Duration,
+    /// Maximum time the relay waits for a sink to publish a batch.
+    #[serde(
+        deserialize_with = "crate::config::seconds_to_std_duration",
+        serialize_with = "crate::config::serialize_std_duration_as_ms"
+    )]
+    pub publish_timeout: std::time::Duration,
+    /// Number of attempts after which events that were not published by all sinks
+    /// are dead-lettered.
+    pub max_attempts: u32,
+}
+
+impl Default for CloudEventsOutbox {
+    fn default() -> Self {
+        Self {
+            enabled: false,
+            poll_interval: Duration::from_secs(1),
+            publish_timeout: Duration::from_secs(30),
+            max_attempts: 20,
+        }
+    }
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[serde(default)]
+pub struct TaskNotifications {
+    /// If false, idle task queue workers poll every `task_poll_interval`.
+    pub enabled: bool,
+    /// Interval at which idle workers poll even if notifications are enabled.
+    /// Catches tasks that become due without a notification, e.g. retries.
+    #[serde(
+        deserialize_with = "crate::config::seconds_to_std_duration",
+        serialize_with = "crate::config::serialize_std_duration_as_ms"
+    )]
+    pub fallback_poll_interval: std::time::Duration,
+}
+
+impl Default for TaskNotifications {
+    fn default() -> Self {
+        Self {
+            enabled: true,
+            fallback_poll_interval: Duration::from_secs(60),
+        }
+    }
+}
+
+#[derive(Debug, Clone, Default, Serialize, Deserialize, PartialEq)]
+#[serde(default)]
+pub struct CommitQueue {
+    /// If true, commits to the same table are processed one after another on each
+    /// instance instead of competing for the same database row.
+    pub enabled: bool,
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+pub struct TableMetadataCache {
+    /// If false, table metadata is always rebuilt from the database.
+    pub enabled: bool,
+    /// Upper bound for the estimated memory used by cached table metadata.
+    pub max_size_mb: u64,
+}
+
+impl Default for TableMetadataCache {
+    fn default() -> Self {
+        Self {
+            enabled: true,
+            max_size_mb: 256,
+        }
+    }
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[serde(default)]
+pub struct TableLocationIndex {
+    /// If false, tables are always looked up by location in the database.
+    pub enabled: bool,
+    /// Maximum number of indexed tables. Once reached, tables that were not found
+    /// recently are evicted to index new ones.
+    pub max_entries: usize,
+}
+
+impl Default for TableLocationIndex {
+    fn default() -> Self {
+        Self {
+            enabled: true,
+            max_entries: 1_000_000,
+        }
+    }
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[serde(default)]
+pub struct SecretCache {
+    /// If false, storage secrets are read from the secret store on every access.
+    pub enabled: bool,
+    /// Maximum number of cached secrets.
+    pub max_entries: u64,
+    /// Time after which a cached secret is read again from the secret store.
+    pub time_to_live_seconds: u64,
+}
+
+impl Default for SecretCache {
+    fn default() -> Self {
+        Self {
+            enabled: true,
+            max_entries: 10_000,
+            time_to_live_seconds: 600,
+        }
+    }
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[serde(default)]
+pub struct AuthzDecisionCache {
+    /// If true, authorization decisions are cached in process. Revocations made by
+    /// other instances or directly in the authorization backend are ignored for up to
+    /// `time_to_live_seconds`. Disabled by default.
+    pub enabled: bool,
+    /// Maximum number of cached decisions.
+    pub max_entries: u64,
+    /// Maximum time a cached decision is used. Bounds how long permission changes
+    /// made by other instances may go unnoticed.
+    pub time_to_live_seconds: u64,
+}
+
+impl Default for AuthzDecisionCache {
+    fn default() -> Self {
+        Self {
+            enabled: false,
+            max_entries: 100_000,
+            time_to_live_seconds: 10,
+        }
+    }
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[serde(default)]
+pub struct CredentialCache {
+    /// If false, new credentials are requested for every table access.
+    pub enabled: bool,
+    /// Maximum number of cached credentials.
+    pub max_entries: u64,
+    /// Fraction of the credential validity during which a cached credential
+    /// is handed out. Clients always receive credentials that are valid for
+    /// at least `1 - reuse_fraction` of the configured validity.
+    pub reuse_fraction: f64,
+}
+
+impl Default for CredentialCache {
+    fn default() -> Self {
+        Self {
+            enabled: true,
+            max_entries: 10_000,
+            reuse_fraction: 0.5,
+        }
+    }
+}
+
 #[derive(Clone, Serialize, Deserialize, PartialEq, Redact)]
 pub struct KV2Config {
     pub url: Url,
@@ -486,6 +806,8 @@ impl Default for DynAppConfig {
             kafka_config: None,
             kafka_topic: None,
             log_cloudevents: None,
+            cloudevents_publisher: CloudEventsPublisherConfig::default(),
+            cloudevents_outbox: CloudEventsOutbox::default(),
             openid_provider_uri: None,
             openid_audience: None,
             openid_additional_issuers: None,
@@ -503,8 +825,15 @@ impl Default for DynAppConfig {
             openfga: None,
             secret_backend: SecretBackend::Postgres,
             task_poll_interval: Duration::from_secs(10),
+            task_notifications: TaskNotifications::default(),
+            task_batch_size: 16,
+            task_concurrency: 4,
+            purge_delete_concurrency: 16,
             default_tabular_expiration_delay_seconds: chrono::Duration::days(7),
+            commit_queue: CommitQueue::default(),
             endpoint_stat_flush_interval: Duration::from_secs(30),
+            cache: Cache::default(),
+            response_compression: ResponseCompression::default(),
             server_id: uuid::Uuid::nil(),
             serve_swagger_ui: true,
         }
@@ -875,6 +1204,254 @@ mod test {
         });
     }
 
+    #[test]
+    fn test_table_metadata_cache_config() {
+        figment::Jail::expect_with(|jail| {
+            jail.set_env("LAKEKEEPER_TEST__CACHE__TABLE_METADATA__ENABLED", "false");
+            jail.set_env("LAKEKEEPER_TEST__CACHE__TABLE_METADATA__MAX_SIZE_MB", "64");
+            let config = get_config();
+            assert!(!config.cache.table_metadata.enabled);
+            assert_eq!(config.cache.table_metadata.max_size_mb, 64);
+            Ok(())
+        });
+    }
+
+    #[test]
+    fn test_table_metadata_cache_config_defaults() {
+        figment::Jail::expect_with(|_jail| {
+            let config = get_config();
+            assert!(config.cache.table_metadata.enabled);
+            assert_eq!(config.cache.table_metadata.max_size_mb, 256);
+            assert!(config.cache.sts_credentials.enabled);
+            assert_eq!(config.cache.sts_credentials.max_entries, 10_000);
+            assert!((config.cache.sts_credentials.reuse_fraction - 0.5).abs() < f64::EPSILON);
+            Ok(())
+        });
+    }
+
+    #[test]
+    fn test_adls_credential_cache_config() {
+        figment::Jail::expect_with(|jail| {
+            jail.set_env("LAKEKEEPER_TEST__CACHE__ADLS_CREDENTIALS__ENABLED", "false");
+            let config = get_config();
+            assert!(!config.cache.adls_credentials.enabled);
+            assert!(config.cache.sts_credentials.enabled);
+            Ok(())
+        });
+    }
+
+    #[test]
+    fn test_storage_secret_cache_config() {
+        figment::Jail::expect_with(|jail| {
+            jail.set_env(
+                "LAKEKEEPER_TEST__CACHE__STORAGE_SECRETS__TIME_TO_LIVE_SECONDS",
+                "60",
+            );
+            let config = get_config();
+            assert!(config.cache.storage_secrets.enabled);
+            assert_eq!(config.cache.storage_secrets.time_to_live_seconds, 60);
+            assert_eq!(config.cache.storage_secrets.max_entries, 10_000);
+            Ok(())
+        });
+    }
+
+    #[test]
+    fn test_response_compression_config() {
+        figment::Jail::expect_with(|jail| {
+            jail.set_env(
+                "LAKEKEEPER_TEST__RESPONSE_COMPRESSION__METADATA__LEVEL",
+                "best",
+            );
+            jail.set_env(
+                "LAKEKEEPER_TEST__RESPONSE_COMPRESSION__METADATA__BR",
+                "false",
+            );
+            jail.set_env(
+                "LAKEKEEPER_TEST__RESPONSE_COMPRESSION__MIN_SIZE_BYTES",
+                "4096",
+            );
+            let config = get_config();
+            let compression = &config.response_compression;
+            assert!(compression.enabled);
+            assert_eq!(compression.min_size_bytes, 4096);
+            assert_eq!(compression.metadata.level, CompressionLevel::Best);
+            assert!(!compression.metadata.br);
+            assert!(compression.metadata.zstd);
+            assert_eq!(compression.default, CompressionProfile::default());
+            assert!(!compression.compress_sign_responses);
+            assert!(config.cache.load_table_responses.enabled);
+            Ok(())
+        });
+    }
+
+    #[test]
+    fn test_task_notifications_config() {
+        figment::Jail::expect_with(|jail| {
+            let config = get_config();
+            assert!(config.task_notifications.enabled);
+            assert_eq!(
+                config.task_notifications.fallback_poll_interval,
+                Duration::from_secs(60)
+            );
+            jail.set_env("LAKEKEEPER_TEST__TASK_NOTIFICATIONS__ENABLED", "false");
+            jail.set_env(
+                "LAKEKEEPER_TEST__TASK_NOTIFICATIONS__FALLBACK_POLL_INTERVAL",
+                "300s",
+            );
+            let config = get_config();
+            assert!(!config.task_notifications.enabled);
+            assert_eq!(
+                config.task_notifications.fallback_poll_interval,
+                Duration::from_secs(300)
+            );
+            Ok(())
+        });
+    }
+
+    #[test]
+    fn test_cloudevents_publisher_config() {
+        figment::Jail::expect_with(|jail| {
+            let config = get_config();
+            assert_eq!(
+                config.cloudevents_publisher,
+                CloudEventsPublisherConfig::default()
+            );
+            jail.set_env("LAKEKEEPER_TEST__CLOUDEVENTS_PUBLISHER__BATCH_SIZE", "500");
+            jail.set_env(
+                "LAKEKEEPER_TEST__CLOUDEVENTS_PUBLISHER__SINK_QUEUE_SIZE",
+                "100000",
+            );
+            let config = get_config();
+            assert_eq!(config.cloudevents_publisher.batch_size, 500);
+            assert_eq!(config.cloudevents_publisher.sink_queue_size, 100_000);
+            Ok(())
+        });
+    }
+
+    #[test]
+    fn test_cloudevents_outbox_config() {
+        figment::Jail::expect_with(|jail| {
+            let config = get_config();
+            assert!(!config.cloudevents_outbox.enabled);
+            assert_eq!(
+                config.cloudevents_outbox.poll_interval,
+                Duration::from_secs(1)
+            );
+            assert_eq!(
+                config.cloudevents_outbox.publish_timeout,
+                Duration::from_secs(30)
+            );
+            assert_eq!(config.cloudevents_outbox.max_attempts, 20);
+            jail.set_env("LAKEKEEPER_TEST__CLOUDEVENTS_OUTBOX__ENABLED", "true");
+            jail.set_env(
+                "LAKEKEEPER_TEST__CLOUDEVENTS_OUTBOX__POLL_INTERVAL",
+                "250ms",
+            );
+            jail.set_env("LAKEKEEPER_TEST__CLOUDEVENTS_OUTBOX__PUBLISH_TIMEOUT", "5s");
+            jail.set_env("LAKEKEEPER_TEST__CLOUDEVENTS_OUTBOX__MAX_ATTEMPTS", "3");
+            let config = get_config();
+            assert!(config.cloudevents_outbox.enabled);
+            assert_eq!(
+                config.cloudevents_outbox.poll_interval,
+                Duration::from_millis(250)
+            );
+            assert_eq!(
+                config.cloudevents_outbox.publish_timeout,
+                Duration::from_secs(5)
+            );
+            assert_eq!(config.cloudevents_outbox.max_attempts, 3);
+            Ok(())
+        });
+    }
+
+    #[test]
+    fn test_task_batch_config() {
+        figment::Jail::expect_with(|jail| {
+            let config = get_config();
+            assert_eq!(config.task_batch_size, 16);
+            assert_eq!(config.task_concurrency, 4);
+            assert_eq!(config.purge_delete_concurrency, 16);
+            jail.set_env("LAKEKEEPER_TEST__TASK_BATCH_SIZE", "100");
+            jail.set_env("LAKEKEEPER_TEST__TASK_CONCURRENCY", "10");
+            jail.set_env("LAKEKEEPER_TEST__PURGE_DELETE_CONCURRENCY", "64");
+            let config = get_config();
+            assert_eq!(config.task_batch_size, 100);
+            assert_eq!(config.task_concurrency, 10);
+            assert_eq!(config.purge_delete_concurrency, 64);
+            Ok(())
+        });
+    }
+
+    #[test]
+    fn test_commit_queue_config() {
+        figment::Jail::expect_with(|jail| {
+            let config = get_config();
+            assert!(!config.commit_queue.enabled);
+            jail.set_env("LAKEKEEPER_TEST__COMMIT_QUEUE__ENABLED", "true");
+            let config = get_config();
+            assert!(config.commit_queue.enabled);
+            Ok(())
+        });
+    }
+
+    #[test]
+    fn test_authz_decision_cache_config() {
+        figment::Jail::expect_with(|jail| {
+            let config = get_config();
+            assert!(!config.cache.authz_decisions.enabled);
+
+            jail.set_env("LAKEKEEPER_TEST__CACHE__AUTHZ_DECISIONS__ENABLED", "true");
+            jail.set_env(
+                "LAKEKEEPER_TEST__CACHE__AUTHZ_DECISIONS__TIME_TO_LIVE_SECONDS",
+                "2",
+            );
+            let config = get_config();
+            assert!(config.cache.authz_decisions.enabled);
+            assert_eq!(config.cache.authz_decisions.time_to_live_seconds, 2);
+            assert_eq!(config.cache.authz_decisions.max_entries, 100_000);
+            Ok(())
+        });
+    }
+
+    #[test]
+    fn test_table_location_index_config() {
+        figment::Jail::expect_with(|jail| {
+            jail.set_env("LAKEKEEPER_TEST__CACHE__TABLE_LOCATIONS__ENABLED", "false");
+            let config = get_config();
+            assert!(!config.cache.table_locations.enabled);
+            assert_eq!(config.cache.table_locations.max_entries, 1_000_000);
+            Ok(())
+        });
+    }
+
+    #[test]
+    fn test_gcs_credential_cache_config() {
+        figment::Jail::expect_with(|jail| {
+            jail.set_env(
+                "LAKEKEEPER_TEST__CACHE__GCS_CREDENTIALS__MAX_ENTRIES",
+                "100",
+            );
+            let config = get_config();
+            assert!(config.cache.gcs_credentials.enabled);
+            assert_eq!(config.cache.gcs_credentials.max_entries, 100);
+            Ok(())
+        });
+    }
+
+    #[test]
+    fn test_sts_credential_cache_config() {
+        figment::Jail::expect_with(|jail| {
+            jail.set_env(
+                "LAKEKEEPER_TEST__CACHE__STS_CREDENTIALS__REUSE_FRACTION",
+                "0.25",
+            );
+            let config = get_config();
+            assert!(config.cache.sts_credentials.enabled);
+            assert!((config.cache.sts_credentials.reuse_fraction - 0.25).abs() < f64::EPSILON);
+            Ok(())
+        });
+    }
+
     #[test]
     fn reserved_namespaces_should_contains_default_values() {
         assert!(CONFIG.reserved_namespaces.contains("system"));
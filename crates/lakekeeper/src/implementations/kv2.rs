@@ -99,7 +99,7 @@ impl SecretStore for SecretsState {
 
     /// Delete a secret
     async fn delete_secret(&self, secret_id: &SecretIdent) -> Result<()> {
-        Ok(vaultrs::kv2::delete_metadata(
+        vaultrs::kv2::delete_metadata(
             &*self.vault_client.read().await,
             self.secret_mount.as_str(),
             &secret_ident_to_key(*secret_id),
@@ -111,7 +111,10 @@ impl SecretStore for SecretsState {
                 "SecretDeletionFailed",
                 Some(Box::new(err)),
             )
-        })?)
+        })?;
+        crate::service::secrets::invalidate_storage_credential(*secret_id).await;
+
+        Ok(())
     }
 }
 
@@ -10,6 +10,7 @@ use itertools::Itertools;
 
 use super::{
     bootstrap::{bootstrap, get_validation_data},
+    cloudevents_outbox,
     namespace::{
         create_namespace, drop_namespace, get_namespace, list_namespaces, namespace_to_id,
         update_namespace_properties,
@@ -29,7 +30,9 @@ use super::{
 };
 use crate::{
     api::{
-        iceberg::v1::{namespace::NamespaceDropFlags, PaginatedMapping, PaginationQuery},
+        iceberg::v1::{
+            namespace::NamespaceDropFlags, LoadTableSnapshots, PaginatedMapping, PaginationQuery,
+        },
         management::v1::{
             project::{EndpointStatisticsResponse, TimeWindowSelector, WarehouseFilter},
             role::{ListRolesResponse, Role, SearchRoleResponse},
@@ -61,8 +64,9 @@ use crate::{
     request_metadata::RequestMetadata,
     service::{
         authn::UserId,
+        event_publisher::outbox::{OutboxEvent, OutboxStats},
         storage::StorageProfile,
-        task_queue::{Task, TaskCheckState, TaskFilter, TaskId, TaskInput},
+        task_queue::{Task, TaskCheckState, TaskFailure, TaskFilter, TaskId, TaskInput},
         Catalog, CreateNamespaceRequest, CreateNamespaceResponse, CreateOrUpdateUserResponse,
         CreateTableResponse, GetNamespaceResponse, GetProjectResponse, GetTableMetadataResponse,
         GetWarehouseResponse, ListFlags, ListNamespacesQuery, LoadTableResponse, NamespaceDropInfo,
@@ -209,9 +213,17 @@ impl Catalog for super::PostgresCatalog {
         warehouse_id: WarehouseId,
         tables: impl IntoIterator<Item = TableId> + Send,
         include_deleted: bool,
+        snapshots: LoadTableSnapshots,
         transaction: <Self::Transaction as Transaction<Self::State>>::Transaction<'a>,
     ) -> Result<HashMap<TableId, LoadTableResponse>> {
-        load_tables(warehouse_id, tables, include_deleted, transaction).await
+        load_tables(
+            warehouse_id,
+            tables,
+            include_deleted,
+            snapshots,
+            transaction,
+        )
+        .await
     }
 
     async fn get_table_metadata_by_id(
@@ -701,19 +713,30 @@ impl Catalog for super::PostgresCatalog {
         set_warehouse_protection(warehouse_id, protect, transaction).await
     }
 
-    async fn pick_new_task(
+    async fn pick_new_tasks(
         queue_name: &str,
         max_time_since_last_heartbeat: Duration,
+        limit: usize,
         state: Self::State,
-    ) -> Result<Option<Task>> {
-        crate::implementations::postgres::task_queues::pick_task(
+    ) -> Result<Vec<Task>> {
+        crate::implementations::postgres::task_queues::pick_tasks(
             &state.write_pool(),
             queue_name,
             max_time_since_last_heartbeat,
+            limit,
         )
         .await
     }
 
+    fn subscribe_to_new_tasks(
+        queue_name: &str,
+        state: Self::State,
+    ) -> Option<tokio::sync::watch::Receiver<()>> {
+        state
+            .task_notifier
+            .subscribe(&state.write_pool(), queue_name)
+    }
+
     async fn record_task_success(
         id: TaskId,
         message: Option<&str>,
@@ -738,6 +761,27 @@ impl Catalog for super::PostgresCatalog {
         .await
     }
 
+    async fn heartbeat_tasks(ids: &[TaskId], state: Self::State) -> Result<()> {
+        crate::implementations::postgres::task_queues::heartbeat_tasks(&state.write_pool(), ids)
+            .await
+    }
+
+    async fn record_task_successes(
+        ids: &[TaskId],
+        message: Option<&str>,
+        transaction: &mut <Self::Transaction as Transaction<Self::State>>::Transaction<'_>,
+    ) -> Result<()> {
+        crate::implementations::postgres::task_queues::record_successes(ids, transaction, message)
+            .await
+    }
+
+    async fn record_task_failures(
+        failures: &[TaskFailure],
+        transaction: &mut <Self::Transaction as Transaction<Self::State>>::Transaction<'_>,
+    ) -> Result<()> {
+        crate::implementations::postgres::task_queues::record_failures(transaction, failures).await
+    }
+
     async fn enqueue_task_batch(
         queue_name: &'static str,
         tasks: Vec<TaskInput>,
@@ -792,4 +836,55 @@ impl Catalog for super::PostgresCatalog {
     ) -> Result<Option<GetTaskQueueConfigResponse>> {
         get_task_queue_config(transaction, warehouse_id, queue_name).await
     }
+
+    async fn write_change_events(
+        events: &[cloudevents::Event],
+        transaction: <Self::Transaction as Transaction<Self::State>>::Transaction<'_>,
+    ) -> Result<()> {
+        cloudevents_outbox::write_change_events(transaction, events).await
+    }
+
+    async fn claim_change_events(
+        limit: usize,
+        lease: std::time::Duration,
+        state: Self::State,
+    ) -> Result<Vec<OutboxEvent>> {
+        cloudevents_outbox::claim_change_events(&state.write_pool(), limit, lease).await
+    }
+
+    async fn delete_change_events(sequence_numbers: &[i64], state: Self::State) -> Result<()> {
+        cloudevents_outbox::delete_change_events(&state.write_pool(), sequence_numbers).await
+    }
+
+    async fn release_change_events(
+        sequence_numbers: &[i64],
+        published_to: &[String],
+        retry_after: std::time::Duration,
+        state: Self::State,
+    ) -> Result<()> {
+        cloudevents_outbox::release_change_events(
+            &state.write_pool(),
+            sequence_numbers,
+            published_to,
+            retry_after,
+        )
+        .await
+    }
+
+    async fn dead_letter_change_events(
+        sequence_numbers: &[i64],
+        published_to: &[String],
+        state: Self::State,
+    ) -> Result<()> {
+        cloudevents_outbox::dead_letter_change_events(
+            &state.write_pool(),
+            sequence_numbers,
+            published_to,
+        )
+        .await
+    }
+
+    async fn get_change_event_outbox_stats(state: Self::State) -> Result<OutboxStats> {
+        cloudevents_outbox::get_outbox_stats(&state.read_pool()).await
+    }
 }
@@ -0,0 +1,270 @@
+use std::time::Duration;
+
+use chrono::Utc;
+use cloudevents::{AttributesReader as _, Event};
+use iceberg_ext::catalog::rest::{ErrorModel, IcebergErrorResponse};
+use itertools::Itertools;
+use sqlx::{postgres::types::PgInterval, PgConnection, PgPool};
+
+use crate::{
+    implementations::postgres::{dbutils::DBErrorHandler, task_notifications::notify_new_tasks},
+    service::event_publisher::outbox::{OutboxEvent, OutboxStats, OUTBOX_NOTIFICATION_QUEUE},
+};
+
+fn serialization_error(e: serde_json::Error) -> IcebergErrorResponse {
+    ErrorModel::internal(
+        "Failed to serialize change event",
+        "CloudEventSerializationError",
+        Some(Box::new(e)),
+    )
+    .into()
+}
+
+fn pg_interval(duration: Duration) -> PgInterval {
+    PgInterval {
+        months: 0,
+        days: 0,
+        microseconds: i64::try_from(duration.as_micros()).unwrap_or(i64::MAX),
+    }
+}
+
+pub(crate) async fn write_change_events(
+    conn: &mut PgConnection,
+    events: &[Event],
+) -> Result<(), IcebergErrorResponse> {
+    if events.is_empty() {
+        return Ok(());
+    }
+    let event_ids = events.iter().map(|e| e.id().to_string()).collect_vec();
+    let payloads = events
+        .iter()
+        .map(serde_json::to_value)
+        .collect::<Result<Vec<_>, _>>()
+        .map_err(serialization_error)?;
+    // Sequence numbers are assigned in the order of `events`.
+    sqlx::query!(
+        r#"INSERT INTO cloudevents_outbox (event_id, event)
+        SELECT event_id, event FROM UNNEST($1::text[], $2::jsonb[]) WITH ORDINALITY AS e(event_id, event, idx)
+        ORDER BY idx"#,
+        &event_ids,
+        &payloads,
+    )
+    .execute(&mut *conn)
+    .await
+    .map_err(|e| e.into_error_model("Failed to write change events to the outbox"))?;
+    // Wakes idle relays once the transaction commits.
+    notify_new_tasks(conn, OUTBOX_NOTIFICATION_QUEUE, Utc::now()).await
+}
+
+/// Claim up to `limit` of the oldest events that are neither leased nor dead-lettered,
+/// leasing them for `lease`.
+pub(crate) async fn claim_change_events(
+    pool: &PgPool,
+    limit: usize,
+    lease: Duration,
+) -> Result<Vec<OutboxEvent>, IcebergErrorResponse> {
+    let rows = sqlx::query!(
+        r#"UPDATE cloudevents_outbox o
+        SET attempts = o.attempts + 1,
+            leased_until = now() + $2::interval
+        FROM (
+            SELECT sequence_number
+            FROM cloudevents_outbox
+            WHERE dead_lettered_at IS NULL
+              AND (leased_until IS NULL OR leased_until <= now())
+            ORDER BY sequence_number
+            FOR UPDATE SKIP LOCKED
+            LIMIT $1
+        ) claimable
+        WHERE o.sequence_number = claimable.sequence_number
+        RETURNING o.sequence_number, o.event, o.attempts, o.published_to"#,
+        i64::try_from(limit).unwrap_or(i64::MAX),
+        pg_interval(lease),
+    )
+    .fetch_all(pool)
+    .await
+    .map_err(|e| e.into_error_model("Failed to claim change events from the outbox"))?;
+
+    Ok(rows
+        .into_iter()
+        .map(|row| OutboxEvent {
+            sequence_number: row.sequence_number,
+            event: serde_json::from_value(row.event)
+                .inspect_err(|e| {
+                    tracing::warn!(
+                        sequence_number = row.sequence_number,
+                        ?e,
+                        "Failed to read change event from the outbox"
+                    );
+                })
+                .ok(),
+            attempts: row.attempts,
+            published_to: row.published_to,
+        })
+        .sorted_by_key(|e| e.sequence_number)
+        .collect())
+}
+
+pub(crate) async fn delete_change_events(
+    pool: &PgPool,
+    sequence_numbers: &[i64],
+) -> Result<(), IcebergErrorResponse> {
+    sqlx::query!(
+        r#"DELETE FROM cloudevents_outbox WHERE sequence_number = ANY($1)"#,
+        sequence_numbers,
+    )
+    .execute(pool)
+    .await
+    .map_err(|e| e.into_error_model("Failed to delete published change events from the outbox"))?;
+    Ok(())
+}
+
+/// Record that `published_to` published the events and make them available again
+/// after `retry_after`.
+pub(crate) async fn release_change_events(
+    pool: &PgPool,
+    sequence_numbers: &[i64],
+    published_to: &[String],
+    retry_after: Duration,
+) -> Result<(), IcebergErrorResponse> {
+    sqlx::query!(
+        r#"UPDATE cloudevents_outbox
+        SET published_to = ARRAY(SELECT DISTINCT unnest(published_to || $2::text[])),
+            leased_until = now() + $3::interval
+        WHERE sequence_number = ANY($1)"#,
+        sequence_numbers,
+        published_to,
+        pg_interval(retry_after),
+    )
+    .execute(pool)
+    .await
+    .map_err(|e| e.into_error_model("Failed to release change events in the outbox"))?;
+    Ok(())
+}
+
+/// Record that `published_to` published the events and stop publishing them.
+pub(crate) async fn dead_letter_change_events(
+    pool: &PgPool,
+    sequence_numbers: &[i64],
+    published_to: &[String],
+) -> Result<(), IcebergErrorResponse> {
+    sqlx::query!(
+        r#"UPDATE cloudevents_outbox
+        SET published_to = ARRAY(SELECT DISTINCT unnest(published_to || $2::text[])),
+            leased_until = NULL,
+            dead_lettered_at = now()
+        WHERE sequence_number = ANY($1)"#,
+        sequence_numbers,
+        published_to,
+    )
+    .execute(pool)
+    .await
+    .map_err(|e| e.into_error_model("Failed to dead-letter change events in the outbox"))?;
+    Ok(())
+}
+
+pub(crate) async fn get_outbox_stats(pool: &PgPool) -> Result<OutboxStats, IcebergErrorResponse> {
+    let row = sqlx::query!(
+        r#"SELECT count(*) FILTER (WHERE dead_lettered_at IS NULL) AS "pending_events!",
+            count(*) FILTER (WHERE dead_lettered_at IS NOT NULL) AS "dead_lettered_events!",
+            min(created_at) FILTER (WHERE dead_lettered_at IS NULL) AS oldest_pending_event
+        FROM cloudevents_outbox"#,
+    )
+    .fetch_one(pool)
+    .await
+    .map_err(|e| e.into_error_model("Failed to read change event outbox statistics"))?;
+    Ok(OutboxStats {
+        pending_events: row.pending_events,
+        dead_lettered_events: row.dead_lettered_events,
+        oldest_pending_event: row.oldest_pending_event,
+    })
+}
+
+#[cfg(test)]
+mod tests {
+    use cloudevents::{AttributesReader as _, EventBuilder, EventBuilderV10};
+    use sqlx::PgPool;
+
+    use super::*;
+
+    fn event(id: &str) -> Event {
+        EventBuilderV10::new()
+            .id(id)
+            .source("uri:test")
+            .ty("createTable")
+            .data("application/json", serde_json::json!({"id": id}))
+            .build()
+            .unwrap()
+    }
+
+    fn ids(events: &[OutboxEvent]) -> Vec<&str> {
+        events
+            .iter()
+            .map(|e| e.event.as_ref().unwrap().id())
+            .collect_vec()
+    }
+
+    #[sqlx::test]
+    async fn test_change_events_are_claimed_in_order_and_leased(pool: PgPool) {
+        let mut conn = pool.acquire().await.unwrap();
+        write_change_events(&mut conn, &[event("1"), event("2"), event("3")])
+            .await
+            .unwrap();
+        let lease = Duration::from_secs(60);
+
+        let claimed = claim_change_events(&pool, 2, lease).await.unwrap();
+        assert_eq!(ids(&claimed), vec!["1", "2"]);
+        assert_eq!(claimed[0].event, Some(event("1")));
+        assert_eq!(claimed[0].attempts, 1);
+        assert!(claimed[0].published_to.is_empty());
+
+        // Leased events are skipped.
+        let others = claim_change_events(&pool, 10, lease).await.unwrap();
+        assert_eq!(ids(&others), vec!["3"]);
+
+        // Released events are claimed again once the retry delay passed.
+        release_change_events(
+            &pool,
+            &[claimed[0].sequence_number],
+            &["a".to_string()],
+            Duration::ZERO,
+        )
+        .await
+        .unwrap();
+        let retried = claim_change_events(&pool, 10, lease).await.unwrap();
+        assert_eq!(ids(&retried), vec!["1"]);
+        assert_eq!(retried[0].attempts, 2);
+        assert_eq!(retried[0].published_to, vec!["a".to_string()]);
+
+        dead_letter_change_events(&pool, &[retried[0].sequence_number], &["b".to_string()])
+            .await
+            .unwrap();
+        delete_change_events(&pool, &[claimed[1].sequence_number])
+            .await
+            .unwrap();
+        let stats = get_outbox_stats(&pool).await.unwrap();
+        assert_eq!(stats.pending_events, 1);
+        assert_eq!(stats.dead_lettered_events, 1);
+        assert!(stats.oldest_pending_event.is_some());
+
+        // Dead-lettered events are not claimed again.
+        release_change_events(&pool, &[others[0].sequence_number], &[], Duration::ZERO)
+            .await
+            .unwrap();
+        let remaining = claim_change_events(&pool, 10, lease).await.unwrap();
+        assert_eq!(ids(&remaining), vec!["3"]);
+    }
+
+    #[sqlx::test]
+    async fn test_unreadable_change_events_are_claimed_without_event(pool: PgPool) {
+        sqlx::query("INSERT INTO cloudevents_outbox (event_id, event) VALUES ('1', '{}')")
+            .execute(&pool)
+            .await
+            .unwrap();
+        let claimed = claim_change_events(&pool, 10, Duration::from_secs(60))
+            .await
+            .unwrap();
+        assert_eq!(claimed.len(), 1);
+        assert!(claimed[0].event.is_none());
+    }
+}
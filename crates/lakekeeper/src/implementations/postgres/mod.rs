@@ -1,5 +1,6 @@
 mod bootstrap;
 mod catalog;
+pub(crate) mod cloudevents_outbox;
 pub(crate) mod dbutils;
 pub mod endpoint_statistics;
 pub mod migrations;
@@ -8,6 +9,7 @@ mod pagination;
 pub(crate) mod role;
 pub(crate) mod secrets;
 pub mod tabular;
+mod task_notifications;
 pub mod task_queues;
 pub(crate) mod user;
 pub(crate) mod warehouse;
@@ -25,7 +27,7 @@ use sqlx::{
 pub use tabular::DeletionKind;
 use tokio::sync::RwLock;
 
-use self::dbutils::DBErrorHandler;
+use self::{dbutils::DBErrorHandler, task_notifications::TaskNotifier};
 use crate::{
     api::Result,
     config::{DynAppConfig, PgSslMode},
@@ -177,6 +179,7 @@ impl ReadWrite {
 
 pub struct CatalogState {
     pub read_write: ReadWrite,
+    pub(crate) task_notifier: Arc<TaskNotifier>,
 }
 
 #[async_trait]
@@ -195,6 +198,7 @@ impl CatalogState {
     pub fn from_pools(read_pool: PgPool, write_pool: PgPool) -> Self {
         Self {
             read_write: ReadWrite::from_pools(read_pool, write_pool),
+            task_notifier: Arc::default(),
         }
     }
 
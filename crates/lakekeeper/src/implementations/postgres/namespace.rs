@@ -617,7 +617,7 @@ pub(crate) mod tests {
         *,
     };
     use crate::{
-        api::iceberg::types::PageToken,
+        api::iceberg::{types::PageToken, v1::LoadTableSnapshots},
         implementations::postgres::{
             tabular::{
                 set_tabular_protected,
@@ -967,6 +967,7 @@ pub(crate) mod tests {
             warehouse_id,
             [table.table_id].into_iter(),
             true,
+            LoadTableSnapshots::All,
             transaction.transaction(),
         )
         .await
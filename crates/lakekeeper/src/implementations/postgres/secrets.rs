@@ -168,6 +168,7 @@ impl SecretStore for SecretsState {
                 .source(Some(Box::new(e)))
                 .build()
         })?;
+        crate::service::secrets::invalidate_storage_credential(*secret_id).await;
 
         Ok(())
     }
@@ -218,4 +219,57 @@ mod tests {
 
         assert!(read_secret.is_err());
     }
+
+    #[sqlx::test]
+    async fn test_deleted_secret_is_evicted_from_cache(pool: sqlx::PgPool) {
+        let state = SecretsState::from_pools(pool.clone(), pool);
+
+        let secret: StorageCredential = S3Credential::AccessKey(S3AccessKeyCredential {
+            aws_access_key_id: "my access key".to_string(),
+            aws_secret_access_key: "my secret key".to_string(),
+            external_id: None,
+        })
+        .into();
+
+        let secret_id = state.create_secret(secret.clone()).await.unwrap();
+        let cached = crate::service::secrets::get_storage_credential(&state, secret_id)
+            .await
+            .unwrap();
+        assert_eq!(cached, secret);
+
+        state.delete_secret(&secret_id).await.unwrap();
+
+        assert!(
+            crate::service::secrets::get_storage_credential(&state, secret_id)
+                .await
+                .is_err()
+        );
+    }
+
+    #[sqlx::test]
+    async fn test_read_racing_delete_does_not_cache_secret(pool: sqlx::PgPool) {
+        let state = SecretsState::from_pools(pool.clone(), pool);
+
+        let secret: StorageCredential = S3Credential::AccessKey(S3AccessKeyCredential {
+            aws_access_key_id: "my access key".to_string(),
+            aws_secret_access_key: "my secret key".to_string(),
+            external_id: None,
+        })
+        .into();
+
+        for _ in 0..10 {
+            let secret_id = state.create_secret(secret.clone()).await.unwrap();
+            let (_, deleted) = tokio::join!(
+                crate::service::secrets::get_storage_credential(&state, secret_id),
+                state.delete_secret(&secret_id)
+            );
+            deleted.unwrap();
+
+            assert!(
+                crate::service::secrets::get_storage_credential(&state, secret_id)
+                    .await
+                    .is_err()
+            );
+        }
+    }
 }
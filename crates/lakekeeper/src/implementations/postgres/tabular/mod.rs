@@ -130,7 +130,7 @@ pub(crate) async fn tabular_ident_to_id<'a, 'e, 'c: 'e, E>(
     table: &TabularIdentBorrowed<'a>,
     list_flags: crate::service::ListFlags,
     transaction: E,
-) -> Result<Option<(TabularId, String)>>
+) -> Result<Option<(TabularId, String, Option<String>)>>
 where
     E: 'e + sqlx::Executor<'c, Database = sqlx::Postgres>,
 {
@@ -139,7 +139,7 @@ where
 
     let rows = sqlx::query!(
         r#"
-        SELECT t.tabular_id, t.typ as "typ: TabularType", fs_protocol, fs_location
+        SELECT t.tabular_id, t.typ as "typ: TabularType", fs_protocol, fs_location, t.metadata_location
         FROM tabular t
         INNER JOIN namespace n ON t.namespace_id = n.namespace_id
         INNER JOIN warehouse w ON n.warehouse_id = w.warehouse_id
@@ -161,10 +161,11 @@ where
     .await
     .map(|r| {
         let location = join_location(&r.fs_protocol, &r.fs_location);
-        Some(match r.typ {
-            TabularType::Table => (TabularId::Table(r.tabular_id), location),
-            TabularType::View => (TabularId::View(r.tabular_id), location),
-        })
+        let id = match r.typ {
+            TabularType::Table => TabularId::Table(r.tabular_id),
+            TabularType::View => TabularId::View(r.tabular_id),
+        };
+        Some((id, location, r.metadata_location))
     });
 
     match rows {
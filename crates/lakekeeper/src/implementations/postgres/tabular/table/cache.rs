@@ -0,0 +1,132 @@
+use std::sync::LazyLock;
+
+use axum_prometheus::metrics;
+use iceberg::spec::TableMetadata;
+
+use crate::{api::iceberg::v1::LoadTableSnapshots, service::TableId, CONFIG};
+
+const METRIC_CACHE_HITS: &str = "lakekeeper_table_metadata_cache_hits_total";
+const METRIC_CACHE_MISSES: &str = "lakekeeper_table_metadata_cache_misses_total";
+
+// Rough per-item sizes used to weigh cache entries. They don't need to be exact,
+// they only need to scale with the parts of the metadata that grow over time.
+const BASE_WEIGHT: usize = 4 * 1024;
+const SCHEMA_FIELD_WEIGHT: usize = 128;
+const SNAPSHOT_WEIGHT: usize = 1024;
+const LOG_ENTRY_WEIGHT: usize = 128;
+const STATISTICS_WEIGHT: usize = 512;
+
+/// Table metadata is immutable for a given metadata location. Keying by
+/// `(table_id, metadata_location)` means that a commit produces a new key
+/// and stale entries are never served - they simply age out.
+/// Refs-only metadata is a different view of the same version and cached separately.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+pub(super) struct TableMetadataCacheKey {
+    pub(super) table_id: TableId,
+    pub(super) metadata_location: String,
+    pub(super) load_snapshots: LoadTableSnapshots,
+}
+
+static TABLE_METADATA_CACHE: LazyLock<moka::sync::Cache<TableMetadataCacheKey, TableMetadata>> =
+    LazyLock::new(|| {
+        moka::sync::Cache::builder()
+            .max_capacity(
+                CONFIG
+                    .cache
+                    .table_metadata
+                    .max_size_mb
+                    .saturating_mul(1024 * 1024),
+            )
+            .weigher(|_key, value: &TableMetadata| {
+                u32::try_from(estimate_size(value)).unwrap_or(u32::MAX)
+            })
+            .build()
+    });
+
+pub(super) fn is_enabled() -> bool {
+    CONFIG.cache.table_metadata.enabled
+}
+
+pub(super) fn get(key: &TableMetadataCacheKey) -> Option<TableMetadata> {
+    let value = TABLE_METADATA_CACHE.get(key);
+    if value.is_some() {
+        metrics::counter!(METRIC_CACHE_HITS).increment(1);
+    } else {
+        metrics::counter!(METRIC_CACHE_MISSES).increment(1);
+    }
+    value
+}
+
+pub(super) fn insert(key: TableMetadataCacheKey, metadata: TableMetadata) {
+    TABLE_METADATA_CACHE.insert(key, metadata);
+}
+
+/// Approximate the in-memory footprint of `TableMetadata` in bytes.
+fn estimate_size(metadata: &TableMetadata) -> usize {
+    let schema_fields = metadata
+        .schemas_iter()
+        .map(|s| s.as_struct().fields().len())
+        .sum::<usize>();
+    let properties = metadata
+        .properties()
+        .iter()
+        .map(|(k, v)| k.len() + v.len())
+        .sum::<usize>();
+    let log_entries = metadata.history().len() + metadata.metadata_log().len();
+    let statistics =
+        metadata.statistics_iter().count() + metadata.partition_statistics_iter().count();
+
+    BASE_WEIGHT
+        + schema_fields * SCHEMA_FIELD_WEIGHT
+        + metadata.partition_specs_iter().count() * SCHEMA_FIELD_WEIGHT
+        + metadata.sort_orders_iter().count() * SCHEMA_FIELD_WEIGHT
+        + metadata.snapshots().count() * SNAPSHOT_WEIGHT
+        + log_entries * LOG_ENTRY_WEIGHT
+        + statistics * STATISTICS_WEIGHT
+        + properties
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::{
+        catalog::tables::create_table_request_into_table_metadata,
+        implementations::postgres::tabular::table::tests::create_request,
+    };
+
+    #[test]
+    fn test_cache_key_includes_metadata_location() {
+        let table_id = TableId::from(uuid::Uuid::now_v7());
+        let (request, _) = create_request(Some(false), None);
+        let metadata = create_table_request_into_table_metadata(table_id, request).unwrap();
+
+        let key = TableMetadataCacheKey {
+            table_id,
+            metadata_location: "s3://bucket/table/metadata/00000-a.metadata.json".to_string(),
+            load_snapshots: LoadTableSnapshots::All,
+        };
+        insert(key.clone(), metadata.clone());
+        assert_eq!(get(&key), Some(metadata));
+
+        let refs_key = TableMetadataCacheKey {
+            load_snapshots: LoadTableSnapshots::Refs,
+            ..key.clone()
+        };
+        assert!(get(&refs_key).is_none());
+
+        let next_key = TableMetadataCacheKey {
+            table_id,
+            metadata_location: "s3://bucket/table/metadata/00001-b.metadata.json".to_string(),
+            load_snapshots: LoadTableSnapshots::All,
+        };
+        assert!(get(&next_key).is_none());
+    }
+
+    #[test]
+    fn test_estimate_size_grows_with_schema() {
+        let table_id = TableId::from(uuid::Uuid::now_v7());
+        let (request, _) = create_request(Some(false), None);
+        let metadata = create_table_request_into_table_metadata(table_id, request).unwrap();
+        assert!(estimate_size(&metadata) > BASE_WEIGHT);
+    }
+}
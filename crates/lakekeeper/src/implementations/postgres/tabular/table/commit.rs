@@ -12,7 +12,7 @@ use crate::{
         dbutils::DBErrorHandler,
         tabular::table::{
             common::{self, expire_metadata_log_entries, remove_snapshot_log_entries},
-            DbTableFormatVersion, TableUpdates, MAX_PARAMETERS,
+            location_index, DbTableFormatVersion, TableUpdates, MAX_PARAMETERS,
         },
     },
     service::{storage::split_location, TableCommit},
@@ -53,6 +53,22 @@ pub(crate) async fn commit_table_transaction(
         })
         .unzip();
 
+    let (mut query_meta_update, mut query_meta_location_update) =
+        build_queries(&location_metadata_pairs)?;
+
+    // Swap the metadata location first. It is the compare-and-swap that detects concurrent
+    // commits, so a commit that lost the race fails before doing any further work.
+    let updated_tabulars = query_meta_location_update
+        .build()
+        .fetch_all(&mut **transaction)
+        .await
+        .map_err(|e| {
+            e.into_error_model("Error committing tablemetadata location updates".to_string())
+        })?;
+    let updated_tabulars_ids: HashSet<uuid::Uuid> =
+        updated_tabulars.into_iter().map(|row| row.get(0)).collect();
+    verify_metadata_location_swapped(&tabular_ids_in_commit, &updated_tabulars_ids)?;
+
     for ((updates, diffs), TableMetadataTransition { new_metadata, .. }) in table_change_operations
         .into_iter()
         .zip(location_metadata_pairs.iter())
@@ -61,9 +77,6 @@ pub(crate) async fn commit_table_transaction(
         apply_metadata_changes(transaction, updates, new_metadata, diffs).await?;
     }
 
-    let (mut query_meta_update, mut query_meta_location_update) =
-        build_queries(location_metadata_pairs)?;
-
     // futures::try_join didn't work due to concurrent mutable borrow of transaction
     let updated_tables = query_meta_update
         .build()
@@ -72,22 +85,7 @@ pub(crate) async fn commit_table_transaction(
         .map_err(|e| e.into_error_model("Error committing tablemetadata updates".to_string()))?;
     let updated_tables_ids: HashSet<uuid::Uuid> =
         updated_tables.into_iter().map(|row| row.get(0)).collect();
-
-    let updated_tabulars = query_meta_location_update
-        .build()
-        .fetch_all(&mut **transaction)
-        .await
-        .map_err(|e| {
-            e.into_error_model("Error committing tablemetadata location updates".to_string())
-        })?;
-    let updated_tabulars_ids: HashSet<uuid::Uuid> =
-        updated_tabulars.into_iter().map(|row| row.get(0)).collect();
-
-    verify_commit_completeness(CommitVerificationData {
-        tabular_ids_in_commit,
-        updated_tables_ids,
-        updated_tabulars_ids,
-    })?;
+    verify_tables_updated(&tabular_ids_in_commit, &updated_tables_ids)?;
 
     Ok(())
 }
@@ -98,14 +96,8 @@ struct TableMetadataTransition {
     new_metadata_location: Location,
 }
 
-struct CommitVerificationData {
-    tabular_ids_in_commit: HashSet<uuid::Uuid>,
-    updated_tables_ids: HashSet<uuid::Uuid>,
-    updated_tabulars_ids: HashSet<uuid::Uuid>,
-}
-
 fn build_queries(
-    location_metadata_pairs: Vec<TableMetadataTransition>,
+    location_metadata_pairs: &[TableMetadataTransition],
 ) -> Result<
     (
         sqlx::QueryBuilder<'static, Postgres>,
@@ -142,9 +134,10 @@ fn build_queries(
             new_metadata,
             new_metadata_location,
         },
-    ) in location_metadata_pairs.into_iter().enumerate()
+    ) in location_metadata_pairs.iter().enumerate()
     {
         let (fs_protocol, fs_location) = split_location(new_metadata.location())?;
+        location_index::relocate(new_metadata.uuid().into(), fs_location);
 
         query_builder_table.push("(");
         query_builder_table.push_bind(new_metadata.uuid());
@@ -172,7 +165,8 @@ fn build_queries(
         query_builder_tabular.push(", ");
         query_builder_tabular.push_bind(fs_protocol.to_string());
         query_builder_tabular.push(", ");
-        query_builder_tabular.push_bind(previous_metadata_location.map(|l| l.to_string()));
+        query_builder_tabular
+            .push_bind(previous_metadata_location.as_ref().map(ToString::to_string));
         query_builder_tabular.push(")");
 
         if i != n_commits - 1 {
@@ -193,16 +187,13 @@ fn build_queries(
     Ok((query_builder_table, query_builder_tabular))
 }
 
-fn verify_commit_completeness(verification_data: CommitVerificationData) -> api::Result<()> {
-    let CommitVerificationData {
-        tabular_ids_in_commit,
-        updated_tables_ids,
-        updated_tabulars_ids,
-    } = verification_data;
-
-    if tabular_ids_in_commit != updated_tables_ids {
+fn verify_metadata_location_swapped(
+    tabular_ids_in_commit: &HashSet<uuid::Uuid>,
+    updated_tabulars_ids: &HashSet<uuid::Uuid>,
+) -> api::Result<()> {
+    if tabular_ids_in_commit != updated_tabulars_ids {
         let missing_ids = tabular_ids_in_commit
-            .difference(&updated_tables_ids)
+            .difference(updated_tabulars_ids)
             .collect_vec();
         return Err(ErrorModel::bad_request(
             format!("Concurrent updates to tables with IDs: {missing_ids:?}"),
@@ -211,10 +202,16 @@ fn verify_commit_completeness(verification_data: CommitVerificationData) -> api:
         )
         .into());
     }
+    Ok(())
+}
 
-    if tabular_ids_in_commit != updated_tabulars_ids {
+fn verify_tables_updated(
+    tabular_ids_in_commit: &HashSet<uuid::Uuid>,
+    updated_tables_ids: &HashSet<uuid::Uuid>,
+) -> api::Result<()> {
+    if tabular_ids_in_commit != updated_tables_ids {
         let missing_ids = tabular_ids_in_commit
-            .difference(&updated_tabulars_ids)
+            .difference(updated_tables_ids)
             .collect_vec();
         return Err(ErrorModel::internal(
             format!("Failed to update tables with IDs: {missing_ids:?}"),
@@ -14,7 +14,7 @@ use crate::{
         dbutils::DBErrorHandler,
         tabular::{
             create_tabular,
-            table::{common, DbTableFormatVersion},
+            table::{common, location_index, DbTableFormatVersion},
             CreateTabular, TabularType,
         },
     },
@@ -40,6 +40,9 @@ pub(crate) async fn create_table(
     })?;
 
     let staged_table_id = maybe_delete_staged_table(namespace_id, transaction, name).await?;
+    if let Some(staged_table_id) = staged_table_id {
+        location_index::remove(staged_table_id);
+    }
 
     let tabular_id = create_tabular(
         CreateTabular {
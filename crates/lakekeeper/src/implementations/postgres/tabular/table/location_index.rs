@@ -0,0 +1,339 @@
+use std::{
+    collections::{HashMap, VecDeque},
+    sync::{
+        atomic::{AtomicBool, Ordering},
+        LazyLock, RwLock,
+    },
+};
+
+use axum_prometheus::metrics;
+
+use crate::{service::TableId, WarehouseId, CONFIG};
+
+const METRIC_INDEX_HITS: &str = "lakekeeper_table_location_index_hits_total";
+const METRIC_INDEX_MISSES: &str = "lakekeeper_table_location_index_misses_total";
+
+/// Maps table locations to table ids, so that S3 sign requests without a table id
+/// can be resolved without scanning `tabular` by location.
+///
+/// The index is only a hint: every hit is verified by loading the table by id and
+/// checking that its current location covers the requested location.
+/// Entries are added when tables are found by location, and removed when a table is
+/// dropped, moved to a different location or fails the verification. Renames don't
+/// change the location of a table.
+///
+/// Removals happen inside the transaction of the change. If it is rolled back, the
+/// next lookup indexes the table again. If a concurrent lookup indexes the old location
+/// before the change is committed, the entry fails the verification afterwards.
+///
+/// Once `max_entries` tables are indexed, tables that were not found recently are
+/// evicted to make room for new ones.
+static TABLE_LOCATION_INDEX: LazyLock<RwLock<LocationIndex>> =
+    LazyLock::new(|| RwLock::new(LocationIndex::new(CONFIG.cache.table_locations.max_entries)));
+
+pub(super) fn is_enabled() -> bool {
+    CONFIG.cache.table_locations.enabled
+}
+
+/// Find the table whose location is the longest prefix of `fs_location`.
+pub(super) fn get(warehouse_id: WarehouseId, fs_location: &str) -> Option<TableId> {
+    let table_id = TABLE_LOCATION_INDEX
+        .read()
+        .ok()
+        .and_then(|index| index.get(warehouse_id, fs_location));
+    if table_id.is_some() {
+        metrics::counter!(METRIC_INDEX_HITS).increment(1);
+    } else {
+        metrics::counter!(METRIC_INDEX_MISSES).increment(1);
+    }
+    table_id
+}
+
+pub(super) fn insert(warehouse_id: WarehouseId, table_id: TableId, fs_location: &str) {
+    if !is_enabled() {
+        return;
+    }
+    if let Ok(mut index) = TABLE_LOCATION_INDEX.write() {
+        index.insert(warehouse_id, table_id, fs_location);
+    }
+}
+
+pub(super) fn remove(table_id: TableId) {
+    if let Ok(mut index) = TABLE_LOCATION_INDEX.write() {
+        index.remove(table_id);
+    }
+}
+
+/// Check if `fs_location` is `table_location` or a path below it.
+pub(super) fn covers(table_location: &str, fs_location: &str) -> bool {
+    path_segments(fs_location).starts_with(&path_segments(table_location))
+}
+
+/// Remove the entry of `table_id` if it is indexed at a location other than `fs_location`.
+pub(super) fn relocate(table_id: TableId, fs_location: &str) {
+    let moved = TABLE_LOCATION_INDEX.read().is_ok_and(|index| {
+        index
+            .tables
+            .get(&table_id)
+            .is_some_and(|table| table.segments != path_segments(fs_location))
+    });
+    if moved {
+        remove(table_id);
+    }
+}
+
+fn path_segments(fs_location: &str) -> Vec<String> {
+    fs_location
+        .split('/')
+        .filter(|s| !s.is_empty())
+        .map(ToString::to_string)
+        .collect()
+}
+
+#[derive(Debug)]
+struct LocationIndex {
+    max_entries: usize,
+    warehouses: HashMap<WarehouseId, Node>,
+    tables: HashMap<TableId, IndexedTable>,
+    /// Candidates for eviction, oldest first, with the `insertion` they belong to.
+    /// Entries of removed or re-inserted tables are skipped.
+    eviction_queue: VecDeque<(TableId, u64)>,
+    insertions: u64,
+}
+
+#[derive(Debug)]
+struct IndexedTable {
+    warehouse_id: WarehouseId,
+    segments: Vec<String>,
+    insertion: u64,
+    /// Set when the table is found. A recently used table is passed over once when
+    /// it is up for eviction.
+    recently_used: AtomicBool,
+}
+
+#[derive(Debug, Default)]
+struct Node {
+    table_id: Option<TableId>,
+    children: HashMap<String, Node>,
+}
+
+impl LocationIndex {
+    fn new(max_entries: usize) -> Self {
+        Self {
+            max_entries,
+            warehouses: HashMap::new(),
+            tables: HashMap::new(),
+            eviction_queue: VecDeque::new(),
+            insertions: 0,
+        }
+    }
+
+    fn get(&self, warehouse_id: WarehouseId, fs_location: &str) -> Option<TableId> {
+        let mut node = self.warehouses.get(&warehouse_id)?;
+        let mut table_id = node.table_id;
+        for segment in fs_location.split('/').filter(|s| !s.is_empty()) {
+            let Some(child) = node.children.get(segment) else {
+                break;
+            };
+            node = child;
+            table_id = node.table_id.or(table_id);
+        }
+        if let Some(table) = table_id.and_then(|id| self.tables.get(&id)) {
+            table.recently_used.store(true, Ordering::Relaxed);
+        }
+        table_id
+    }
+
+    fn insert(&mut self, warehouse_id: WarehouseId, table_id: TableId, fs_location: &str) {
+        self.remove(table_id);
+        while self.tables.len() >= self.max_entries {
+            if !self.evict() {
+                return;
+            }
+        }
+        let segments = path_segments(fs_location);
+        let node = segments.iter().fold(
+            self.warehouses.entry(warehouse_id).or_default(),
+            |node, segment| node.children.entry(segment.clone()).or_default(),
+        );
+        if let Some(previous) = node.table_id.replace(table_id) {
+            self.tables.remove(&previous);
+        }
+        self.insertions += 1;
+        self.tables.insert(
+            table_id,
+            IndexedTable {
+                warehouse_id,
+                segments,
+                insertion: self.insertions,
+                recently_used: AtomicBool::new(false),
+            },
+        );
+        self.eviction_queue.push_back((table_id, self.insertions));
+        if self.eviction_queue.len() > self.tables.len().saturating_mul(2).max(16) {
+            let tables = &self.tables;
+            self.eviction_queue.retain(|(id, insertion)| {
+                tables.get(id).is_some_and(|t| t.insertion == *insertion)
+            });
+        }
+    }
+
+    fn remove(&mut self, table_id: TableId) {
+        let Some(table) = self.tables.remove(&table_id) else {
+            return;
+        };
+        if let Some(root) = self.warehouses.get_mut(&table.warehouse_id) {
+            root.remove(&table.segments, table_id);
+            if root.is_empty() {
+                self.warehouses.remove(&table.warehouse_id);
+            }
+        }
+    }
+
+    /// Remove the oldest table that was not found since it was last passed over.
+    /// Returns `false` if there is no table to evict.
+    fn evict(&mut self) -> bool {
+        while let Some((table_id, insertion)) = self.eviction_queue.pop_front() {
+            let Some(table) = self
+                .tables
+                .get(&table_id)
+                .filter(|t| t.insertion == insertion)
+            else {
+                continue;
+            };
+            if table.recently_used.swap(false, Ordering::Relaxed) {
+                self.eviction_queue.push_back((table_id, insertion));
+            } else {
+                self.remove(table_id);
+                return true;
+            }
+        }
+        false
+    }
+}
+
+impl Node {
+    fn is_empty(&self) -> bool {
+        self.table_id.is_none() && self.children.is_empty()
+    }
+
+    /// Remove `table_id` at `segments` and prune nodes that became empty.
+    fn remove(&mut self, segments: &[String], table_id: TableId) {
+        match segments.split_first() {
+            None => {
+                if self.table_id == Some(table_id) {
+                    self.table_id = None;
+                }
+            }
+            Some((segment, rest)) => {
+                if let Some(child) = self.children.get_mut(segment) {
+                    child.remove(rest, table_id);
+                    if child.is_empty() {
+                        self.children.remove(segment);
+                    }
+                }
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_longest_prefix_is_returned() {
+        let warehouse_id = WarehouseId::new_random();
+        let outer = TableId::new_random();
+        let inner = TableId::new_random();
+        let mut index = LocationIndex::new(100);
+        index.insert(warehouse_id, outer, "bucket/ns/outer/");
+        index.insert(warehouse_id, inner, "bucket/ns/outer/inner");
+
+        assert_eq!(
+            index.get(warehouse_id, "bucket/ns/outer/data/file.parquet"),
+            Some(outer)
+        );
+        assert_eq!(
+            index.get(warehouse_id, "bucket/ns/outer/inner/data/file.parquet"),
+            Some(inner)
+        );
+        assert_eq!(index.get(warehouse_id, "bucket/ns/outer"), Some(outer));
+        assert_eq!(index.get(warehouse_id, "bucket/ns/out"), None);
+        assert_eq!(index.get(warehouse_id, "bucket/ns"), None);
+        assert_eq!(
+            index.get(WarehouseId::new_random(), "bucket/ns/outer/file"),
+            None
+        );
+    }
+
+    #[test]
+    fn test_remove_prunes_empty_nodes() {
+        let warehouse_id = WarehouseId::new_random();
+        let table_id = TableId::new_random();
+        let mut index = LocationIndex::new(100);
+        index.insert(warehouse_id, table_id, "bucket/ns/table");
+        index.remove(table_id);
+
+        assert_eq!(index.get(warehouse_id, "bucket/ns/table/file"), None);
+        assert!(index.warehouses.is_empty());
+        assert!(index.tables.is_empty());
+    }
+
+    #[test]
+    fn test_reinsert_moves_table() {
+        let warehouse_id = WarehouseId::new_random();
+        let table_id = TableId::new_random();
+        let mut index = LocationIndex::new(100);
+        index.insert(warehouse_id, table_id, "bucket/old");
+        index.insert(warehouse_id, table_id, "bucket/new");
+
+        assert_eq!(index.get(warehouse_id, "bucket/old/file"), None);
+        assert_eq!(index.get(warehouse_id, "bucket/new/file"), Some(table_id));
+        assert_eq!(index.tables.len(), 1);
+    }
+
+    #[test]
+    fn test_least_recently_found_tables_are_evicted() {
+        let warehouse_id = WarehouseId::new_random();
+        let tables = [
+            TableId::new_random(),
+            TableId::new_random(),
+            TableId::new_random(),
+        ];
+        let mut index = LocationIndex::new(2);
+        index.insert(warehouse_id, tables[0], "bucket/t0");
+        index.insert(warehouse_id, tables[1], "bucket/t1");
+        assert_eq!(index.get(warehouse_id, "bucket/t0/file"), Some(tables[0]));
+
+        // The oldest table was found recently, so the second one is evicted
+        index.insert(warehouse_id, tables[2], "bucket/t2");
+        assert_eq!(index.tables.len(), 2);
+        assert_eq!(index.get(warehouse_id, "bucket/t0/file"), Some(tables[0]));
+        assert_eq!(index.get(warehouse_id, "bucket/t1/file"), None);
+        assert_eq!(index.get(warehouse_id, "bucket/t2/file"), Some(tables[2]));
+
+        // Re-inserting a table doesn't evict it
+        for _ in 0..50 {
+            index.insert(warehouse_id, tables[2], "bucket/t2");
+        }
+        assert_eq!(index.tables.len(), 2);
+        assert!(index.eviction_queue.len() <= 16);
+        assert_eq!(index.get(warehouse_id, "bucket/t0/file"), Some(tables[0]));
+        assert_eq!(index.get(warehouse_id, "bucket/t2/file"), Some(tables[2]));
+    }
+
+    #[test]
+    fn test_covers() {
+        assert!(covers(
+            "bucket/ns/table",
+            "bucket/ns/table/data/file.parquet"
+        ));
+        assert!(covers("bucket/ns/table/", "bucket/ns/table"));
+        assert!(!covers(
+            "bucket/ns/table",
+            "bucket/ns/table-2/data/file.parquet"
+        ));
+        assert!(!covers("bucket/ns/table", "bucket/ns"));
+    }
+}
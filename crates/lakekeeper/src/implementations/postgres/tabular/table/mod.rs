@@ -1,6 +1,8 @@
+mod cache;
 mod commit;
 mod common;
 mod create;
+mod location_index;
 
 use std::{
     collections::{HashMap, HashSet},
@@ -26,7 +28,7 @@ use uuid::Uuid;
 
 use super::get_partial_fs_locations;
 use crate::{
-    api::iceberg::v1::{PaginatedMapping, PaginationQuery},
+    api::iceberg::v1::{LoadTableSnapshots, PaginatedMapping, PaginationQuery},
     implementations::postgres::{
         dbutils::DBErrorHandler as _,
         tabular::{
@@ -61,10 +63,11 @@ where
         catalog_state,
     )
     .await?
-    .map(|(id, location)| match id {
+    .map(|(id, location, metadata_location)| match id {
         TabularId::Table(tab) => Ok(TabularDetails {
             ident: tab.into(),
             location,
+            metadata_location,
         }),
         TabularId::View(_) => Err(ErrorModel::builder()
             .code(StatusCode::INTERNAL_SERVER_ERROR.into())
@@ -223,7 +226,10 @@ struct TableQueryStruct {
 
 impl TableQueryStruct {
     #[expect(clippy::too_many_lines)]
-    fn into_table_metadata(self) -> Result<Option<TableMetadata>> {
+    fn into_table_metadata(
+        self,
+        load_snapshots: LoadTableSnapshots,
+    ) -> Result<Option<TableMetadata>> {
         macro_rules! expect {
             ($e:expr) => {
                 match $e {
@@ -292,12 +298,18 @@ impl TableQueryStruct {
                 )
             },
         )
-        .collect::<_>();
+        .collect::<HashMap<_, _>>();
+        // In refs mode, snapshots not referenced by a branch or tag are not loaded.
+        // Drop everything else that points to them so the metadata stays consistent.
+        let is_loaded = |snapshot_id: &i64| {
+            load_snapshots == LoadTableSnapshots::All || snapshots.contains_key(snapshot_id)
+        };
 
         let snapshot_log = itertools::multizip((
             self.snapshot_log_ids.unwrap_or_default(),
             self.snapshot_log_timestamps.unwrap_or_default(),
         ))
+        .filter(|(snap_id, _)| is_loaded(snap_id))
         .map(|(snap_id, timestamp)| iceberg::spec::SnapshotLog {
             snapshot_id: snap_id,
             timestamp_ms: timestamp,
@@ -342,6 +354,7 @@ impl TableQueryStruct {
             self.partition_stats_statistics_paths.unwrap_or_default(),
             self.partition_stats_file_size_in_bytes.unwrap_or_default(),
         ))
+        .filter(|(snapshot_id, _, _)| is_loaded(snapshot_id))
         .map(|(snapshot_id, statistics_path, file_size_in_bytes)| {
             (
                 snapshot_id,
@@ -363,6 +376,7 @@ impl TableQueryStruct {
             self.table_stats_key_metadata.unwrap_or_default(),
             self.table_stats_blob_metadata.unwrap_or_default(),
         ))
+        .filter(|(snapshot_id, ..)| is_loaded(snapshot_id))
         .map(
             |(
                 snapshot_id,
@@ -452,11 +466,123 @@ pub(crate) async fn load_storage_profile(
     ))
 }
 
-#[allow(clippy::too_many_lines)]
 pub(crate) async fn load_tables(
     warehouse_id: WarehouseId,
     tables: impl IntoIterator<Item = TableId>,
     include_deleted: bool,
+    load_snapshots: LoadTableSnapshots,
+    transaction: &mut sqlx::Transaction<'_, sqlx::Postgres>,
+) -> Result<HashMap<TableId, LoadTableResponse>> {
+    if !cache::is_enabled() {
+        return load_tables_from_db(
+            warehouse_id,
+            tables,
+            include_deleted,
+            load_snapshots,
+            transaction,
+        )
+        .await;
+    }
+
+    let table_ids = tables.into_iter().map(Into::into).collect::<Vec<Uuid>>();
+    // Cheap lookup of the current metadata location. Metadata is only rebuilt
+    // from the table_* relations for tables which are not cached at that location.
+    let current = sqlx::query!(
+        r#"
+        SELECT
+            t."table_id",
+            ti.namespace_id,
+            ti."metadata_location",
+            w.storage_profile as "storage_profile: Json<StorageProfile>",
+            w."storage_secret_id"
+        FROM "table" t
+        INNER JOIN tabular ti ON t.table_id = ti.tabular_id
+        INNER JOIN namespace n ON ti.namespace_id = n.namespace_id
+        INNER JOIN warehouse w ON n.warehouse_id = w.warehouse_id
+        WHERE w.warehouse_id = $1
+            AND w.status = 'active'
+            AND (ti.deleted_at IS NULL OR $3)
+            AND t."table_id" = ANY($2)
+        "#,
+        *warehouse_id,
+        &table_ids,
+        include_deleted
+    )
+    .fetch_all(&mut **transaction)
+    .await
+    .map_err(|e| e.into_error_model("Error fetching table metadata locations".to_string()))?;
+
+    let mut tables = HashMap::with_capacity(table_ids.len());
+    let mut cache_misses = Vec::new();
+    for row in current {
+        let table_id = TableId::from(row.table_id);
+        // Staged tables have no metadata location and can change without one, never cache them.
+        let Some(metadata_location) = row.metadata_location else {
+            cache_misses.push(row.table_id);
+            continue;
+        };
+        let metadata_location = Location::from_str(&metadata_location).map_err(|e| {
+            ErrorModel::internal(
+                "Error parsing metadata location",
+                "InternalMetadataLocationParseError",
+                Some(Box::new(e)),
+            )
+        })?;
+        let Some(table_metadata) = cache::get(&cache::TableMetadataCacheKey {
+            table_id,
+            metadata_location: metadata_location.to_string(),
+            load_snapshots,
+        }) else {
+            cache_misses.push(row.table_id);
+            continue;
+        };
+
+        tables.insert(
+            table_id,
+            LoadTableResponse {
+                table_id,
+                namespace_id: row.namespace_id.into(),
+                table_metadata,
+                metadata_location: Some(metadata_location),
+                storage_secret_ident: row.storage_secret_id.map(SecretIdent::from),
+                storage_profile: row.storage_profile.0,
+            },
+        );
+    }
+
+    if !cache_misses.is_empty() {
+        let loaded = load_tables_from_db(
+            warehouse_id,
+            cache_misses.into_iter().map(TableId::from),
+            include_deleted,
+            load_snapshots,
+            transaction,
+        )
+        .await?;
+        for (table_id, response) in loaded {
+            if let Some(metadata_location) = &response.metadata_location {
+                cache::insert(
+                    cache::TableMetadataCacheKey {
+                        table_id,
+                        metadata_location: metadata_location.to_string(),
+                        load_snapshots,
+                    },
+                    response.table_metadata.clone(),
+                );
+            }
+            tables.insert(table_id, response);
+        }
+    }
+
+    Ok(tables)
+}
+
+#[allow(clippy::too_many_lines)]
+async fn load_tables_from_db(
+    warehouse_id: WarehouseId,
+    tables: impl IntoIterator<Item = TableId>,
+    include_deleted: bool,
+    load_snapshots: LoadTableSnapshots,
     transaction: &mut sqlx::Transaction<'_, sqlx::Postgres>,
 ) -> Result<HashMap<TableId, LoadTableResponse>> {
     let table_ids = &tables.into_iter().map(Into::into).collect::<Vec<_>>();
@@ -543,12 +669,18 @@ pub(crate) async fn load_tables(
                           ARRAY_AGG(summary) as summaries,
                           ARRAY_AGG(schema_id) as schema_ids,
                           ARRAY_AGG(timestamp_ms) as timestamp
-                   FROM table_snapshot WHERE table_id = ANY($2)
+                   FROM table_snapshot s WHERE table_id = ANY($2)
+                   AND (NOT $4 OR EXISTS (SELECT 1 FROM table_refs r
+                                          WHERE r.table_id = s.table_id
+                                          AND r.snapshot_id = s.snapshot_id))
                    GROUP BY table_id) tsnap ON tsnap.table_id = t.table_id
         LEFT JOIN (SELECT table_id,
                           ARRAY_AGG(snapshot_id ORDER BY sequence_number) as snapshot_ids,
                           ARRAY_AGG(timestamp ORDER BY sequence_number) as timestamps
-                     FROM table_snapshot_log WHERE table_id = ANY($2)
+                     FROM table_snapshot_log l WHERE table_id = ANY($2)
+                     AND (NOT $4 OR EXISTS (SELECT 1 FROM table_refs r
+                                            WHERE r.table_id = l.table_id
+                                            AND r.snapshot_id = l.snapshot_id))
                      GROUP BY table_id) tsl ON tsl.table_id = t.table_id
         LEFT JOIN (SELECT table_id,
                           ARRAY_AGG(timestamp ORDER BY sequence_number) as timestamps,
@@ -588,7 +720,8 @@ pub(crate) async fn load_tables(
         "#,
         *warehouse_id,
         &table_ids,
-        include_deleted
+        include_deleted,
+        load_snapshots == LoadTableSnapshots::Refs
     )
     .fetch_all(&mut **transaction)
     .await
@@ -618,7 +751,7 @@ pub(crate) async fn load_tables(
         let storage_secret_ident = table.storage_secret_id.map(SecretIdent::from);
         let storage_profile = table.storage_profile.deref().clone();
 
-        let Some(table_metadata) = table.into_table_metadata()? else {
+        let Some(table_metadata) = table.into_table_metadata(load_snapshots)? else {
             tracing::warn!(
                 "Table metadata could not be fetched from tables, falling back to blob retrieval."
             );
@@ -669,7 +802,6 @@ pub(crate) async fn get_table_metadata_by_id(
             ti.fs_protocol as "table_fs_protocol",
             namespace_name,
             ti.namespace_id,
-            t."metadata" as "metadata: Json<TableMetadata>",
             ti."metadata_location",
             w.storage_profile as "storage_profile: Json<StorageProfile>",
             w."storage_secret_id"
@@ -726,6 +858,35 @@ pub(crate) async fn get_table_metadata_by_s3_location(
     catalog_state: CatalogState,
 ) -> Result<Option<GetTableMetadataResponse>> {
     let (fs_protocol, fs_location) = split_location(location.url().as_str())?;
+
+    if location_index::is_enabled() {
+        if let Some(table_id) = location_index::get(warehouse_id, fs_location) {
+            let table = get_table_metadata_by_id(
+                warehouse_id,
+                table_id,
+                crate::service::ListFlags {
+                    include_staged: true,
+                    ..list_flags
+                },
+                catalog_state.clone(),
+            )
+            .await?;
+            if let Some(table) = table {
+                let table_fs_location = split_location(&table.location)?.1;
+                if location_index::covers(table_fs_location, fs_location) {
+                    if !list_flags.include_staged && table.metadata_location.is_none() {
+                        return Ok(None);
+                    }
+                    // Keep the protocol of the request, as the location query does
+                    let location = join_location(fs_protocol, table_fs_location);
+                    return Ok(Some(GetTableMetadataResponse { location, ..table }));
+                }
+            }
+            // Dropped or moved, possibly by another instance
+            location_index::remove(table_id);
+        }
+    }
+
     let partial_locations = get_partial_fs_locations(location)?;
 
     // Location might also be a subpath of the table location.
@@ -738,7 +899,6 @@ pub(crate) async fn get_table_metadata_by_s3_location(
              ti.fs_location as "fs_location",
              namespace_name,
              ti.namespace_id,
-             t."metadata" as "metadata: Json<TableMetadata>",
              ti."metadata_location",
              w.storage_profile as "storage_profile: Json<StorageProfile>",
              w."storage_secret_id"
@@ -774,6 +934,8 @@ pub(crate) async fn get_table_metadata_by_s3_location(
         }
     };
 
+    location_index::insert(warehouse_id, table.table_id.into(), &table.fs_location);
+
     if !list_flags.include_staged && table.metadata_location.is_none() {
         return Ok(None);
     }
@@ -820,6 +982,7 @@ pub(crate) async fn drop_table(
     force: bool,
     transaction: &mut sqlx::Transaction<'_, sqlx::Postgres>,
 ) -> Result<String> {
+    location_index::remove(table_id);
     drop_tabular(TabularId::Table(*table_id), force, None, transaction).await
 }
 
@@ -889,7 +1052,7 @@ pub(crate) mod tests {
         },
     };
 
-    fn create_request(
+    pub(crate) fn create_request(
         stage_create: Option<bool>,
         table_name: Option<String>,
     ) -> (CreateTableRequest, Option<Location>) {
@@ -1113,9 +1276,15 @@ pub(crate) mod tests {
 
         // Load should succeed
         let mut t = pool.begin().await.unwrap();
-        let load_result = load_tables(warehouse_id, vec![table_id], false, &mut t)
-            .await
-            .unwrap();
+        let load_result = load_tables(
+            warehouse_id,
+            vec![table_id],
+            false,
+            LoadTableSnapshots::All,
+            &mut t,
+        )
+        .await
+        .unwrap();
         assert_eq!(load_result.len(), 1);
         assert_eq!(
             load_result.get(&table_id).unwrap().table_metadata,
@@ -1123,6 +1292,37 @@ pub(crate) mod tests {
         );
     }
 
+    #[sqlx::test]
+    async fn test_load_tables_is_stable_across_cached_loads(pool: sqlx::PgPool) {
+        let state = CatalogState::from_pools(pool.clone(), pool.clone());
+        let warehouse_id = initialize_warehouse(state.clone(), None, None, None, true).await;
+        let table = initialize_table(warehouse_id, state.clone(), false, None, None).await;
+
+        let mut t = pool.begin().await.unwrap();
+        let first = load_tables(
+            warehouse_id,
+            vec![table.table_id],
+            false,
+            LoadTableSnapshots::All,
+            &mut t,
+        )
+        .await
+        .unwrap();
+        let second = load_tables(
+            warehouse_id,
+            vec![table.table_id],
+            false,
+            LoadTableSnapshots::All,
+            &mut t,
+        )
+        .await
+        .unwrap();
+        t.commit().await.unwrap();
+
+        assert_eq!(first.len(), 1);
+        assert_eq!(first, second);
+    }
+
     #[sqlx::test]
     async fn test_stage_create(pool: sqlx::PgPool) {
         let state = CatalogState::from_pools(pool.clone(), pool.clone());
@@ -1159,6 +1359,7 @@ pub(crate) mod tests {
             warehouse_id,
             vec![table_id],
             false,
+            LoadTableSnapshots::All,
             &mut pool.begin().await.unwrap(),
         )
         .await
@@ -1200,6 +1401,7 @@ pub(crate) mod tests {
             warehouse_id,
             vec![table_id],
             false,
+            LoadTableSnapshots::All,
             &mut pool.begin().await.unwrap(),
         )
         .await
@@ -1752,6 +1954,100 @@ pub(crate) mod tests {
         .is_none());
     }
 
+    #[sqlx::test]
+    async fn test_stale_location_index_entries_are_not_used(pool: sqlx::PgPool) {
+        let state = CatalogState::from_pools(pool.clone(), pool.clone());
+
+        let warehouse_id = initialize_warehouse(state.clone(), None, None, None, true).await;
+        let table = initialize_table(warehouse_id, state.clone(), false, None, None).await;
+        let metadata = get_table_metadata_by_id(
+            warehouse_id,
+            table.table_id,
+            ListFlags::default(),
+            state.clone(),
+        )
+        .await
+        .unwrap()
+        .unwrap();
+        let mut location = metadata.location.parse::<Location>().unwrap();
+        location.push("data/foo.parquet");
+
+        // The first lookup indexes the table, the second one is served by the index
+        for _ in 0..2 {
+            let found = get_table_metadata_by_s3_location(
+                warehouse_id,
+                &location,
+                ListFlags::default(),
+                state.clone(),
+            )
+            .await
+            .unwrap()
+            .unwrap();
+            assert_eq!(found, metadata);
+        }
+        let (_, fs_location) = split_location(location.url().as_str()).unwrap();
+        assert_eq!(
+            location_index::get(warehouse_id, fs_location),
+            Some(table.table_id)
+        );
+
+        let mut transaction = pool.begin().await.unwrap();
+        drop_table(table.table_id, true, &mut transaction)
+            .await
+            .unwrap();
+        transaction.commit().await.unwrap();
+        // Simulate an index that was populated before another instance dropped the table
+        location_index::insert(warehouse_id, table.table_id, fs_location);
+
+        assert!(get_table_metadata_by_s3_location(
+            warehouse_id,
+            &location,
+            ListFlags {
+                include_deleted: true,
+                ..ListFlags::default()
+            },
+            state.clone(),
+        )
+        .await
+        .unwrap()
+        .is_none());
+        assert_eq!(location_index::get(warehouse_id, fs_location), None);
+    }
+
+    #[sqlx::test]
+    async fn test_location_index_entries_of_moved_tables_are_not_used(pool: sqlx::PgPool) {
+        let state = CatalogState::from_pools(pool.clone(), pool.clone());
+
+        let warehouse_id = initialize_warehouse(state.clone(), None, None, None, true).await;
+        let table = initialize_table(warehouse_id, state.clone(), false, None, None).await;
+        let metadata = get_table_metadata_by_id(
+            warehouse_id,
+            table.table_id,
+            ListFlags::default(),
+            state.clone(),
+        )
+        .await
+        .unwrap()
+        .unwrap();
+        let mut location = metadata.location.parse::<Location>().unwrap();
+        location.pop().push("previous-location").push("foo.parquet");
+        let (_, fs_location) = split_location(location.url().as_str()).unwrap();
+
+        // Simulate an entry of a location the table was moved away from
+        location_index::insert(warehouse_id, table.table_id, fs_location);
+
+        assert!(get_table_metadata_by_s3_location(
+            warehouse_id,
+            &location,
+            ListFlags::default(),
+            state.clone(),
+        )
+        .await
+        .unwrap()
+        .is_none());
+        assert_eq!(location_index::get(warehouse_id, fs_location), None);
+    }
+
     #[sqlx::test]
     async fn test_cannot_get_table_of_inactive_warehouse(pool: sqlx::PgPool) {
         let state = CatalogState::from_pools(pool.clone(), pool.clone());
@@ -1854,4 +2150,63 @@ pub(crate) mod tests {
         .unwrap()
         .is_none());
     }
+
+    #[sqlx::test]
+    async fn test_commit_with_stale_metadata_location_is_concurrent_update(pool: sqlx::PgPool) {
+        let state = CatalogState::from_pools(pool.clone(), pool.clone());
+        let warehouse_id = initialize_warehouse(state.clone(), None, None, None, true).await;
+        let table = initialize_table(warehouse_id, state.clone(), false, None, None).await;
+
+        let mut t = pool.begin().await.unwrap();
+        let loaded = load_tables(
+            warehouse_id,
+            vec![table.table_id],
+            false,
+            LoadTableSnapshots::All,
+            &mut t,
+        )
+        .await
+        .unwrap()
+        .remove(&table.table_id)
+        .unwrap();
+        let stale_location = format!("s3://my_bucket/my_table/metadata/stale/{}", Uuid::now_v7())
+            .parse::<Location>()
+            .unwrap();
+        let new_location = format!("s3://my_bucket/my_table/metadata/new/{}", Uuid::now_v7())
+            .parse::<Location>()
+            .unwrap();
+        let err = commit_table_transaction(
+            warehouse_id,
+            [crate::service::TableCommit {
+                new_metadata: loaded.table_metadata,
+                new_metadata_location: new_location,
+                previous_metadata_location: Some(stale_location),
+                updates: vec![],
+                diffs: crate::catalog::tables::TableMetadataDiffs::default(),
+            }],
+            &mut t,
+        )
+        .await
+        .unwrap_err();
+        assert_eq!(
+            err.error.r#type,
+            crate::catalog::tables::CONCURRENT_UPDATE_ERROR_TYPE
+        );
+        t.rollback().await.unwrap();
+
+        // The metadata location is unchanged
+        let mut t = pool.begin().await.unwrap();
+        let reloaded = load_tables(
+            warehouse_id,
+            vec![table.table_id],
+            false,
+            LoadTableSnapshots::All,
+            &mut t,
+        )
+        .await
+        .unwrap()
+        .remove(&table.table_id)
+        .unwrap();
+        assert_eq!(reloaded.metadata_location, loaded.metadata_location);
+    }
 }
@@ -50,7 +50,7 @@ where
         catalog_state,
     )
     .await?
-    .map(|(id, _)| match id {
+    .map(|(id, _, _)| match id {
         TabularId::Table(_) => Err(ErrorModel::builder()
             .code(StatusCode::INTERNAL_SERVER_ERROR.into())
             .message("DB returned a table when filtering for views.".to_string())
@@ -0,0 +1,236 @@
+use std::{
+    collections::HashMap,
+    sync::{Arc, Mutex, OnceLock, Weak},
+    time::Duration,
+};
+
+use chrono::{DateTime, Utc};
+use iceberg_ext::catalog::rest::{ErrorModel, IcebergErrorResponse};
+use serde::{Deserialize, Serialize};
+use sqlx::{
+    postgres::{PgListener, PgPoolOptions},
+    PgConnection, PgPool,
+};
+use tokio::sync::watch;
+
+use crate::{implementations::postgres::dbutils::DBErrorHandler, CONFIG};
+
+/// Postgres channel on which newly queued tasks are announced.
+const NEW_TASKS_CHANNEL: &str = "lakekeeper_new_tasks";
+const LISTENER_RETRY_INTERVAL: Duration = Duration::from_secs(5);
+
+/// Payload of a notification on [`NEW_TASKS_CHANNEL`].
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
+struct NewTasks {
+    queue_name: String,
+    /// Earliest `scheduled_for` of the queued tasks.
+    scheduled_for: DateTime<Utc>,
+}
+
+/// Announce tasks queued in the transaction of `conn` to the workers of all instances.
+/// Postgres delivers the notification only once the transaction commits.
+pub(super) async fn notify_new_tasks(
+    conn: &mut PgConnection,
+    queue_name: &str,
+    scheduled_for: DateTime<Utc>,
+) -> Result<(), IcebergErrorResponse> {
+    if !CONFIG.task_notifications.enabled {
+        return Ok(());
+    }
+    let payload = serde_json::to_string(&NewTasks {
+        queue_name: queue_name.to_string(),
+        scheduled_for,
+    })
+    .map_err(|e| {
+        ErrorModel::internal(
+            "Failed to serialize task notification",
+            "TaskNotificationSerializationError",
+            Some(Box::new(e)),
+        )
+    })?;
+    sqlx::query!("SELECT pg_notify($1, $2)", NEW_TASKS_CHANNEL, payload)
+        .execute(conn)
+        .await
+        .map_err(|e| e.into_error_model("failed to notify workers about new tasks"))?;
+    Ok(())
+}
+
+/// Wakes the idle task queue workers of this instance when tasks are queued.
+///
+/// A single connection per [`super::CatalogState`] listens on [`NEW_TASKS_CHANNEL`];
+/// it is opened when the first worker subscribes. The connection is not taken from the
+/// pool of the catalog, as the listener holds it for its whole lifetime.
+#[derive(Debug, Default)]
+pub(crate) struct TaskNotifier {
+    senders: Mutex<HashMap<String, watch::Sender<()>>>,
+    listener: OnceLock<tokio::task::JoinHandle<()>>,
+}
+
+impl Drop for TaskNotifier {
+    fn drop(&mut self) {
+        if let Some(listener) = self.listener.get() {
+            listener.abort();
+        }
+    }
+}
+
+impl TaskNotifier {
+    /// Subscribe to new tasks of `queue_name`. The receiver is marked as changed whenever
+    /// a task of the queue is queued or becomes due.
+    ///
+    /// Returns `None` if notifications are disabled.
+    pub(super) fn subscribe(
+        self: &Arc<Self>,
+        pool: &PgPool,
+        queue_name: &str,
+    ) -> Option<watch::Receiver<()>> {
+        if !CONFIG.task_notifications.enabled {
+            return None;
+        }
+        self.listener
+            .get_or_init(|| tokio::task::spawn(Self::listen(Arc::downgrade(self), pool.clone())));
+        let mut senders = self.senders.lock().ok()?;
+        Some(
+            senders
+                .entry(queue_name.to_string())
+                .or_insert_with(|| watch::channel(()).0)
+                .subscribe(),
+        )
+    }
+
+    async fn listen(notifier: Weak<Self>, pool: PgPool) {
+        // Same database and credentials as `pool`. Only used to reconnect the listener.
+        let listener_pool = PgPoolOptions::new()
+            .max_connections(1)
+            .max_lifetime(None)
+            .idle_timeout(None)
+            .connect_lazy_with(pool.connect_options().as_ref().clone());
+        drop(pool);
+        loop {
+            let mut listener = match PgListener::connect_with(&listener_pool).await {
+                Ok(listener) => listener,
+                Err(e) => {
+                    tracing::warn!(?e, "Failed to connect task notification listener, retrying");
+                    tokio::time::sleep(LISTENER_RETRY_INTERVAL).await;
+                    continue;
+                }
+            };
+            if let Err(e) = listener.listen(NEW_TASKS_CHANNEL).await {
+                tracing::warn!(?e, "Failed to listen for task notifications, retrying");
+                tokio::time::sleep(LISTENER_RETRY_INTERVAL).await;
+                continue;
+            }
+            // Tasks queued while we were not listening went unannounced.
+            let Some(n) = notifier.upgrade() else { return };
+            n.wake_all();
+            drop(n);
+
+            loop {
+                let received = listener.try_recv().await;
+                let Some(n) = notifier.upgrade() else { return };
+                match received {
+                    Ok(Some(notification)) => n.handle_notification(notification.payload()),
+                    Ok(None) => {
+                        tracing::debug!(
+                            "Task notification listener lost its connection, reconnecting"
+                        );
+                        n.wake_all();
+                    }
+                    Err(e) => {
+                        tracing::warn!(?e, "Task notification listener failed, restarting");
+                        break;
+                    }
+                }
+            }
+            tokio::time::sleep(LISTENER_RETRY_INTERVAL).await;
+        }
+    }
+
+    fn handle_notification(self: &Arc<Self>, payload: &str) {
+        let NewTasks {
+            queue_name,
+            scheduled_for,
+        } = match serde_json::from_str(payload) {
+            Ok(new_tasks) => new_tasks,
+            Err(e) => {
+                tracing::warn!(?e, "Ignoring malformed task notification: {payload}");
+                return;
+            }
+        };
+
+        let Ok(delay) = (scheduled_for - Utc::now()).to_std() else {
+            // Already due
+            self.wake(&queue_name);
+            return;
+        };
+        // Tasks due after the next fallback poll are found by polling.
+        if delay <= CONFIG.task_notifications.fallback_poll_interval {
+            let notifier = Arc::downgrade(self);
+            tokio::task::spawn(async move {
+                tokio::time::sleep(delay).await;
+                if let Some(notifier) = notifier.upgrade() {
+                    notifier.wake(&queue_name);
+                }
+            });
+        }
+    }
+
+    fn wake(&self, queue_name: &str) {
+        if let Ok(senders) = self.senders.lock() {
+            if let Some(sender) = senders.get(queue_name) {
+                sender.send_replace(());
+            }
+        }
+    }
+
+    fn wake_all(&self) {
+        if let Ok(senders) = self.senders.lock() {
+            for sender in senders.values() {
+                sender.send_replace(());
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_new_tasks_payload_roundtrip() {
+        let new_tasks = NewTasks {
+            queue_name: "tabular_purge".to_string(),
+            scheduled_for: Utc::now(),
+        };
+        let payload = serde_json::to_string(&new_tasks).unwrap();
+        assert_eq!(
+            serde_json::from_str::<NewTasks>(&payload).unwrap(),
+            new_tasks
+        );
+    }
+
+    #[tokio::test]
+    async fn test_due_notification_wakes_subscribers() {
+        let notifier = Arc::new(TaskNotifier::default());
+        let mut receiver = notifier
+            .senders
+            .lock()
+            .unwrap()
+            .entry("tabular_purge".to_string())
+            .or_insert_with(|| watch::channel(()).0)
+            .subscribe();
+
+        notifier.handle_notification(
+            &serde_json::to_string(&NewTasks {
+                queue_name: "tabular_purge".to_string(),
+                scheduled_for: Utc::now() + chrono::Duration::milliseconds(50),
+            })
+            .unwrap(),
+        );
+        assert!(!receiver.has_changed().unwrap());
+        tokio::time::timeout(Duration::from_secs(5), receiver.changed())
+            .await
+            .unwrap()
+            .unwrap();
+    }
+}
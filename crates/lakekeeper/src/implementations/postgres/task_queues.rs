@@ -7,7 +7,7 @@ use crate::{
     api::management::v1::warehouse::{
         GetTaskQueueConfigResponse, QueueConfigResponse, SetTaskQueueConfigRequest,
     },
-    implementations::postgres::dbutils::DBErrorHandler,
+    implementations::postgres::{dbutils::DBErrorHandler, task_notifications::notify_new_tasks},
     service::task_queue::{Task, TaskFilter, TaskStatus},
     WarehouseId,
 };
@@ -65,7 +65,7 @@ pub(crate) async fn queue_task_batch(
         entity_ids.push(entity_id.to_uuid());
     }
 
-    Ok(sqlx::query!(
+    let records = sqlx::query!(
         r#"WITH input_rows AS (
             SELECT
                 unnest($1::uuid[]) as task_id,
@@ -99,7 +99,7 @@ pub(crate) async fn queue_task_batch(
             i.entity_types
         FROM input_rows i
         ON CONFLICT (warehouse_id, entity_type, entity_id, queue_name) DO NOTHING
-        RETURNING task_id, queue_name, entity_id, entity_type as "entity_type: EntityType""#,
+        RETURNING task_id, queue_name, entity_id, entity_type as "entity_type: EntityType", scheduled_for"#,
         &task_ids,
         queue_name,
         &parent_task_ids as _,
@@ -113,30 +113,49 @@ pub(crate) async fn queue_task_batch(
         &entity_types as _,
         TaskStatus::Scheduled as _,
     )
-    .fetch_all(conn)
+    .fetch_all(&mut *conn)
     .await
-    .map(|records| {
-        records
-            .into_iter()
-            .map(|record| InsertResult {
-                task_id: record.task_id.into(),
-                // queue_name: record.queue_name,
-                #[cfg(test)]
-                entity_id: match record.entity_type {
-                    EntityType::Tabular => EntityId::Tabular(record.entity_id),
-                },
-            })
-            .collect_vec()
-    })
-    .map_err(|e| e.into_error_model("failed queueing tasks"))?)
+    .map_err(|e| e.into_error_model("failed queueing tasks"))?;
+
+    if let Some(scheduled_for) = records.iter().map(|r| r.scheduled_for).min() {
+        notify_new_tasks(conn, queue_name, scheduled_for).await?;
+    }
+
+    Ok(records
+        .into_iter()
+        .map(|record| InsertResult {
+            task_id: record.task_id.into(),
+            // queue_name: record.queue_name,
+            #[cfg(test)]
+            entity_id: match record.entity_type {
+                EntityType::Tabular => EntityId::Tabular(record.entity_id),
+            },
+        })
+        .collect_vec())
 }
 
-#[tracing::instrument]
+#[cfg(test)]
 pub(crate) async fn pick_task(
     pool: &PgPool,
     queue_name: &str,
     max_time_since_last_heartbeat: chrono::Duration,
 ) -> Result<Option<Task>, IcebergErrorResponse> {
+    Ok(
+        pick_tasks(pool, queue_name, max_time_since_last_heartbeat, 1)
+            .await?
+            .pop(),
+    )
+}
+
+/// Claim up to `limit` tasks of `queue_name` in a single statement, taking turns between
+/// warehouses so that each warehouse gets its share of the workers.
+#[tracing::instrument]
+pub(crate) async fn pick_tasks(
+    pool: &PgPool,
+    queue_name: &str,
+    max_time_since_last_heartbeat: chrono::Duration,
+    limit: usize,
+) -> Result<Vec<Task>, IcebergErrorResponse> {
     let max_time_since_last_heartbeat = PgInterval {
         months: 0,
         days: 0,
@@ -148,20 +167,44 @@ pub(crate) async fn pick_task(
             ),
         )?,
     };
-    let x = sqlx::query!(
-        r#"WITH updated_task AS (
-        SELECT task_id, t.warehouse_id, config
+    let tasks = sqlx::query!(
+        r#"WITH candidates AS (
+        -- The oldest due tasks of every warehouse, so that a single warehouse with many
+        -- tasks cannot starve the others.
+        SELECT c.task_id,
+               c.status,
+               c.attempt,
+               c.config,
+               row_number() OVER (PARTITION BY c.warehouse_id ORDER BY c.scheduled_for) AS warehouse_rank,
+               c.scheduled_for
+        FROM warehouse w
+        CROSS JOIN LATERAL (
+            SELECT t.task_id, t.warehouse_id, t.status, t.attempt, t.scheduled_for, tc.config
+            FROM task t
+            LEFT JOIN task_config tc
+                ON tc.queue_name = t.queue_name
+                       AND tc.warehouse_id = t.warehouse_id
+            WHERE t.warehouse_id = w.warehouse_id
+              AND t.queue_name = $1
+              AND ((t.status = $3 AND t.scheduled_for < now() AT TIME ZONE 'UTC')
+                OR (t.status = $4 AND (now() - t.last_heartbeat_at) > COALESCE(tc.max_time_since_last_heartbeat, $2)))
+            ORDER BY t.scheduled_for
+            LIMIT $5
+        ) c
+    ),
+    updated_task AS (
+        -- Round-robin across warehouses: first the oldest task of each warehouse, then the second
+        -- oldest and so on.
+        SELECT t.task_id, candidates.config
         FROM task t
-        LEFT JOIN task_config tc
-            ON tc.queue_name = t.queue_name
-                   AND tc.warehouse_id = t.warehouse_id
-        WHERE (status = $3 AND t.queue_name = $1
-                   AND scheduled_for < now() AT TIME ZONE 'UTC')
-           OR (status = $4 AND (now() - last_heartbeat_at) > COALESCE(tc.max_time_since_last_heartbeat, $2))
+        JOIN candidates ON candidates.task_id = t.task_id
+        -- Skip tasks picked up or rescheduled since the candidates were selected.
+        WHERE t.status = candidates.status AND t.attempt = candidates.attempt
+        ORDER BY candidates.warehouse_rank, candidates.scheduled_for
         -- FOR UPDATE locks the row we select here, SKIP LOCKED makes us not wait for rows other
         -- transactions locked, this is our queue right there.
         FOR UPDATE OF t SKIP LOCKED
-        LIMIT 1
+        LIMIT $5
     )
     UPDATE task
     SET status = $4,
@@ -182,42 +225,62 @@ pub(crate) async fn pick_task(
         task.attempt,
         task.parent_task_id,
         task.queue_name,
-        (select config from updated_task)
+        updated_task.config
     "#,
         queue_name,
         max_time_since_last_heartbeat,
         TaskStatus::Scheduled as _,
         TaskStatus::Running as _,
+        i64::try_from(limit).unwrap_or(i64::MAX),
     )
-    .fetch_optional(pool)
+    .fetch_all(pool)
     .await
     .map_err(|e| {
-        tracing::error!(?e, "Failed to pick a task for '{queue_name}'");
-        e.into_error_model(format!("Failed to pick a '{queue_name}' task"))
+        tracing::error!(?e, "Failed to pick tasks for '{queue_name}'");
+        e.into_error_model(format!("Failed to pick '{queue_name}' tasks"))
     })?;
 
-    if let Some(task) = x {
-        tracing::trace!("Picked up task: {:?}", task);
-        return Ok(Some(Task {
-            task_metadata: TaskMetadata {
-                warehouse_id: task.warehouse_id.into(),
-                entity_id: match task.entity_type {
-                    EntityType::Tabular => EntityId::Tabular(task.entity_id),
+    Ok(tasks
+        .into_iter()
+        .map(|task| {
+            tracing::trace!("Picked up task: {:?}", task);
+            Task {
+                task_metadata: TaskMetadata {
+                    warehouse_id: task.warehouse_id.into(),
+                    entity_id: match task.entity_type {
+                        EntityType::Tabular => EntityId::Tabular(task.entity_id),
+                    },
+                    parent_task_id: task.parent_task_id.map(TaskId::from),
+                    schedule_for: Some(task.scheduled_for),
                 },
-                parent_task_id: task.parent_task_id.map(TaskId::from),
-                schedule_for: Some(task.scheduled_for),
-            },
-            config: task.config,
-            task_id: task.task_id.into(),
-            status: task.status,
-            queue_name: task.queue_name,
-            picked_up_at: task.picked_up_at,
-            attempt: task.attempt,
-            state: task.task_data,
-        }));
-    }
+                config: task.config,
+                task_id: task.task_id.into(),
+                status: task.status,
+                queue_name: task.queue_name,
+                picked_up_at: task.picked_up_at,
+                attempt: task.attempt,
+                state: task.task_data,
+            }
+        })
+        .collect())
+}
 
-    Ok(None)
+pub(crate) async fn heartbeat_tasks(
+    pool: &PgPool,
+    task_ids: &[TaskId],
+) -> Result<(), IcebergErrorResponse> {
+    if task_ids.is_empty() {
+        return Ok(());
+    }
+    sqlx::query!(
+        r#"UPDATE task SET last_heartbeat_at = now() WHERE task_id = ANY($1) AND status = $2"#,
+        &task_ids.iter().map(|id| **id).collect::<Vec<_>>(),
+        TaskStatus::Running as _,
+    )
+    .execute(pool)
+    .await
+    .map_err(|e| e.into_error_model("failed to renew task heartbeats"))?;
+    Ok(())
 }
 
 pub(crate) async fn record_success(
@@ -225,6 +288,15 @@ pub(crate) async fn record_success(
     pool: &mut PgConnection,
     message: Option<&str>,
 ) -> Result<(), IcebergErrorResponse> {
+    record_successes(&[task_id], pool, message).await
+}
+
+pub(crate) async fn record_successes(
+    task_ids: &[TaskId],
+    conn: &mut PgConnection,
+    message: Option<&str>,
+) -> Result<(), IcebergErrorResponse> {
+    let task_ids = task_ids.iter().map(|id| **id).collect_vec();
     let _ = sqlx::query!(
         r#"
         WITH history as (
@@ -251,15 +323,15 @@ pub(crate) async fn record_success(
                        picked_up_at,
                        now() - picked_up_at
                 FROM task
-                WHERE task_id = $1)
+                WHERE task_id = ANY($1))
         DELETE FROM task
-        WHERE task_id = $1
+        WHERE task_id = ANY($1)
         "#,
-        *task_id,
+        &task_ids,
         message,
         TaskOutcome::Success as _,
     )
-    .execute(pool)
+    .execute(conn)
     .await
     .map_err(|e| e.into_error_model("failed to record task success"))?;
     Ok(())
@@ -271,58 +343,63 @@ pub(crate) async fn record_failure(
     max_retries: i32,
     details: &str,
 ) -> Result<(), IcebergErrorResponse> {
-    let should_fail = sqlx::query_scalar!(
+    record_failures(
+        conn,
+        &[TaskFailure {
+            task_id,
+            details: details.to_string(),
+            max_retries,
+        }],
+    )
+    .await
+}
+
+/// Reschedule failed tasks, or move them to the task log once they reached their
+/// `max_retries`.
+pub(crate) async fn record_failures(
+    conn: &mut PgConnection,
+    failures: &[TaskFailure],
+) -> Result<(), IcebergErrorResponse> {
+    let mut task_ids = Vec::with_capacity(failures.len());
+    let mut details = Vec::with_capacity(failures.len());
+    let mut max_retries = Vec::with_capacity(failures.len());
+    for failure in failures {
+        task_ids.push(*failure.task_id);
+        details.push(failure.details.as_str());
+        max_retries.push(failure.max_retries);
+    }
+
+    sqlx::query!(
         r#"
-        SELECT attempt >= $1 as "should_fail!"
-        FROM task
-        WHERE task_id = $2
+        WITH failures AS (
+            SELECT * FROM unnest($1::uuid[], $2::text[], $3::int[]) AS f(task_id, details, max_retries)
+        ),
+        task_log AS (
+            INSERT INTO task_log(task_id, warehouse_id, queue_name, task_data, status, entity_id, entity_type, message, attempt, started_at, duration)
+            SELECT t.task_id, t.warehouse_id, t.queue_name, t.task_data, $4, t.entity_id, t.entity_type,
+                   CASE WHEN t.attempt >= f.max_retries THEN NULL ELSE f.details END,
+                   t.attempt, t.picked_up_at, now() - t.picked_up_at
+            FROM task t JOIN failures f ON t.task_id = f.task_id
+        ),
+        failed AS (
+            DELETE FROM task t
+            USING failures f
+            WHERE t.task_id = f.task_id AND t.attempt >= f.max_retries
+        )
+        UPDATE task t
+        SET status = $5
+        FROM failures f
+        WHERE t.task_id = f.task_id AND t.attempt < f.max_retries
         "#,
-        max_retries,
-        *task_id
+        &task_ids,
+        &details as _,
+        &max_retries,
+        TaskOutcome::Failed as _,
+        TaskStatus::Scheduled as _,
     )
-    .fetch_optional(&mut *conn)
+    .execute(conn)
     .await
-    .map_err(|e| e.into_error_model("failed to check if task should fail"))?
-    .unwrap_or(false);
-
-    if should_fail {
-        sqlx::query!(
-            r#"
-            WITH history as (
-                INSERT INTO task_log(task_id, warehouse_id, queue_name, task_data, status, entity_id, entity_type, attempt, started_at, duration)
-                SELECT task_id, warehouse_id, queue_name, task_data, $2, entity_id, entity_type, attempt, picked_up_at, now() - picked_up_at
-                FROM task WHERE task_id = $1
-            )
-            DELETE FROM task
-            WHERE task_id = $1
-            "#,
-            *task_id,
-            TaskOutcome::Failed as _,
-        )
-            .execute(conn)
-            .await
-            .map_err(|e| e.into_error_model("failed to log and delete failed task"))?;
-    } else {
-        sqlx::query!(
-            r#"
-            WITH task_log as (
-                INSERT INTO task_log(task_id, warehouse_id, queue_name, task_data, status, entity_id, entity_type, message, attempt, started_at, duration)
-                SELECT task_id, warehouse_id, queue_name, task_data, $4, entity_id, entity_type, $2, attempt, picked_up_at, now() - picked_up_at
-                FROM task WHERE task_id = $1
-            )
-            UPDATE task
-            SET status = $3
-            WHERE task_id = $1
-            "#,
-            *task_id,
-            details,
-            TaskStatus::Scheduled as _,
-            TaskOutcome::Failed as _,
-        )
-            .execute(conn)
-            .await
-            .map_err(|e| e.into_error_model("failed to update task status"))?;
-    }
+    .map_err(|e| e.into_error_model("failed to record task failures"))?;
 
     Ok(())
 }
@@ -452,7 +529,7 @@ pub(crate) async fn check_task(
 }
 
 use crate::service::task_queue::{
-    EntityId, TaskCheckState, TaskId, TaskInput, TaskMetadata, TaskOutcome,
+    EntityId, TaskCheckState, TaskFailure, TaskId, TaskInput, TaskMetadata, TaskOutcome,
 };
 
 /// Cancel pending tasks for a warehouse
@@ -570,13 +647,14 @@ mod test {
     use super::*;
     use crate::{
         api::management::v1::warehouse::{QueueConfig, TabularDeleteProfile},
+        implementations::postgres::{warehouse::test::initialize_warehouse, CatalogState},
         service::{
             authz::AllowAllAuthorizer,
             task_queue::{
                 EntityId, TaskId, TaskInput, TaskStatus, DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT,
             },
         },
-        WarehouseId,
+        ProjectId, WarehouseId,
     };
 
     async fn queue_task(
@@ -709,6 +787,129 @@ mod test {
         );
     }
 
+    #[sqlx::test]
+    async fn test_pick_and_record_tasks_in_bulk(pool: PgPool) {
+        let mut conn = pool.acquire().await.unwrap();
+        let warehouse_id = setup(pool.clone()).await;
+        let mut ids = Vec::new();
+        for _ in 0..3 {
+            ids.push(
+                queue_task(
+                    &mut conn,
+                    "test",
+                    None,
+                    EntityId::Tabular(Uuid::now_v7()),
+                    warehouse_id,
+                    None,
+                    None,
+                )
+                .await
+                .unwrap()
+                .unwrap(),
+            );
+        }
+
+        let tasks = pick_tasks(&pool, "test", DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT, 2)
+            .await
+            .unwrap();
+        assert_eq!(tasks.len(), 2);
+        let remaining = pick_tasks(&pool, "test", DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT, 2)
+            .await
+            .unwrap();
+        assert_eq!(remaining.len(), 1);
+
+        record_successes(&[tasks[0].task_id, tasks[1].task_id], &mut conn, None)
+            .await
+            .unwrap();
+        record_failures(
+            &mut conn,
+            &[TaskFailure {
+                task_id: remaining[0].task_id,
+                details: "test".to_string(),
+                max_retries: 5,
+            }],
+        )
+        .await
+        .unwrap();
+
+        let task = pick_task(&pool, "test", DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT)
+            .await
+            .unwrap()
+            .unwrap();
+        assert_eq!(task.task_id, remaining[0].task_id);
+        assert_eq!(task.attempt, 2);
+
+        record_failures(
+            &mut conn,
+            &[TaskFailure {
+                task_id: task.task_id,
+                details: "test".to_string(),
+                max_retries: 2,
+            }],
+        )
+        .await
+        .unwrap();
+        assert!(
+            pick_task(&pool, "test", DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT)
+                .await
+                .unwrap()
+                .is_none()
+        );
+        assert!(tasks
+            .iter()
+            .chain(&remaining)
+            .all(|t| ids.contains(&t.task_id)));
+    }
+
+    #[sqlx::test]
+    async fn test_pick_tasks_takes_turns_between_warehouses(pool: PgPool) {
+        let mut conn = pool.acquire().await.unwrap();
+        let busy_warehouse = setup(pool.clone()).await;
+        let quiet_warehouse = initialize_warehouse(
+            CatalogState::from_pools(pool.clone(), pool.clone()),
+            None,
+            Some(&ProjectId::new_random()),
+            None,
+            true,
+        )
+        .await;
+        for _ in 0..4 {
+            queue_task(
+                &mut conn,
+                "test",
+                None,
+                EntityId::Tabular(Uuid::now_v7()),
+                busy_warehouse,
+                None,
+                None,
+            )
+            .await
+            .unwrap()
+            .unwrap();
+        }
+        let quiet_task = queue_task(
+            &mut conn,
+            "test",
+            None,
+            EntityId::Tabular(Uuid::now_v7()),
+            quiet_warehouse,
+            None,
+            None,
+        )
+        .await
+        .unwrap()
+        .unwrap();
+
+        let tasks = pick_tasks(&pool, "test", DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT, 2)
+            .await
+            .unwrap();
+        assert_eq!(tasks.len(), 2);
+        assert!(tasks.iter().any(|t| t.task_id == quiet_task));
+        assert!(tasks
+            .iter()
+            .any(|t| t.task_metadata.warehouse_id == busy_warehouse));
+    }
+
     #[sqlx::test]
     async fn test_success_task_arent_polled(pool: PgPool) {
         let mut conn = pool.acquire().await.unwrap();
@@ -199,6 +199,19 @@ impl RequestMetadata {
         format!("v1/signer/{warehouse_id}/tabular-id/{table_id}/v1/aws/s3/sign")
     }
 
+    /// Endpoint to sign multiple requests for a table at once, relative to `s3_signer_uri`.
+    #[must_use]
+    pub fn s3_signer_batch_endpoint_for_table(
+        &self,
+        warehouse_id: WarehouseId,
+        table_id: TabularId,
+    ) -> String {
+        format!(
+            "{}/batch",
+            self.s3_signer_endpoint_for_table(warehouse_id, table_id)
+        )
+    }
+
     #[must_use]
     pub fn base_uri_catalog(&self) -> String {
         format!("{}/catalog", self.base_url())
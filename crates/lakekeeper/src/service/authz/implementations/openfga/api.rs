@@ -14,7 +14,7 @@ use strum::IntoEnumIterator;
 use utoipa::OpenApi;
 
 use super::{
-    check::{__path_check, check},
+    check::{__path_batch_check, __path_check, batch_check, check},
     relations::{
         APINamespaceAction as NamespaceAction, APINamespaceRelation as NamespaceRelation,
         APIProjectAction as ProjectAction, APIProjectRelation as ProjectRelation,
@@ -1263,6 +1263,7 @@ async fn update_role_assignments_by_id<C: Catalog, S: SecretStore>(
         (name = "permissions", description = "Manage Permissions"),
     ),
     paths(
+        batch_check,
         check,
         get_namespace_access_by_id,
         get_namespace_assignments_by_id,
@@ -1382,6 +1383,7 @@ pub(super) fn new_v1_router<C: Catalog, S: SecretStore>(
             get(get_view_assignments_by_id).post(update_view_assignments_by_id),
         )
         .route("/permissions/check", post(check))
+        .route("/permissions/check/batch", post(batch_check))
 }
 
 async fn get_relations<RA: Assignment>(
@@ -1,6 +1,9 @@
+use std::collections::{HashMap, HashSet};
+
 use axum::{extract::State as AxumState, Extension, Json};
 use http::StatusCode;
 use iceberg::{NamespaceIdent, TableIdent};
+use iceberg_ext::catalog::rest::ErrorModel;
 use openfga_client::client::CheckRequestTupleKey;
 use serde::{Deserialize, Serialize};
 
@@ -18,12 +21,15 @@ use super::{
 use crate::{
     api::ApiContext,
     catalog::{
-        namespace::authorized_namespace_ident_to_id, tables::authorized_table_ident_to_id,
+        namespace::{authorized_namespace_ident_to_id, validate_namespace_ident},
+        tables::authorized_table_ident_to_id,
         views::authorized_view_ident_to_id,
     },
     request_metadata::RequestMetadata,
     service::{
-        authz::{implementations::openfga::entities::OpenFgaEntity, Authorizer},
+        authz::{
+            implementations::openfga::entities::OpenFgaEntity, Authorizer, CatalogWarehouseAction,
+        },
         Catalog, ListFlags, NamespaceId, Result, SecretStore, State, TableId, Transaction, ViewId,
     },
     ProjectId, WarehouseId,
@@ -128,6 +134,380 @@ async fn check_internal<C: Catalog, S: SecretStore>(
     Ok(allowed)
 }
 
+/// Maximum number of operations in a single batch check request.
+const MAX_OPERATIONS_PER_BATCH_CHECK: usize = 1000;
+
+/// Check multiple actions for the same user or role at once
+///
+/// Results are returned in the order of the operations. Operations on objects
+/// that do not exist or that may not be inspected by the caller are reported
+/// as not allowed instead of failing the whole request.
+#[utoipa::path(
+    post,
+    tag = "permissions",
+    path = "/management/v1/permissions/check/batch",
+    request_body = BatchCheckRequest,
+    responses(
+            (status = 200, body = BatchCheckResponse),
+    )
+)]
+pub(super) async fn batch_check<C: Catalog, S: SecretStore>(
+    AxumState(api_context): AxumState<ApiContext<State<OpenFGAAuthorizer, C, S>>>,
+    Extension(metadata): Extension<RequestMetadata>,
+    Json(request): Json<BatchCheckRequest>,
+) -> Result<(StatusCode, Json<BatchCheckResponse>)> {
+    let results = batch_check_internal(api_context, &metadata, request)
+        .await?
+        .into_iter()
+        .map(|allowed| CheckResponse { allowed })
+        .collect();
+    Ok((StatusCode::OK, Json(BatchCheckResponse { results })))
+}
+
+/// Object of a batch check operation, after the caller's access to it has been
+/// verified as far as possible without looking at other operations.
+enum BatchCheckTarget {
+    Denied,
+    Object { relation: String, object: String },
+    Namespace { relation: String, id: NamespaceId },
+    Table { relation: String, id: TableId },
+    View { relation: String, id: ViewId },
+}
+
+impl BatchCheckTarget {
+    /// Errors caused by the request, such as missing objects or missing permissions
+    /// to inspect them, only deny the affected operation.
+    fn from_result(result: Result<(String, String)>) -> Result<Self> {
+        match result {
+            Ok((relation, object)) => Ok(Self::Object { relation, object }),
+            Err(e) if e.error.code < StatusCode::INTERNAL_SERVER_ERROR.as_u16() => Ok(Self::Denied),
+            Err(e) => Err(e),
+        }
+    }
+}
+
+async fn batch_check_internal<C: Catalog, S: SecretStore>(
+    api_context: ApiContext<State<OpenFGAAuthorizer, C, S>>,
+    metadata: &RequestMetadata,
+    request: BatchCheckRequest,
+) -> Result<Vec<bool>> {
+    let authorizer = api_context.v1_state.authz.clone();
+    let BatchCheckRequest {
+        identity: mut for_principal,
+        operations,
+    } = request;
+    if operations.len() > MAX_OPERATIONS_PER_BATCH_CHECK {
+        return Err(ErrorModel::bad_request(
+            format!(
+                "Too many operations in batch check. Got {}, maximum is {MAX_OPERATIONS_PER_BATCH_CHECK}",
+                operations.len()
+            ),
+            "TooManyOperations",
+            None,
+        )
+        .into());
+    }
+    let user_or_role = metadata.actor().to_user_or_role();
+    if let Some(user_or_role) = &user_or_role {
+        for_principal = for_principal.filter(|p| p != user_or_role);
+    }
+
+    // 1. Resolve names to ids. Every distinct name is looked up only once.
+    let mut namespace_names = HashSet::new();
+    let mut table_names: HashMap<WarehouseId, HashSet<TableIdent>> = HashMap::new();
+    let mut view_names = HashSet::new();
+    for operation in &operations {
+        match operation {
+            CheckOperation::Namespace {
+                namespace:
+                    NamespaceIdentOrUuid::Name {
+                        namespace,
+                        warehouse_id,
+                    },
+                ..
+            } => {
+                namespace_names.insert((*warehouse_id, namespace.clone()));
+            }
+            CheckOperation::Table {
+                table:
+                    TabularIdentOrUuid::Name {
+                        namespace,
+                        table,
+                        warehouse_id,
+                    },
+                ..
+            } => {
+                table_names
+                    .entry(*warehouse_id)
+                    .or_default()
+                    .insert(tabular_ident(namespace, table));
+            }
+            CheckOperation::View {
+                view:
+                    TabularIdentOrUuid::Name {
+                        namespace,
+                        table,
+                        warehouse_id,
+                    },
+                ..
+            } => {
+                view_names.insert((*warehouse_id, tabular_ident(namespace, table)));
+            }
+            _ => {}
+        }
+    }
+
+    // Names are only resolved in warehouses the caller may use.
+    let warehouse_ids = namespace_names
+        .iter()
+        .map(|(warehouse_id, _)| *warehouse_id)
+        .chain(table_names.keys().copied())
+        .chain(view_names.iter().map(|(warehouse_id, _)| *warehouse_id))
+        .collect::<HashSet<_>>()
+        .into_iter()
+        .collect::<Vec<_>>();
+    let usable_warehouses = futures::future::try_join_all(warehouse_ids.iter().map(|w| {
+        authorizer.is_allowed_warehouse_action(metadata, *w, CatalogWarehouseAction::CanUse)
+    }))
+    .await?
+    .into_iter()
+    .zip(warehouse_ids)
+    .filter_map(|(allowed, warehouse_id)| allowed.then_some(warehouse_id))
+    .collect::<HashSet<_>>();
+
+    let mut table_ids = HashMap::new();
+    for (warehouse_id, idents) in &table_names {
+        if !usable_warehouses.contains(warehouse_id) {
+            continue;
+        }
+        let ids = C::table_idents_to_ids(
+            *warehouse_id,
+            idents.iter().collect(),
+            ListFlags {
+                include_active: true,
+                include_staged: false,
+                include_deleted: false,
+            },
+            api_context.v1_state.catalog.clone(),
+        )
+        .await?;
+        table_ids.extend(
+            ids.into_iter()
+                .filter_map(|(ident, id)| Some(((*warehouse_id, ident), id?))),
+        );
+    }
+
+    let mut namespace_ids = HashMap::new();
+    let mut view_ids = HashMap::new();
+    namespace_names.retain(|(warehouse_id, namespace)| {
+        usable_warehouses.contains(warehouse_id) && validate_namespace_ident(namespace).is_ok()
+    });
+    view_names.retain(|(warehouse_id, _)| usable_warehouses.contains(warehouse_id));
+    if !namespace_names.is_empty() || !view_names.is_empty() {
+        let mut t = C::Transaction::begin_read(api_context.v1_state.catalog).await?;
+        for (warehouse_id, namespace) in namespace_names {
+            if let Some(id) = C::namespace_to_id(warehouse_id, &namespace, t.transaction()).await? {
+                namespace_ids.insert((warehouse_id, namespace), id);
+            }
+        }
+        for (warehouse_id, view) in view_names {
+            if let Some(id) = C::view_to_id(warehouse_id, &view, t.transaction()).await? {
+                view_ids.insert((warehouse_id, view), id);
+            }
+        }
+        t.commit().await.ok();
+    }
+
+    // 2. Map operations to the relation to check on the resolved object.
+    let mut targets = Vec::with_capacity(operations.len());
+    for operation in &operations {
+        let target = match operation {
+            CheckOperation::Server { action } => BatchCheckTarget::from_result(
+                check_server(metadata, &authorizer, &mut for_principal.clone(), action).await,
+            )?,
+            CheckOperation::Project { action, project_id } => BatchCheckTarget::from_result(
+                check_project(
+                    metadata,
+                    &authorizer,
+                    for_principal.as_ref(),
+                    action,
+                    project_id.as_ref(),
+                )
+                .await,
+            )?,
+            CheckOperation::Warehouse {
+                action,
+                warehouse_id,
+            } => BatchCheckTarget::from_result(
+                check_warehouse(
+                    metadata,
+                    &authorizer,
+                    for_principal.as_ref(),
+                    action,
+                    *warehouse_id,
+                )
+                .await,
+            )?,
+            CheckOperation::Namespace { action, namespace } => {
+                let id = match namespace {
+                    NamespaceIdentOrUuid::Id { namespace_id } => Some(*namespace_id),
+                    NamespaceIdentOrUuid::Name {
+                        namespace,
+                        warehouse_id,
+                    } => namespace_ids
+                        .get(&(*warehouse_id, namespace.clone()))
+                        .copied(),
+                };
+                id.map_or(BatchCheckTarget::Denied, |id| BatchCheckTarget::Namespace {
+                    relation: action.to_openfga().to_string(),
+                    id,
+                })
+            }
+            CheckOperation::Table { action, table } => {
+                let id = match table {
+                    TabularIdentOrUuid::Id { table_id } => Some(TableId::from(*table_id)),
+                    TabularIdentOrUuid::Name {
+                        namespace,
+                        table,
+                        warehouse_id,
+                    } => table_ids
+                        .get(&(*warehouse_id, tabular_ident(namespace, table)))
+                        .copied(),
+                };
+                id.map_or(BatchCheckTarget::Denied, |id| BatchCheckTarget::Table {
+                    relation: action.to_openfga().to_string(),
+                    id,
+                })
+            }
+            CheckOperation::View { action, view } => {
+                let id = match view {
+                    TabularIdentOrUuid::Id { table_id } => Some(ViewId::from(*table_id)),
+                    TabularIdentOrUuid::Name {
+                        namespace,
+                        table,
+                        warehouse_id,
+                    } => view_ids
+                        .get(&(*warehouse_id, tabular_ident(namespace, table)))
+                        .copied(),
+                };
+                id.map_or(BatchCheckTarget::Denied, |id| BatchCheckTarget::View {
+                    relation: action.to_openfga().to_string(),
+                    id,
+                })
+            }
+        };
+        targets.push(target);
+    }
+
+    // 3. The caller must be allowed to inspect namespaces, tables and views.
+    let namespace_ids = distinct_ids(&targets, |t| match t {
+        BatchCheckTarget::Namespace { id, .. } => Some(*id),
+        _ => None,
+    });
+    let namespace_action = for_principal
+        .as_ref()
+        .map_or(AllNamespaceRelations::CanGetMetadata, |_| {
+            AllNamespaceRelations::CanReadAssignments
+        });
+    let visible_namespaces = authorizer
+        .are_allowed_namespace_actions(metadata, &namespace_ids, namespace_action)
+        .await
+        .map(|allowed| allowed_ids(namespace_ids, allowed))?;
+
+    let table_ids = distinct_ids(&targets, |t| match t {
+        BatchCheckTarget::Table { id, .. } => Some(*id),
+        _ => None,
+    });
+    let table_action = for_principal
+        .as_ref()
+        .map_or(AllTableRelations::CanGetMetadata, |_| {
+            AllTableRelations::CanReadAssignments
+        });
+    let visible_tables = authorizer
+        .are_allowed_table_actions(metadata, &table_ids, table_action)
+        .await
+        .map(|allowed| allowed_ids(table_ids, allowed))?;
+
+    let view_ids = distinct_ids(&targets, |t| match t {
+        BatchCheckTarget::View { id, .. } => Some(*id),
+        _ => None,
+    });
+    let view_action = for_principal
+        .as_ref()
+        .map_or(AllViewRelations::CanGetMetadata, |_| {
+            AllViewRelations::CanReadAssignments
+        });
+    let visible_views = authorizer
+        .are_allowed_view_actions(metadata, &view_ids, view_action)
+        .await
+        .map(|allowed| allowed_ids(view_ids, allowed))?;
+
+    // 4. Check all remaining operations for the principal in a single batch.
+    let user = if let Some(for_principal) = &for_principal {
+        for_principal.to_openfga()
+    } else {
+        metadata.actor().to_openfga()
+    };
+    let tuple_keys = targets
+        .into_iter()
+        .map(|target| {
+            let (relation, object) = match target {
+                BatchCheckTarget::Denied => return None,
+                BatchCheckTarget::Object { relation, object } => (relation, object),
+                BatchCheckTarget::Namespace { relation, id } => {
+                    (relation, visible_namespaces.get(&id)?.to_openfga())
+                }
+                BatchCheckTarget::Table { relation, id } => {
+                    (relation, visible_tables.get(&id)?.to_openfga())
+                }
+                BatchCheckTarget::View { relation, id } => {
+                    (relation, visible_views.get(&id)?.to_openfga())
+                }
+            };
+            Some(CheckRequestTupleKey {
+                user: user.clone(),
+                relation,
+                object,
+            })
+        })
+        .collect::<Vec<_>>();
+
+    let mut allowed = authorizer
+        .batch_check(tuple_keys.iter().flatten().cloned().collect())
+        .await?
+        .into_iter();
+    Ok(tuple_keys
+        .iter()
+        .map(|tuple_key| tuple_key.is_some() && allowed.next().unwrap_or(false))
+        .collect())
+}
+
+fn distinct_ids<T: Copy + Eq + std::hash::Hash>(
+    targets: &[BatchCheckTarget],
+    select: impl Fn(&BatchCheckTarget) -> Option<T>,
+) -> Vec<T> {
+    targets
+        .iter()
+        .filter_map(select)
+        .collect::<HashSet<_>>()
+        .into_iter()
+        .collect()
+}
+
+fn allowed_ids<T: Eq + std::hash::Hash>(ids: Vec<T>, allowed: Vec<bool>) -> HashSet<T> {
+    ids.into_iter()
+        .zip(allowed)
+        .filter_map(|(id, allowed)| allowed.then_some(id))
+        .collect()
+}
+
+fn tabular_ident(namespace: &NamespaceIdent, name: &str) -> TableIdent {
+    TableIdent {
+        namespace: namespace.clone(),
+        name: name.to_string(),
+    }
+}
+
 async fn check_warehouse(
     metadata: &RequestMetadata,
     authorizer: &OpenFGAAuthorizer,
@@ -420,6 +800,23 @@ pub(super) struct CheckResponse {
     allowed: bool,
 }
 
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq, utoipa::ToSchema)]
+#[serde(rename_all = "kebab-case")]
+/// Check multiple operations for the same user or role
+pub(super) struct BatchCheckRequest {
+    /// The user or role to check access for.
+    identity: Option<UserOrRole>,
+    /// The operations to check. At most 1000 operations are allowed.
+    operations: Vec<CheckOperation>,
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq, utoipa::ToSchema)]
+#[serde(rename_all = "kebab-case")]
+pub(super) struct BatchCheckResponse {
+    /// Results in the order of the requested operations.
+    results: Vec<CheckResponse>,
+}
+
 #[cfg(test)]
 mod tests {
     use std::str::FromStr;
@@ -511,6 +908,40 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_serde_batch_check_request() {
+        let json = serde_json::json!({
+            "identity": {
+                "user": "oidc~cfb55bf6-fcbb-4a1e-bfec-30c6649b52f8"
+            },
+            "operations": [
+                {
+                    "table": {
+                        "action": "get_metadata",
+                        "namespace": ["trino_namespace"],
+                        "table": "trino_table",
+                        "warehouse-id": "490cbf7a-cbfe-11ef-84c5-178606d4cab3"
+                    }
+                },
+                {
+                    "view": {
+                        "action": "get_metadata",
+                        "table-id": "00000000-0000-0000-0000-000000000000"
+                    }
+                }
+            ]
+        });
+        let request: BatchCheckRequest = serde_json::from_value(json).unwrap();
+        assert_eq!(request.operations.len(), 2);
+        assert!(matches!(
+            request.operations[1],
+            CheckOperation::View {
+                view: TabularIdentOrUuid::Id { .. },
+                ..
+            }
+        ));
+    }
+
     #[needs_env_var(TEST_OPENFGA = 1)]
     mod openfga {
         use std::str::FromStr;
@@ -774,5 +1205,103 @@ mod tests {
                 .unwrap();
             }
         }
+
+        #[sqlx::test]
+        async fn test_batch_check_matches_single_checks(pool: sqlx::PgPool) {
+            let operator_id = UserId::new_unchecked("oidc", &Uuid::now_v7().to_string());
+            let (ctx, warehouse, namespace) = setup(operator_id.clone(), pool).await;
+            let namespace_id = NamespaceId::from_str(
+                namespace
+                    .properties
+                    .unwrap()
+                    .get(NAMESPACE_ID_PROPERTY)
+                    .unwrap(),
+            )
+            .unwrap();
+
+            let user_1_id = UserId::new_unchecked("oidc", &Uuid::now_v7().to_string());
+            let user_1_metadata = RequestMetadata::random_human(user_1_id.clone());
+            ctx.v1_state
+                .authz
+                .write(
+                    Some(vec![TupleKey {
+                        condition: None,
+                        object: namespace_id.to_openfga(),
+                        relation: AllNamespaceRelations::Select.to_string(),
+                        user: user_1_id.to_openfga(),
+                    }]),
+                    None,
+                )
+                .await
+                .unwrap();
+
+            let namespace_ids = [
+                NamespaceIdentOrUuid::Id { namespace_id },
+                NamespaceIdentOrUuid::Name {
+                    namespace: namespace.namespace.clone(),
+                    warehouse_id: warehouse.warehouse_id,
+                },
+                NamespaceIdentOrUuid::Name {
+                    namespace: NamespaceIdent::from_vec(vec!["missing".to_string()]).unwrap(),
+                    warehouse_id: warehouse.warehouse_id,
+                },
+            ];
+            let operations = itertools::chain!(
+                WarehouseAction::iter().map(|a| CheckOperation::Warehouse {
+                    action: a,
+                    warehouse_id: warehouse.warehouse_id,
+                }),
+                NamespaceAction::iter().flat_map(|a| {
+                    namespace_ids
+                        .iter()
+                        .map(move |n| CheckOperation::Namespace {
+                            action: a,
+                            namespace: n.clone(),
+                        })
+                }),
+                [CheckOperation::Table {
+                    action: TableAction::GetMetadata,
+                    table: TabularIdentOrUuid::Name {
+                        namespace: namespace.namespace.clone(),
+                        table: "missing".to_string(),
+                        warehouse_id: warehouse.warehouse_id,
+                    },
+                }]
+            )
+            .collect::<Vec<_>>();
+
+            for (metadata, identity) in [
+                (user_1_metadata.clone(), None),
+                (
+                    RequestMetadata::random_human(operator_id.clone()),
+                    Some(UserOrRole::User(user_1_id.clone())),
+                ),
+            ] {
+                let batch = batch_check_internal(
+                    ctx.clone(),
+                    &metadata,
+                    BatchCheckRequest {
+                        identity: identity.clone(),
+                        operations: operations.clone(),
+                    },
+                )
+                .await
+                .unwrap();
+
+                for (operation, allowed) in operations.iter().zip(batch) {
+                    let single = check_internal(
+                        ctx.clone(),
+                        &metadata,
+                        CheckRequest {
+                            identity: identity.clone(),
+                            operation: operation.clone(),
+                        },
+                    )
+                    .await
+                    .unwrap_or(false);
+                    assert_eq!(allowed, single, "{operation:?}");
+                }
+            }
+        }
     }
 }
@@ -7,7 +7,9 @@ use openfga_client::client::{
 };
 use tokio::sync::RwLock;
 
-use super::{OpenFGAAuthorizer, OpenFGAError, OpenFGAResult, AUTH_CONFIG};
+use super::{
+    decision_cache::DecisionCache, OpenFGAAuthorizer, OpenFGAError, OpenFGAResult, AUTH_CONFIG,
+};
 use crate::{
     service::authz::implementations::{openfga::migration::get_active_auth_model_id, Authorizers},
     OpenFGAAuth,
@@ -95,5 +97,6 @@ pub(crate) async fn new_authorizer(
     Ok(OpenFGAAuthorizer {
         client,
         health: Arc::new(RwLock::new(vec![])),
+        decisions: DecisionCache::from_config(),
     })
 }
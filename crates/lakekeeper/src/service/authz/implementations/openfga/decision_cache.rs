@@ -0,0 +1,146 @@
+use std::{
+    sync::{
+        atomic::{AtomicU64, Ordering},
+        Arc,
+    },
+    time::Duration,
+};
+
+use axum_prometheus::metrics;
+use openfga_client::client::CheckRequestTupleKey;
+
+use crate::{config::AuthzDecisionCache, CONFIG};
+
+const METRIC_CACHE_HITS: &str = "lakekeeper_authz_decision_cache_hits_total";
+const METRIC_CACHE_MISSES: &str = "lakekeeper_authz_decision_cache_misses_total";
+
+/// In-process cache of `OpenFGA` check results, keyed by user, relation and object.
+///
+/// Tuples written or deleted by this instance clear the whole cache, as a single tuple
+/// can change the outcome of checks on any object below it - including revoking
+/// permissions via exclusions. Changes made by other instances or directly in `OpenFGA`
+/// become visible after at most the configured time to live.
+#[derive(Debug, Clone)]
+pub(super) struct DecisionCache {
+    cache: Option<moka::future::Cache<DecisionKey, bool>>,
+    /// Incremented on every invalidation, so that checks which were in flight
+    /// while tuples changed don't re-populate the cache with outdated results.
+    generation: Arc<AtomicU64>,
+}
+
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+struct DecisionKey {
+    user: String,
+    relation: String,
+    object: String,
+}
+
+impl From<&CheckRequestTupleKey> for DecisionKey {
+    fn from(tuple_key: &CheckRequestTupleKey) -> Self {
+        Self {
+            user: tuple_key.user.clone(),
+            relation: tuple_key.relation.clone(),
+            object: tuple_key.object.clone(),
+        }
+    }
+}
+
+impl DecisionCache {
+    pub(super) fn from_config() -> Self {
+        Self::new(&CONFIG.cache.authz_decisions)
+    }
+
+    fn new(config: &AuthzDecisionCache) -> Self {
+        let cache = config.enabled.then(|| {
+            moka::future::Cache::builder()
+                .max_capacity(config.max_entries)
+                .time_to_live(Duration::from_secs(config.time_to_live_seconds))
+                .build()
+        });
+        Self {
+            cache,
+            generation: Arc::new(AtomicU64::new(0)),
+        }
+    }
+
+    /// Must be obtained before checking with `OpenFGA` and passed to [`Self::insert`].
+    pub(super) fn generation(&self) -> u64 {
+        self.generation.load(Ordering::Acquire)
+    }
+
+    pub(super) async fn get(&self, tuple_key: &CheckRequestTupleKey) -> Option<bool> {
+        let cache = self.cache.as_ref()?;
+        let allowed = cache.get(&DecisionKey::from(tuple_key)).await;
+        if allowed.is_some() {
+            metrics::counter!(METRIC_CACHE_HITS).increment(1);
+        } else {
+            metrics::counter!(METRIC_CACHE_MISSES).increment(1);
+        }
+        allowed
+    }
+
+    pub(super) async fn insert(
+        &self,
+        tuple_key: &CheckRequestTupleKey,
+        allowed: bool,
+        generation: u64,
+    ) {
+        let Some(cache) = &self.cache else {
+            return;
+        };
+        if self.generation() == generation {
+            cache.insert(DecisionKey::from(tuple_key), allowed).await;
+        }
+    }
+
+    pub(super) fn invalidate_all(&self) {
+        if let Some(cache) = &self.cache {
+            self.generation.fetch_add(1, Ordering::AcqRel);
+            cache.invalidate_all();
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn tuple_key(object: &str) -> CheckRequestTupleKey {
+        CheckRequestTupleKey {
+            user: "user:alice".to_string(),
+            relation: "can_get_metadata".to_string(),
+            object: object.to_string(),
+        }
+    }
+
+    #[tokio::test]
+    async fn test_invalidation_discards_in_flight_results() {
+        let cache = DecisionCache::new(&AuthzDecisionCache {
+            enabled: true,
+            ..AuthzDecisionCache::default()
+        });
+        let key = tuple_key("table:1");
+
+        let generation = cache.generation();
+        cache.insert(&key, true, generation).await;
+        assert_eq!(cache.get(&key).await, Some(true));
+
+        let generation = cache.generation();
+        cache.invalidate_all();
+        assert_eq!(cache.get(&key).await, None);
+        // Result of a check that started before the invalidation
+        cache.insert(&key, false, generation).await;
+        assert_eq!(cache.get(&key).await, None);
+
+        cache.insert(&key, false, cache.generation()).await;
+        assert_eq!(cache.get(&key).await, Some(false));
+    }
+
+    #[tokio::test]
+    async fn test_disabled_cache_stores_nothing() {
+        let cache = DecisionCache::new(&AuthzDecisionCache::default());
+        let key = tuple_key("table:1");
+        cache.insert(&key, true, cache.generation()).await;
+        assert_eq!(cache.get(&key).await, None);
+    }
+}
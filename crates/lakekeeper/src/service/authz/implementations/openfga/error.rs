@@ -36,6 +36,8 @@ pub(crate) enum OpenFGAError {
     },
     #[error("Cannot assign {0} to itself")]
     SelfAssignment(String),
+    #[error("OpenFGA batch check failed for `{object}`: {reason}")]
+    BatchCheckFailed { object: String, reason: String },
 }
 
 impl OpenFGAError {
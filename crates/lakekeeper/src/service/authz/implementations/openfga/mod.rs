@@ -6,10 +6,11 @@ use std::{
 };
 
 use axum::Router;
+use futures::{StreamExt, TryStreamExt};
 use openfga_client::{
     client::{
-        CheckRequestTupleKey, ReadRequestTupleKey, ReadResponse, Tuple, TupleKey,
-        TupleKeyWithoutCondition,
+        batch_check_single_result::CheckResult, BatchCheckItem, CheckRequestTupleKey,
+        ReadRequestTupleKey, ReadResponse, Tuple, TupleKey, TupleKeyWithoutCondition,
     },
     migration::AuthorizationModelVersion,
     tonic,
@@ -32,6 +33,7 @@ use crate::{
 pub(super) mod api;
 mod check;
 mod client;
+mod decision_cache;
 mod entities;
 mod error;
 mod health;
@@ -43,6 +45,7 @@ pub(crate) use client::{new_authorizer_from_config, new_client_from_config};
 pub use client::{
     BearerOpenFGAAuthorizer, ClientCredentialsOpenFGAAuthorizer, UnauthenticatedOpenFGAAuthorizer,
 };
+use decision_cache::DecisionCache;
 use entities::{OpenFgaEntity, ParseOpenFgaEntity as _};
 pub(crate) use error::{OpenFGAError, OpenFGAResult};
 use iceberg_ext::catalog::rest::IcebergErrorResponse;
@@ -70,6 +73,9 @@ use crate::{
 };
 
 const MAX_TUPLES_PER_WRITE: i32 = 100;
+/// Default limit of checks per `BatchCheck` request in OpenFGA.
+const MAX_CHECKS_PER_BATCH: usize = 50;
+const MAX_CONCURRENT_BATCH_CHECKS: usize = 4;
 
 static AUTH_CONFIG: LazyLock<crate::config::OpenFGAConfig> =
     LazyLock::new(|| CONFIG.openfga.clone().expect("OpenFGAConfig not found"));
@@ -97,6 +103,7 @@ pub(crate) static OPENFGA_SERVER: LazyLock<String> =
 pub struct OpenFGAAuthorizer {
     client: BasicOpenFgaClient,
     health: Arc<RwLock<Vec<Health>>>,
+    decisions: DecisionCache,
 }
 
 #[async_trait::async_trait]
@@ -331,6 +338,31 @@ impl Authorizer for OpenFGAAuthorizer {
         .map_err(Into::into)
     }
 
+    async fn are_allowed_namespace_actions<A>(
+        &self,
+        metadata: &RequestMetadata,
+        namespace_ids: &[NamespaceId],
+        action: A,
+    ) -> Result<Vec<bool>>
+    where
+        A: From<CatalogNamespaceAction> + std::fmt::Display + Send + Sync + Clone,
+    {
+        let user = metadata.actor().to_openfga();
+        let relation = action.to_string();
+        self.batch_check(
+            namespace_ids
+                .iter()
+                .map(|id| CheckRequestTupleKey {
+                    user: user.clone(),
+                    relation: relation.clone(),
+                    object: id.to_openfga(),
+                })
+                .collect(),
+        )
+        .await
+        .map_err(Into::into)
+    }
+
     async fn is_allowed_table_action<A>(
         &self,
         metadata: &RequestMetadata,
@@ -349,6 +381,31 @@ impl Authorizer for OpenFGAAuthorizer {
         .map_err(Into::into)
     }
 
+    async fn are_allowed_table_actions<A>(
+        &self,
+        metadata: &RequestMetadata,
+        table_ids: &[TableId],
+        action: A,
+    ) -> Result<Vec<bool>>
+    where
+        A: From<CatalogTableAction> + std::fmt::Display + Send + Sync + Clone,
+    {
+        let user = metadata.actor().to_openfga();
+        let relation = action.to_string();
+        self.batch_check(
+            table_ids
+                .iter()
+                .map(|id| CheckRequestTupleKey {
+                    user: user.clone(),
+                    relation: relation.clone(),
+                    object: id.to_openfga(),
+                })
+                .collect(),
+        )
+        .await
+        .map_err(Into::into)
+    }
+
     async fn is_allowed_view_action<A>(
         &self,
         metadata: &RequestMetadata,
@@ -367,6 +424,31 @@ impl Authorizer for OpenFGAAuthorizer {
         .map_err(Into::into)
     }
 
+    async fn are_allowed_view_actions<A>(
+        &self,
+        metadata: &RequestMetadata,
+        view_ids: &[ViewId],
+        action: A,
+    ) -> Result<Vec<bool>>
+    where
+        A: From<CatalogViewAction> + std::fmt::Display + Send + Sync + Clone,
+    {
+        let user = metadata.actor().to_openfga();
+        let relation = action.to_string();
+        self.batch_check(
+            view_ids
+                .iter()
+                .map(|id| CheckRequestTupleKey {
+                    user: user.clone(),
+                    relation: relation.clone(),
+                    object: id.to_openfga(),
+                })
+                .collect(),
+        )
+        .await
+        .map_err(Into::into)
+    }
+
     async fn delete_user(&self, _metadata: &RequestMetadata, user_id: UserId) -> Result<()> {
         self.delete_all_relations(&user_id).await
     }
@@ -680,7 +762,10 @@ impl OpenFGAAuthorizer {
         writes: impl Into<Option<Vec<TupleKey>>>,
         deletes: impl Into<Option<Vec<TupleKeyWithoutCondition>>>,
     ) -> OpenFGAResult<()> {
-        self.client.write(writes, deletes).await.inspect_err(|e| {
+        let result = self.client.write(writes, deletes).await;
+        // Parts of a failed write may still have been applied.
+        self.decisions.invalidate_all();
+        result.inspect_err(|e| {
             tracing::error!("Failed to write to OpenFGA: {e}");
         })?;
         Ok(())
@@ -714,15 +799,97 @@ impl OpenFGAAuthorizer {
             .map_err(Into::into)
     }
 
-    /// A convenience wrapper around check
+    /// A convenience wrapper around check, served from the decision cache if possible.
     async fn check(&self, tuple_key: impl Into<CheckRequestTupleKey>) -> OpenFGAResult<bool> {
-        self.client
-            .check(tuple_key, None, None, false)
+        let tuple_key = tuple_key.into();
+        if let Some(allowed) = self.decisions.get(&tuple_key).await {
+            return Ok(allowed);
+        }
+
+        let generation = self.decisions.generation();
+        let allowed = self
+            .client
+            .check(tuple_key.clone(), None, None, false)
             .await
             .inspect_err(|e| {
                 tracing::error!("Failed to check with OpenFGA: {e}");
+            })?;
+        self.decisions.insert(&tuple_key, allowed, generation).await;
+        Ok(allowed)
+    }
+
+    /// Check many tuples at once using OpenFGA's `BatchCheck`.
+    /// Results are returned in the order of `tuple_keys`.
+    /// Cached decisions are used where available. The remaining checks are split into
+    /// batches of [`MAX_CHECKS_PER_BATCH`], of which at most
+    /// [`MAX_CONCURRENT_BATCH_CHECKS`] are in flight at the same time.
+    async fn batch_check(&self, tuple_keys: Vec<CheckRequestTupleKey>) -> OpenFGAResult<Vec<bool>> {
+        let mut results = Vec::with_capacity(tuple_keys.len());
+        let mut missing = Vec::new();
+        for (i, tuple_key) in tuple_keys.iter().enumerate() {
+            let cached = self.decisions.get(tuple_key).await;
+            if cached.is_none() {
+                missing.push((i, tuple_key.clone()));
+            }
+            results.push(cached.unwrap_or_default());
+        }
+        if missing.is_empty() {
+            return Ok(results);
+        }
+
+        let generation = self.decisions.generation();
+        let (positions, missing): (Vec<_>, Vec<_>) = missing.into_iter().unzip();
+        let checked = futures::stream::iter(missing.chunks(MAX_CHECKS_PER_BATCH))
+            .map(|chunk| self.batch_check_chunk(chunk))
+            .buffered(MAX_CONCURRENT_BATCH_CHECKS)
+            .try_collect::<Vec<_>>()
+            .await?;
+        for ((i, tuple_key), allowed) in positions
+            .into_iter()
+            .zip(missing.iter())
+            .zip(checked.into_iter().flatten())
+        {
+            self.decisions.insert(tuple_key, allowed, generation).await;
+            results[i] = allowed;
+        }
+        Ok(results)
+    }
+
+    async fn batch_check_chunk(
+        &self,
+        tuple_keys: &[CheckRequestTupleKey],
+    ) -> OpenFGAResult<Vec<bool>> {
+        // Correlation ids are the positions within the chunk, so that results
+        // can be mapped back to their requests.
+        let items = tuple_keys
+            .iter()
+            .enumerate()
+            .map(|(i, tuple_key)| BatchCheckItem {
+                tuple_key: Some(tuple_key.clone()),
+                contextual_tuples: None,
+                context: None,
+                correlation_id: i.to_string(),
             })
-            .map_err(Into::into)
+            .collect::<Vec<_>>();
+        let mut results = self.client.batch_check(items).await.inspect_err(|e| {
+            tracing::error!("Failed to batch check with OpenFGA: {e}");
+        })?;
+
+        tuple_keys
+            .iter()
+            .enumerate()
+            .map(|(i, tuple_key)| match results.remove(&i.to_string()) {
+                Some(CheckResult::Allowed(allowed)) => Ok(allowed),
+                Some(CheckResult::Error(e)) => Err(OpenFGAError::BatchCheckFailed {
+                    object: tuple_key.object.clone(),
+                    reason: e.message,
+                }),
+                None => Err(OpenFGAError::BatchCheckFailed {
+                    object: tuple_key.object.clone(),
+                    reason: "No result returned".to_string(),
+                }),
+            })
+            .collect()
     }
 
     async fn require_action(
@@ -892,9 +1059,12 @@ impl OpenFGAAuthorizer {
 
     async fn delete_own_relations(&self, object: &impl OpenFgaEntity) -> Result<()> {
         let object_openfga = object.to_openfga();
-        self.client
+        let result = self
+            .client
             .delete_relations_to_object(&object_openfga)
-            .await
+            .await;
+        self.decisions.invalidate_all();
+        result
             .inspect_err(|e| tracing::error!("Failed to delete relations to {object_openfga}: {e}"))
             .map_err(OpenFGAError::from)
             .map_err(Into::into)
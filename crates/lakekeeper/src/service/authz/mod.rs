@@ -264,6 +264,64 @@ where
     where
         A: From<CatalogViewAction> + std::fmt::Display + Send;
 
+    /// Batch variant of `is_allowed_namespace_action`.
+    /// Returns one result per namespace, in the order of `namespace_ids`.
+    /// Implementations should override this if their backend can check many objects at once.
+    async fn are_allowed_namespace_actions<A>(
+        &self,
+        metadata: &RequestMetadata,
+        namespace_ids: &[NamespaceId],
+        action: A,
+    ) -> Result<Vec<bool>>
+    where
+        A: From<CatalogNamespaceAction> + std::fmt::Display + Send + Sync + Clone,
+    {
+        futures::future::try_join_all(namespace_ids.iter().map(|namespace_id| {
+            self.is_allowed_namespace_action(metadata, *namespace_id, action.clone())
+        }))
+        .await
+    }
+
+    /// Batch variant of `is_allowed_table_action`.
+    /// Returns one result per table, in the order of `table_ids`.
+    /// Implementations should override this if their backend can check many objects at once.
+    async fn are_allowed_table_actions<A>(
+        &self,
+        metadata: &RequestMetadata,
+        table_ids: &[TableId],
+        action: A,
+    ) -> Result<Vec<bool>>
+    where
+        A: From<CatalogTableAction> + std::fmt::Display + Send + Sync + Clone,
+    {
+        futures::future::try_join_all(
+            table_ids
+                .iter()
+                .map(|table_id| self.is_allowed_table_action(metadata, *table_id, action.clone())),
+        )
+        .await
+    }
+
+    /// Batch variant of `is_allowed_view_action`.
+    /// Returns one result per view, in the order of `view_ids`.
+    /// Implementations should override this if their backend can check many objects at once.
+    async fn are_allowed_view_actions<A>(
+        &self,
+        metadata: &RequestMetadata,
+        view_ids: &[ViewId],
+        action: A,
+    ) -> Result<Vec<bool>>
+    where
+        A: From<CatalogViewAction> + std::fmt::Display + Send + Sync + Clone,
+    {
+        futures::future::try_join_all(
+            view_ids
+                .iter()
+                .map(|view_id| self.is_allowed_view_action(metadata, *view_id, action.clone())),
+        )
+        .await
+    }
+
     /// Hook that is called when a user is deleted.
     async fn delete_user(&self, metadata: &RequestMetadata, user_id: UserId) -> Result<()>;
 
@@ -893,4 +951,22 @@ pub(crate) mod tests {
             Ok(())
         }
     }
+
+    #[tokio::test]
+    async fn test_batch_checks_preserve_order() {
+        let authorizer = HidingAuthorizer::new();
+        let table_ids = (0..5).map(|_| TableId::new_random()).collect::<Vec<_>>();
+        authorizer.hide(&format!("table:{}", table_ids[1]));
+        authorizer.hide(&format!("table:{}", table_ids[4]));
+
+        let allowed = authorizer
+            .are_allowed_table_actions(
+                &RequestMetadata::new_unauthenticated(),
+                &table_ids,
+                CatalogTableAction::CanIncludeInList,
+            )
+            .await
+            .unwrap();
+        assert_eq!(allowed, vec![true, false, true, true, false]);
+    }
 }
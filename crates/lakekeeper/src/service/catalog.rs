@@ -23,7 +23,9 @@ pub use crate::api::iceberg::v1::{
 };
 use crate::{
     api::{
-        iceberg::v1::{namespace::NamespaceDropFlags, PaginatedMapping, PaginationQuery},
+        iceberg::v1::{
+            namespace::NamespaceDropFlags, LoadTableSnapshots, PaginatedMapping, PaginationQuery,
+        },
         management::v1::{
             project::{EndpointStatisticsResponse, TimeWindowSelector, WarehouseFilter},
             role::{ListRolesResponse, Role, SearchRoleResponse},
@@ -39,12 +41,13 @@ use crate::{
     request_metadata::RequestMetadata,
     service::{
         authn::UserId,
+        event_publisher::outbox::{OutboxEvent, OutboxStats},
         health::HealthExt,
         tabular_idents::{TabularId, TabularIdentOwned},
         task_queue::{
             tabular_expiration_queue, tabular_expiration_queue::TabularExpirationPayload,
             tabular_purge_queue, tabular_purge_queue::TabularPurgePayload, Status, Task,
-            TaskCheckState, TaskFilter, TaskId, TaskInput, TaskMetadata,
+            TaskCheckState, TaskFailure, TaskFilter, TaskId, TaskInput, TaskMetadata,
         },
     },
     SecretIdent,
@@ -91,7 +94,7 @@ pub struct CreateTableResponse {
     pub staged_table_id: Option<TableId>,
 }
 
-#[derive(Debug, PartialEq, Eq)]
+#[derive(Debug, Clone, PartialEq, Eq)]
 pub struct LoadTableResponse {
     pub table_id: TableId,
     pub namespace_id: NamespaceId,
@@ -423,10 +426,13 @@ where
     /// Load tables by table id.
     /// Does not return staged tables.
     /// If a table does not exist, do not include it in the response.
+    /// With `LoadTableSnapshots::Refs`, only snapshots referenced by branches
+    /// or tags are loaded.
     async fn load_tables<'a>(
         warehouse_id: WarehouseId,
         tables: impl IntoIterator<Item = TableId> + Send,
         include_deleted: bool,
+        snapshots: LoadTableSnapshots,
         transaction: <Self::Transaction as Transaction<Self::State>>::Transaction<'a>,
     ) -> Result<HashMap<TableId, LoadTableResponse>>;
 
@@ -489,6 +495,10 @@ where
 
     /// Commit changes to a table.
     /// The table might be staged or not.
+    ///
+    /// The metadata location of each table is only swapped if it still equals
+    /// `previous_metadata_location` of the commit. Otherwise an error of type
+    /// `CONCURRENT_UPDATE_ERROR_TYPE` is returned.
     async fn commit_table_transaction<'a>(
         warehouse_id: WarehouseId,
         commits: impl IntoIterator<Item = TableCommit> + Send,
@@ -801,7 +811,31 @@ where
         queue_name: &str,
         max_time_since_last_heartbeat: chrono::Duration,
         state: Self::State,
-    ) -> Result<Option<Task>>;
+    ) -> Result<Option<Task>> {
+        Ok(
+            Self::pick_new_tasks(queue_name, max_time_since_last_heartbeat, 1, state)
+                .await?
+                .pop(),
+        )
+    }
+    /// Claim up to `limit` tasks of `queue_name`.
+    async fn pick_new_tasks(
+        queue_name: &str,
+        max_time_since_last_heartbeat: chrono::Duration,
+        limit: usize,
+        state: Self::State,
+    ) -> Result<Vec<Task>>;
+    /// Subscribe to new tasks of `queue_name`. The receiver is marked as changed
+    /// when a task of the queue is queued or becomes due.
+    ///
+    /// Returns `None` if the catalog doesn't support notifications, in which case
+    /// workers poll for new tasks.
+    fn subscribe_to_new_tasks(
+        _queue_name: &str,
+        _state: Self::State,
+    ) -> Option<tokio::sync::watch::Receiver<()>> {
+        None
+    }
     async fn record_task_success(
         id: TaskId,
         message: Option<&str>,
@@ -813,6 +847,17 @@ where
         max_retries: i32,
         transaction: &mut <Self::Transaction as Transaction<Self::State>>::Transaction<'_>,
     ) -> Result<()>;
+    /// Renew the heartbeat of running tasks, for example while they wait for a worker slot.
+    async fn heartbeat_tasks(ids: &[TaskId], state: Self::State) -> Result<()>;
+    async fn record_task_successes(
+        ids: &[TaskId],
+        message: Option<&str>,
+        transaction: &mut <Self::Transaction as Transaction<Self::State>>::Transaction<'_>,
+    ) -> Result<()>;
+    async fn record_task_failures(
+        failures: &[TaskFailure],
+        transaction: &mut <Self::Transaction as Transaction<Self::State>>::Transaction<'_>,
+    ) -> Result<()>;
 
     async fn retrying_record_task_success(
         task_id: TaskId,
@@ -982,6 +1027,38 @@ where
         queue_name: &str,
         transaction: <Self::Transaction as Transaction<Self::State>>::Transaction<'_>,
     ) -> Result<Option<GetTaskQueueConfigResponse>>;
+
+    // ---------------- Change Event Outbox ----------------
+    /// Store `events` in the outbox as part of `transaction`. They are published by the
+    /// outbox relay once the transaction is committed.
+    async fn write_change_events(
+        events: &[cloudevents::Event],
+        transaction: <Self::Transaction as Transaction<Self::State>>::Transaction<'_>,
+    ) -> Result<()>;
+    /// Claim up to `limit` of the oldest events of the outbox that are neither claimed
+    /// by another relay, waiting for a retry nor dead-lettered. They are leased to the
+    /// caller for `lease`.
+    async fn claim_change_events(
+        limit: usize,
+        lease: std::time::Duration,
+        state: Self::State,
+    ) -> Result<Vec<OutboxEvent>>;
+    async fn delete_change_events(sequence_numbers: &[i64], state: Self::State) -> Result<()>;
+    /// Add `published_to` to the sinks that published the events and make them
+    /// available for claiming again after `retry_after`.
+    async fn release_change_events(
+        sequence_numbers: &[i64],
+        published_to: &[String],
+        retry_after: std::time::Duration,
+        state: Self::State,
+    ) -> Result<()>;
+    /// Add `published_to` to the sinks that published the events and stop publishing them.
+    async fn dead_letter_change_events(
+        sequence_numbers: &[i64],
+        published_to: &[String],
+        state: Self::State,
+    ) -> Result<()>;
+    async fn get_change_event_outbox_stats(state: Self::State) -> Result<OutboxStats>;
 }
 
 #[derive(Debug, Clone, Copy, PartialEq)]
@@ -0,0 +1,272 @@
+//! Change events of catalog operations. They are published by the [`super::CloudEventsPublisher`]
+//! hooks or, if the outbox is enabled, written to the outbox in the transaction of the operation.
+use std::collections::HashMap;
+
+use iceberg::{
+    spec::{TableMetadata, ViewMetadata},
+    TableIdent,
+};
+use iceberg_ext::catalog::rest::{
+    CommitTransactionRequest, CommitViewRequest, CreateTableRequest, CreateViewRequest,
+    RegisterTableRequest, RenameTableRequest,
+};
+use uuid::Uuid;
+
+use super::{EventMetadata, Payload};
+use crate::{
+    api::{
+        iceberg::{
+            types::Prefix,
+            v1::{NamespaceParameters, TableParameters, ViewParameters},
+        },
+        RequestMetadata,
+    },
+    catalog::tables::maybe_body_to_json,
+    service::{tabular_idents::TabularId, TableId, UndropTabularResponse, ViewId, WarehouseId},
+};
+
+fn prefix_string(prefix: Option<&Prefix>) -> String {
+    prefix.map(|p| p.as_str().to_string()).unwrap_or_default()
+}
+
+#[allow(clippy::too_many_arguments)]
+fn single(
+    typ: &str,
+    data: serde_json::Value,
+    tabular_id: TabularId,
+    warehouse_id: WarehouseId,
+    name: String,
+    namespace: String,
+    prefix: String,
+    request_metadata: &RequestMetadata,
+) -> Payload {
+    Payload {
+        id: Uuid::now_v7(),
+        typ: typ.to_string(),
+        data,
+        metadata: EventMetadata {
+            tabular_id,
+            warehouse_id,
+            name,
+            namespace,
+            prefix,
+            num_events: 1,
+            sequence_number: 0,
+            trace_id: request_metadata.request_id(),
+        },
+    }
+}
+
+pub(crate) fn update_tables(
+    warehouse_id: WarehouseId,
+    request: &CommitTransactionRequest,
+    table_ident_map: &HashMap<TableIdent, TableId>,
+    request_metadata: &RequestMetadata,
+) -> Vec<Payload> {
+    let changes = request
+        .table_changes
+        .iter()
+        .filter_map(|commit_table_request| {
+            let table_ident = commit_table_request.identifier.as_ref()?;
+            let table_id = table_ident_map.get(table_ident)?;
+            Some((commit_table_request, table_ident, *table_id))
+        })
+        .collect::<Vec<_>>();
+    let num_events = changes.len();
+    changes
+        .into_iter()
+        .enumerate()
+        .map(
+            |(sequence_number, (commit_table_request, table_ident, table_id))| Payload {
+                id: Uuid::now_v7(),
+                typ: "updateTable".to_string(),
+                data: maybe_body_to_json(commit_table_request),
+                metadata: EventMetadata {
+                    tabular_id: TabularId::Table(*table_id),
+                    warehouse_id,
+                    name: table_ident.name.clone(),
+                    namespace: table_ident.namespace.to_url_string(),
+                    prefix: String::new(),
+                    num_events,
+                    sequence_number,
+                    trace_id: request_metadata.request_id(),
+                },
+            },
+        )
+        .collect()
+}
+
+pub(crate) fn drop_table(
+    warehouse_id: WarehouseId,
+    TableParameters { prefix, table }: &TableParameters,
+    table_id: TableId,
+    request_metadata: &RequestMetadata,
+) -> Payload {
+    single(
+        "dropTable",
+        serde_json::Value::Null,
+        TabularId::Table(*table_id),
+        warehouse_id,
+        table.name.clone(),
+        table.namespace.to_url_string(),
+        prefix_string(prefix.as_ref()),
+        request_metadata,
+    )
+}
+
+pub(crate) fn register_table(
+    warehouse_id: WarehouseId,
+    NamespaceParameters { prefix, namespace }: &NamespaceParameters,
+    request: &RegisterTableRequest,
+    metadata: &TableMetadata,
+    request_metadata: &RequestMetadata,
+) -> Payload {
+    single(
+        "registerTable",
+        serde_json::Value::Null,
+        TabularId::Table(metadata.uuid()),
+        warehouse_id,
+        request.name.clone(),
+        namespace.to_url_string(),
+        prefix_string(prefix.as_ref()),
+        request_metadata,
+    )
+}
+
+pub(crate) fn create_table(
+    warehouse_id: WarehouseId,
+    NamespaceParameters { prefix, namespace }: &NamespaceParameters,
+    request: &CreateTableRequest,
+    metadata: &TableMetadata,
+    request_metadata: &RequestMetadata,
+) -> Payload {
+    single(
+        "createTable",
+        serde_json::Value::Null,
+        TabularId::Table(metadata.uuid()),
+        warehouse_id,
+        request.name.clone(),
+        namespace.to_url_string(),
+        prefix_string(prefix.as_ref()),
+        request_metadata,
+    )
+}
+
+pub(crate) fn rename_table(
+    warehouse_id: WarehouseId,
+    table_id: TableId,
+    request: &RenameTableRequest,
+    request_metadata: &RequestMetadata,
+) -> Payload {
+    single(
+        "renameTable",
+        serde_json::Value::Null,
+        TabularId::Table(*table_id),
+        warehouse_id,
+        request.source.name.clone(),
+        request.source.namespace.to_url_string(),
+        String::new(),
+        request_metadata,
+    )
+}
+
+pub(crate) fn create_view(
+    warehouse_id: WarehouseId,
+    NamespaceParameters { prefix, namespace }: &NamespaceParameters,
+    request: &CreateViewRequest,
+    metadata: &ViewMetadata,
+    request_metadata: &RequestMetadata,
+) -> Payload {
+    single(
+        "createView",
+        maybe_body_to_json(request),
+        TabularId::View(metadata.uuid()),
+        warehouse_id,
+        request.name.clone(),
+        namespace.to_url_string(),
+        prefix_string(prefix.as_ref()),
+        request_metadata,
+    )
+}
+
+pub(crate) fn update_view(
+    warehouse_id: WarehouseId,
+    ViewParameters { prefix, view }: &ViewParameters,
+    request: &CommitViewRequest,
+    new_metadata: &ViewMetadata,
+    request_metadata: &RequestMetadata,
+) -> Payload {
+    single(
+        "updateView",
+        maybe_body_to_json(request),
+        TabularId::View(new_metadata.uuid()),
+        warehouse_id,
+        view.name.clone(),
+        view.namespace.to_url_string(),
+        prefix_string(prefix.as_ref()),
+        request_metadata,
+    )
+}
+
+pub(crate) fn drop_view(
+    warehouse_id: WarehouseId,
+    ViewParameters { prefix, view }: &ViewParameters,
+    view_id: ViewId,
+    request_metadata: &RequestMetadata,
+) -> Payload {
+    single(
+        "dropView",
+        serde_json::Value::Null,
+        TabularId::View(*view_id),
+        warehouse_id,
+        view.name.clone(),
+        view.namespace.to_url_string(),
+        prefix_string(prefix.as_ref()),
+        request_metadata,
+    )
+}
+
+pub(crate) fn rename_view(
+    warehouse_id: WarehouseId,
+    view_id: ViewId,
+    request: &RenameTableRequest,
+    request_metadata: &RequestMetadata,
+) -> Payload {
+    single(
+        "renameView",
+        serde_json::Value::Null,
+        TabularId::View(*view_id),
+        warehouse_id,
+        request.source.name.clone(),
+        request.source.namespace.to_url_string(),
+        String::new(),
+        request_metadata,
+    )
+}
+
+pub(crate) fn undrop_tabulars(
+    warehouse_id: WarehouseId,
+    responses: &[UndropTabularResponse],
+    request_metadata: &RequestMetadata,
+) -> Vec<Payload> {
+    let num_events = responses.len();
+    responses
+        .iter()
+        .enumerate()
+        .map(|(sequence_number, response)| Payload {
+            id: Uuid::now_v7(),
+            typ: "undropTabulars".to_string(),
+            data: serde_json::Value::Null,
+            metadata: EventMetadata {
+                tabular_id: TabularId::from(response.table_ident),
+                warehouse_id,
+                name: response.name.clone(),
+                namespace: response.namespace.to_url_string(),
+                prefix: String::new(),
+                num_events,
+                sequence_number,
+                trace_id: request_metadata.request_id(),
+            },
+        })
+        .collect()
+}
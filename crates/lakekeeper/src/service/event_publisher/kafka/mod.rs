@@ -119,38 +119,70 @@ impl std::fmt::Debug for KafkaBackend {
     }
 }
 
+/// Messages are keyed by tabular, so that all events of a tabular land in the same partition.
+fn message_key(event: &Event) -> String {
+    match event.extension("tabular-id") {
+        Some(extension_value) => extension_value.to_string(),
+        None => String::new(),
+    }
+}
+
 #[async_trait]
 impl CloudEventBackend for KafkaBackend {
     async fn publish(&self, event: Event) -> anyhow::Result<()> {
-        let key: String = match event.extension("tabular-id") {
-            Some(extension_value) => extension_value.to_string(),
-            None => String::new(),
-        };
-        let message_record = MessageRecord::from_event(event)?;
-        let delivery_status = self
-            .producer
-            .send(
+        self.publish_batch(vec![event]).await
+    }
+
+    /// Hands all events of the batch to the producer before awaiting their delivery,
+    /// so that the producer can send them in as few requests as possible.
+    async fn publish_batch(&self, events: Vec<Event>) -> anyhow::Result<()> {
+        let num_events = events.len();
+        let records = events
+            .into_iter()
+            .filter_map(|event| {
+                let key = message_key(&event);
+                MessageRecord::from_event(event)
+                    .inspect_err(|e| tracing::warn!("Failed to encode event for kafka: {e}"))
+                    .ok()
+                    .map(|record| (key, record))
+            })
+            .collect::<Vec<_>>();
+        let deliveries = futures::future::join_all(records.iter().map(|(key, record)| {
+            self.producer.send(
                 FutureRecord::to(&self.topic)
-                    .message_record(&message_record)
+                    .message_record(record)
                     .key(&key[..]),
                 Duration::from_secs(1),
             )
-            .await;
-
-        match delivery_status {
-            Ok(Delivery {
-                partition,
-                offset,
-                timestamp,
-            }) => {
-                tracing::debug!(
-                    "CloudEvents event sent via kafka to topic: {}, partition: {partition}, offset: {offset}, timestamp: {timestamp:?}",
-                    &self.topic,
-                );
-                Ok(())
+        }))
+        .await;
+
+        let mut failed = num_events - records.len();
+        for delivery_status in deliveries {
+            match delivery_status {
+                Ok(Delivery {
+                    partition,
+                    offset,
+                    timestamp,
+                }) => {
+                    tracing::debug!(
+                        "CloudEvents event sent via kafka to topic: {}, partition: {partition}, offset: {offset}, timestamp: {timestamp:?}",
+                        &self.topic,
+                    );
+                }
+                Err((e, _)) => {
+                    tracing::debug!("Failed to send CloudEvents event via kafka: {e}");
+                    failed += 1;
+                }
             }
-            Err((e, _)) => Err(anyhow::anyhow!(e)),
         }
+        if failed > 0 {
+            anyhow::bail!(
+                "{failed} of {num_events} events could not be sent to kafka topic {}",
+                self.topic
+            );
+        }
+        Ok(())
     }
 
     fn name(&self) -> &'static str {
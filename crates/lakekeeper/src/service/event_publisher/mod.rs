@@ -1,12 +1,13 @@
 use std::{
     collections::HashMap,
     fmt::{Debug, Display},
-    sync::Arc,
+    sync::{Arc, LazyLock},
 };
 
 use anyhow::Context;
 use async_trait::async_trait;
-use cloudevents::Event;
+use axum_prometheus::metrics;
+use cloudevents::{AttributesReader as _, Event};
 use iceberg::{
     spec::{TableMetadata, ViewMetadata},
     TableIdent,
@@ -18,29 +19,33 @@ use iceberg_ext::{
     },
     configs::Location,
 };
+use tokio::sync::mpsc::error::TrySendError;
 use uuid::Uuid;
 
 use super::{TableId, UndropTabularResponse, ViewId, WarehouseId};
 use crate::{
     api::{
         iceberg::{
-            types::{DropParams, Prefix},
+            types::DropParams,
             v1::{DataAccess, NamespaceParameters, TableParameters, ViewParameters},
         },
         management::v1::warehouse::UndropTabularsRequest,
         RequestMetadata,
     },
-    catalog::tables::{maybe_body_to_json, CommitContext},
+    catalog::tables::CommitContext,
     service::{
         endpoint_hooks::{EndpointHooks, ViewCommit},
         tabular_idents::TabularId,
     },
+    CONFIG,
 };
 
+pub(crate) mod change_events;
 #[cfg(feature = "kafka")]
 pub mod kafka;
 #[cfg(feature = "nats")]
 pub mod nats;
+pub mod outbox;
 
 #[async_trait::async_trait]
 impl EndpointHooks for CloudEventsPublisher {
@@ -52,129 +57,80 @@ impl EndpointHooks for CloudEventsPublisher {
         table_ident_map: Arc<HashMap<TableIdent, TableId>>,
         request_metadata: Arc<RequestMetadata>,
     ) -> anyhow::Result<()> {
-        let mut events = vec![];
-        let mut event_table_ids: Vec<(TableIdent, TableId)> = vec![];
-        let mut updates = vec![];
-        for commit_table_request in &request.table_changes {
-            if let Some(id) = &commit_table_request.identifier {
-                if let Some(uuid) = table_ident_map.get(id) {
-                    events.push(maybe_body_to_json(commit_table_request));
-                    event_table_ids.push((id.clone(), *uuid));
-                    updates.push(commit_table_request.updates.clone());
-                }
-            }
-        }
-        let number_of_events = events.len();
-        let mut futs = Vec::with_capacity(number_of_events);
-        for (event_sequence_number, (body, (table_ident, table_id))) in
-            events.into_iter().zip(event_table_ids).enumerate()
-        {
-            futs.push(self.publish(
-                Uuid::now_v7(),
-                "updateTable",
-                body,
-                EventMetadata {
-                    tabular_id: TabularId::Table(*table_id),
-                    warehouse_id,
-                    name: table_ident.name,
-                    namespace: table_ident.namespace.to_url_string(),
-                    prefix: String::new(),
-                    num_events: number_of_events,
-                    sequence_number: event_sequence_number,
-                    trace_id: request_metadata.request_id(),
-                },
-            ));
-        }
-        futures::future::try_join_all(futs)
-            .await
-            .context("Failed to publish `updateTable` event")?;
-        Ok(())
+        self.publish_all(|| {
+            change_events::update_tables(
+                warehouse_id,
+                &request,
+                &table_ident_map,
+                &request_metadata,
+            )
+        })
+        .await
+        .context("Failed to publish `updateTable` event")
     }
 
     async fn drop_table(
         &self,
         warehouse_id: WarehouseId,
-        TableParameters { prefix, table }: TableParameters,
+        parameters: TableParameters,
         _drop_params: DropParams,
         table_ident_uuid: TableId,
         request_metadata: Arc<RequestMetadata>,
     ) -> anyhow::Result<()> {
-        self.publish(
-            Uuid::now_v7(),
-            "dropTable",
-            serde_json::Value::Null,
-            EventMetadata {
-                tabular_id: TabularId::Table(*table_ident_uuid),
+        self.publish_all(|| {
+            [change_events::drop_table(
                 warehouse_id,
-                name: table.name,
-                namespace: table.namespace.to_url_string(),
-                prefix: prefix.map(Prefix::into_string).unwrap_or_default(),
-                num_events: 1,
-                sequence_number: 0,
-                trace_id: request_metadata.request_id(),
-            },
-        )
+                &parameters,
+                table_ident_uuid,
+                &request_metadata,
+            )]
+        })
         .await
-        .context("Failed to publish `dropTable` event")?;
-        Ok(())
+        .context("Failed to publish `dropTable` event")
     }
     async fn register_table(
         &self,
         warehouse_id: WarehouseId,
-        NamespaceParameters { prefix, namespace }: NamespaceParameters,
+        parameters: NamespaceParameters,
         request: Arc<RegisterTableRequest>,
         metadata: Arc<TableMetadata>,
         _metadata_location: Arc<Location>,
         request_metadata: Arc<RequestMetadata>,
     ) -> anyhow::Result<()> {
-        self.publish(
-            Uuid::now_v7(),
-            "registerTable",
-            serde_json::Value::Null,
-            EventMetadata {
-                tabular_id: TabularId::Table(metadata.uuid()),
+        self.publish_all(|| {
+            [change_events::register_table(
                 warehouse_id,
-                name: request.name.clone(),
-                namespace: namespace.to_url_string(),
-                prefix: prefix.map(Prefix::into_string).unwrap_or_default(),
-                num_events: 1,
-                sequence_number: 0,
-                trace_id: request_metadata.request_id(),
-            },
-        )
+                &parameters,
+                &request,
+                &metadata,
+                &request_metadata,
+            )]
+        })
         .await
-        .context("Failed to publish `registerTable` event")?;
-        Ok(())
+        .context("Failed to publish `registerTable` event")
     }
 
     async fn create_table(
         &self,
         warehouse_id: WarehouseId,
-        NamespaceParameters { prefix, namespace }: NamespaceParameters,
+        parameters: NamespaceParameters,
         request: Arc<CreateTableRequest>,
         metadata: Arc<TableMetadata>,
         _metadata_location: Option<Arc<Location>>,
         _data_access: DataAccess,
         request_metadata: Arc<RequestMetadata>,
     ) -> anyhow::Result<()> {
-        self.publish(
-            Uuid::now_v7(),
-            "createTable",
-            serde_json::Value::Null,
-            EventMetadata {
-                tabular_id: TabularId::Table(metadata.uuid()),
+        self.publish_all(|| {
+            [change_events::create_table(
                 warehouse_id,
-                name: request.name.clone(),
-                namespace: namespace.to_url_string(),
-                prefix: prefix.map(Prefix::into_string).unwrap_or_default(),
-                num_events: 1,
-                sequence_number: 0,
-                trace_id: request_metadata.request_id(),
-            },
-        )
+                &parameters,
+                &request,
+                &metadata,
+                &request_metadata,
+            )]
+        })
         .await
-        .context("Failed to publish `createTable` event")?;
-        Ok(())
+        .context("Failed to publish `createTable` event")
     }
 
     async fn rename_table(
@@ -184,24 +140,16 @@ impl EndpointHooks for CloudEventsPublisher {
         request: Arc<RenameTableRequest>,
         request_metadata: Arc<RequestMetadata>,
     ) -> anyhow::Result<()> {
-        self.publish(
-            Uuid::now_v7(),
-            "renameTable",
-            serde_json::Value::Null,
-            EventMetadata {
-                tabular_id: TabularId::Table(*table_ident_uuid),
+        self.publish_all(|| {
+            [change_events::rename_table(
                 warehouse_id,
-                name: request.source.name.clone(),
-                namespace: request.source.namespace.to_url_string(),
-                prefix: String::new(),
-                num_events: 1,
-                sequence_number: 0,
-                trace_id: request_metadata.request_id(),
-            },
-        )
+                table_ident_uuid,
+                &request,
+                &request_metadata,
+            )]
+        })
         .await
-        .context("Failed to publish `renameTable` event")?;
-        Ok(())
+        .context("Failed to publish `renameTable` event")
     }
 
     async fn create_view(
@@ -214,27 +162,17 @@ impl EndpointHooks for CloudEventsPublisher {
         _data_access: DataAccess,
         request_metadata: Arc<RequestMetadata>,
     ) -> anyhow::Result<()> {
-        self.publish(
-            Uuid::now_v7(),
-            "createView",
-            maybe_body_to_json(&request),
-            EventMetadata {
-                tabular_id: TabularId::View(metadata.uuid()),
+        self.publish_all(|| {
+            [change_events::create_view(
                 warehouse_id,
-                name: request.name.clone(),
-                namespace: parameters.namespace.to_url_string(),
-                prefix: parameters
-                    .prefix
-                    .map(Prefix::into_string)
-                    .unwrap_or_default(),
-                num_events: 1,
-                sequence_number: 0,
-                trace_id: request_metadata.request_id(),
-            },
-        )
+                &parameters,
+                &request,
+                &metadata,
+                &request_metadata,
+            )]
+        })
         .await
-        .context("Failed to publish `createView` event")?;
-        Ok(())
+        .context("Failed to publish `createView` event")
     }
 
     async fn commit_view(
@@ -246,27 +184,17 @@ impl EndpointHooks for CloudEventsPublisher {
         _data_access: DataAccess,
         request_metadata: Arc<RequestMetadata>,
     ) -> anyhow::Result<()> {
-        self.publish(
-            Uuid::now_v7(),
-            "updateView",
-            maybe_body_to_json(request),
-            EventMetadata {
-                tabular_id: TabularId::View(metadata.new_metadata.uuid()),
+        self.publish_all(|| {
+            [change_events::update_view(
                 warehouse_id,
-                name: parameters.view.name,
-                namespace: parameters.view.namespace.to_url_string(),
-                prefix: parameters
-                    .prefix
-                    .map(Prefix::into_string)
-                    .unwrap_or_default(),
-                num_events: 1,
-                sequence_number: 0,
-                trace_id: request_metadata.request_id(),
-            },
-        )
+                &parameters,
+                &request,
+                &metadata.new_metadata,
+                &request_metadata,
+            )]
+        })
         .await
-        .context("Failed to publish `updateView` event")?;
-        Ok(())
+        .context("Failed to publish `updateView` event")
     }
 
     async fn drop_view(
@@ -277,27 +205,16 @@ impl EndpointHooks for CloudEventsPublisher {
         view_ident_uuid: ViewId,
         request_metadata: Arc<RequestMetadata>,
     ) -> anyhow::Result<()> {
-        self.publish(
-            Uuid::now_v7(),
-            "dropView",
-            serde_json::Value::Null,
-            EventMetadata {
-                tabular_id: TabularId::View(*view_ident_uuid),
+        self.publish_all(|| {
+            [change_events::drop_view(
                 warehouse_id,
-                name: parameters.view.name,
-                namespace: parameters.view.namespace.to_url_string(),
-                prefix: parameters
-                    .prefix
-                    .map(Prefix::into_string)
-                    .unwrap_or_default(),
-                num_events: 1,
-                sequence_number: 0,
-                trace_id: request_metadata.request_id(),
-            },
-        )
+                &parameters,
+                view_ident_uuid,
+                &request_metadata,
+            )]
+        })
         .await
-        .context("Failed to publish `dropView` event")?;
-        Ok(())
+        .context("Failed to publish `dropView` event")
     }
 
     async fn rename_view(
@@ -307,24 +224,16 @@ impl EndpointHooks for CloudEventsPublisher {
         request: Arc<RenameTableRequest>,
         request_metadata: Arc<RequestMetadata>,
     ) -> anyhow::Result<()> {
-        self.publish(
-            Uuid::now_v7(),
-            "renameView",
-            serde_json::Value::Null,
-            EventMetadata {
-                tabular_id: TabularId::View(*view_ident_uuid),
+        self.publish_all(|| {
+            [change_events::rename_view(
                 warehouse_id,
-                name: request.source.name.clone(),
-                namespace: request.source.namespace.to_url_string(),
-                prefix: String::new(),
-                num_events: 1,
-                sequence_number: 0,
-                trace_id: request_metadata.request_id(),
-            },
-        )
+                view_ident_uuid,
+                &request,
+                &request_metadata,
+            )]
+        })
         .await
-        .context("Failed to publish `renameView` event")?;
-        Ok(())
+        .context("Failed to publish `renameView` event")
     }
 
     async fn undrop_tabular(
@@ -334,33 +243,15 @@ impl EndpointHooks for CloudEventsPublisher {
         responses: Arc<Vec<UndropTabularResponse>>,
         request_metadata: Arc<RequestMetadata>,
     ) -> anyhow::Result<()> {
-        let num_tabulars = responses.len();
-        let mut futs = Vec::with_capacity(responses.len());
-        for (idx, utr) in responses.iter().enumerate() {
-            futs.push(self.publish(
-                Uuid::now_v7(),
-                "undropTabulars",
-                serde_json::Value::Null,
-                EventMetadata {
-                    tabular_id: TabularId::from(utr.table_ident),
-                    warehouse_id,
-                    name: utr.name.clone(),
-                    namespace: utr.namespace.to_url_string(),
-                    prefix: String::new(),
-                    num_events: num_tabulars,
-                    sequence_number: idx,
-                    trace_id: request_metadata.request_id(),
-                },
-            ));
-        }
-        futures::future::try_join_all(futs)
-            .await
-            .map_err(|e| {
-                tracing::error!("Failed to publish event: {e}");
-                e
-            })
-            .context("Failed to publish `undropTabulars` event")?;
-        Ok(())
+        self.publish_all(|| {
+            change_events::undrop_tabulars(warehouse_id, &responses, &request_metadata)
+        })
+        .await
+        .map_err(|e| {
+            tracing::error!("Failed to publish event: {e}");
+            e
+        })
+        .context("Failed to publish `undropTabulars` event")
     }
 }
 
@@ -413,10 +304,32 @@ impl CloudEventsPublisher {
             .await
             .map_err(|e| {
                 tracing::warn!("Failed to emit event with id: '{}' due to: '{}'.", id, e);
+                metrics::counter!(METRIC_DROPPED_EVENTS, "queue" => PUBLISHER_QUEUE).increment(1);
                 e
             })?;
         Ok(())
     }
+
+    /// Publish the change events built by `events`, unless they are written to the outbox
+    /// in the transaction of the change instead.
+    async fn publish_all<P: IntoIterator<Item = Payload>>(
+        &self,
+        events: impl FnOnce() -> P,
+    ) -> anyhow::Result<()> {
+        if CONFIG.cloudevents_outbox.enabled {
+            return Ok(());
+        }
+        futures::future::try_join_all(events().into_iter().map(
+            |Payload {
+                 id,
+                 typ,
+                 data,
+                 metadata,
+             }| async move { self.publish(id, &typ, data, metadata).await },
+        ))
+        .await?;
+        Ok(())
+    }
 }
 
 #[derive(Debug, Clone)]
@@ -453,75 +366,197 @@ pub struct CloudEventsPublisherBackgroundTask {
 }
 
 impl CloudEventsPublisherBackgroundTask {
+    /// Publish the events received from `source` to all sinks until a shutdown message
+    /// is received or all publishers are dropped.
+    ///
+    /// Every sink drains its own queue and publishes in batches, so a slow sink neither
+    /// delays the other sinks nor backs up `source`. Events that don't fit into the queue
+    /// of a sink are dropped for that sink.
+    ///
     /// # Errors
-    /// Returns an error if the `Event` cannot be built from the data passed into this function
+    /// Returns an error if the worker of a sink panicked.
     pub async fn publish(mut self) -> anyhow::Result<()> {
-        while let Some(CloudEventsMessage::Event(Payload {
-            id,
-            typ,
-            data,
-            metadata,
-        })) = self.source.recv().await
-        {
-            use cloudevents::{EventBuilder, EventBuilderV10};
-
-            let event_builder = EventBuilderV10::new()
-                .id(id.to_string())
-                .source(format!(
-                    "uri:iceberg-catalog-service:{}",
-                    hostname::get()
-                        .map(|os| os.to_string_lossy().to_string())
-                        .unwrap_or("hostname-unavailable".into())
-                ))
-                .ty(typ)
-                .data("application/json", data);
-
-            let EventMetadata {
-                tabular_id,
-                warehouse_id,
-                name,
-                namespace,
-                prefix,
-                num_events,
-                sequence_number,
-                trace_id,
-            } = metadata;
-            // TODO: this could be more elegant with a proc macro to give us IntoIter for EventMetadata
-            let event = event_builder
-                .extension("tabular-type", tabular_id.typ_str())
-                .extension("tabular-id", tabular_id.to_string())
-                .extension("warehouse-id", warehouse_id.to_string())
-                .extension("name", name.to_string())
-                .extension("namespace", namespace.to_string())
-                .extension("prefix", prefix.to_string())
-                .extension("num-events", i64::try_from(num_events).unwrap_or(i64::MAX))
-                .extension(
-                    "sequence-number",
-                    i64::try_from(sequence_number).unwrap_or(i64::MAX),
-                )
-                // Implement distributed tracing: https://github.com/lakekeeper/lakekeeper/issues/63
-                .extension("trace-id", trace_id.to_string())
-                .build()?;
-
-            for sink in &self.sinks {
-                if let Err(e) = sink.publish(event.clone()).await {
-                    tracing::warn!(
-                        "Failed to emit event with id: '{}' on sink: '{}' due to: '{}'.",
-                        id,
-                        sink.name(),
-                        e
-                    );
+        let config = &CONFIG.cloudevents_publisher;
+        let batch_size = config.batch_size.max(1);
+        let (queues, workers): (Vec<_>, Vec<_>) = self
+            .sinks
+            .into_iter()
+            .map(|sink| {
+                let (tx, rx) = tokio::sync::mpsc::channel(config.sink_queue_size.max(1));
+                let queue = SinkQueue {
+                    name: sink.name().to_string(),
+                    tx,
+                };
+                let worker = tokio::task::spawn(drain_sink_queue(sink, rx, batch_size));
+                (queue, worker)
+            })
+            .unzip();
+
+        let mut messages = Vec::with_capacity(batch_size);
+        'receive: while self.source.recv_many(&mut messages, batch_size).await > 0 {
+            set_queue_depth(PUBLISHER_QUEUE.to_string(), self.source.len());
+            for message in messages.drain(..) {
+                let CloudEventsMessage::Event(payload) = message else {
+                    break 'receive;
+                };
+                let id = payload.id;
+                let event = match build_event(&EVENT_SOURCE, payload) {
+                    Ok(event) => event,
+                    Err(e) => {
+                        tracing::warn!("Failed to build event with id: '{id}' due to: '{e}'.");
+                        continue;
+                    }
+                };
+                for queue in &queues {
+                    queue.push(event.clone());
                 }
             }
+            for queue in &queues {
+                set_queue_depth(
+                    queue.name.clone(),
+                    queue.tx.max_capacity() - queue.tx.capacity(),
+                );
+            }
         }
 
+        // Closing the queues lets the workers publish the remaining events and stop.
+        drop(queues);
+        for worker in workers {
+            worker.await?;
+        }
         Ok(())
     }
 }
 
+/// Name of the queue between the [`CloudEventsPublisher`]s and the background task in metrics.
+const PUBLISHER_QUEUE: &str = "publisher";
+const METRIC_QUEUE_DEPTH: &str = "lakekeeper_cloudevents_queue_depth";
+const METRIC_DROPPED_EVENTS: &str = "lakekeeper_cloudevents_dropped_events_total";
+const METRIC_FAILED_BATCHES: &str = "lakekeeper_cloudevents_failed_batches_total";
+
+#[allow(clippy::cast_precision_loss)]
+fn set_queue_depth(queue: String, depth: usize) {
+    metrics::gauge!(METRIC_QUEUE_DEPTH, "queue" => queue).set(depth as f64);
+}
+
+/// Source attribute of all events published by this instance.
+static EVENT_SOURCE: LazyLock<String> = LazyLock::new(|| {
+    format!(
+        "uri:iceberg-catalog-service:{}",
+        hostname::get()
+            .map(|os| os.to_string_lossy().to_string())
+            .unwrap_or("hostname-unavailable".into())
+    )
+});
+
+pub(crate) fn build_event(
+    event_source: &str,
+    Payload {
+        id,
+        typ,
+        data,
+        metadata,
+    }: Payload,
+) -> anyhow::Result<Event> {
+    use cloudevents::{EventBuilder, EventBuilderV10};
+
+    let EventMetadata {
+        tabular_id,
+        warehouse_id,
+        name,
+        namespace,
+        prefix,
+        num_events,
+        sequence_number,
+        trace_id,
+    } = metadata;
+    // TODO: this could be more elegant with a proc macro to give us IntoIter for EventMetadata
+    Ok(EventBuilderV10::new()
+        .id(id.to_string())
+        .source(event_source)
+        .ty(typ)
+        .data("application/json", data)
+        .extension("tabular-type", tabular_id.typ_str())
+        .extension("tabular-id", tabular_id.to_string())
+        .extension("warehouse-id", warehouse_id.to_string())
+        .extension("name", name)
+        .extension("namespace", namespace)
+        .extension("prefix", prefix)
+        .extension("num-events", i64::try_from(num_events).unwrap_or(i64::MAX))
+        .extension(
+            "sequence-number",
+            i64::try_from(sequence_number).unwrap_or(i64::MAX),
+        )
+        // Implement distributed tracing: https://github.com/lakekeeper/lakekeeper/issues/63
+        .extension("trace-id", trace_id.to_string())
+        .build()?)
+}
+
+/// Bounded queue of the events a single sink has yet to publish.
+#[derive(Debug)]
+struct SinkQueue {
+    name: String,
+    tx: tokio::sync::mpsc::Sender<Event>,
+}
+
+impl SinkQueue {
+    fn push(&self, event: Event) {
+        if let Err(e) = self.tx.try_send(event) {
+            let event = match e {
+                TrySendError::Full(event) | TrySendError::Closed(event) => event,
+            };
+            tracing::warn!(
+                "Dropping event with id: '{}' for sink: '{}', its queue is full.",
+                event.id(),
+                self.name
+            );
+            metrics::counter!(METRIC_DROPPED_EVENTS, "queue" => self.name.clone()).increment(1);
+        }
+    }
+}
+
+async fn drain_sink_queue(
+    sink: Arc<dyn CloudEventBackend + Sync + Send>,
+    mut queue: tokio::sync::mpsc::Receiver<Event>,
+    batch_size: usize,
+) {
+    let name = sink.name().to_string();
+    let mut batch = Vec::with_capacity(batch_size);
+    while queue.recv_many(&mut batch, batch_size).await > 0 {
+        set_queue_depth(name.clone(), queue.len());
+        let num_events = batch.len();
+        if let Err(e) = sink.publish_batch(std::mem::take(&mut batch)).await {
+            tracing::warn!("Failed to emit {num_events} events on sink: '{name}' due to: '{e}'.");
+            metrics::counter!(METRIC_FAILED_BATCHES, "queue" => name.clone()).increment(1);
+        }
+    }
+}
+
 #[async_trait]
 pub trait CloudEventBackend: Debug {
     async fn publish(&self, event: Event) -> anyhow::Result<()>;
+
+    /// Publish `events` in order. Backends should override this to send the batch at once.
+    /// The default publishes one event after the other.
+    ///
+    /// # Errors
+    /// Returns an error if any event could not be published. Other events of the batch
+    /// may have been published nevertheless.
+    async fn publish_batch(&self, events: Vec<Event>) -> anyhow::Result<()> {
+        let num_events = events.len();
+        let mut failed = 0;
+        for event in events {
+            if let Err(e) = self.publish(event).await {
+                tracing::debug!("Failed to emit event on sink: '{}': {e}", self.name());
+                failed += 1;
+            }
+        }
+        if failed > 0 {
+            anyhow::bail!("{failed} of {num_events} events could not be published");
+        }
+        Ok(())
+    }
+
     fn name(&self) -> &str;
 }
 
@@ -541,3 +576,100 @@ impl CloudEventBackend for TracingPublisher {
         "tracing-publisher"
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use std::sync::Mutex;
+
+    use cloudevents::AttributesReader as _;
+
+    use super::*;
+
+    #[derive(Debug, Default)]
+    struct CollectingSink {
+        batches: Mutex<Vec<Vec<Event>>>,
+    }
+
+    #[async_trait]
+    impl CloudEventBackend for CollectingSink {
+        async fn publish(&self, event: Event) -> anyhow::Result<()> {
+            self.publish_batch(vec![event]).await
+        }
+
+        async fn publish_batch(&self, events: Vec<Event>) -> anyhow::Result<()> {
+            self.batches.lock().unwrap().push(events);
+            Ok(())
+        }
+
+        fn name(&self) -> &'static str {
+            "collecting-sink"
+        }
+    }
+
+    fn payload(sequence_number: usize) -> Payload {
+        Payload {
+            id: Uuid::now_v7(),
+            typ: "updateTable".to_string(),
+            data: serde_json::Value::Null,
+            metadata: EventMetadata {
+                tabular_id: TabularId::Table(Uuid::now_v7()),
+                warehouse_id: WarehouseId::new_random(),
+                name: "table".to_string(),
+                namespace: "ns".to_string(),
+                prefix: String::new(),
+                num_events: 3,
+                sequence_number,
+                trace_id: Uuid::now_v7(),
+            },
+        }
+    }
+
+    #[tokio::test]
+    async fn test_events_are_published_in_batches_before_shutdown() {
+        let sink = Arc::new(CollectingSink::default());
+        let (tx, rx) = tokio::sync::mpsc::channel(10);
+        for sequence_number in 0..3 {
+            tx.send(CloudEventsMessage::Event(payload(sequence_number)))
+                .await
+                .unwrap();
+        }
+        tx.send(CloudEventsMessage::Shutdown).await.unwrap();
+
+        CloudEventsPublisherBackgroundTask {
+            source: rx,
+            sinks: vec![sink.clone() as Arc<dyn CloudEventBackend + Sync + Send>],
+        }
+        .publish()
+        .await
+        .unwrap();
+
+        let batches = sink.batches.lock().unwrap();
+        assert_eq!(batches.len(), 1);
+        assert_eq!(batches[0].len(), 3);
+        assert!(batches[0]
+            .iter()
+            .all(|e| e.source().as_str() == EVENT_SOURCE.as_str()));
+        assert_eq!(
+            batches[0][2]
+                .extension("sequence-number")
+                .unwrap()
+                .to_string(),
+            "2"
+        );
+    }
+
+    #[test]
+    fn test_full_sink_queue_drops_events() {
+        let (tx, mut rx) = tokio::sync::mpsc::channel(1);
+        let queue = SinkQueue {
+            name: "slow-sink".to_string(),
+            tx,
+        };
+        let first = build_event("test", payload(0)).unwrap();
+        queue.push(first.clone());
+        queue.push(build_event("test", payload(1)).unwrap());
+
+        assert_eq!(rx.try_recv().unwrap().id(), first.id());
+        assert!(rx.try_recv().is_err());
+    }
+}
@@ -69,6 +69,16 @@ impl CloudEventBackend for NatsBackend {
             .await?)
     }
 
+    /// Publishing only queues a message in the client, the batch is sent with a single flush.
+    async fn publish_batch(&self, events: Vec<Event>) -> anyhow::Result<()> {
+        for event in events {
+            self.client
+                .publish(self.topic.clone(), serde_json::to_vec(&event)?.into())
+                .await?;
+        }
+        Ok(self.client.flush().await?)
+    }
+
     fn name(&self) -> &'static str {
         "nats-publisher"
     }
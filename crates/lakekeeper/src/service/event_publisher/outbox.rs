@@ -0,0 +1,289 @@
+use std::{
+    sync::Arc,
+    time::{Duration, Instant},
+};
+
+use axum_prometheus::metrics;
+use chrono::{DateTime, Utc};
+use cloudevents::Event;
+use iceberg_ext::catalog::rest::ErrorModel;
+
+use super::{build_event, CloudEventBackend, Payload, EVENT_SOURCE, METRIC_FAILED_BATCHES};
+use crate::{
+    api::Result,
+    service::{task_queue::wait_for_new_tasks, Catalog, Transaction},
+    CONFIG,
+};
+
+const METRIC_RELAYED_EVENTS: &str = "lakekeeper_cloudevents_outbox_relayed_events_total";
+const METRIC_DEAD_LETTERED_EVENTS: &str =
+    "lakekeeper_cloudevents_outbox_dead_lettered_events_total";
+const METRIC_PENDING_EVENTS: &str = "lakekeeper_cloudevents_outbox_pending_events";
+const METRIC_DEAD_LETTERED_EVENTS_STORED: &str =
+    "lakekeeper_cloudevents_outbox_dead_lettered_events";
+const METRIC_OLDEST_PENDING_EVENT_AGE: &str =
+    "lakekeeper_cloudevents_outbox_oldest_pending_event_age_seconds";
+/// Name of the outbox in the metrics of the publisher.
+const OUTBOX_QUEUE: &str = "outbox";
+/// Name under which writers of change events notify idle relays, shared with the
+/// notifications of the task queues.
+pub(crate) const OUTBOX_NOTIFICATION_QUEUE: &str = "cloudevents_outbox";
+/// Upper bound of the delay between two attempts to publish an event.
+const MAX_RETRY_INTERVAL: Duration = Duration::from_secs(300);
+/// Interval at which each relay reports the size of the outbox.
+const STATS_INTERVAL: Duration = Duration::from_secs(60);
+
+/// A change event stored in the outbox.
+#[derive(Debug, Clone, PartialEq)]
+pub struct OutboxEvent {
+    /// Position of the event in the outbox, increasing in the order events were written.
+    pub sequence_number: i64,
+    /// `None` if the stored event can't be read.
+    pub event: Option<Event>,
+    /// Number of times the event was claimed by a relay, including the current claim.
+    pub attempts: i32,
+    /// Names of the sinks that already published the event.
+    pub published_to: Vec<String>,
+}
+
+/// Size of the outbox.
+#[derive(Debug, Clone, PartialEq)]
+pub struct OutboxStats {
+    pub pending_events: i64,
+    pub dead_lettered_events: i64,
+    pub oldest_pending_event: Option<DateTime<Utc>>,
+}
+
+/// Write the change events built by `events` to the outbox as part of `transaction`,
+/// if the outbox is enabled. Otherwise the events are published by the
+/// [`super::CloudEventsPublisher`] hooks after the transaction is committed.
+pub(crate) async fn write_change_events<C: Catalog, P: IntoIterator<Item = Payload>>(
+    events: impl FnOnce() -> P,
+    transaction: <C::Transaction as Transaction<C::State>>::Transaction<'_>,
+) -> Result<()> {
+    if !CONFIG.cloudevents_outbox.enabled {
+        return Ok(());
+    }
+    let events = events()
+        .into_iter()
+        .map(|payload| build_event(&EVENT_SOURCE, payload))
+        .collect::<anyhow::Result<Vec<_>>>()
+        .map_err(|e| {
+            ErrorModel::internal(
+                "Failed to build change event",
+                "CloudEventBuildError",
+                Some(e.into()),
+            )
+        })?;
+    C::write_change_events(&events, transaction).await
+}
+
+/// Publishes the events of the outbox to all sinks.
+///
+/// Relays of all instances claim batches of events with a lease and publish them outside
+/// of any database transaction. Events are claimed in the order they were written, but
+/// relays run concurrently and failed events are retried later, so sinks may receive
+/// events out of order.
+///
+/// Each sink publishes an event at least once: an event is removed from the outbox once
+/// all sinks published it, sinks that already published it are skipped on retries.
+/// Events that still miss a sink after `max_attempts` claims, or that can't be read,
+/// are dead-lettered and kept in the outbox for inspection.
+pub struct CloudEventsOutboxRelay<C: Catalog> {
+    pub catalog_state: C::State,
+    pub sinks: Vec<Arc<dyn CloudEventBackend + Sync + Send>>,
+}
+
+impl<C: Catalog> CloudEventsOutboxRelay<C> {
+    pub async fn run(self) {
+        let batch_size = CONFIG.cloudevents_publisher.batch_size.max(1);
+        let poll_interval = CONFIG.cloudevents_outbox.poll_interval;
+        let mut new_events =
+            C::subscribe_to_new_tasks(OUTBOX_NOTIFICATION_QUEUE, self.catalog_state.clone());
+        let mut next_stats = Instant::now();
+        let mut next_retry: Option<Instant> = None;
+        loop {
+            if Instant::now() >= next_stats {
+                self.report_stats().await;
+                next_stats = Instant::now() + STATS_INTERVAL;
+            }
+            match self.relay_batch(batch_size).await {
+                Ok(relayed) => {
+                    if let Some(retry_at) = relayed.retry_at {
+                        next_retry = Some(next_retry.map_or(retry_at, |t| t.min(retry_at)));
+                    }
+                    // More events are probably waiting.
+                    if relayed.claimed == batch_size {
+                        continue;
+                    }
+                }
+                Err(e) => {
+                    tracing::warn!("Failed to relay change events from the outbox: {}", e.error);
+                    next_retry = Some(Instant::now() + poll_interval);
+                }
+            }
+            match next_retry.take() {
+                Some(retry_at) if retry_at > Instant::now() => {
+                    tokio::select! {
+                        () = wait_for_new_tasks(&mut new_events, poll_interval) => {
+                            next_retry = Some(retry_at);
+                        }
+                        () = tokio::time::sleep_until(retry_at.into()) => {}
+                    }
+                }
+                Some(_) => {}
+                None => wait_for_new_tasks(&mut new_events, poll_interval).await,
+            }
+        }
+    }
+
+    /// Publish the next batch of events.
+    async fn relay_batch(&self, batch_size: usize) -> Result<RelayedBatch> {
+        let config = &CONFIG.cloudevents_outbox;
+        // Covers the publish timeout and recording the outcome afterwards.
+        let lease = config.publish_timeout * 2;
+        let claimed = C::claim_change_events(batch_size, lease, self.catalog_state.clone()).await?;
+        let mut relayed = RelayedBatch {
+            claimed: claimed.len(),
+            retry_at: None,
+        };
+        if claimed.is_empty() {
+            return Ok(relayed);
+        }
+
+        let results = futures::future::join_all(self.sinks.iter().map(|sink| {
+            let events = claimed
+                .iter()
+                .filter(|e| !e.published_to.iter().any(|name| name == sink.name()))
+                .filter_map(|e| e.event.clone())
+                .collect::<Vec<_>>();
+            async move {
+                if events.is_empty() {
+                    return Ok(());
+                }
+                let num_events = events.len();
+                tokio::time::timeout(config.publish_timeout, sink.publish_batch(events))
+                    .await
+                    .unwrap_or_else(|_| {
+                        Err(anyhow::anyhow!(
+                            "Publishing {num_events} events timed out after {:?}",
+                            config.publish_timeout
+                        ))
+                    })
+            }
+        }))
+        .await;
+        let mut published_by = Vec::with_capacity(self.sinks.len());
+        for (sink, result) in self.sinks.iter().zip(results) {
+            match result {
+                Ok(()) => published_by.push(sink.name().to_string()),
+                Err(e) => {
+                    tracing::warn!(
+                        "Failed to publish change events from the outbox on sink '{}': {e}",
+                        sink.name()
+                    );
+                    metrics::counter!(METRIC_FAILED_BATCHES, "queue" => OUTBOX_QUEUE).increment(1);
+                }
+            }
+        }
+
+        let mut delivered = vec![];
+        let mut retry = vec![];
+        let mut dead_lettered = vec![];
+        let mut max_retry_attempts = 0;
+        for e in &claimed {
+            let published = self.sinks.iter().all(|sink| {
+                published_by.iter().any(|name| name == sink.name())
+                    || e.published_to.iter().any(|name| name == sink.name())
+            });
+            if e.event.is_some() && published {
+                delivered.push(e.sequence_number);
+            } else if e.event.is_none()
+                || u32::try_from(e.attempts).unwrap_or(u32::MAX) >= config.max_attempts
+            {
+                dead_lettered.push(e.sequence_number);
+            } else {
+                retry.push(e.sequence_number);
+                max_retry_attempts = max_retry_attempts.max(e.attempts);
+            }
+        }
+
+        if !delivered.is_empty() {
+            C::delete_change_events(&delivered, self.catalog_state.clone()).await?;
+            metrics::counter!(METRIC_RELAYED_EVENTS).increment(delivered.len() as u64);
+        }
+        if !retry.is_empty() {
+            let retry_after = retry_interval(config.poll_interval, max_retry_attempts);
+            C::release_change_events(
+                &retry,
+                &published_by,
+                retry_after,
+                self.catalog_state.clone(),
+            )
+            .await?;
+            relayed.retry_at = Some(Instant::now() + retry_after);
+        }
+        if !dead_lettered.is_empty() {
+            tracing::error!(
+                "Dead-lettering {} change events of the outbox that can't be read or were not published after {} attempts",
+                dead_lettered.len(),
+                config.max_attempts
+            );
+            C::dead_letter_change_events(&dead_lettered, &published_by, self.catalog_state.clone())
+                .await?;
+            metrics::counter!(METRIC_DEAD_LETTERED_EVENTS).increment(dead_lettered.len() as u64);
+        }
+        Ok(relayed)
+    }
+
+    #[allow(clippy::cast_precision_loss)]
+    async fn report_stats(&self) {
+        match C::get_change_event_outbox_stats(self.catalog_state.clone()).await {
+            Ok(stats) => {
+                metrics::gauge!(METRIC_PENDING_EVENTS).set(stats.pending_events as f64);
+                metrics::gauge!(METRIC_DEAD_LETTERED_EVENTS_STORED)
+                    .set(stats.dead_lettered_events as f64);
+                let age = stats
+                    .oldest_pending_event
+                    .and_then(|oldest| (Utc::now() - oldest).to_std().ok())
+                    .unwrap_or_default();
+                metrics::gauge!(METRIC_OLDEST_PENDING_EVENT_AGE).set(age.as_secs_f64());
+            }
+            Err(e) => {
+                tracing::warn!("Failed to read change event outbox statistics: {}", e.error);
+            }
+        }
+    }
+}
+
+struct RelayedBatch {
+    /// Number of claimed events.
+    claimed: usize,
+    /// When events of the batch that are retried become available again.
+    retry_at: Option<Instant>,
+}
+
+/// Delay before the next attempt of an event that was claimed `attempts` times,
+/// doubling with every attempt.
+fn retry_interval(poll_interval: Duration, attempts: i32) -> Duration {
+    let exponent = u32::try_from(attempts.saturating_sub(1))
+        .unwrap_or(0)
+        .min(16);
+    poll_interval
+        .saturating_mul(1 << exponent)
+        .min(MAX_RETRY_INTERVAL)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_retry_interval_doubles_up_to_maximum() {
+        let poll_interval = Duration::from_secs(1);
+        assert_eq!(retry_interval(poll_interval, 1), Duration::from_secs(1));
+        assert_eq!(retry_interval(poll_interval, 2), Duration::from_secs(2));
+        assert_eq!(retry_interval(poll_interval, 4), Duration::from_secs(8));
+        assert_eq!(retry_interval(poll_interval, 100), MAX_RETRY_INTERVAL);
+    }
+}
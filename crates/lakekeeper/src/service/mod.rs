@@ -485,4 +485,6 @@ impl TryFrom<Prefix> for WarehouseId {
 pub struct TabularDetails {
     pub ident: TableId,
     pub location: String,
+    /// `None` for staged tables.
+    pub metadata_location: Option<String>,
 }
@@ -1,7 +1,40 @@
+use std::{
+    sync::{
+        atomic::{AtomicU64, Ordering},
+        LazyLock,
+    },
+    time::Duration,
+};
+
 use async_trait::async_trait;
+use axum_prometheus::metrics;
 use serde::{de::DeserializeOwned, Serialize};
 
-use crate::{api::Result, service::health::HealthExt};
+use crate::{
+    api::Result,
+    service::{health::HealthExt, storage::StorageCredential},
+    CONFIG,
+};
+
+const METRIC_CACHE_HITS: &str = "lakekeeper_storage_secret_cache_hits_total";
+const METRIC_CACHE_MISSES: &str = "lakekeeper_storage_secret_cache_misses_total";
+
+/// Decrypted storage secrets. A secret is never modified in place - changing the
+/// credential of a warehouse creates a new secret and deletes the old one -
+/// so entries only need to be evicted on deletion.
+static STORAGE_SECRET_CACHE: LazyLock<moka::future::Cache<SecretIdent, StorageCredential>> =
+    LazyLock::new(|| {
+        moka::future::Cache::builder()
+            .max_capacity(CONFIG.cache.storage_secrets.max_entries)
+            .time_to_live(Duration::from_secs(
+                CONFIG.cache.storage_secrets.time_to_live_seconds,
+            ))
+            .build()
+    });
+
+/// Incremented on every invalidation, so that reads which were in flight while a
+/// secret was deleted don't re-populate the cache with it.
+static STORAGE_SECRET_INVALIDATIONS: AtomicU64 = AtomicU64::new(0);
 
 /// Interface for Handling Secrets.
 #[async_trait]
@@ -26,6 +59,65 @@ where
     async fn delete_secret(&self, secret_id: &SecretIdent) -> Result<()>;
 }
 
+/// Get a storage credential, served from an in-process cache if possible.
+///
+/// # Errors
+/// Fails if the secret is not cached and can't be fetched from the secret store.
+pub async fn get_storage_credential<S: SecretStore>(
+    store: &S,
+    secret_id: SecretIdent,
+) -> Result<StorageCredential> {
+    if !CONFIG.cache.storage_secrets.enabled {
+        return Ok(store.get_secret_by_id(secret_id).await?.secret);
+    }
+
+    if let Some(secret) = STORAGE_SECRET_CACHE.get(&secret_id).await {
+        metrics::counter!(METRIC_CACHE_HITS).increment(1);
+        return Ok(secret);
+    }
+    metrics::counter!(METRIC_CACHE_MISSES).increment(1);
+
+    // Only one read per secret is in flight, concurrent misses wait for its result.
+    // The result is not cached if a secret was deleted while it was read.
+    let mut error = None;
+    let mut uncached = None;
+    let secret = STORAGE_SECRET_CACHE
+        .try_get_with(secret_id, async {
+            let invalidations = STORAGE_SECRET_INVALIDATIONS.load(Ordering::Acquire);
+            match store.get_secret_by_id::<StorageCredential>(secret_id).await {
+                Ok(secret)
+                    if STORAGE_SECRET_INVALIDATIONS.load(Ordering::Acquire) == invalidations =>
+                {
+                    Ok(secret.secret)
+                }
+                Ok(secret) => {
+                    uncached = Some(secret.secret);
+                    Err(())
+                }
+                Err(e) => {
+                    error = Some(e);
+                    Err(())
+                }
+            }
+        })
+        .await;
+
+    match (secret, error, uncached) {
+        (Ok(secret), _, _) | (Err(_), None, Some(secret)) => Ok(secret),
+        (Err(_), Some(e), _) => Err(e),
+        // The shared read of another request failed or was invalidated.
+        (Err(_), None, None) => Ok(store.get_secret_by_id(secret_id).await?.secret),
+    }
+}
+
+/// Remove a secret from the storage secret cache.
+/// Secret stores must call this when a secret is deleted.
+pub async fn invalidate_storage_credential(secret_id: SecretIdent) {
+    // Before removing the entry, so that in-flight reads don't insert it again.
+    STORAGE_SECRET_INVALIDATIONS.fetch_add(1, Ordering::AcqRel);
+    STORAGE_SECRET_CACHE.invalidate(&secret_id).await;
+}
+
 #[derive(Debug, Copy, Clone, PartialEq, Eq, Hash, PartialOrd, Ord)]
 #[cfg_attr(feature = "sqlx", derive(sqlx::Type))]
 #[cfg_attr(feature = "sqlx", sqlx(transparent))]
@@ -11,7 +11,7 @@ use azure_identity::{
 use azure_storage::{
     prelude::{BlobSasPermissions, BlobSignedResource},
     shared_access_signature::{
-        service_sas::{BlobSharedAccessSignature, SasKey},
+        service_sas::{BlobSharedAccessSignature, SasKey, UserDeligationKey},
         SasToken,
     },
     StorageCredentials,
@@ -24,6 +24,7 @@ use iceberg_ext::configs::{
 };
 use lazy_regex::Regex;
 use serde::{Deserialize, Serialize};
+use sha2::{Digest, Sha256};
 use time::OffsetDateTime;
 use url::{Host, Url};
 use veil::Redact;
@@ -34,6 +35,7 @@ use crate::{
         CatalogConfig, Result,
     },
     service::storage::{
+        cache::CredentialCache,
         error::{CredentialsError, FileIoError, TableConfigError, UpdateError, ValidationError},
         StoragePermissions, StorageType, TableConfig,
     },
@@ -82,6 +84,78 @@ static ADLS_PATH_PATTERN: LazyLock<Regex> = LazyLock::new(|| {
 
 static SYSTEM_IDENTITY_CACHE: LazyLock<moka::sync::Cache<String, Arc<DefaultAzureCredential>>> =
     LazyLock::new(|| moka::sync::Cache::builder().max_capacity(1000).build());
+// Delegation keys are reused until their remaining lifetime drops below one SAS
+// validity, see `sas_via_delegation_key`, so their reuse window is not shortened
+// by the configured reuse fraction.
+static DELEGATION_KEY_CACHE: LazyLock<CredentialCache<DelegationKeyCacheKey, UserDeligationKey>> =
+    LazyLock::new(|| {
+        CredentialCache::new(
+            "azure-delegation-key",
+            &crate::config::CredentialCache {
+                reuse_fraction: 1.0,
+                ..CONFIG.cache.adls_credentials.clone()
+            },
+        )
+    });
+static SAS_CACHE: LazyLock<CredentialCache<SasCacheKey, String>> =
+    LazyLock::new(|| CredentialCache::new("azure-sas", &CONFIG.cache.adls_credentials));
+
+/// The principal signing SAS tokens. Secrets are only kept as digest.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+enum SasSigner {
+    ClientCredentials {
+        authority_host: Option<Url>,
+        tenant_id: String,
+        client_id: String,
+    },
+    SharedAccessKey {
+        key_digest: Vec<u8>,
+    },
+    SystemIdentity {
+        authority_host: Option<Url>,
+    },
+}
+
+impl SasSigner {
+    fn new(profile: &AdlsProfile, credential: &AzCredential) -> Self {
+        match credential {
+            AzCredential::ClientCredentials {
+                client_id,
+                tenant_id,
+                client_secret: _,
+            } => SasSigner::ClientCredentials {
+                authority_host: profile.authority_host.clone(),
+                tenant_id: tenant_id.clone(),
+                client_id: client_id.clone(),
+            },
+            AzCredential::SharedAccessKey { key } => SasSigner::SharedAccessKey {
+                key_digest: Sha256::digest(key.as_bytes()).to_vec(),
+            },
+            AzCredential::AzureSystemIdentity {} => SasSigner::SystemIdentity {
+                authority_host: profile.authority_host.clone(),
+            },
+        }
+    }
+}
+
+/// User delegation keys are issued per storage account and principal.
+/// Their lifetime depends on the SAS validity of the profile.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+struct DelegationKeyCacheKey {
+    account_name: String,
+    host: Option<String>,
+    sas_token_validity: time::Duration,
+    signer: SasSigner,
+}
+
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+struct SasCacheKey {
+    account_name: String,
+    filesystem: String,
+    location: String,
+    permissions: StoragePermissions,
+    signer: SasSigner,
+}
 
 impl AdlsProfile {
     /// Check if an Azure variant is allowed.
@@ -204,7 +278,48 @@ impl AdlsProfile {
         credential: &AzCredential,
         permissions: StoragePermissions,
     ) -> Result<TableConfig, TableConfigError> {
-        let sas = match credential {
+        let key = SasCacheKey {
+            account_name: self.account_name.clone(),
+            filesystem: self.filesystem.clone(),
+            location: table_location.to_string(),
+            permissions,
+            signer: SasSigner::new(self, credential),
+        };
+        let profile = self.clone();
+        let table_location = table_location.clone();
+        let credential = credential.clone();
+        let sas = SAS_CACHE
+            .get_or_fetch_expiring(key, move || async move {
+                let (sas, signed_expiry) = profile
+                    .generate_sas(&table_location, &credential, permissions)
+                    .await?;
+                Ok::<_, CredentialsError>((sas, remaining_validity(signed_expiry)))
+            })
+            .await?;
+
+        let mut creds = TableProperties::default();
+
+        creds.insert(&custom::CustomConfig {
+            key: self.iceberg_sas_property_key(),
+            value: sas,
+        });
+
+        Ok(TableConfig {
+            // Due to backwards compat reasons we still return creds within config too
+            config: creds.clone(),
+            creds,
+        })
+    }
+
+    /// Generate a SAS token for `table_location`.
+    /// Returns the token and its expiry.
+    async fn generate_sas(
+        &self,
+        table_location: &Location,
+        credential: &AzCredential,
+        permissions: StoragePermissions,
+    ) -> Result<(String, OffsetDateTime), CredentialsError> {
+        let (sas, signed_expiry) = match credential {
             AzCredential::ClientCredentials {
                 client_id,
                 tenant_id,
@@ -223,23 +338,29 @@ impl AdlsProfile {
                 self.sas_via_delegation_key(
                     table_location,
                     StorageCredentials::token_credential(Arc::new(token)),
+                    SasSigner::new(self, credential),
                     permissions,
                 )
                 .await?
             }
-            AzCredential::SharedAccessKey { key } => self.sas(
-                table_location,
-                permissions,
-                OffsetDateTime::now_utc()
+            AzCredential::SharedAccessKey { key } => {
+                let signed_expiry = OffsetDateTime::now_utc()
                     .saturating_sub(time::Duration::minutes(5))
-                    .saturating_add(time::Duration::days(7)),
-                azure_core::auth::Secret::new(key.to_string()),
-            )?,
+                    .saturating_add(time::Duration::days(7));
+                let sas = self.sas(
+                    table_location,
+                    permissions,
+                    signed_expiry,
+                    azure_core::auth::Secret::new(key.to_string()),
+                )?;
+                (sas, signed_expiry)
+            }
             AzCredential::AzureSystemIdentity {} => {
                 let identity: Arc<DefaultAzureCredential> = self.get_system_identity()?;
                 self.sas_via_delegation_key(
                     table_location,
                     StorageCredentials::token_credential(identity),
+                    SasSigner::new(self, credential),
                     permissions,
                 )
                 .await
@@ -253,18 +374,7 @@ impl AdlsProfile {
             }
         };
 
-        let mut creds = TableProperties::default();
-
-        creds.insert(&custom::CustomConfig {
-            key: self.iceberg_sas_property_key(),
-            value: sas,
-        });
-
-        Ok(TableConfig {
-            // Due to backwards compat reasons we still return creds within config too
-            config: creds.clone(),
-            creds,
-        })
+        Ok((sas, signed_expiry))
     }
 
     fn get_system_identity(&self) -> Result<Arc<DefaultAzureCredential>, CredentialsError> {
@@ -381,33 +491,75 @@ impl AdlsProfile {
         Ok(builder.build()?)
     }
 
+    /// Sign a SAS token valid for `sas_token_validity_seconds` with a user delegation key.
+    ///
+    /// Delegation keys are requested for two SAS validities and reused until less than
+    /// one SAS validity of their lifetime remains, so that every SAS token is valid for
+    /// the full configured validity.
     async fn sas_via_delegation_key(
         &self,
         path: &Location,
         cred: StorageCredentials,
+        signer: SasSigner,
         permissions: StoragePermissions,
-    ) -> Result<String, CredentialsError> {
+    ) -> Result<(String, OffsetDateTime), CredentialsError> {
+        let sas_token_validity = self.sas_token_validity();
+        let key = DelegationKeyCacheKey {
+            account_name: self.account_name.clone(),
+            host: self.host.clone(),
+            sas_token_validity,
+            signer,
+        };
+        let profile = self.clone();
+        let delegation_key = DELEGATION_KEY_CACHE
+            .get_or_fetch_expiring(key, move || async move {
+                let delegation_key = profile
+                    .user_delegation_key(cred, sas_token_validity)
+                    .await?;
+                let reuse_for =
+                    delegation_key_reuse(delegation_key.signed_expiry, sas_token_validity);
+                Ok::<_, CredentialsError>((delegation_key, reuse_for))
+            })
+            .await?;
+        // A SAS token must not outlive the key it is signed with.
+        let signed_expiry = OffsetDateTime::now_utc()
+            .saturating_add(sas_token_validity)
+            .min(delegation_key.signed_expiry);
+
+        let sas = self.sas(path, permissions, signed_expiry, delegation_key)?;
+        Ok((sas, signed_expiry))
+    }
+
+    /// Validity of SAS tokens signed with user delegation keys.
+    fn sas_token_validity(&self) -> time::Duration {
+        time::Duration::seconds(
+            i64::try_from(self.sas_token_validity_seconds.unwrap_or(3600))
+                .unwrap_or(MAX_SAS_TOKEN_VALIDITY_SECONDS_I64)
+                .clamp(0, MAX_SAS_TOKEN_VALIDITY_SECONDS_I64),
+        )
+    }
+
+    async fn user_delegation_key(
+        &self,
+        cred: StorageCredentials,
+        sas_token_validity: time::Duration,
+    ) -> Result<UserDeligationKey, CredentialsError> {
         let client = blob_service_client(self.account_name.as_str(), cred);
 
         // allow for some clock drift
         let start = time::OffsetDateTime::now_utc() - time::Duration::minutes(5);
-        let max_validity_seconds = MAX_SAS_TOKEN_VALIDITY_SECONDS_I64;
-        // account for the 5 minutes offset from above
-        let sas_token_validity_seconds = self.sas_token_validity_seconds.unwrap_or(3600) + 300;
-        let clamped_validity_seconds = i64::try_from(sas_token_validity_seconds)
-            .unwrap_or(max_validity_seconds)
-            .clamp(0, max_validity_seconds);
+        let validity = delegation_key_validity(sas_token_validity);
 
         let delegation_key = client
             .get_user_deligation_key(
                 start,
                 start
-                    .checked_add(time::Duration::seconds(clamped_validity_seconds))
+                    .checked_add(validity)
                     .ok_or(CredentialsError::ShortTermCredential {
                         reason: format!(
-                            "SAS expiry overflow: Cannot issue a token valid for {clamped_validity_seconds} seconds",
-                        )
-                            .to_string(),
+                        "Delegation key expiry overflow: Cannot issue a key valid for {} seconds",
+                        validity.whole_seconds()
+                    ),
                         source: None,
                     })?,
             )
@@ -416,10 +568,8 @@ impl AdlsProfile {
                 reason: "Error getting azure user delegation key.".to_string(),
                 source: Some(Box::new(e)),
             })?;
-        let signed_expiry = delegation_key.user_deligation_key.signed_expiry;
-        let key = delegation_key.user_deligation_key.clone();
 
-        self.sas(path, permissions, signed_expiry, key)
+        Ok(delegation_key.user_deligation_key)
     }
 
     fn sas(
@@ -759,6 +909,32 @@ impl From<StoragePermissions> for BlobSasPermissions {
     }
 }
 
+/// Time until `expiry`, zero if it already passed.
+fn remaining_validity(expiry: OffsetDateTime) -> std::time::Duration {
+    std::time::Duration::try_from(expiry - OffsetDateTime::now_utc()).unwrap_or_default()
+}
+
+/// Lifetime of a user delegation key, measured from its start 5 minutes in the past.
+/// Two SAS validities, so that the key is reused for one SAS validity.
+fn delegation_key_validity(sas_token_validity: time::Duration) -> time::Duration {
+    sas_token_validity
+        .saturating_mul(2)
+        .saturating_add(time::Duration::minutes(5))
+        .clamp(
+            time::Duration::ZERO,
+            time::Duration::seconds(MAX_SAS_TOKEN_VALIDITY_SECONDS_I64),
+        )
+}
+
+/// A delegation key is reused while SAS tokens signed with it can still be valid for
+/// the full `sas_token_validity`.
+fn delegation_key_reuse(
+    key_expiry: OffsetDateTime,
+    sas_token_validity: time::Duration,
+) -> std::time::Duration {
+    remaining_validity(key_expiry.saturating_sub(sas_token_validity))
+}
+
 fn iceberg_sas_property_key(account_name: &str, endpoint_suffix: &str) -> String {
     format!("adls.sas-token.{account_name}.{endpoint_suffix}")
 }
@@ -951,16 +1127,20 @@ pub(crate) mod test {
     use iceberg_ext::configs::Location;
     use needs_env_var::needs_env_var;
 
-    use crate::service::{
-        storage::{
-            az::{
-                normalize_host, reduce_scheme_string, validate_account_name,
-                validate_filesystem_name, validate_path_segment, DEFAULT_AUTHORITY_HOST,
+    use crate::{
+        api::iceberg::v1::DataAccess,
+        service::{
+            storage::{
+                az::{
+                    normalize_host, reduce_scheme_string, validate_account_name,
+                    validate_filesystem_name, validate_path_segment, AzCredential, SasSigner,
+                    DEFAULT_AUTHORITY_HOST,
+                },
+                AdlsLocation, AdlsProfile, StorageLocations, StoragePermissions, StorageProfile,
             },
-            AdlsLocation, AdlsProfile, StorageLocations, StorageProfile,
+            tabular_idents::TabularId,
+            NamespaceId,
         },
-        tabular_idents::TabularId,
-        NamespaceId,
     };
 
     #[test]
@@ -1066,6 +1246,98 @@ pub(crate) mod test {
         );
     }
 
+    #[test]
+    fn test_sas_signer_does_not_contain_secrets() {
+        let profile = AdlsProfile {
+            filesystem: "filesystem".to_string(),
+            key_prefix: None,
+            account_name: "account".to_string(),
+            authority_host: None,
+            host: None,
+            sas_token_validity_seconds: None,
+            allow_alternative_protocols: false,
+        };
+        let signer = SasSigner::new(
+            &profile,
+            &AzCredential::SharedAccessKey {
+                key: "my-secret-key".to_string(),
+            },
+        );
+        assert!(!format!("{signer:?}").contains("my-secret-key"));
+        assert_ne!(
+            signer,
+            SasSigner::new(
+                &profile,
+                &AzCredential::SharedAccessKey {
+                    key: "my-rotated-key".to_string(),
+                },
+            )
+        );
+
+        let signer = SasSigner::new(
+            &profile,
+            &AzCredential::ClientCredentials {
+                client_id: "client".to_string(),
+                tenant_id: "tenant".to_string(),
+                client_secret: "my-client-secret".to_string(),
+            },
+        );
+        assert!(!format!("{signer:?}").contains("my-client-secret"));
+    }
+
+    #[test]
+    fn test_delegation_keys_outlive_sas_tokens() {
+        let hour = time::Duration::hours(1);
+        assert_eq!(delegation_key_validity(hour), time::Duration::minutes(125));
+        // Capped at the maximum validity of delegation keys
+        assert_eq!(
+            delegation_key_validity(time::Duration::days(7)),
+            time::Duration::days(7)
+        );
+
+        // Reused until less than one SAS validity remains
+        let key_expiry = OffsetDateTime::now_utc() + time::Duration::minutes(120);
+        let reuse = delegation_key_reuse(key_expiry, hour);
+        assert!(reuse > std::time::Duration::from_secs(59 * 60));
+        assert!(reuse <= std::time::Duration::from_secs(60 * 60));
+        let key_expiry = OffsetDateTime::now_utc() + time::Duration::minutes(30);
+        assert!(delegation_key_reuse(key_expiry, hour).is_zero());
+    }
+
+    #[tokio::test]
+    async fn test_shared_key_sas_is_reused() {
+        let profile = AdlsProfile {
+            filesystem: "filesystem".to_string(),
+            key_prefix: None,
+            account_name: "account".to_string(),
+            authority_host: None,
+            host: None,
+            sas_token_validity_seconds: None,
+            allow_alternative_protocols: false,
+        };
+        let credential = AzCredential::SharedAccessKey {
+            key: "dGVzdC1rZXk=".to_string(),
+        };
+        let location =
+            Location::from_str("abfss://filesystem@account.dfs.core.windows.net/ns/table").unwrap();
+
+        let config = |permissions| {
+            profile.generate_table_config(
+                DataAccess::not_specified(),
+                &location,
+                &credential,
+                permissions,
+            )
+        };
+        let first = config(StoragePermissions::Read).await.unwrap();
+        tokio::time::sleep(std::time::Duration::from_millis(1100)).await;
+        let second = config(StoragePermissions::Read).await.unwrap();
+        assert_eq!(first.creds.inner(), second.creds.inner());
+
+        let write = config(StoragePermissions::ReadWrite).await.unwrap();
+        assert_ne!(first.creds.inner(), write.creds.inner());
+    }
+
     #[test]
     fn test_validate_endpoint_suffix() {
         assert_eq!(
@@ -0,0 +1,330 @@
+use std::{
+    future::Future,
+    hash::Hash,
+    sync::{
+        atomic::{AtomicBool, Ordering},
+        Arc,
+    },
+    time::{Duration, Instant},
+};
+
+use axum_prometheus::metrics;
+
+use crate::config::CredentialCache as CredentialCacheConfig;
+
+const METRIC_CACHE_HITS: &str = "lakekeeper_storage_credential_cache_hits_total";
+const METRIC_CACHE_MISSES: &str = "lakekeeper_storage_credential_cache_misses_total";
+const METRIC_CACHE_REFRESHES: &str = "lakekeeper_storage_credential_cache_refreshes_total";
+
+/// Once this fraction of the reuse window has passed, the next hit
+/// refreshes the entry in the background.
+const REFRESH_AHEAD_FRACTION: f64 = 0.75;
+
+/// Cache for short-lived credentials handed out to clients.
+///
+/// Entries are served for `reuse_fraction` of their validity. Hot entries are
+/// refreshed in the background shortly before that, so that requests only wait
+/// for the credential provider on a cold cache. Concurrent misses for the same
+/// key share a single request to the credential provider.
+#[derive(Clone)]
+pub(super) struct CredentialCache<K, V> {
+    name: &'static str,
+    enabled: bool,
+    reuse_fraction: f64,
+    inner: moka::future::Cache<K, Arc<Entry<V>>>,
+}
+
+#[derive(Debug)]
+struct Entry<V> {
+    value: V,
+    created_at: Instant,
+    reuse_for: Duration,
+    refreshing: AtomicBool,
+}
+
+impl<V> Entry<V> {
+    fn new(value: V, reuse_for: Duration) -> Self {
+        Self {
+            value,
+            created_at: Instant::now(),
+            reuse_for,
+            refreshing: AtomicBool::new(false),
+        }
+    }
+
+    fn should_refresh(&self) -> bool {
+        self.created_at.elapsed() >= self.reuse_for.mul_f64(REFRESH_AHEAD_FRACTION)
+    }
+}
+
+struct Expiry;
+
+impl<K, V> moka::Expiry<K, Arc<Entry<V>>> for Expiry {
+    fn expire_after_create(
+        &self,
+        _key: &K,
+        value: &Arc<Entry<V>>,
+        _created_at: Instant,
+    ) -> Option<Duration> {
+        Some(value.reuse_for)
+    }
+
+    fn expire_after_update(
+        &self,
+        _key: &K,
+        value: &Arc<Entry<V>>,
+        _updated_at: Instant,
+        _duration_until_expiry: Option<Duration>,
+    ) -> Option<Duration> {
+        Some(value.reuse_for)
+    }
+}
+
+impl<K, V> CredentialCache<K, V>
+where
+    K: Hash + Eq + Clone + Send + Sync + 'static,
+    V: Clone + Send + Sync + 'static,
+{
+    pub(super) fn new(name: &'static str, config: &CredentialCacheConfig) -> Self {
+        Self {
+            name,
+            enabled: config.enabled,
+            reuse_fraction: config.reuse_fraction.clamp(0.0, 1.0),
+            inner: moka::future::Cache::builder()
+                .name(name)
+                .max_capacity(config.max_entries)
+                .expire_after(Expiry)
+                .build(),
+        }
+    }
+
+    /// Get a cached credential or obtain a new one via `fetch`.
+    /// `validity` is the lifetime of credentials returned by `fetch`.
+    pub(super) async fn get_or_fetch<F, Fut, E>(
+        &self,
+        key: K,
+        validity: Duration,
+        fetch: F,
+    ) -> Result<V, E>
+    where
+        F: FnOnce() -> Fut + Send + 'static,
+        Fut: Future<Output = Result<V, E>> + Send + 'static,
+        E: std::fmt::Display + Send + 'static,
+    {
+        self.get_or_fetch_expiring(key, move || async move {
+            fetch().await.map(|value| (value, validity))
+        })
+        .await
+    }
+
+    /// Same as `get_or_fetch`, but `fetch` returns the remaining validity
+    /// together with the credential.
+    pub(super) async fn get_or_fetch_expiring<F, Fut, E>(&self, key: K, fetch: F) -> Result<V, E>
+    where
+        F: FnOnce() -> Fut + Send + 'static,
+        Fut: Future<Output = Result<(V, Duration), E>> + Send + 'static,
+        E: std::fmt::Display + Send + 'static,
+    {
+        if !self.enabled {
+            return fetch().await.map(|(value, _)| value);
+        }
+
+        if let Some(entry) = self.inner.get(&key).await {
+            metrics::counter!(METRIC_CACHE_HITS, "cache" => self.name).increment(1);
+            if entry.should_refresh() && !entry.refreshing.swap(true, Ordering::AcqRel) {
+                self.refresh_in_background(key, entry.clone(), fetch);
+            }
+            return Ok(entry.value.clone());
+        }
+
+        metrics::counter!(METRIC_CACHE_MISSES, "cache" => self.name).increment(1);
+        // Only one `fetch` per key is in flight, concurrent misses wait for its result.
+        // An entry without reuse window expires right away.
+        let mut fetch = Some(fetch);
+        let mut error = None;
+        let entry = self
+            .inner
+            .try_get_with(key, async {
+                let fetch = fetch.take().expect("init future is polled at most once");
+                match fetch().await {
+                    Ok((value, validity)) => Ok(Arc::new(Entry::new(
+                        value,
+                        validity.mul_f64(self.reuse_fraction),
+                    ))),
+                    Err(e) => {
+                        error = Some(e);
+                        Err(())
+                    }
+                }
+            })
+            .await;
+
+        match (entry, error, fetch) {
+            (Ok(entry), _, _) => Ok(entry.value.clone()),
+            (Err(_), Some(e), _) => Err(e),
+            // The shared fetch of another request failed. Errors are not cached,
+            // so this request tries on its own.
+            (Err(_), None, Some(fetch)) => fetch().await.map(|(value, _)| value),
+            (Err(_), None, None) => unreachable!("fetch was called, so its error is set"),
+        }
+    }
+
+    async fn insert(&self, key: K, value: V, validity: Duration) {
+        let reuse_for = validity.mul_f64(self.reuse_fraction);
+        if !reuse_for.is_zero() {
+            self.inner
+                .insert(key, Arc::new(Entry::new(value, reuse_for)))
+                .await;
+        }
+    }
+
+    fn refresh_in_background<F, Fut, E>(&self, key: K, entry: Arc<Entry<V>>, fetch: F)
+    where
+        F: FnOnce() -> Fut + Send + 'static,
+        Fut: Future<Output = Result<(V, Duration), E>> + Send + 'static,
+        E: std::fmt::Display + Send + 'static,
+    {
+        metrics::counter!(METRIC_CACHE_REFRESHES, "cache" => self.name).increment(1);
+        let cache = self.clone();
+        tokio::spawn(async move {
+            match fetch().await {
+                Ok((value, validity)) => cache.insert(key, value, validity).await,
+                Err(e) => {
+                    // The current entry is still served until it expires.
+                    // The next hit tries again.
+                    tracing::warn!("Failed to refresh cached {} credentials: {e}", cache.name);
+                    entry.refreshing.store(false, Ordering::Release);
+                }
+            }
+        });
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::sync::atomic::AtomicUsize;
+
+    use super::*;
+
+    fn cache(enabled: bool, reuse_fraction: f64) -> CredentialCache<String, usize> {
+        CredentialCache::new(
+            "test",
+            &CredentialCacheConfig {
+                enabled,
+                max_entries: 100,
+                reuse_fraction,
+            },
+        )
+    }
+
+    async fn get(
+        cache: &CredentialCache<String, usize>,
+        calls: &Arc<AtomicUsize>,
+        validity: Duration,
+    ) -> usize {
+        let calls = calls.clone();
+        cache
+            .get_or_fetch("key".to_string(), validity, move || async move {
+                Ok::<_, String>(calls.fetch_add(1, Ordering::SeqCst) + 1)
+            })
+            .await
+            .unwrap()
+    }
+
+    #[tokio::test]
+    async fn test_cached_credentials_are_reused() {
+        let cache = cache(true, 0.5);
+        let calls = Arc::new(AtomicUsize::new(0));
+        assert_eq!(get(&cache, &calls, Duration::from_secs(3600)).await, 1);
+        assert_eq!(get(&cache, &calls, Duration::from_secs(3600)).await, 1);
+        assert_eq!(calls.load(Ordering::SeqCst), 1);
+    }
+
+    #[tokio::test]
+    async fn test_disabled_cache_always_fetches() {
+        let cache = cache(false, 0.5);
+        let calls = Arc::new(AtomicUsize::new(0));
+        assert_eq!(get(&cache, &calls, Duration::from_secs(3600)).await, 1);
+        assert_eq!(get(&cache, &calls, Duration::from_secs(3600)).await, 2);
+    }
+
+    #[tokio::test]
+    async fn test_errors_are_not_cached() {
+        let cache = cache(true, 0.5);
+        let result = cache
+            .get_or_fetch("key".to_string(), Duration::from_secs(3600), || async {
+                Err::<usize, _>("sts unavailable".to_string())
+            })
+            .await;
+        assert!(result.is_err());
+
+        let calls = Arc::new(AtomicUsize::new(0));
+        assert_eq!(get(&cache, &calls, Duration::from_secs(3600)).await, 1);
+    }
+
+    #[tokio::test]
+    async fn test_validity_is_taken_from_fetched_value() {
+        let cache = cache(true, 0.5);
+        let value = cache
+            .get_or_fetch_expiring("key".to_string(), || async {
+                Ok::<_, String>((1, Duration::ZERO))
+            })
+            .await
+            .unwrap();
+        assert_eq!(value, 1);
+        // Expired credentials are never cached
+        assert!(cache.inner.get("key").await.is_none());
+    }
+
+    #[tokio::test]
+    async fn test_concurrent_misses_fetch_once() {
+        let cache = cache(true, 0.5);
+        let calls = Arc::new(AtomicUsize::new(0));
+        let slow_get = || {
+            let calls = calls.clone();
+            cache.get_or_fetch(
+                "key".to_string(),
+                Duration::from_secs(3600),
+                move || async move {
+                    tokio::time::sleep(Duration::from_millis(50)).await;
+                    Ok::<_, String>(calls.fetch_add(1, Ordering::SeqCst) + 1)
+                },
+            )
+        };
+        let (a, b) = tokio::join!(slow_get(), slow_get());
+        assert_eq!((a.unwrap(), b.unwrap()), (1, 1));
+        assert_eq!(calls.load(Ordering::SeqCst), 1);
+    }
+
+    #[tokio::test]
+    async fn test_failed_shared_fetch_is_retried_by_waiters() {
+        let cache = cache(true, 0.5);
+        let failing = cache.get_or_fetch("key".to_string(), Duration::from_secs(3600), || async {
+            tokio::time::sleep(Duration::from_millis(50)).await;
+            Err::<usize, _>("sts unavailable".to_string())
+        });
+        let waiting = cache.get_or_fetch("key".to_string(), Duration::from_secs(3600), || async {
+            Ok::<_, String>(2)
+        });
+        let (failing, waiting) = tokio::join!(failing, waiting);
+        assert_eq!(failing.unwrap_err(), "sts unavailable");
+        assert_eq!(waiting.unwrap(), 2);
+    }
+
+    #[tokio::test]
+    async fn test_entries_are_refreshed_in_background() {
+        let cache = cache(true, 0.5);
+        let calls = Arc::new(AtomicUsize::new(0));
+        // Reused for 100ms, refreshed after 75ms.
+        let validity = Duration::from_millis(200);
+        assert_eq!(get(&cache, &calls, validity).await, 1);
+
+        tokio::time::sleep(Duration::from_millis(80)).await;
+        // The stale-but-valid entry is returned while the refresh runs.
+        assert_eq!(get(&cache, &calls, validity).await, 1);
+
+        tokio::time::sleep(Duration::from_millis(10)).await;
+        assert_eq!(calls.load(Ordering::SeqCst), 2);
+        assert_eq!(get(&cache, &calls, validity).await, 2);
+    }
+}
@@ -4,6 +4,7 @@ use std::{
     collections::HashMap,
     str::FromStr,
     sync::{Arc, LazyLock},
+    time::{Duration, SystemTime},
 };
 
 use base64::Engine;
@@ -27,6 +28,7 @@ use crate::{
         CatalogConfig,
     },
     service::storage::{
+        cache::CredentialCache,
         error::{CredentialsError, FileIoError, TableConfigError, UpdateError, ValidationError},
         StoragePermissions, TableConfig,
     },
@@ -43,6 +45,48 @@ static STS_URL: LazyLock<Url> = LazyLock::new(|| {
         .expect("failed to parse a constant to a url")
 });
 const GOOGLE_CLOUD_PLATFORM_SCOPE: &str = "https://www.googleapis.com/auth/cloud-platform";
+static DOWNSCOPED_TOKEN_CACHE: LazyLock<CredentialCache<DownscopedTokenCacheKey, DownscopedToken>> =
+    LazyLock::new(|| CredentialCache::new("gcs-downscoped", &CONFIG.cache.gcs_credentials));
+
+/// The service account whose token is downscoped. Private keys are identified
+/// by their id only.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+enum ServiceAccount {
+    Key {
+        client_email: String,
+        private_key_id: String,
+    },
+    SystemIdentity,
+}
+
+impl From<&GcsCredential> for ServiceAccount {
+    fn from(credential: &GcsCredential) -> Self {
+        match credential {
+            GcsCredential::ServiceAccountKey { key } => ServiceAccount::Key {
+                client_email: key.client_email.clone(),
+                private_key_id: key.private_key_id.clone(),
+            },
+            GcsCredential::GcpSystemIdentity {} => ServiceAccount::SystemIdentity,
+        }
+    }
+}
+
+/// Downscoped tokens are bound to a bucket, a prefix and a set of permissions.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+struct DownscopedTokenCacheKey {
+    service_account: ServiceAccount,
+    bucket: String,
+    location: String,
+    permissions: StoragePermissions,
+}
+
+#[derive(Clone, Redact)]
+struct DownscopedToken {
+    #[redact(partial)]
+    access_token: String,
+    expires_at: Option<SystemTime>,
+    project_id: Option<String>,
+}
 
 #[derive(Debug, Eq, Clone, PartialEq, Serialize, Deserialize, utoipa::ToSchema)]
 #[serde(rename_all = "kebab-case")]
@@ -284,29 +328,35 @@ impl GcsProfile {
         table_location: &Location,
         storage_permissions: StoragePermissions,
     ) -> Result<TableConfig, TableConfigError> {
-        let mut table_properties = TableProperties::default();
-
-        let (source, project_id) = self.get_token_source(cred).await?;
-        let token = sts::downscope(
-            source,
-            &self.bucket,
-            table_location.clone(),
-            storage_permissions,
-        )
-        .await?;
+        let key = DownscopedTokenCacheKey {
+            service_account: cred.into(),
+            bucket: self.bucket.clone(),
+            location: table_location.to_string(),
+            permissions: storage_permissions,
+        };
+        let profile = self.clone();
+        let cred = cred.clone();
+        let table_location = table_location.clone();
+        let token = DOWNSCOPED_TOKEN_CACHE
+            .get_or_fetch_expiring(key, move || async move {
+                profile
+                    .downscoped_token(&cred, table_location, storage_permissions)
+                    .await
+            })
+            .await?;
 
+        let mut table_properties = TableProperties::default();
         table_properties.insert(&gcs::Token(token.access_token));
-        if let Some(ref project_id) = project_id {
-            table_properties.insert(&gcs::ProjectId(project_id.clone()));
+        if let Some(project_id) = token.project_id {
+            table_properties.insert(&gcs::ProjectId(project_id));
         }
 
-        if let Some(expiry) = token.expires_in {
+        if let Some(expires_at) = token.expires_at {
             table_properties.insert(&gcs::TokenExpiresAt(
-                (std::time::SystemTime::now()
+                expires_at
                     .duration_since(std::time::UNIX_EPOCH)
-                    .unwrap()
+                    .unwrap_or_default()
                     .as_millis()
-                    + (expiry * 1000) as u128)
                     .to_string(),
             ));
         }
@@ -318,6 +368,29 @@ impl GcsProfile {
         })
     }
 
+    /// Exchange a token of the service account for a downscoped token.
+    /// Returns the token together with its validity. Tokens without expiry are not cached.
+    async fn downscoped_token(
+        &self,
+        cred: &GcsCredential,
+        table_location: Location,
+        storage_permissions: StoragePermissions,
+    ) -> Result<(DownscopedToken, Duration), TableConfigError> {
+        let (source, project_id) = self.get_token_source(cred).await?;
+        let token =
+            sts::downscope(source, &self.bucket, table_location, storage_permissions).await?;
+
+        let validity = token
+            .expires_in
+            .map_or(Duration::ZERO, |e| Duration::from_secs(e as u64));
+        let token = DownscopedToken {
+            access_token: token.access_token,
+            expires_at: token.expires_in.map(|_| SystemTime::now() + validity),
+            project_id,
+        };
+        Ok((token, validity))
+    }
+
     fn normalize_key_prefix(&mut self) -> Result<(), ValidationError> {
         if let Some(key_prefix) = self.key_prefix.as_mut() {
             *key_prefix = key_prefix.trim_matches('/').to_string();
@@ -469,7 +542,36 @@ fn validate_bucket_name(bucket: &str) -> Result<(), ValidationError> {
 pub(crate) mod test {
     use needs_env_var::needs_env_var;
 
-    use crate::service::storage::gcs::validate_bucket_name;
+    use crate::service::storage::gcs::{
+        validate_bucket_name, GcsCredential, GcsServiceKey, ServiceAccount,
+    };
+
+    #[test]
+    fn test_service_account_does_not_contain_private_key() {
+        let key = GcsServiceKey {
+            r#type: "service_account".to_string(),
+            project_id: "example-project-1234".to_string(),
+            private_key_id: "key-id".to_string(),
+            private_key: "super-secret-private-key".to_string(),
+            client_email: "abc@example-project-1234.iam.gserviceaccount.com".to_string(),
+            client_id: "123456789012345678901".to_string(),
+            auth_uri: "https://accounts.google.com/o/oauth2/auth".to_string(),
+            token_uri: "https://oauth2.googleapis.com/token".to_string(),
+            auth_provider_x509_cert_url: "https://www.googleapis.com/oauth2/v1/certs".to_string(),
+            client_x509_cert_url: "https://www.googleapis.com/robot/v1/metadata/x509/abc"
+                .to_string(),
+            universe_domain: "googleapis.com".to_string(),
+        };
+        let service_account = ServiceAccount::from(&GcsCredential::ServiceAccountKey { key });
+        assert_eq!(
+            service_account,
+            ServiceAccount::Key {
+                client_email: "abc@example-project-1234.iam.gserviceaccount.com".to_string(),
+                private_key_id: "key-id".to_string(),
+            }
+        );
+        assert!(!format!("{service_account:?}").contains("super-secret-private-key"));
+    }
 
     // Bucket names: Your bucket names must meet the following requirements:
     //
@@ -1,6 +1,7 @@
 #![allow(clippy::match_wildcard_for_single_variants)]
 
 pub(crate) mod az;
+mod cache;
 mod error;
 pub(crate) mod gcs;
 pub(crate) mod s3;
@@ -68,7 +69,7 @@ pub enum StorageType {
     Gcs,
 }
 
-#[derive(Debug, Clone, PartialEq, Copy)]
+#[derive(Debug, Clone, PartialEq, Eq, Hash, Copy)]
 pub enum StoragePermissions {
     Read,
     ReadWrite,
@@ -22,6 +22,7 @@ use crate::{
     request_metadata::RequestMetadata,
     service::{
         storage::{
+            cache::CredentialCache,
             error::{
                 CredentialsError, FileIoError, TableConfigError, UpdateError, ValidationError,
             },
@@ -42,6 +43,22 @@ static STS_HTTP_CLIENT: LazyLock<aws_sdk_sts::config::SharedHttpClient> = LazyLo
 });
 static AWS_IDENTITY_CACHE: LazyLock<SharedIdentityCache> =
     LazyLock::new(|| IdentityCache::lazy().build());
+static STS_CREDENTIAL_CACHE: LazyLock<
+    CredentialCache<StsCredentialCacheKey, aws_sdk_sts::types::Credentials>,
+> = LazyLock::new(|| CredentialCache::new("sts", &CONFIG.cache.sts_credentials));
+
+/// Vended credentials are downscoped to a table location and permissions.
+/// Credentials obtained for the same key grant the same access.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+struct StsCredentialCacheKey {
+    role_arn: Option<String>,
+    external_id: Option<String>,
+    /// Identity used to call STS. `None` for system identities.
+    access_key_id: Option<String>,
+    endpoint: Option<url::Url>,
+    table_location: String,
+    storage_permissions: StoragePermissions,
+}
 
 #[derive(
     Debug,
@@ -545,6 +562,9 @@ impl S3Profile {
             config.insert(&s3::SignerEndpoint(
                 request_metadata.s3_signer_endpoint_for_table(warehouse_id, tabular_id),
             ));
+            config.insert(&s3::SignerBatchEndpoint(
+                request_metadata.s3_signer_batch_endpoint_for_table(warehouse_id, tabular_id),
+            ));
         }
 
         Ok(TableConfig { creds, config })
@@ -678,8 +698,33 @@ impl S3Profile {
         role_arn: Option<&str>,
         storage_permissions: StoragePermissions,
     ) -> Result<aws_sdk_sts::types::Credentials, CredentialsError> {
+        let key = StsCredentialCacheKey {
+            role_arn: role_arn.map(ToString::to_string),
+            external_id: s3_credential
+                .as_ref()
+                .and_then(|c| c.external_id().map(ToString::to_string)),
+            access_key_id: match &s3_credential {
+                Some(STSCapableCredential::AccessKey(c)) => Some(c.aws_access_key_id.clone()),
+                Some(STSCapableCredential::AwsSystemIdentity(_)) | None => None,
+            },
+            endpoint: self.endpoint.clone(),
+            table_location: table_location.to_string(),
+            storage_permissions,
+        };
         let policy = self.get_aws_policy_string(table_location, storage_permissions)?;
-        self.assume_role_with_sts(s3_credential, role_arn, Some(policy))
+        let profile = self.clone();
+        let role_arn = key.role_arn.clone();
+
+        STS_CREDENTIAL_CACHE
+            .get_or_fetch(
+                key,
+                std::time::Duration::from_secs(self.sts_token_validity_seconds),
+                move || async move {
+                    profile
+                        .assume_role_with_sts(s3_credential, role_arn.as_deref(), Some(policy))
+                        .await
+                },
+            )
             .await
     }
 
@@ -1,6 +1,6 @@
 use std::{
     borrow::Cow,
-    collections::HashMap,
+    collections::{HashMap, VecDeque},
     fmt::{Debug, Formatter},
     ops::Deref,
     sync::{Arc, LazyLock},
@@ -15,11 +15,14 @@ use utoipa::ToSchema;
 use uuid::Uuid;
 
 use super::{authz::Authorizer, Transaction, WarehouseId};
-use crate::service::{
-    task_queue::{
-        tabular_expiration_queue::ExpirationQueueConfig, tabular_purge_queue::PurgeQueueConfig,
+use crate::{
+    service::{
+        task_queue::{
+            tabular_expiration_queue::ExpirationQueueConfig, tabular_purge_queue::PurgeQueueConfig,
+        },
+        Catalog, SecretStore,
     },
-    Catalog, SecretStore,
+    CONFIG,
 };
 
 pub mod tabular_expiration_queue;
@@ -465,6 +468,15 @@ pub struct Task {
     pub(crate) state: serde_json::Value,
 }
 
+/// Outcome of a failed task attempt, recorded with [`Catalog::record_task_failures`].
+#[derive(Debug, Clone, PartialEq)]
+pub struct TaskFailure {
+    pub task_id: TaskId,
+    pub details: String,
+    /// The task is not rescheduled once it has been attempted this many times.
+    pub max_retries: i32,
+}
+
 #[derive(Debug, Clone, Copy)]
 pub enum TaskCheckState {
     Stop,
@@ -546,23 +558,241 @@ impl std::fmt::Display for Status<'_> {
     }
 }
 
-pub(crate) async fn record_error_with_catalog<C: Catalog>(
+/// Wait until new tasks may be available.
+///
+/// Without a subscription, sleeps for `poll_interval`. Otherwise waits for a
+/// notification, or the fallback poll interval if none arrives.
+pub(crate) async fn wait_for_new_tasks(
+    new_tasks: &mut Option<tokio::sync::watch::Receiver<()>>,
+    poll_interval: Duration,
+) {
+    let Some(receiver) = new_tasks else {
+        tokio::time::sleep(poll_interval).await;
+        return;
+    };
+    let fallback_poll_interval = CONFIG
+        .task_notifications
+        .fallback_poll_interval
+        .max(poll_interval);
+    if let Ok(Err(_)) = tokio::time::timeout(fallback_poll_interval, receiver.changed()).await {
+        tracing::warn!("Task notifications stopped, falling back to polling");
+        *new_tasks = None;
+    }
+}
+
+/// Outcome of a task run by a [`WorkerTasks`].
+#[derive(Debug, Clone, PartialEq)]
+pub(crate) enum RunOutcome {
+    Success(TaskId),
+    Failure(TaskFailure),
+    /// Nothing left to record, for example because the task recorded its outcome itself.
+    Recorded,
+}
+
+/// Outcomes are recorded at the latest this long after the first of them finished.
+const OUTCOME_FLUSH_INTERVAL: Duration = Duration::from_secs(1);
+/// Interval at which the heartbeat of claimed tasks that wait for a free slot is renewed.
+/// Well below [`DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT`].
+const QUEUED_TASK_HEARTBEAT_INTERVAL: Duration = Duration::from_secs(60);
+
+/// The claimed tasks of a worker.
+///
+/// Tasks are claimed in batches of up to `task_batch_size` and run with at most
+/// `task_concurrency` at a time. Claimed tasks that wait for a free slot have their
+/// heartbeat renewed, so they are not picked up by other workers. Outcomes are recorded
+/// in bulk once `task_batch_size` of them are collected, the worker is idle, or
+/// [`OUTCOME_FLUSH_INTERVAL`] passed.
+pub(crate) struct WorkerTasks<C: Catalog> {
+    catalog_state: C::State,
+    queued: VecDeque<(TaskId, BoxFuture<'static, RunOutcome>)>,
+    running: tokio::task::JoinSet<RunOutcome>,
+    successes: Vec<TaskId>,
+    failures: Vec<TaskFailure>,
+    flush_at: Option<tokio::time::Instant>,
+    heartbeats: tokio::time::Interval,
+}
+
+impl<C: Catalog> WorkerTasks<C> {
+    pub(crate) fn new(catalog_state: C::State) -> Self {
+        let mut heartbeats = tokio::time::interval_at(
+            tokio::time::Instant::now() + QUEUED_TASK_HEARTBEAT_INTERVAL,
+            QUEUED_TASK_HEARTBEAT_INTERVAL,
+        );
+        heartbeats.set_missed_tick_behavior(tokio::time::MissedTickBehavior::Delay);
+        Self {
+            catalog_state,
+            queued: VecDeque::new(),
+            running: tokio::task::JoinSet::new(),
+            successes: Vec::new(),
+            failures: Vec::new(),
+            flush_at: None,
+            heartbeats,
+        }
+    }
+
+    /// Number of tasks to claim next. Tasks are only claimed once all claimed tasks
+    /// started, up to `task_batch_size` at once.
+    pub(crate) fn tasks_to_claim(&self) -> usize {
+        if !self.queued.is_empty() {
+            return 0;
+        }
+        let batch_size = CONFIG.task_batch_size.max(1);
+        batch_size
+            .max(CONFIG.task_concurrency.max(1))
+            .saturating_sub(self.running.len())
+            .min(batch_size)
+    }
+
+    /// Add a claimed task. It starts once a slot is free.
+    pub(crate) fn push(
+        &mut self,
+        task_id: TaskId,
+        run: impl std::future::Future<Output = RunOutcome> + Send + 'static,
+    ) {
+        self.queued.push_back((task_id, Box::pin(run)));
+        self.start_queued();
+    }
+
+    /// Record the failure of a claimed task that can't be run.
+    pub(crate) fn push_failure(&mut self, failure: TaskFailure) {
+        self.add_outcome(RunOutcome::Failure(failure));
+    }
+
+    /// Wait until a task finished, outcomes or heartbeats are due or, if `queue_drained`,
+    /// new tasks may be available.
+    pub(crate) async fn wait(
+        &mut self,
+        new_tasks: &mut Option<tokio::sync::watch::Receiver<()>>,
+        poll_interval: Duration,
+        queue_drained: bool,
+    ) {
+        let flush_at = self.flush_at;
+        let heartbeat_queued = !self.queued.is_empty();
+        let mut finished = None;
+        let mut flush = false;
+        let mut heartbeat = false;
+        tokio::select! {
+            Some(task) = self.running.join_next() => finished = Some(task),
+            () = wait_for_new_tasks(new_tasks, poll_interval), if queue_drained => {}
+            () = tokio::time::sleep_until(flush_at.unwrap_or_else(tokio::time::Instant::now)),
+                if flush_at.is_some() => flush = true,
+            _ = self.heartbeats.tick(), if heartbeat_queued => heartbeat = true,
+            else => {}
+        }
+        match finished {
+            Some(Ok(outcome)) => self.add_outcome(outcome),
+            Some(Err(e)) => tracing::error!("Task did not run to completion: {e}"),
+            None => {}
+        }
+        if heartbeat {
+            self.heartbeat_queued().await;
+        }
+        if flush {
+            self.flush().await;
+        }
+        self.start_queued();
+        let idle = self.running.is_empty() && self.queued.is_empty();
+        if idle || self.successes.len() + self.failures.len() >= CONFIG.task_batch_size.max(1) {
+            self.flush().await;
+        }
+    }
+
+    fn start_queued(&mut self) {
+        while self.running.len() < CONFIG.task_concurrency.max(1) {
+            let Some((_, run)) = self.queued.pop_front() else {
+                break;
+            };
+            self.running.spawn(run);
+        }
+    }
+
+    fn add_outcome(&mut self, outcome: RunOutcome) {
+        match outcome {
+            RunOutcome::Success(task_id) => self.successes.push(task_id),
+            RunOutcome::Failure(failure) => self.failures.push(failure),
+            RunOutcome::Recorded => return,
+        }
+        self.flush_at
+            .get_or_insert_with(|| tokio::time::Instant::now() + OUTCOME_FLUSH_INTERVAL);
+    }
+
+    async fn flush(&mut self) {
+        self.flush_at = None;
+        record_successes_with_catalog::<C>(
+            self.catalog_state.clone(),
+            &std::mem::take(&mut self.successes),
+        )
+        .await;
+        record_errors_with_catalog::<C>(
+            self.catalog_state.clone(),
+            &std::mem::take(&mut self.failures),
+        )
+        .await;
+    }
+
+    async fn heartbeat_queued(&mut self) {
+        let task_ids = self.queued.iter().map(|(id, _)| *id).collect::<Vec<_>>();
+        if let Err(e) = C::heartbeat_tasks(&task_ids, self.catalog_state.clone()).await {
+            tracing::warn!(
+                "Failed to renew heartbeat of {} queued tasks: {:?}",
+                task_ids.len(),
+                e.error
+            );
+        }
+    }
+}
+
+/// Record the success of several tasks in one transaction.
+pub(crate) async fn record_successes_with_catalog<C: Catalog>(
     catalog_state: C::State,
-    error: &str,
-    max_retries: i32,
-    task_id: TaskId,
+    task_ids: &[TaskId],
 ) {
-    let mut trx: C::Transaction = match Transaction::begin_write(catalog_state).await.map_err(|e| {
-        tracing::error!("Failed to start transaction: {:?}", e);
-        e
-    }) {
+    if task_ids.is_empty() {
+        return;
+    }
+    let mut trx: C::Transaction = match Transaction::begin_write(catalog_state).await {
         Ok(trx) => trx,
         Err(e) => {
             tracing::error!("Failed to start transaction: {:?}", e);
             return;
         }
     };
-    C::retrying_record_task_failure(task_id, error, max_retries, trx.transaction()).await;
+    if let Err(e) = C::record_task_successes(task_ids, None, &mut trx.transaction()).await {
+        tracing::error!(
+            "Failed to record success of {} tasks: {:?}",
+            task_ids.len(),
+            e
+        );
+        return;
+    }
+    let _ = trx.commit().await.inspect_err(|e| {
+        tracing::error!("Failed to commit transaction: {:?}", e);
+    });
+}
+
+/// Record failed attempts of several tasks in one transaction.
+pub(crate) async fn record_errors_with_catalog<C: Catalog>(
+    catalog_state: C::State,
+    failures: &[TaskFailure],
+) {
+    if failures.is_empty() {
+        return;
+    }
+    let mut trx: C::Transaction = match Transaction::begin_write(catalog_state).await {
+        Ok(trx) => trx,
+        Err(e) => {
+            tracing::error!("Failed to start transaction: {:?}", e);
+            return;
+        }
+    };
+    if let Err(e) = C::record_task_failures(failures, &mut trx.transaction()).await {
+        tracing::error!(
+            "Failed to record failures of {} tasks: {:?}",
+            failures.len(),
+            e
+        );
+        return;
+    }
     let _ = trx.commit().await.inspect_err(|e| {
         tracing::error!("Failed to commit transaction: {:?}", e);
     });
@@ -603,6 +833,37 @@ mod test {
         },
     };
 
+    #[tokio::test]
+    async fn test_worker_tasks_claim_batches_and_bound_concurrency() {
+        // Only used to record outcomes, which these tasks don't have.
+        let pool = PgPool::connect_lazy("postgres://localhost/unused").unwrap();
+        let mut worker = super::WorkerTasks::<PostgresCatalog>::new(CatalogState::from_pools(
+            pool.clone(),
+            pool,
+        ));
+        let concurrency = crate::CONFIG.task_concurrency.max(1);
+        let batch_size = crate::CONFIG.task_batch_size.max(1);
+        assert_eq!(worker.tasks_to_claim(), batch_size);
+
+        let (tx, rx) = tokio::sync::watch::channel(false);
+        for _ in 0..batch_size.max(concurrency) + 1 {
+            let mut rx = rx.clone();
+            worker.push(uuid::Uuid::now_v7().into(), async move {
+                rx.wait_for(|done| *done).await.ok();
+                super::RunOutcome::Recorded
+            });
+        }
+        assert_eq!(worker.running.len(), concurrency);
+        // Nothing is claimed while claimed tasks wait for a slot
+        assert_eq!(worker.tasks_to_claim(), 0);
+
+        tx.send(true).unwrap();
+        worker
+            .wait(&mut None, std::time::Duration::from_secs(3600), false)
+            .await;
+        assert_eq!(worker.running.len(), concurrency);
+    }
+
     #[sqlx::test]
     #[traced_test]
     async fn test_queue_expiration_queue_task(pool: PgPool) {
@@ -6,7 +6,8 @@ use utoipa::{PartialSchema, ToSchema};
 use uuid::Uuid;
 
 use super::{
-    EntityId, QueueApiConfig, QueueConfig, TaskMetadata, DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT,
+    EntityId, QueueApiConfig, QueueConfig, RunOutcome, TaskFailure, TaskMetadata, WorkerTasks,
+    DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT,
 };
 use crate::{
     api::{
@@ -18,6 +19,7 @@ use crate::{
         task_queue::{tabular_purge_queue::TabularPurgePayload, Task},
         Catalog, TableId, Transaction, ViewId,
     },
+    CONFIG,
 };
 
 pub(crate) const QUEUE_NAME: &str = "tabular_expiration";
@@ -45,64 +47,84 @@ pub(crate) async fn tabular_expiration_worker<C: Catalog, A: Authorizer>(
     authorizer: A,
     poll_interval: std::time::Duration,
 ) {
+    let mut new_tasks = C::subscribe_to_new_tasks(QUEUE_NAME, catalog_state.clone());
+    let mut worker = WorkerTasks::<C>::new(catalog_state.clone());
     loop {
-        let expiration = match C::pick_new_task(
-            QUEUE_NAME,
-            DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT,
-            catalog_state.clone(),
-        )
-        .await
-        {
-            Ok(expiration) => expiration,
-            Err(err) => {
-                // TODO: add retry counter + exponential backoff
-                tracing::error!("Failed to fetch expiration: {:?}", err);
-                tokio::time::sleep(std::time::Duration::from_secs(5)).await;
-                continue;
+        let requested = worker.tasks_to_claim();
+        let expirations = if requested == 0 {
+            vec![]
+        } else {
+            match C::pick_new_tasks(
+                QUEUE_NAME,
+                DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT,
+                requested,
+                catalog_state.clone(),
+            )
+            .await
+            {
+                Ok(expirations) => expirations,
+                Err(err) => {
+                    // TODO: add retry counter + exponential backoff
+                    tracing::error!("Failed to fetch expirations: {:?}", err);
+                    tokio::time::sleep(std::time::Duration::from_secs(5)).await;
+                    continue;
+                }
             }
         };
-        let Some(expiration) = expiration else {
-            tokio::time::sleep(poll_interval).await;
+        let queue_drained = expirations.len() < requested;
+        for expiration in expirations {
+            worker.push(
+                expiration.task_id,
+                expire::<C, A>(catalog_state.clone(), authorizer.clone(), expiration),
+            );
+        }
+
+        if !queue_drained && worker.tasks_to_claim() > 0 {
             continue;
-        };
-        let state = match expiration.task_state::<TabularExpirationPayload>() {
-            Ok(state) => state,
-            Err(err) => {
-                tracing::error!("Failed to deserialize task state: {:?}", err);
-                // TODO: record fatal error
-                continue;
-            }
-        };
-        let _config = match expiration.task_config::<ExpirationQueueConfig>() {
-            Ok(config) => config,
-            Err(err) => {
-                tracing::error!("Failed to deserialize task config: {:?}", err);
-                continue;
-            }
         }
-        .unwrap_or_default();
-
-        let EntityId::Tabular(tabular_id) = expiration.task_metadata.entity_id;
-
-        let span = tracing::debug_span!(
-            QUEUE_NAME,
-            tabular_id = %tabular_id,
-            warehouse_id = %expiration.task_metadata.warehouse_id,
-            tabular_type = %state.tabular_type,
-            deletion_kind = ?state.deletion_kind,
-            task = ?expiration,
-        );
-
-        instrumented_expire::<C, A>(
-            catalog_state.clone(),
-            authorizer.clone(),
-            tabular_id,
-            &state,
-            &expiration,
-        )
-        .instrument(span.or_current())
-        .await;
+        worker
+            .wait(&mut new_tasks, poll_interval, queue_drained)
+            .await;
+    }
+}
+
+/// Run a single expiration. Successful expirations record their success themselves.
+async fn expire<C: Catalog, A: Authorizer>(
+    catalog_state: C::State,
+    authorizer: A,
+    expiration: Task,
+) -> RunOutcome {
+    let state = match expiration.task_state::<TabularExpirationPayload>() {
+        Ok(state) => state,
+        Err(err) => {
+            tracing::error!("Failed to deserialize task state: {:?}", err);
+            // TODO: record fatal error
+            return RunOutcome::Recorded;
+        }
+    };
+    let _config = match expiration.task_config::<ExpirationQueueConfig>() {
+        Ok(config) => config,
+        Err(err) => {
+            tracing::error!("Failed to deserialize task config: {:?}", err);
+            return RunOutcome::Recorded;
+        }
     }
+    .unwrap_or_default();
+
+    let EntityId::Tabular(tabular_id) = expiration.task_metadata.entity_id;
+
+    let span = tracing::debug_span!(
+        QUEUE_NAME,
+        tabular_id = %tabular_id,
+        warehouse_id = %expiration.task_metadata.warehouse_id,
+        tabular_type = %state.tabular_type,
+        deletion_kind = ?state.deletion_kind,
+        task = ?expiration,
+    );
+
+    instrumented_expire::<C, A>(catalog_state, authorizer, tabular_id, &state, &expiration)
+        .instrument(span.or_current())
+        .await
 }
 
 async fn instrumented_expire<C: Catalog, A: Authorizer>(
@@ -111,30 +133,21 @@ async fn instrumented_expire<C: Catalog, A: Authorizer>(
     tabular_id: Uuid,
     expiration: &TabularExpirationPayload,
     task: &Task,
-) {
-    match handle_table::<C, A>(
-        catalog_state.clone(),
-        authorizer,
-        tabular_id,
-        expiration,
-        task,
-    )
-    .await
-    {
+) -> RunOutcome {
+    match handle_table::<C, A>(catalog_state, authorizer, tabular_id, expiration, task).await {
         Ok(()) => {
             tracing::debug!("Successful {expiration:?}");
+            RunOutcome::Recorded
         }
         Err(err) => {
             tracing::error!("Failed to handle {expiration:?}: {err:?}");
-            super::record_error_with_catalog::<C>(
-                catalog_state.clone(),
-                &format!("Failed to expire tabular: '{:?}'", err.error),
-                5,
-                task.task_id,
-            )
-            .await;
+            RunOutcome::Failure(TaskFailure {
+                task_id: task.task_id,
+                details: format!("Failed to expire tabular: '{:?}'", err.error),
+                max_retries: 5,
+            })
         }
-    };
+    }
 }
 
 async fn handle_table<C, A>(
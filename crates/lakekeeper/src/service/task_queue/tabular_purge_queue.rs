@@ -1,5 +1,12 @@
-use std::sync::LazyLock;
+use std::{
+    collections::{hash_map::Entry, HashMap},
+    future::Future,
+    num::NonZeroU32,
+    sync::{Arc, LazyLock, Mutex, PoisonError},
+};
 
+use futures::StreamExt as _;
+use iceberg::io::FileIO;
 use iceberg_ext::{
     catalog::rest::ErrorModel,
     configs::{Location, ParseFromStr},
@@ -8,11 +15,22 @@ use serde::{Deserialize, Serialize};
 use tracing::Instrument;
 use utoipa::{PartialSchema, ToSchema};
 
-use super::{QueueApiConfig, QueueConfig, TaskMetadata, DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT};
+use super::{
+    QueueApiConfig, QueueConfig, RunOutcome, TaskFailure, WorkerTasks,
+    DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT,
+};
 use crate::{
     api::{management::v1::TabularType, Result},
-    catalog::{io::remove_all, maybe_get_secret},
-    service::{task_queue::Task, Catalog, SecretStore, Transaction},
+    catalog::{
+        io::{delete_files, list_location, remove_all, IoError},
+        maybe_get_secret,
+    },
+    service::{
+        task_queue::{Task, TaskCheckState},
+        Catalog, GetWarehouseResponse, SecretStore, Transaction,
+    },
+    utils::rate_limit::RateLimiter,
+    WarehouseId, CONFIG,
 };
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -29,146 +47,246 @@ pub(crate) static API_CONFIG: LazyLock<QueueApiConfig> = LazyLock::new(|| QueueA
 });
 
 #[derive(Debug, Clone, Serialize, Deserialize, Default, ToSchema)]
-pub(crate) struct PurgeQueueConfig {}
+#[serde(rename_all = "kebab-case")]
+/// Warehouse-specific configuration for the purge queue.
+pub(crate) struct PurgeQueueConfig {
+    /// Maximum number of files deleted per second for this warehouse by each
+    /// Lakekeeper instance. Unlimited if not set. Best effort, directories and
+    /// files written to the location during the purge are removed without the limit.
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    #[schema(value_type = Option<u32>, minimum = 1)]
+    pub(crate) max_deletes_per_second: Option<NonZeroU32>,
+}
 
 impl QueueConfig for PurgeQueueConfig {}
 
+/// Interval at which a running purge renews its task heartbeat while files are deleted. Well below [`DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT`].
+const PURGE_HEARTBEAT_INTERVAL: std::time::Duration = std::time::Duration::from_secs(60);
+
+/// Maximum number of times a rate limited purge lists and deletes the remaining files.
+/// Bounded, as clients may still write to the location of a dropped tabular.
+const RATE_LIMITED_PURGE_PASSES: usize = 2;
+
+/// Delete rate limiters per warehouse, shared by all purges of this instance.
+static DELETE_RATE_LIMITERS: LazyLock<Mutex<HashMap<WarehouseId, Arc<RateLimiter>>>> =
+    LazyLock::new(Mutex::default);
+
+/// The delete rate limiter of `warehouse_id` according to its current `config`.
+fn delete_rate_limiter(
+    warehouse_id: WarehouseId,
+    config: &PurgeQueueConfig,
+) -> Option<Arc<RateLimiter>> {
+    let mut limiters = DELETE_RATE_LIMITERS
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner);
+    let Some(per_second) = config.max_deletes_per_second else {
+        limiters.remove(&warehouse_id);
+        return None;
+    };
+    let limiter = limiters
+        .entry(warehouse_id)
+        .and_modify(|limiter| {
+            if limiter.per_second() != per_second {
+                *limiter = Arc::new(RateLimiter::new(per_second));
+            }
+        })
+        .or_insert_with(|| Arc::new(RateLimiter::new(per_second)));
+    Some(Arc::clone(limiter))
+}
+
 pub(crate) async fn tabular_purge_worker<C: Catalog, S: SecretStore>(
     catalog_state: C::State,
     secret_state: S,
     poll_interval: std::time::Duration,
 ) {
+    let mut new_tasks = C::subscribe_to_new_tasks(QUEUE_NAME, catalog_state.clone());
+    let mut worker = WorkerTasks::<C>::new(catalog_state.clone());
     loop {
-        let task = match C::pick_new_task(
-            QUEUE_NAME,
-            DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT,
-            catalog_state.clone(),
-        )
-        .await
-        {
-            Ok(expiration) => expiration,
-            Err(err) => {
-                // TODO: add retry counter + exponential backoff
-                tracing::error!("Failed to fetch purge: {:?}", err);
-                tokio::time::sleep(std::time::Duration::from_secs(5)).await;
-                continue;
+        let requested = worker.tasks_to_claim();
+        let tasks = if requested == 0 {
+            vec![]
+        } else {
+            match C::pick_new_tasks(
+                QUEUE_NAME,
+                DEFAULT_MAX_TIME_SINCE_LAST_HEARTBEAT,
+                requested,
+                catalog_state.clone(),
+            )
+            .await
+            {
+                Ok(tasks) => tasks,
+                Err(err) => {
+                    // TODO: add retry counter + exponential backoff
+                    tracing::error!("Failed to fetch purges: {:?}", err);
+                    tokio::time::sleep(std::time::Duration::from_secs(5)).await;
+                    continue;
+                }
             }
         };
+        let queue_drained = tasks.len() < requested;
 
-        let Some(task) = task else {
-            tokio::time::sleep(poll_interval).await;
-            continue;
-        };
-        let state = match task.task_state::<TabularPurgePayload>() {
-            Ok(state) => state,
-            Err(err) => {
-                tracing::error!("Failed to deserialize task state: {:?}", err);
-                // TODO: record fatal error
-                continue;
-            }
-        };
-        let config = match task.task_config::<PurgeQueueConfig>() {
-            Ok(config) => config,
-            Err(err) => {
-                tracing::error!("Failed to deserialize task config: {:?}", err);
-                continue;
+        let purges = tasks.into_iter().filter_map(|task| {
+            let payload = match task.task_state::<TabularPurgePayload>() {
+                Ok(payload) => payload,
+                Err(err) => {
+                    tracing::error!("Failed to deserialize task state: {:?}", err);
+                    // TODO: record fatal error
+                    return None;
+                }
+            };
+            let config = match task.task_config::<PurgeQueueConfig>() {
+                Ok(config) => config,
+                Err(err) => {
+                    tracing::error!("Failed to deserialize task config: {:?}", err);
+                    return None;
+                }
             }
+            .unwrap_or_default();
+            Some(Purge {
+                task,
+                payload,
+                config,
+            })
+        });
+
+        let (purges, failures) =
+            load_warehouses::<C>(catalog_state.clone(), purges.collect()).await;
+        for failure in failures {
+            worker.push_failure(failure);
+        }
+        for (purge, warehouse) in purges {
+            let span = tracing::debug_span!(
+                "tabular_purge",
+                location = %purge.payload.tabular_location,
+                warehouse_id = %purge.task.task_metadata.warehouse_id,
+                tabular_type = %purge.payload.tabular_type,
+                queue_name = %purge.task.queue_name,
+                task = ?purge.task,
+            );
+            worker.push(
+                purge.task.task_id,
+                instrumented_purge::<C, S>(
+                    catalog_state.clone(),
+                    purge,
+                    warehouse,
+                    secret_state.clone(),
+                )
+                .instrument(span.or_current()),
+            );
         }
-        .unwrap_or_default();
-
-        let span = tracing::debug_span!(
-            "tabular_purge",
-            location = %state.tabular_location,
-            warehouse_id = %task.task_metadata.warehouse_id,
-            tabular_type = %state.tabular_type,
-            queue_name = %task.queue_name,
-            task = ?task,
-        );
 
-        instrumented_purge::<_, C>(catalog_state.clone(), &secret_state, &state, &task, &config)
-            .instrument(span.or_current())
+        if !queue_drained && worker.tasks_to_claim() > 0 {
+            continue;
+        }
+        worker
+            .wait(&mut new_tasks, poll_interval, queue_drained)
             .await;
     }
 }
 
-async fn instrumented_purge<S: SecretStore, C: Catalog>(
+#[derive(Debug)]
+struct Purge {
+    task: Task,
+    payload: TabularPurgePayload,
+    config: PurgeQueueConfig,
+}
+
+impl Purge {
+    fn failure(&self, details: String) -> TaskFailure {
+        TaskFailure {
+            task_id: self.task.task_id,
+            details,
+            max_retries: self.config.max_retries(),
+        }
+    }
+}
+
+/// Load the warehouses of `purges`, each warehouse once.
+async fn load_warehouses<C: Catalog>(
     catalog_state: C::State,
-    secret_state: &S,
-    purge_task: &TabularPurgePayload,
-    task: &Task,
-    config: &PurgeQueueConfig,
-) {
-    match purge::<C, S>(purge_task, task, secret_state, catalog_state.clone()).await {
+    purges: Vec<Purge>,
+) -> (Vec<(Purge, Arc<GetWarehouseResponse>)>, Vec<TaskFailure>) {
+    let mut trx = match C::Transaction::begin_read(catalog_state).await {
+        Ok(trx) => trx,
+        Err(e) => {
+            tracing::error!("Failed to start transaction: {:?}", e);
+            let failures = purges
+                .iter()
+                .map(|p| p.failure(format!("Failed to purge tabular: '{:?}'", e.error)))
+                .collect();
+            return (vec![], failures);
+        }
+    };
+
+    let mut warehouses = HashMap::new();
+    let mut loaded = Vec::with_capacity(purges.len());
+    let mut failures = Vec::new();
+    for purge in purges {
+        let warehouse_id = purge.task.task_metadata.warehouse_id;
+        let warehouse = match warehouses.entry(warehouse_id) {
+            Entry::Occupied(entry) => Arc::clone(entry.get()),
+            Entry::Vacant(entry) => {
+                match C::require_warehouse(warehouse_id, trx.transaction()).await {
+                    Ok(warehouse) => Arc::clone(entry.insert(Arc::new(warehouse))),
+                    Err(e) => {
+                        tracing::error!("Failed to get warehouse: {:?}", e);
+                        failures.push(
+                            purge.failure(format!("Failed to purge tabular: '{:?}'", e.error)),
+                        );
+                        continue;
+                    }
+                }
+            }
+        };
+        loaded.push((purge, warehouse));
+    }
+    let _ = trx.commit().await.inspect_err(|e| {
+        tracing::warn!("Failed to commit read transaction: {:?}", e);
+    });
+
+    (loaded, failures)
+}
+
+async fn instrumented_purge<C: Catalog, S: SecretStore>(
+    catalog_state: C::State,
+    purge: Purge,
+    warehouse: Arc<GetWarehouseResponse>,
+    secret_state: S,
+) -> RunOutcome {
+    match purge_location::<C, S>(catalog_state, &purge, &warehouse, &secret_state).await {
         Ok(()) => {
             tracing::info!(
                 "Successfully cleaned up tabular at location {}",
-                purge_task.tabular_location
+                purge.payload.tabular_location
             );
+            RunOutcome::Success(purge.task.task_id)
         }
         Err(err) => {
             tracing::error!(
                 "Failed to expire tabular at location {} due to: {}",
-                purge_task.tabular_location,
+                purge.payload.tabular_location,
                 err.error
             );
-            super::record_error_with_catalog::<C>(
-                catalog_state.clone(),
-                &format!("Failed to purge tabular: '{:?}'", err.error),
-                config.max_retries(),
-                task.task_id,
+            RunOutcome::Failure(
+                purge.failure(format!("Failed to purge tabular: '{:?}'", err.error)),
             )
-            .await;
         }
-    };
+    }
 }
 
-async fn purge<C, S>(
-    TabularPurgePayload {
-        tabular_location,
-        tabular_type: _,
-    }: &TabularPurgePayload,
-    Task {
-        task_metadata:
-            TaskMetadata {
-                entity_id: _,
-                warehouse_id,
-                parent_task_id: _,
-                schedule_for: _,
-            },
-        queue_name: _,
-        task_id,
-        status: _,
-        picked_up_at: _,
-        attempt: _,
-        config: _,
-        state: _,
-    }: &Task,
-    secret_state: &S,
+/// Delete all files below the tabular location.
+///
+/// Without a delete rate limit for the warehouse, this is a single `remove_all` with
+/// batched deletes. Otherwise files are deleted one by one through the rate limiter
+/// first. The task heartbeat is renewed throughout; deleted files are not listed again,
+/// so a restarted purge continues with the remaining files.
+async fn purge_location<C: Catalog, S: SecretStore>(
     catalog_state: C::State,
-) -> Result<()>
-where
-    C: Catalog,
-    S: SecretStore,
-{
-    let mut trx = C::Transaction::begin_write(catalog_state)
-        .await
-        .map_err(|e| {
-            tracing::error!("Failed to start transaction: {:?}", e);
-            e
-        })?;
-
-    let warehouse = C::require_warehouse(*warehouse_id, trx.transaction())
-        .await
-        .map_err(|e| {
-            tracing::error!("Failed to get warehouse: {:?}", e);
-            e
-        })?;
-    C::retrying_record_task_success(*task_id, None, trx.transaction()).await;
-    trx.commit().await.map_err(|e| {
-        tracing::error!("Failed to commit transaction: {:?}", e);
-        e
-    })?;
-
+    purge: &Purge,
+    warehouse: &GetWarehouseResponse,
+    secret_state: &S,
+) -> Result<()> {
+    let tabular_location = &purge.payload.tabular_location;
     let secret = maybe_get_secret(warehouse.storage_secret_id, secret_state)
         .await
         .map_err(|e| {
@@ -197,7 +315,7 @@ where
             Some(Box::new(e)),
         )
     })?;
-    remove_all(&file_io, &tabular_location).await.map_err(|e| {
+    let io_error = |e: IoError| {
         tracing::error!(
             ?e,
             "Failed to purge tabular at location: '{tabular_location}'",
@@ -207,7 +325,130 @@ where
             "FileIOError",
             Some(Box::new(e)),
         )
-    })?;
+    };
+
+    if let Some(rate_limit) =
+        delete_rate_limiter(purge.task.task_metadata.warehouse_id, &purge.config)
+    {
+        with_heartbeats::<C, _>(
+            catalog_state.clone(),
+            purge,
+            delete_files_rate_limited(&file_io, &tabular_location, &rate_limit),
+        )
+        .await?
+        .map_err(io_error)?;
+    }
+
+    // Deletes are batched by the storage backend, on S3 up to 1000 objects per request.
+    // For rate limited purges this only removes directories and files written during
+    // the last pass above, which are not rate limited.
+    with_heartbeats::<C, _>(
+        catalog_state,
+        purge,
+        remove_all(&file_io, &tabular_location),
+    )
+    .await?
+    .map_err(io_error)?;
 
     Ok(())
 }
+
+/// Delete the files below `location` one by one, so that every deleted file passes
+/// `rate_limit`. Further passes delete files written while the previous pass ran.
+async fn delete_files_rate_limited(
+    file_io: &FileIO,
+    location: &Location,
+    rate_limit: &RateLimiter,
+) -> std::result::Result<(), IoError> {
+    for _ in 0..RATE_LIMITED_PURGE_PASSES {
+        let mut deleted_files = 0;
+        let mut pages = list_location(file_io, location, None).await?;
+        while let Some(page) = pages.next().await {
+            // Directories are removed with the location afterwards.
+            let files = page?
+                .into_iter()
+                .filter(|path| !path.ends_with('/'))
+                .collect::<Vec<_>>();
+            if files.is_empty() {
+                continue;
+            }
+            delete_files(file_io, &files, CONFIG.purge_delete_concurrency, rate_limit).await?;
+            deleted_files += files.len();
+        }
+        if deleted_files == 0 {
+            break;
+        }
+    }
+    Ok(())
+}
+
+/// Renew the heartbeat of the task of `purge`.
+/// Fails if the task no longer exists or should stop, for example because it was cancelled.
+async fn heartbeat_purge<C: Catalog>(catalog_state: C::State, purge: &Purge) -> Result<()> {
+    let mut trx = C::Transaction::begin_write(catalog_state).await?;
+    let check = C::check_and_heartbeat_task(purge.task.task_id, trx.transaction()).await?;
+    trx.commit().await?;
+    match check {
+        Some(TaskCheckState::Continue) => Ok(()),
+        Some(TaskCheckState::Stop) | None => {
+            Err(
+                ErrorModel::conflict("Purge task is no longer running.", "TaskNotRunning", None)
+                    .into(),
+            )
+        }
+    }
+}
+
+/// Run `operation` to completion, renewing the heartbeat of `purge` every
+/// [`PURGE_HEARTBEAT_INTERVAL`].
+async fn with_heartbeats<C: Catalog, T>(
+    catalog_state: C::State,
+    purge: &Purge,
+    operation: impl Future<Output = T>,
+) -> Result<T> {
+    tokio::pin!(operation);
+    let mut heartbeats = tokio::time::interval(PURGE_HEARTBEAT_INTERVAL);
+    heartbeats.set_missed_tick_behavior(tokio::time::MissedTickBehavior::Delay);
+    // The first tick completes immediately
+    heartbeats.tick().await;
+    loop {
+        tokio::select! {
+            output = &mut operation => return Ok(output),
+            _ = heartbeats.tick() => heartbeat_purge::<C>(catalog_state.clone(), purge).await?,
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_delete_rate_limiter_follows_config() {
+        let warehouse_id = WarehouseId::new_random();
+        let config: PurgeQueueConfig =
+            serde_json::from_value(serde_json::json!({"max-deletes-per-second": 100})).unwrap();
+        let limiter = delete_rate_limiter(warehouse_id, &config).unwrap();
+        assert_eq!(limiter.per_second().get(), 100);
+        assert!(Arc::ptr_eq(
+            &limiter,
+            &delete_rate_limiter(warehouse_id, &config).unwrap()
+        ));
+
+        let config = PurgeQueueConfig {
+            max_deletes_per_second: NonZeroU32::new(10),
+        };
+        assert_eq!(
+            delete_rate_limiter(warehouse_id, &config)
+                .unwrap()
+                .per_second()
+                .get(),
+            10
+        );
+        assert!(delete_rate_limiter(warehouse_id, &PurgeQueueConfig::default()).is_none());
+        assert!(serde_json::from_value::<PurgeQueueConfig>(
+            serde_json::json!({"max-deletes-per-second": 0})
+        )
+        .is_err());
+    }
+}
@@ -1 +1,2 @@
+pub(crate) mod rate_limit;
 pub(crate) mod time_conversion;
@@ -0,0 +1,63 @@
+use std::{
+    num::NonZeroU32,
+    sync::{Mutex, PoisonError},
+    time::Duration,
+};
+
+use tokio::time::Instant;
+
+/// Spaces out operations evenly to at most `per_second` operations per second.
+/// Unused capacity is not saved up, so there are no bursts after idle periods.
+#[derive(Debug)]
+pub(crate) struct RateLimiter {
+    per_second: NonZeroU32,
+    interval: Duration,
+    next: Mutex<Instant>,
+}
+
+impl RateLimiter {
+    pub(crate) fn new(per_second: NonZeroU32) -> Self {
+        Self {
+            per_second,
+            interval: Duration::from_secs(1) / per_second.get(),
+            next: Mutex::new(Instant::now()),
+        }
+    }
+
+    pub(crate) fn per_second(&self) -> NonZeroU32 {
+        self.per_second
+    }
+
+    /// Wait until the next operation may start.
+    pub(crate) async fn acquire(&self) {
+        let slot = {
+            let mut next = self.next.lock().unwrap_or_else(PoisonError::into_inner);
+            let slot = (*next).max(Instant::now());
+            *next = slot + self.interval;
+            slot
+        };
+        tokio::time::sleep_until(slot).await;
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[tokio::test(start_paused = true)]
+    async fn test_acquire_spaces_out_operations() {
+        let limiter = RateLimiter::new(NonZeroU32::new(10).unwrap());
+        let start = Instant::now();
+        for _ in 0..5 {
+            limiter.acquire().await;
+        }
+        assert_eq!(start.elapsed(), Duration::from_millis(400));
+
+        // Idle time does not allow a burst.
+        tokio::time::sleep(Duration::from_secs(5)).await;
+        let start = Instant::now();
+        limiter.acquire().await;
+        limiter.acquire().await;
+        assert_eq!(start.elapsed(), Duration::from_millis(100));
+    }
+}